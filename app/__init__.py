@@ -3,8 +3,9 @@ Flask 앱 팩토리
 """
 
 import os
-from flask import Flask, send_from_directory
-from app.database import db
+from flask import send_from_directory
+from app.database import db, resolve_database_url
+from app.utils.aio import AsyncFlask
 
 
 def create_app(config=None):
@@ -14,7 +15,8 @@ def create_app(config=None):
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     static_folder = os.path.join(BASE_DIR, 'frontend', 'out')
     
-    app = Flask(__name__, static_folder=static_folder, static_url_path='/_next_static')
+    # async def 뷰는 프로세스 공유 이벤트 루프에서 실행 (app/utils/aio.py)
+    app = AsyncFlask(__name__, static_folder=static_folder, static_url_path='/_next_static')
     
     # 설정
     app.config['JSON_AS_ASCII'] = False  # 한글 지원
@@ -23,50 +25,44 @@ def create_app(config=None):
     if config:
         app.config.update(config)
     
-    # Database Config
-    db_url = os.environ.get('TURSO_DATABASE_URL', 'sqlite:///local.db')
-    auth_token = os.environ.get('TURSO_AUTH_TOKEN')
-    
-    if 'turso.io' in db_url:
-        import urllib.parse
-        # Turso/LibSQL URL format: sqlite+libsql://...
-        
-        # Ensure correct scheme for SQLAlchemy
-        # Case 1: libsql://... -> sqlite+libsql://...
-        # Case 2: https://... -> sqlite+libsql://...
-        
-        if db_url.startswith('libsql://'):
-            db_url = db_url.replace('libsql://', 'sqlite+libsql://')
-        elif db_url.startswith('https://'):
-            db_url = db_url.replace('https://', 'sqlite+libsql://')
-            
-        if auth_token:
-            # Token needs to be URL encoded safely
-            encoded_token = urllib.parse.quote_plus(auth_token)
-            
-            # Append as query param
-            separator = '&' if '?' in db_url else '?'
-            app.config['SQLALCHEMY_DATABASE_URI'] = f"{db_url}{separator}authToken={encoded_token}&secure=true"
-        else:
-            app.config['SQLALCHEMY_DATABASE_URI'] = db_url
-    else:
-        app.config['SQLALCHEMY_DATABASE_URI'] = db_url
-
+    # Database Config (로컬 SQLite 또는 Turso)
+    app.config['SQLALCHEMY_DATABASE_URI'] = resolve_database_url()
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
     db.init_app(app)
+
+    from app.startup import is_preload, phase
+
+    # 결과 저장소 테이블 생성 (시그널/일별 실행/Market Gate/성과)
+    with phase('db_schema'):
+        from app import models  # noqa: F401 - 테이블 메타데이터 등록
+        with app.app_context():
+            try:
+                db.create_all()
+            except Exception as e:
+                print(f"[DB] 테이블 생성 실패 (JSON 파일 모드로 동작): {e}")
+
+    with phase('backfill'):
+        from app.store import backfill_once
+        backfill_once(os.path.join(BASE_DIR, 'data'))
     
-    # 블루프린트 등록
-    from app.routes.kr_market import kr_bp
-    from app.routes.jp_market import jp_bp
-    from app.routes.us_market import us_bp
-    from app.routes.common import common_bp
-    
-    app.register_blueprint(kr_bp, url_prefix='/api/kr')
-    app.register_blueprint(jp_bp, url_prefix='/api/jp')
-    app.register_blueprint(us_bp, url_prefix='/api/us')
-    app.register_blueprint(common_bp, url_prefix='/api')
+    # 블루프린트 등록 (무거운 라이브러리는 각 핸들러에서 지연 import)
+    with phase('blueprints'):
+        from app.routes.kr_market import kr_bp
+        from app.routes.jp_market import jp_bp
+        from app.routes.us_market import us_bp
+        from app.routes.common import common_bp
+        
+        app.register_blueprint(kr_bp, url_prefix='/api/kr')
+        app.register_blueprint(jp_bp, url_prefix='/api/jp')
+        app.register_blueprint(us_bp, url_prefix='/api/us')
+        app.register_blueprint(common_bp, url_prefix='/api')
 
+    # 백그라운드 작업 워커 (JOB_WORKER_MODE=external 이면 별도 프로세스에서 실행)
+    # preload 모드에서는 마스터에서 스레드를 띄우지 않고 fork 이후 워커마다 시작 (gunicorn.conf.py post_fork)
+    if not is_preload():
+        from app.jobs import start_worker_pool
+        start_worker_pool()
     
     # 캐시 비활성화 - 모든 API 응답에 no-cache 헤더 추가
     @app.after_request
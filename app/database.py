@@ -1,7 +1,97 @@
+import os
+import threading
+import urllib.parse
+from contextlib import contextmanager
+
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import create_engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 class Base(DeclarativeBase):
     pass
 
 db = SQLAlchemy(model_class=Base)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_database_url(db_url: str = None, auth_token: str = None) -> str:
+    """환경변수 기반 DB URL 결정 (로컬 SQLite 또는 Turso)"""
+    db_url = db_url or os.environ.get('TURSO_DATABASE_URL', 'sqlite:///local.db')
+    auth_token = auth_token or os.environ.get('TURSO_AUTH_TOKEN')
+
+    if 'turso.io' in db_url:
+        # Turso/LibSQL URL format: sqlite+libsql://...
+
+        # Ensure correct scheme for SQLAlchemy
+        # Case 1: libsql://... -> sqlite+libsql://...
+        # Case 2: https://... -> sqlite+libsql://...
+
+        if db_url.startswith('libsql://'):
+            db_url = db_url.replace('libsql://', 'sqlite+libsql://')
+        elif db_url.startswith('https://'):
+            db_url = db_url.replace('https://', 'sqlite+libsql://')
+
+        if auth_token:
+            # Token needs to be URL encoded safely
+            encoded_token = urllib.parse.quote_plus(auth_token)
+
+            # Append as query param
+            separator = '&' if '?' in db_url else '?'
+            return f"{db_url}{separator}authToken={encoded_token}&secure=true"
+        return db_url
+
+    # 로컬 SQLite 상대경로는 프로젝트 루트 기준 절대경로로 고정
+    # (Flask 앱과 스케줄러/CLI가 같은 파일을 보도록)
+    if db_url.startswith('sqlite:///') and not db_url.startswith('sqlite:////'):
+        rel_path = db_url[len('sqlite:///'):]
+        if rel_path and rel_path != ':memory:' and not os.path.isabs(rel_path):
+            db_url = 'sqlite:///' + os.path.join(BASE_DIR, rel_path)
+
+    return db_url
+
+
+# --- Flask 앱 컨텍스트 밖(스케줄러, 백그라운드 스레드, CLI)에서 사용하는 세션 ---
+_engine = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """독립 실행용 SQLAlchemy 엔진 (프로세스당 1개)"""
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                url = resolve_database_url()
+                kwargs = {'pool_pre_ping': True}
+                if url.startswith('sqlite'):
+                    kwargs['connect_args'] = {'check_same_thread': False}
+                _engine = create_engine(url, **kwargs)
+                _session_factory = sessionmaker(bind=_engine, expire_on_commit=False)
+    return _engine
+
+
+def dispose_engines(app=None):
+    """fork 직후 부모에게서 물려받은 커넥션 풀 폐기 (소켓은 부모 소유라 닫지 않음)"""
+    if _engine is not None:
+        _engine.dispose(close=False)
+    if app is not None:
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+
+
+@contextmanager
+def session_scope():
+    """트랜잭션 범위 세션 (commit/rollback 자동 처리)"""
+    get_engine()
+    session = _session_factory()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
@@ -0,0 +1,417 @@
+"""
+백그라운드 작업 큐 (SQLite/libSQL 기반)
+- 작업 등록 → jobs 테이블 (job id, 진행률, 메시지, 결과 위치)
+- 같은 dedupe_key 작업은 진행 중 1개만 (DB unique 제약 → gunicorn 워커 간에도 중복 없음)
+- 워커 풀: 웹 프로세스 내 스레드 또는 별도 프로세스 (python -m app.jobs worker)
+- 취소: 대기 중이면 즉시, 실행 중이면 핸들러의 체크포인트에서 중단
+- 실행 중에는 dedupe_key 파일 락 보유 (큐 밖의 스케줄러/수동 실행과도 동시 실행 방지)
+"""
+
+import json
+import os
+import re
+import socket
+import threading
+import time
+import traceback
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.database import Base, get_engine, session_scope
+from app.models import Job
+from engine.locks import FileLock
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+# kind -> handler(ctx, **params) -> result pointer(dict)
+_handlers: Dict[str, Callable] = {}
+
+
+def job_handler(kind: str):
+    """작업 핸들러 등록 데코레이터"""
+    def decorator(func):
+        _handlers[kind] = func
+        return func
+    return decorator
+
+
+class JobCancelled(Exception):
+    """취소 요청으로 중단"""
+
+
+def _job_to_dict(job: Job) -> Dict:
+    return {
+        'id': job.id,
+        'kind': job.kind,
+        'dedupe_key': job.dedupe_key,
+        'params': json.loads(job.params or '{}'),
+        'status': job.status,
+        'progress': job.progress,
+        'message': job.message,
+        'result': json.loads(job.result) if job.result else None,
+        'error': job.error,
+        'cancel_requested': job.cancel_requested,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+class JobQueue:
+    """영속 작업 큐"""
+
+    def __init__(self):
+        self._schema_ready = False
+        self._lock = threading.Lock()
+
+    def ensure_schema(self):
+        if self._schema_ready:
+            return
+        with self._lock:
+            if not self._schema_ready:
+                Base.metadata.create_all(get_engine(), tables=[Job.__table__])
+                self._schema_ready = True
+
+    # === 등록 / 조회 ===
+    def submit(self, kind: str, params: Dict = None, dedupe_key: str = None) -> Tuple[Dict, bool]:
+        """작업 등록. 같은 dedupe_key 작업이 진행 중이면 그 작업을 반환 (created=False)"""
+        self.ensure_schema()
+        params = params or {}
+        dedupe_key = dedupe_key or f"{kind}:{json.dumps(params, sort_keys=True)}"
+        job_id = uuid.uuid4().hex
+        try:
+            with session_scope() as session:
+                session.add(Job(
+                    id=job_id,
+                    kind=kind,
+                    params=json.dumps(params, ensure_ascii=False),
+                    dedupe_key=dedupe_key,
+                    active_key=dedupe_key,
+                    status='queued',
+                    message='Queued',
+                    created_at=datetime.now(),
+                ))
+        except IntegrityError:
+            existing = self.find_active(dedupe_key)
+            if existing:
+                return existing, False
+            raise
+        job = self.get(job_id)
+        _wake_workers()
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        self.ensure_schema()
+        with session_scope() as session:
+            job = session.get(Job, job_id)
+            return _job_to_dict(job) if job else None
+
+    def find_active(self, dedupe_key: str) -> Optional[Dict]:
+        self.ensure_schema()
+        with session_scope() as session:
+            job = session.scalars(select(Job).where(Job.active_key == dedupe_key)).first()
+            return _job_to_dict(job) if job else None
+
+    def list(self, kind_prefix: str = None, status: str = None, limit: int = 20) -> List[Dict]:
+        self.ensure_schema()
+        stmt = select(Job)
+        if kind_prefix:
+            stmt = stmt.where(Job.kind.startswith(kind_prefix))
+        if status:
+            stmt = stmt.where(Job.status == status)
+        stmt = stmt.order_by(Job.created_at.desc()).limit(limit)
+        with session_scope() as session:
+            return [_job_to_dict(j) for j in session.scalars(stmt).all()]
+
+    def latest(self, kind_prefix: str) -> Optional[Dict]:
+        """가장 최근 작업 (진행 중 작업 우선)"""
+        self.ensure_schema()
+        with session_scope() as session:
+            job = session.scalars(
+                select(Job)
+                .where(Job.kind.startswith(kind_prefix), Job.status.in_(ACTIVE_STATUSES))
+                .order_by(Job.created_at.desc())
+            ).first()
+            if job is None:
+                job = session.scalars(
+                    select(Job).where(Job.kind.startswith(kind_prefix)).order_by(Job.created_at.desc())
+                ).first()
+            return _job_to_dict(job) if job else None
+
+    # === 워커 측 ===
+    def claim(self, worker_id: str) -> Optional[Dict]:
+        """대기 작업 1개 선점 (조건부 UPDATE로 원자적)"""
+        self.ensure_schema()
+        kinds = list(_handlers)
+        if not kinds:
+            return None
+        with session_scope() as session:
+            candidates = session.scalars(
+                select(Job.id)
+                .where(Job.status == 'queued', Job.kind.in_(kinds))
+                .order_by(Job.created_at)
+                .limit(5)
+            ).all()
+            now = datetime.now()
+            for job_id in candidates:
+                res = session.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.status == 'queued')
+                    .values(status='running', worker_id=worker_id, started_at=now, heartbeat_at=now,
+                            message='Started')
+                )
+                if res.rowcount == 1:
+                    session.commit()
+                    return _job_to_dict(session.get(Job, job_id))
+        return None
+
+    def update_progress(self, job_id: str, message: str = None, progress: int = None) -> bool:
+        """진행 상황 갱신 + heartbeat. 취소 요청 여부 반환"""
+        values = {'heartbeat_at': datetime.now()}
+        if message is not None:
+            values['message'] = message
+        if progress is not None:
+            values['progress'] = max(0, min(100, int(progress)))
+        with session_scope() as session:
+            session.execute(update(Job).where(Job.id == job_id).values(**values))
+            job = session.get(Job, job_id)
+            return bool(job and job.cancel_requested)
+
+    def finish(self, job_id: str, status: str, message: str = '', result: Dict = None, error: str = None):
+        """작업 종료 (active_key 해제 → 같은 작업 재등록 가능)"""
+        values = {
+            'status': status,
+            'message': message,
+            'active_key': None,
+            'finished_at': datetime.now(),
+            'error': error,
+        }
+        if status == 'succeeded':
+            values['progress'] = 100
+        if result is not None:
+            values['result'] = json.dumps(result, ensure_ascii=False, default=str)
+        with session_scope() as session:
+            session.execute(update(Job).where(Job.id == job_id).values(**values))
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """대기 중이면 즉시 취소, 실행 중이면 취소 요청 표시"""
+        self.ensure_schema()
+        with session_scope() as session:
+            session.execute(
+                update(Job).where(Job.id == job_id, Job.status == 'queued')
+                .values(status='cancelled', active_key=None, finished_at=datetime.now(), message='Cancelled')
+            )
+            session.execute(
+                update(Job).where(Job.id == job_id, Job.status == 'running').values(cancel_requested=True)
+            )
+        return self.get(job_id)
+
+    def cancel_active(self, kind_prefix: str) -> int:
+        """해당 종류의 진행 중 작업 전부 취소"""
+        jobs = [j for j in self.list(kind_prefix, limit=50) if j['status'] in ACTIVE_STATUSES]
+        for job in jobs:
+            self.cancel(job['id'])
+        return len(jobs)
+
+    def fail_stale(self, timeout_seconds: int) -> int:
+        """heartbeat가 끊긴 실행 작업 정리 (워커 프로세스 종료 등)"""
+        self.ensure_schema()
+        limit = datetime.now() - timedelta(seconds=timeout_seconds)
+        with session_scope() as session:
+            res = session.execute(
+                update(Job).where(Job.status == 'running', Job.heartbeat_at < limit)
+                .values(status='failed', active_key=None, finished_at=datetime.now(),
+                        error='worker lost (heartbeat timeout)', message='Worker lost')
+            )
+            return res.rowcount or 0
+
+
+class JobContext:
+    """핸들러에 전달되는 실행 컨텍스트"""
+
+    def __init__(self, queue: JobQueue, job: Dict):
+        self.queue = queue
+        self.job = job
+        self.job_id = job['id']
+        self._cancelled = False
+
+    def progress(self, message: str = None, percent: int = None):
+        """진행 상황 보고 (취소 요청 감지 시 플래그 설정)"""
+        if self.queue.update_progress(self.job_id, message, percent):
+            self._cancelled = True
+
+    def cancelled(self) -> bool:
+        if not self._cancelled:
+            job = self.queue.get(self.job_id)
+            self._cancelled = bool(job and job['cancel_requested'])
+        return self._cancelled
+
+    def check_cancelled(self):
+        """체크포인트: 취소 요청 시 JobCancelled"""
+        if self.cancelled():
+            raise JobCancelled()
+
+
+def job_lock(dedupe_key: str, timeout: Optional[float] = None) -> FileLock:
+    """dedupe_key 단위 프로세스 간 락 (예: 'kr.screener')"""
+    name = re.sub(r'[^A-Za-z0-9._-]', '_', f"job.{dedupe_key}")[:120]
+    return FileLock(name, timeout=timeout)
+
+
+def run_job(queue: JobQueue, job: Dict):
+    """작업 1개 실행"""
+    handler = _handlers.get(job['kind'])
+    if handler is None:
+        queue.finish(job['id'], 'failed', 'No handler', error=f"unknown job kind: {job['kind']}")
+        return
+
+    ctx = JobContext(queue, job)
+    heartbeat_stop = threading.Event()
+
+    def _heartbeat():
+        # 긴 단계에서도 heartbeat 유지 (stale 판정 방지)
+        while not heartbeat_stop.wait(HEARTBEAT_SECONDS):
+            try:
+                queue.update_progress(job['id'])
+            except Exception:
+                pass
+
+    threading.Thread(target=_heartbeat, daemon=True).start()
+    lock = job_lock(job['dedupe_key'] or job['id'])
+    try:
+        if not lock.acquire(timeout=0):
+            ctx.progress("Waiting for another run to finish...")
+            while not lock.acquire(timeout=HEARTBEAT_SECONDS):
+                ctx.check_cancelled()
+        # '_'로 시작하는 파라미터는 표시용 메타데이터 (핸들러에 전달 안 함)
+        params = {k: v for k, v in job['params'].items() if not k.startswith('_')}
+        result = handler(ctx, **params)
+        if isinstance(result, dict) and result.get('status') == 'error':
+            queue.finish(job['id'], 'failed', result.get('message', 'Error'), result=result,
+                         error=result.get('message'))
+        else:
+            message = result.get('message', 'Completed') if isinstance(result, dict) else 'Completed'
+            queue.finish(job['id'], 'succeeded', message, result=result)
+    except JobCancelled:
+        queue.finish(job['id'], 'cancelled', 'Cancelled')
+    except Exception as e:
+        traceback.print_exc()
+        queue.finish(job['id'], 'failed', f"Error: {e}", error=traceback.format_exc())
+    finally:
+        lock.release()
+        heartbeat_stop.set()
+
+
+# === 워커 풀 ===
+HEARTBEAT_SECONDS = 15
+STALE_SECONDS = 180
+POLL_SECONDS = 2.0
+
+_wake = threading.Event()
+
+
+def _wake_workers():
+    _wake.set()
+
+
+class WorkerPool:
+    """작업 큐 폴링 워커 스레드 묶음"""
+
+    def __init__(self, queue: JobQueue, size: int = 1):
+        self.queue = queue
+        self.size = max(1, size)
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._threads:
+            return
+        for i in range(self.size):
+            t = threading.Thread(target=self._loop, args=(f"{self.worker_prefix}:{i}",),
+                                 name=f'job-worker-{i}', daemon=True)
+            t.start()
+            self._threads.append(t)
+        print(f"[Jobs] 워커 {self.size}개 시작 ({self.worker_prefix})")
+
+    def stop(self):
+        self._stop.set()
+        _wake.set()
+
+    def _loop(self, worker_id: str):
+        while not self._stop.is_set():
+            try:
+                self.queue.fail_stale(STALE_SECONDS)
+                job = self.queue.claim(worker_id)
+            except Exception as e:
+                print(f"[Jobs] 큐 조회 실패: {e}")
+                job = None
+
+            if job is None:
+                _wake.wait(POLL_SECONDS)
+                _wake.clear()
+                continue
+
+            print(f"[Jobs] 실행: {job['kind']} ({job['id']})")
+            run_job(self.queue, job)
+
+
+_queue: Optional[JobQueue] = None
+_pool: Optional[WorkerPool] = None
+_init_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """프로세스 공유 JobQueue"""
+    global _queue
+    if _queue is None:
+        with _init_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
+
+
+def start_worker_pool(size: int = None) -> Optional[WorkerPool]:
+    """워커 풀 시작 (JOB_WORKERS=0 또는 JOB_WORKER_MODE=external 이면 웹 프로세스에서는 실행 안 함)"""
+    global _pool
+    if size is None:
+        if os.environ.get('JOB_WORKER_MODE', 'inline') == 'external':
+            return None
+        size = int(os.environ.get('JOB_WORKERS', '1'))
+    if size <= 0:
+        return None
+    queue = get_job_queue()   # _init_lock 은 재진입 불가 → 락 밖에서 먼저 생성
+    with _init_lock:
+        if _pool is None:
+            _pool = WorkerPool(queue, size)
+            _pool.start()
+    return _pool
+
+
+if __name__ == "__main__":
+    import sys
+
+    # 별도 워커 프로세스: python -m app.jobs worker [N]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'worker'
+    if command == 'worker':
+        from app import create_app
+        # -m 실행 시 이 파일은 __main__ 이라 라우트가 등록한 핸들러(app.jobs._handlers)가 보이지 않음
+        # → 핸들러가 등록된 app.jobs 모듈의 워커 풀을 시작
+        from app import jobs
+
+        os.environ['JOB_WORKER_MODE'] = 'external'   # create_app 내 인라인 풀 비활성화
+        create_app()                                  # 라우트 모듈 import → 핸들러 등록
+        size = int(sys.argv[2]) if len(sys.argv) > 2 else int(os.environ.get('JOB_WORKERS', '2'))
+        jobs.start_worker_pool(size)
+        print(f"[Jobs] 외부 워커 핸들러: {sorted(jobs._handlers)}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    else:
+        print("Usage: python -m app.jobs worker [N]")
@@ -0,0 +1,163 @@
+"""
+결과 저장소 테이블 정의
+- 일별 스크리너 실행 결과 (종가베팅 V2 / VCP, KR·JP)
+- 개별 시그널 (시장·날짜·종목·등급 인덱스)
+- Market Gate 스냅샷
+- OHLCV 기반 시그널 성과
+- SignalTracker 추적 시그널
+- 백그라운드 작업 큐
+- 저장소 마이그레이션 기록 (1회성 작업)
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import (
+    Boolean, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class DailyRun(db.Model):
+    """스크리너 일별 실행 결과 (JSON 원본 보관)"""
+    __tablename__ = 'daily_runs'
+    __table_args__ = (
+        UniqueConstraint('market', 'run_type', 'run_date', name='uq_daily_run'),
+        Index('ix_daily_run_market_type_date', 'market', 'run_type', 'run_date'),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    market: Mapped[str] = mapped_column(String(8))            # KR / JP / US
+    run_type: Mapped[str] = mapped_column(String(32))         # jongga_v2, jongga_v2_n225, vcp ...
+    run_date: Mapped[date] = mapped_column(Date)
+    generated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    total_candidates: Mapped[int] = mapped_column(Integer, default=0)
+    signal_count: Mapped[int] = mapped_column(Integer, default=0)
+    payload: Mapped[str] = mapped_column(Text)                # JSON 원본 (호환용 export)
+
+
+class SignalRecord(db.Model):
+    """개별 시그널"""
+    __tablename__ = 'signals'
+    __table_args__ = (
+        Index('ix_signal_market_date_code_grade', 'market', 'signal_date', 'code', 'grade'),
+        Index('ix_signal_code_date', 'code', 'signal_date'),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey('daily_runs.id', ondelete='CASCADE'), index=True)
+    market: Mapped[str] = mapped_column(String(8))
+    run_type: Mapped[str] = mapped_column(String(32))
+    signal_date: Mapped[date] = mapped_column(Date)
+    code: Mapped[str] = mapped_column(String(16))
+    name: Mapped[str] = mapped_column(String(128), default='')
+    exchange: Mapped[str] = mapped_column(String(16), default='')   # KOSPI / KOSDAQ / TSE
+    grade: Mapped[str] = mapped_column(String(4), default='')
+    score: Mapped[float] = mapped_column(Float, default=0.0)
+    entry_price: Mapped[float] = mapped_column(Float, default=0.0)
+    change_pct: Mapped[float] = mapped_column(Float, default=0.0)
+    payload: Mapped[str] = mapped_column(Text)
+
+
+class MarketGateSnapshot(db.Model):
+    """Market Gate 일별 스냅샷"""
+    __tablename__ = 'market_gate_snapshots'
+    __table_args__ = (
+        UniqueConstraint('market', 'snapshot_date', name='uq_market_gate_snapshot'),
+        Index('ix_market_gate_market_date', 'market', 'snapshot_date'),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    market: Mapped[str] = mapped_column(String(8))
+    snapshot_date: Mapped[date] = mapped_column(Date)
+    status: Mapped[str] = mapped_column(String(16), default='NEUTRAL')
+    score: Mapped[float] = mapped_column(Float, default=50.0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    payload: Mapped[str] = mapped_column(Text)
+
+
+class SignalPerformance(db.Model):
+    """시그널 이후 주가 성과 (OHLCV 기반)"""
+    __tablename__ = 'signal_performance'
+    __table_args__ = (
+        UniqueConstraint('market', 'run_type', 'signal_date', 'code', name='uq_signal_performance'),
+        Index('ix_perf_market_date_code_grade', 'market', 'signal_date', 'code', 'grade'),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    market: Mapped[str] = mapped_column(String(8))
+    run_type: Mapped[str] = mapped_column(String(32))
+    signal_date: Mapped[date] = mapped_column(Date)
+    code: Mapped[str] = mapped_column(String(16))
+    grade: Mapped[str] = mapped_column(String(4), default='')
+    entry_price: Mapped[float] = mapped_column(Float, default=0.0)
+    ret_1d: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    ret_3d: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    ret_5d: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    ret_10d: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    mfe_pct: Mapped[Optional[float]] = mapped_column(Float, nullable=True)   # 최대 유리 변동
+    mae_pct: Mapped[Optional[float]] = mapped_column(Float, nullable=True)   # 최대 불리 변동
+    is_final: Mapped[bool] = mapped_column(default=False)                   # 모든 기간 확정 여부
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
+class TrackedSignal(db.Model):
+    """SignalTracker 추적 시그널 (signals_log.csv 대응)"""
+    __tablename__ = 'tracked_signals'
+    __table_args__ = (
+        UniqueConstraint('ticker', 'signal_date', name='uq_tracked_signal'),
+        Index('ix_tracked_market_date_ticker_status', 'market', 'signal_date', 'ticker', 'status'),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ticker: Mapped[str] = mapped_column(String(16))
+    name: Mapped[str] = mapped_column(String(128), default='')
+    market: Mapped[str] = mapped_column(String(8), default='KOSPI')
+    signal_date: Mapped[date] = mapped_column(Date)
+    status: Mapped[str] = mapped_column(String(16), default='OPEN')
+    score: Mapped[float] = mapped_column(Float, default=0.0)
+    entry_price: Mapped[float] = mapped_column(Float, default=0.0)
+    current_price: Mapped[float] = mapped_column(Float, default=0.0)
+    return_pct: Mapped[float] = mapped_column(Float, default=0.0)
+    exit_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    exit_price: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    exit_reason: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    payload: Mapped[str] = mapped_column(Text, default='{}')
+
+
+class StoreMigration(db.Model):
+    """1회성 저장소 작업 기록 (JSON 히스토리 적재 등) - 행이 있으면 이미 적용"""
+    __tablename__ = 'store_migrations'
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    applied_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
+class Job(db.Model):
+    """백그라운드 작업 (스크리너 실행 등)"""
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        # 진행 중(queued/running) 작업만 active_key를 가짐 → 프로세스 간 중복 실행 방지
+        UniqueConstraint('active_key', name='uq_job_active_key'),
+        Index('ix_job_status_created', 'status', 'created_at'),
+        Index('ix_job_kind_created', 'kind', 'created_at'),
+    )
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(64))                 # kr.jongga_v2, jp.vcp ...
+    params: Mapped[str] = mapped_column(Text, default='{}')
+    dedupe_key: Mapped[str] = mapped_column(String(128))
+    active_key: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    status: Mapped[str] = mapped_column(String(16), default='queued')   # queued/running/succeeded/failed/cancelled
+    progress: Mapped[int] = mapped_column(Integer, default=0)
+    message: Mapped[str] = mapped_column(Text, default='')
+    result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # 결과 파일/DB 위치 (JSON)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False)
+    worker_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
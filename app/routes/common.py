@@ -50,6 +50,13 @@ def db_check():
     return jsonify(status)
 
 
+@common_bp.route('/startup')
+def startup_metrics():
+    """시작 프로파일 (create_app 단계별 시간, 워밍업 import 시간, 무거운 모듈 로드 여부)"""
+    from app.startup import startup_report
+    return jsonify(startup_report())
+
+
 @common_bp.route('/portfolio')
 def get_portfolio_data():
     """포트폴리오 데이터"""
@@ -159,3 +166,104 @@ def get_data_status():
     return jsonify({
         'files': files_status,
     })
+
+
+@common_bp.route('/stream')
+def event_stream():
+    """SSE 스트림 (스크리너 진행 상황 + 실시간 시세)
+
+    Query:
+        channels: 구독 채널 (기본 kr_screener,jp_screener,quotes)
+        kr: 시세 구독 KR 종목코드 (콤마 구분)
+        jp: 시세 구독 JP 종목코드 (콤마 구분)
+    """
+    from flask import Response, stream_with_context
+    from app.utils.events import broker
+
+    channels = request.args.get('channels', 'kr_screener,jp_screener,quotes').split(',')
+    watch = {}
+    for market in ('kr', 'jp'):
+        codes = {c.strip() for c in request.args.get(market, '').split(',') if c.strip()}
+        if codes:
+            watch[market.upper()] = codes
+
+    sub = broker.subscribe([c.strip() for c in channels if c.strip()], watch)
+    return Response(
+        stream_with_context(sub.stream()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',  # 프록시 버퍼링 해제
+        }
+    )
+
+
+@common_bp.route('/jobs')
+def list_jobs():
+    """백그라운드 작업 목록
+
+    Query:
+        kind: 작업 종류 prefix (예: kr., jp.vcp)
+        status: queued / running / succeeded / failed / cancelled
+        limit: 최대 개수 (기본 20)
+    """
+    from app.jobs import get_job_queue
+
+    jobs = get_job_queue().list(
+        kind_prefix=request.args.get('kind'),
+        status=request.args.get('status'),
+        limit=min(int(request.args.get('limit', 20)), 200),
+    )
+    return jsonify({'jobs': jobs})
+
+
+@common_bp.route('/jobs/<job_id>')
+def get_job(job_id):
+    """작업 상태 / 진행률 / 결과 포인터"""
+    from app.jobs import get_job_queue
+
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+
+@common_bp.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """작업 취소 (대기 중이면 즉시, 실행 중이면 다음 체크포인트에서)"""
+    from app.jobs import get_job_queue
+
+    job = get_job_queue().cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+
+@common_bp.route('/market-gate/refresh', methods=['POST'])
+def refresh_all_market_gates():
+    """KR/JP/US Market Gate 동시 갱신 (전체 심볼 다운로드 1회)
+
+    Query:
+        markets: 갱신할 시장 (기본 KR,JP,US)
+    """
+    from engine.market_gate import GATE_SPECS, compute_market_gates
+    from app.routes import kr_market, jp_market, us_market
+
+    refreshers = {'KR': kr_market, 'JP': jp_market, 'US': us_market}
+    markets = [m.strip().upper() for m in request.args.get('markets', 'KR,JP,US').split(',')]
+    markets = [m for m in markets if m in GATE_SPECS]
+    if not markets:
+        return jsonify({'error': 'No valid markets'}), 400
+
+    try:
+        payloads = compute_market_gates(markets)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+    results = {}
+    for market in markets:
+        try:
+            results[market] = refreshers[market].refresh_market_gate(payloads[market])
+        except Exception as e:
+            results[market] = {**payloads[market], 'error': f'save failed: {e}'}
+    return jsonify(results)
@@ -7,11 +7,15 @@ import traceback
 import re
 from datetime import datetime, date
 import glob
-import pandas as pd
-import yfinance as yf
 from flask import Blueprint, jsonify, request, current_app
+from app.store import (
+    record_run, record_market_gate, stored_dates, stored_run, stored_gate_dates, stored_gate
+)
+from engine.persist import save_daily_and_latest, save_scan_result
+from engine.locks import load_json_if_newer, single_flight
+from app.utils.events import tail_job_status
+from app.jobs import ACTIVE_STATUSES, JobCancelled, get_job_queue, job_handler
 
-import threading
 import time
 
 jp_bp = Blueprint('jp', __name__)
@@ -19,40 +23,39 @@ jp_bp = Blueprint('jp', __name__)
 
 # --- Screener Status Management ---
 class JPScreenerManager:
-    def __init__(self):
-        self.is_running = False
-        self.current_task = None
-        self.start_time = None
-        self.message = ""
-        self.lock = threading.Lock()
-
-    def start(self, task_name):
-        with self.lock:
-            if self.is_running:
-                return False
-            self.is_running = True
-            self.current_task = task_name
-            self.start_time = datetime.now()
-            self.message = f"Starting {task_name}..."
-            return True
-
-    def update_message(self, msg):
-        with self.lock:
-            self.message = msg
-
-    def stop(self, msg="Completed"):
-        with self.lock:
-            self.is_running = False
-            self.current_task = None
-            self.message = msg
+    """스크리너 실행 상태 (작업 큐 기반 - gunicorn 워커 간 공유)"""
+
+    def __init__(self, market='jp'):
+        self.market = market
+        self.kind_prefix = f"{market}."
+        self.dedupe_key = f"{market}.screener"  # 동시에 1개만
+
+    def submit(self, kind, task_name, params=None):
+        """작업 등록 -> (job, created). 이미 실행 중이면 created=False"""
+        params = dict(params or {}, _task=task_name)
+        return get_job_queue().submit(kind, params, dedupe_key=self.dedupe_key)
+
+    def reset(self):
+        return get_job_queue().cancel_active(self.kind_prefix)
+
+    def status(self, job=None):
+        job = job or get_job_queue().latest(self.kind_prefix)
+        if not job:
+            return {"isRunning": False, "task": None, "message": "", "startTime": None}
+        running = job['status'] in ACTIVE_STATUSES
+        return {
+            "isRunning": running,
+            "task": job['params'].get('_task') if running else None,
+            "message": job['message'],
+            "startTime": job['started_at'] or job['created_at'],
+            "jobId": job['id'],
+            "status": job['status'],
+            "progress": job['progress'],
+        }
 
 
 jp_screener_manager = JPScreenerManager()
-# Force reset on import (ensures clean state after server restart)
-jp_screener_manager.is_running = False
-jp_screener_manager.current_task = None
-jp_screener_manager.start_time = None
-jp_screener_manager.message = ""
+tail_job_status('jp_screener', jp_screener_manager.status)
 
 
 def get_jp_data_dir():
@@ -72,22 +75,43 @@ def get_jp_data_dir():
 @jp_bp.route('/screener/status')
 def get_screener_status():
     """스크리너 실행 상태 조회"""
-    return jsonify({
-        "isRunning": jp_screener_manager.is_running,
-        "task": jp_screener_manager.current_task,
-        "message": jp_screener_manager.message,
-        "startTime": jp_screener_manager.start_time.isoformat() if jp_screener_manager.start_time else None
-    })
+    return jsonify(jp_screener_manager.status())
 
 
 @jp_bp.route('/screener/reset', methods=['POST'])
 def reset_screener_status():
     """스크리너 상태 강제 리셋"""
-    jp_screener_manager.stop("Reset by user")
-    return jsonify({"status": "ok", "message": "Screener status reset"})
+    cancelled = jp_screener_manager.reset()
+    return jsonify({"status": "ok", "message": "Screener status reset", "cancelled": cancelled})
 
 
 # === Market Gate ===
+def _refresh_jp_market_gate(data_dir, latest_file, result_data=None):
+    """JP Market Gate 실시간 계산 + 저장 (result_data: 일괄 계산된 결과 재사용)"""
+    if result_data is None:
+        from engine.market_gate import compute_market_gate
+        result_data = compute_market_gate('JP')
+    
+    # 일자별 백업 + 캐시 저장
+    today_str = date.today().strftime('%Y%m%d')
+    daily_file = os.path.join(data_dir, f'market_gate_{today_str}.json')
+    save_daily_and_latest(daily_file, latest_file, result_data)
+    record_market_gate('JP', date.today(), result_data)
+
+    return result_data
+
+
+def refresh_market_gate(result_data=None):
+    """JP Market Gate 갱신 (프로세스 간 single-flight)"""
+    data_dir = get_jp_data_dir()
+    latest_file = os.path.join(data_dir, 'market_gate_latest.json')
+    return single_flight(
+        'market_gate.jp',
+        lambda: _refresh_jp_market_gate(data_dir, latest_file, result_data),
+        lambda since: load_json_if_newer(latest_file, since),
+    )
+
+
 @jp_bp.route('/market-gate')
 def jp_market_gate():
     """JP Market Gate 상태 (Nikkei 225 / TOPIX 기반)"""
@@ -102,107 +126,8 @@ def jp_market_gate():
                 cached_data = json.load(f)
             return jsonify(cached_data)
         
-        # 실시간 데이터 조회 (yfinance)
-        # ^N225 for Nikkei, 1306.T ETF for TOPIX (^TPX doesn't work)
-        nikkei = yf.Ticker("^N225")
-        topix_etf = yf.Ticker("1306.T")  # TOPIX連動型ETF (^TPX는 yfinance에서 작동 안함)
-        
-        nikkei_hist = nikkei.history(period="5d")
-        topix_hist = topix_etf.history(period="5d")
-        
-        nikkei_close = float(nikkei_hist['Close'].iloc[-1]) if not nikkei_hist.empty else 0
-        nikkei_prev = float(nikkei_hist['Close'].iloc[-2]) if len(nikkei_hist) > 1 else nikkei_close
-        nikkei_change_pct = ((nikkei_close - nikkei_prev) / nikkei_prev * 100) if nikkei_prev > 0 else 0
-        
-        # TOPIX ETF 가격 (실제 TOPIX 지수는 ETF 가격 * 약간의 비율이지만, 변동률은 동일)
-        topix_etf_close = float(topix_hist['Close'].iloc[-1]) if not topix_hist.empty else 0
-        topix_etf_prev = float(topix_hist['Close'].iloc[-2]) if len(topix_hist) > 1 else topix_etf_close
-        topix_change_pct = ((topix_etf_close - topix_etf_prev) / topix_etf_prev * 100) if topix_etf_prev > 0 else 0
-        # TOPIX ETF 가격을 대략적인 TOPIX 지수로 환산 (ETF 가격 ≈ TOPIX / 10)
-        topix_close = topix_etf_close * 0.7  # 대략적인 환산 (1306.T 기준)
-        
-        # 점수 계산 (간단한 버전)
-        avg_change = (nikkei_change_pct + topix_change_pct) / 2
-        if avg_change >= 1.5:
-            status = 'GREEN'
-            score = min(100, int(50 + avg_change * 10))
-            label = 'BULLISH'
-        elif avg_change <= -1.5:
-            status = 'RED'
-            score = max(0, int(50 + avg_change * 10))
-            label = 'BEARISH'
-        else:
-            status = 'YELLOW'
-            score = int(50 + avg_change * 5)
-            label = 'NEUTRAL'
-        
-        # 섹터 데이터 (일본 주요 섹터 ETF)
-        sectors_data = []
-        sector_etfs = [
-            # 주요 지수 ETF
-            ("1321.T", "닛케이225", "index"),      # NEXT FUNDS 日経225連動型ETF
-            ("1306.T", "TOPIX", "index"),          # TOPIX連動型ETF
-            # 섹터별 ETF
-            ("1617.T", "식품", "sector"),           # NOMURA 食品
-            ("1618.T", "에너지", "sector"),         # NOMURA エネルギー資源
-            ("1619.T", "건설", "sector"),           # NOMURA 建設・資材
-            ("1620.T", "소재", "sector"),           # NOMURA 素材・化学
-            ("1621.T", "의료", "sector"),           # NOMURA 医薬品
-            ("1625.T", "은행", "sector"),           # NOMURA 銀行
-            ("1628.T", "운송", "sector"),           # NOMURA 運輸・物流
-            ("1633.T", "전자", "sector"),           # NOMURA 電機・精密
-        ]
-        
-        for ticker, name, stype in sector_etfs:
-            try:
-                etf = yf.Ticker(ticker)
-                hist = etf.history(period="5d")
-                if not hist.empty and len(hist) >= 2:
-                    close = float(hist['Close'].iloc[-1])
-                    prev = float(hist['Close'].iloc[-2])
-                    change = ((close - prev) / prev * 100) if prev > 0 else 0
-                    sectors_data.append({
-                        'name': name,
-                        'signal': 'bullish' if change > 0 else 'bearish',
-                        'change_pct': round(change, 2),
-                        'score': int(50 + change * 5)
-                    })
-            except:
-                continue
-        
-        reasons = []
-        if nikkei_change_pct > 0:
-            reasons.append(f"日経225 +{nikkei_change_pct:.2f}%")
-        else:
-            reasons.append(f"日経225 {nikkei_change_pct:.2f}%")
-        if topix_change_pct > 0:
-            reasons.append(f"TOPIX +{topix_change_pct:.2f}%")
-        else:
-            reasons.append(f"TOPIX {topix_change_pct:.2f}%")
-        
-        result_data = {
-            'status': status,
-            'score': score,
-            'label': label,
-            'reasons': reasons,
-            'sectors': sectors_data,
-            'metrics': {},
-            'nikkei_close': round(nikkei_close, 2),
-            'nikkei_change_pct': round(nikkei_change_pct, 2),
-            'topix_close': round(topix_close, 2),
-            'topix_change_pct': round(topix_change_pct, 2),
-            'updated_at': datetime.now().isoformat()
-        }
-        
-        # 캐시에 저장
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
-        
-        # 일자별 백업
-        today_str = date.today().strftime('%Y%m%d')
-        daily_file = os.path.join(data_dir, f'market_gate_{today_str}.json')
-        with open(daily_file, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
+        # 실시간 데이터 조회 (동시 요청/다른 워커와 1회로 합침)
+        result_data = refresh_market_gate()
         
         return jsonify(result_data)
         
@@ -222,7 +147,13 @@ def get_market_gate_dates():
     """Market Gate 데이터가 존재하는 날짜 목록"""
     try:
         data_dir = get_jp_data_dir()
-        files = glob.glob(os.path.join(data_dir, 'market_gate_*.json'))
+        pattern = os.path.join(data_dir, 'market_gate_*.json')
+        dates = stored_gate_dates('JP', pattern)
+        if dates:
+            return jsonify(dates)
+        
+        # DB 미사용 시 파일 스캔 폴백
+        files = glob.glob(pattern)
         
         dates = []
         for f in files:
@@ -251,6 +182,11 @@ def get_market_gate_history(date_str):
         filename = f"market_gate_{date_str}.json"
         file_path = os.path.join(data_dir, filename)
         
+        # DB 우선 (DB 기록 이후 파일이 다시 저장됐으면 파일)
+        data = stored_gate('JP', date_str, file_path)
+        if data is not None:
+            return jsonify(data)
+        
         if not os.path.exists(file_path):
             return jsonify({"error": "Data not found"}), 404
         
@@ -323,7 +259,15 @@ def get_jongga_v2_dates():
         data_dir = get_jp_data_dir()
         prefix = 'jongga_v2_n400_' if signal_type == 'n400' else 'jongga_v2_n225_'
         
-        files = glob.glob(os.path.join(data_dir, f'{prefix}results_*.json'))
+        pattern = os.path.join(data_dir, f'{prefix}results_*.json')
+        dates = stored_dates('JP', f"jongga_v2_{'n400' if signal_type == 'n400' else 'n225'}", pattern)
+        if signal_type == 'n225':
+            dates += stored_dates('JP', 'jongga_v2')  # legacy
+        if dates:
+            return jsonify(sorted(set(dates), reverse=True))
+        
+        # DB 미사용 시 파일 스캔 폴백
+        files = glob.glob(pattern)
         
         dates = []
         for f in files:
@@ -363,13 +307,21 @@ def get_jongga_v2_history(date_str):
         if '-' in date_str:
             date_str = date_str.replace('-', '')
         
+        run_type = 'jongga_v2_n400' if signal_type == 'n400' else 'jongga_v2_n225'
         prefix = 'jongga_v2_n400_' if signal_type == 'n400' else 'jongga_v2_n225_'
         filename = f"{prefix}results_{date_str}.json"
         file_path = os.path.join(data_dir, filename)
+        legacy_path = os.path.join(data_dir, f"jongga_v2_results_{date_str}.json")
+        
+        # DB 우선 (DB 기록 이후 파일이 다시 저장됐으면 파일)
+        data = stored_run('JP', run_type, date_str, file_path)
+        if data is None and signal_type == 'n225' and not os.path.exists(file_path):
+            data = stored_run('JP', 'jongga_v2', date_str, legacy_path)  # legacy
+        if data is not None:
+            return jsonify(data)
         
         # Fallback
         if not os.path.exists(file_path) and signal_type == 'n225':
-             legacy_path = os.path.join(data_dir, f"jongga_v2_results_{date_str}.json")
              if os.path.exists(legacy_path):
                  file_path = legacy_path
         
@@ -386,221 +338,246 @@ def get_jongga_v2_history(date_str):
 
 @jp_bp.route('/jongga-v2/run', methods=['POST'])
 def run_jongga_v2():
-    """일본 종가베팅 스크리너 실행 (Background) - Supports n225, n400, or all"""
+    """일본 종가베팅 스크리너 실행 (Background Job) - Supports n225, n400, or all"""
     run_type = request.args.get('type', 'all')  # n225, n400, all
+    # force=true: Market Gate RED 에서도 전체 스캔
+    force = request.args.get('force', 'false').lower() == 'true'
     
     task_name = f"JP_ClosingBet_{run_type.upper()}"
-    if not jp_screener_manager.start(task_name):
-        return jsonify({"status": "error", "message": "Already running"}), 409
+    job, created = jp_screener_manager.submit(
+        'jp.jongga_v2', task_name, {'target_type': run_type, 'gate_aware': not force}
+    )
+    if not created:
+        return jsonify({"status": "error", "message": "Already running", "job_id": job['id']}), 409
 
-    def _run_task(target_type):
-        try:
-            import asyncio
-            from engine.jp_collectors import JPXCollector, YahooJapanNewsCollector
-            from engine.jp_config import JPSignalConfig
-            from engine.scorer import Scorer
-            # from engine.models import Signal # Unused
-            from engine.jp_stock_list import get_n225_list
-            
-            # Identify N225 Set for checking
-            n225_stocks = get_n225_list()
-            n225_codes = set([s[0] for s in n225_stocks]) # "6501.T"
-            
-            data_dir = get_jp_data_dir()
-            
-            base_msg = "JPX Nikkei 400"
-            if target_type == 'n225': base_msg = "Nikkei 225"
-            elif target_type == 'n400': base_msg = "Nikkei 400 (Excl)"
-            
-            jp_screener_manager.update_message(f"Scanning {base_msg} stocks...")
+    return jsonify({
+        "status": "accepted",
+        "message": f"JP Screening ({run_type}) started in background",
+        "job_id": job['id']
+    }), 202
+
+
+@job_handler('jp.jongga_v2')
+def _run_jongga_v2_job(ctx, target_type='all', gate_aware=True):
+    try:
+        import asyncio
+        from engine.jp_collectors import JPXCollector, YahooJapanNewsCollector
+        from engine.jp_config import JPSignalConfig
+        from engine.scorer import Scorer
+        # from engine.models import Signal # Unused
+        from engine.jp_stock_list import get_n225_codes
+        from engine.market_gate import is_gate_red
+        
+        # Identify N225 Set for checking
+        n225_codes = get_n225_codes() # "6501.T"
+        
+        data_dir = get_jp_data_dir()
+        
+        base_msg = "JPX Nikkei 400"
+        if target_type == 'n225': base_msg = "Nikkei 225"
+        elif target_type == 'n400': base_msg = "Nikkei 400 (Excl)"
+        
+        ctx.progress(f"Scanning {base_msg} stocks...", 0)
+        
+        # 비동기 실행
+        async def run_screening():
+            signals_n225 = []
+            signals_n400 = []
             
-            # 비동기 실행
-            async def run_screening():
-                signals_n225 = []
-                signals_n400 = []
-                
-                async with JPXCollector() as collector:
-                    async with YahooJapanNewsCollector() as news_collector:
-                        # JPX Nikkei 400 전체 종목 대상
-                        # Always get full list first (optimized in collector)
-                        gainers = await collector.get_top_gainers(top_n=400)
-                        
-                        # Filter based on run_type
-                        filtered_gainers = []
-                        for g in gainers:
-                            g_code = g.code
-                            if not g_code.endswith('.T'):
-                                g_code = f"{g_code}.T"
-                            
-                            is_n225 = g_code in n225_codes
-                            
-                            if target_type == 'all':
-                                filtered_gainers.append(g)
-                            elif target_type == 'n225' and is_n225:
-                                filtered_gainers.append(g)
-                            elif target_type == 'n400' and not is_n225:
-                                filtered_gainers.append(g)
-                        
-                        jp_screener_manager.update_message(f"Found {len(filtered_gainers)} candidates for {target_type}, analyzing...")
+            async with JPXCollector() as collector:
+                async with YahooJapanNewsCollector() as news_collector:
+                    # JPX Nikkei 400 전체 종목 대상
+                    # Always get full list first (optimized in collector)
+                    gainers = await collector.get_top_gainers(top_n=400)
+                    
+                    # Filter based on run_type
+                    filtered_gainers = []
+                    for g in gainers:
+                        g_code = g.code
+                        if not g_code.endswith('.T'):
+                            g_code = f"{g_code}.T"
                         
-                        config = JPSignalConfig()
-                        scorer = Scorer()
+                        is_n225 = g_code in n225_codes
                         
-                        # --- 병렬 분석 함수 ---
-                        async def analyze_single_stock(stock):
-                            try:
-                                # 차트 데이터 (60일치)
-                                charts = await collector.get_chart_data(stock.code, days=60)
-                                if not charts or len(charts) < 20:
-                                    return None
-                                
-                                # 수급 데이터 (Zero for JP currently)
-                                supply = await collector.get_supply_data(stock.code)
-                                
-                                # 1차 점수 계산 (뉴스 없이) - 성능 최적화
-                                prelim_score, _ = scorer.calculate(stock, charts, [], supply)
-                                
-                                news = []
-                                # 1차 점수가 양호한 경우에만 뉴스 수집 (네트워크 병목 해소)
-                                # 기준: 4.0점 이상 (B급 진입 가능성)
-                                if prelim_score.total >= 4.0:
-                                    try:
-                                        # 뉴스 데이터 (Timeout 적용됨)
-                                        news = await news_collector.get_stock_news(
-                                            code=stock.code, 
-                                            limit=3, 
-                                            stock_name=stock.name
-                                        )
-                                    except Exception:
-                                        news = []
-                                
-                                # 최종 점수 계산 (뉴스 포함/미포함)
-                                score, checklist = scorer.calculate(stock, charts, news, supply)
-                                grade = scorer.determine_grade(stock, score)
-                                
-                                if grade.value in ['S', 'A', 'B']:
-                                    target_pct = {'S': 0.08, 'A': 0.05, 'B': 0.03}.get(grade.value, 0.03)
-                                    target_price = round(stock.close * (1 + target_pct))
-                                    
-                                    # Result Dict
-                                    return {
-                                        'code': stock.code,
-                                        'name': stock.name,
-                                        'sector': stock.sector,
-                                        'market': 'TSE',
-                                        'close': stock.close,
-                                        'change_pct': stock.change_pct,
-                                        'grade': grade.value,
-                                        'score': score.total, # Float now
-                                        'target_price': target_price,
-                                        'score_detail': {
-                                            'news': score.news,
-                                            'volume': score.volume,
-                                            'chart': score.chart,
-                                            'candle': score.candle,
-                                            'consolidation': score.consolidation,
-                                            'supply': score.supply,
-                                            'technical': score.technical,
-                                        },
-                                        'news': [{'title': n.title, 'source': n.source} for n in news[:3]],
-                                    }
-                                return None
-                            except Exception as e:
-                                print(f"Error analyzing {stock.code}: {e}")
+                        if target_type == 'all':
+                            filtered_gainers.append(g)
+                        elif target_type == 'n225' and is_n225:
+                            filtered_gainers.append(g)
+                        elif target_type == 'n400' and not is_n225:
+                            filtered_gainers.append(g)
+                    
+                    config = JPSignalConfig(gate_aware=gate_aware)
+                    scorer = Scorer()
+                    
+                    # Market Gate RED → 후보 축소 + 뉴스 수집 생략
+                    reduced_scan = config.gate_aware and is_gate_red('JP')
+                    if reduced_scan:
+                        filtered_gainers = filtered_gainers[:config.red_top_n]
+                        ctx.progress(f"Market Gate RED - reduced scan ({len(filtered_gainers)} candidates, no news)", 5)
+                    
+                    ctx.progress(f"Found {len(filtered_gainers)} candidates for {target_type}, analyzing...", 5)
+                    
+                    # --- 병렬 분석 함수 ---
+                    async def analyze_single_stock(stock):
+                        try:
+                            # 차트 데이터 (60일치)
+                            charts = await collector.get_chart_data(stock.code, days=60)
+                            if not charts or len(charts) < 20:
                                 return None
-
-                        # --- 배치 병렬 처리 ---
-                        batch_size = 20
-                        
-                        for i in range(0, len(filtered_gainers), batch_size):
-                            batch = filtered_gainers[i:i+batch_size]
                             
-                            progress = min(100, int((i / len(filtered_gainers)) * 100))
-                            jp_screener_manager.update_message(f"Analyzing {target_type}... {progress}% ({i}/{len(filtered_gainers)})")
+                            # 수급 데이터 (Zero for JP currently)
+                            supply = await collector.get_supply_data(stock.code)
                             
-                            tasks = [analyze_single_stock(stock) for stock in batch]
-                            results = await asyncio.gather(*tasks)
+                            # 1차 점수 계산 (뉴스 없이) - 성능 최적화
+                            prelim_score, _ = scorer.calculate(stock, charts, [], supply)
                             
-                            for res in results:
-                                if res:
-                                    # Split logic for correct list
-                                    code_clean = res['code']
-                                    code_full = f"{code_clean}.T"
-                                    
-                                    if code_full in n225_codes:
-                                        signals_n225.append(res)
-                                    else:
-                                        signals_n400.append(res)
+                            news = []
+                            # 1차 점수가 양호한 경우에만 뉴스 수집 (네트워크 병목 해소)
+                            # 기준: 4.0점 이상 (B급 진입 가능성)
+                            if prelim_score.total >= 4.0 and not reduced_scan:
+                                try:
+                                    # 뉴스 데이터 (Timeout 적용됨)
+                                    news = await news_collector.get_stock_news(
+                                        code=stock.code, 
+                                        limit=3, 
+                                        stock_name=stock.name
+                                    )
+                                except Exception:
+                                    news = []
                             
-                            await asyncio.sleep(0.5)
+                            # 최종 점수 계산 (뉴스 포함/미포함)
+                            score, checklist = scorer.calculate(stock, charts, news, supply)
+                            grade = scorer.determine_grade(stock, score)
                             
-                            # Explicit Memory Cleanup
-                            del results
-                            del tasks
-                            del batch
-                            import gc
-                            gc.collect()
-                
-                return signals_n225, signals_n400, len(filtered_gainers)
-            
-            signals_n225, signals_n400, total_scanned_count = asyncio.run(run_screening())
+                            if grade.value in ['S', 'A', 'B']:
+                                target_pct = {'S': 0.08, 'A': 0.05, 'B': 0.03}.get(grade.value, 0.03)
+                                target_price = round(stock.close * (1 + target_pct))
+                                
+                                # Result Dict
+                                return {
+                                    'code': stock.code,
+                                    'name': stock.name,
+                                    'sector': stock.sector,
+                                    'market': 'TSE',
+                                    'close': stock.close,
+                                    'change_pct': stock.change_pct,
+                                    'grade': grade.value,
+                                    'score': score.total, # Float now
+                                    'target_price': target_price,
+                                    'score_detail': {
+                                        'news': score.news,
+                                        'volume': score.volume,
+                                        'chart': score.chart,
+                                        'candle': score.candle,
+                                        'consolidation': score.consolidation,
+                                        'supply': score.supply,
+                                        'technical': score.technical,
+                                    },
+                                    'news': [{'title': n.title, 'source': n.source} for n in news[:3]],
+                                }
+                            return None
+                        except Exception as e:
+                            print(f"Error analyzing {stock.code}: {e}")
+                            return None
+
+                    # --- 배치 병렬 처리 ---
+                    batch_size = 20
+                    
+                    for i in range(0, len(filtered_gainers), batch_size):
+                        batch = filtered_gainers[i:i+batch_size]
+                        
+                        progress = min(100, int((i / len(filtered_gainers)) * 100))
+                        ctx.progress(f"Analyzing {target_type}... {progress}% ({i}/{len(filtered_gainers)})", progress)
+                        ctx.check_cancelled()
+                        
+                        tasks = [analyze_single_stock(stock) for stock in batch]
+                        results = await asyncio.gather(*tasks)
+                        
+                        for res in results:
+                            if res:
+                                # Split logic for correct list
+                                code_clean = res['code']
+                                code_full = f"{code_clean}.T"
+                                
+                                if code_full in n225_codes:
+                                    signals_n225.append(res)
+                                else:
+                                    signals_n400.append(res)
+                        
+                        await asyncio.sleep(0.5)
+                        
+                        # Explicit Memory Cleanup
+                        del results
+                        del tasks
+                        del batch
+                        import gc
+                        gc.collect()
             
-            # --- Result Finalization (Top 30 Limit) ---
-            def finalize_signals(sig_list, filename_prefix, total_count_val):
-                 # Sort by Grade (S->A->B) then Score (Desc)
-                 grade_map = {'S': 3, 'A': 2, 'B': 1, 'C': 0}
-                 sorted_list = sorted(sig_list, key=lambda x: (grade_map.get(x['grade'], 0), x['score']), reverse=True)
-                 
-                 # Limit to Top 30
-                 final_list = sorted_list[:30]
-                 
-                 result_data = {
-                    "generated_at": datetime.now().isoformat(),
-                    "filtered_count": len(final_list),
-                    "total_scanned": total_count_val,
-                    "signals": final_list
-                 }
-                 
-                 # Save Files
-                 with open(os.path.join(data_dir, f'{filename_prefix}latest.json'), 'w', encoding='utf-8') as f:
-                     json.dump(result_data, f, ensure_ascii=False, indent=2)
+            return signals_n225, signals_n400, len(filtered_gainers), reduced_scan
+        
+        signals_n225, signals_n400, total_scanned_count, reduced_scan = asyncio.run(run_screening())
+        
+        # --- Result Finalization (Top 30 Limit) ---
+        def finalize_signals(sig_list, filename_prefix, total_count_val):
+             # Sort by Grade (S->A->B) then Score (Desc)
+             grade_map = {'S': 3, 'A': 2, 'B': 1, 'C': 0}
+             sorted_list = sorted(sig_list, key=lambda x: (grade_map.get(x['grade'], 0), x['score']), reverse=True)
+             
+             # Limit to Top 30
+             final_list = sorted_list[:30]
+             
+             result_data = {
+                "generated_at": datetime.now().isoformat(),
+                "filtered_count": len(final_list),
+                "total_scanned": total_count_val,
+                "signals": final_list
+             }
+             
+             # Save Files (daily + latest hardlink, serialized once) - 축소 스캔은 같은 날 전체 결과를 덮어쓰지 않음
+             today_str = date.today().strftime('%Y%m%d')
+             saved_path, published = save_scan_result(
+                 os.path.join(data_dir, f'{filename_prefix}results_{today_str}.json'),
+                 os.path.join(data_dir, f'{filename_prefix}latest.json'),
+                 result_data, reduced_scan,
+             )
+             if published:
+                 record_run('JP', filename_prefix.rstrip('_'), date.today(), result_data)
+             result_files.append(saved_path)
                  
-                 today_str = date.today().strftime('%Y%m%d')
-                 with open(os.path.join(data_dir, f'{filename_prefix}results_{today_str}.json'), 'w', encoding='utf-8') as f:
-                     json.dump(result_data, f, ensure_ascii=False, indent=2)
-                     
-                 return len(final_list)
+             return len(final_list)
 
-            msg_parts = []
-            
-            if target_type in ['all', 'n225']:
-                count_n225 = finalize_signals(signals_n225, 'jongga_v2_n225_', total_scanned_count)
-                msg_parts.append(f"N225: {count_n225}/{total_scanned_count}")
-                
-            if target_type in ['all', 'n400']:
-                count_n400 = finalize_signals(signals_n400, 'jongga_v2_n400_', total_scanned_count)
-                msg_parts.append(f"Others: {count_n400}/{total_scanned_count}")
-            
-            jp_screener_manager.stop(f"Completed. {', '.join(msg_parts)}")
+        msg_parts = []
+        result_files = []
+        
+        if target_type in ['all', 'n225']:
+            count_n225 = finalize_signals(signals_n225, 'jongga_v2_n225_', total_scanned_count)
+            msg_parts.append(f"N225: {count_n225}/{total_scanned_count}")
             
-        except Exception as e:
-            error_msg = f"Error running JP screener: {str(e)}\n{traceback.format_exc()}"
-            print(error_msg)
-            # Log to file for persistence
-            try:
-                with open('jp_screener_error.log', 'w') as f:
-                    f.write(error_msg)
-            except:
-                pass
-            jp_screener_manager.stop(f"Error: {str(e)}")
-
-    thread = threading.Thread(target=_run_task, args=(run_type,))
-    thread.start()
+        if target_type in ['all', 'n400']:
+            count_n400 = finalize_signals(signals_n400, 'jongga_v2_n400_', total_scanned_count)
+            msg_parts.append(f"Others: {count_n400}/{total_scanned_count}")
+        
+        return {
+            "message": f"Completed. {', '.join(msg_parts)}" + (" (reduced scan)" if reduced_scan else ""),
+            "market": "JP",
+            "run_type": target_type,
+            "date": date.today().isoformat(),
+            "files": result_files
+        }
+        
+    except JobCancelled:
+        raise
+    except Exception as e:
+        error_msg = f"Error running JP screener: {str(e)}\n{traceback.format_exc()}"
+        print(error_msg)
+        # Log to file for persistence
+        try:
+            with open('jp_screener_error.log', 'w') as f:
+                f.write(error_msg)
+        except:
+            pass
+        raise
 
-    return jsonify({
-        "status": "accepted",
-        "message": f"JP Screening ({run_type}) started in background"
-    }), 202
 
 
 # === 백테스트 요약 ===
@@ -656,56 +633,20 @@ def get_backtest_summary():
 
 # === 실시간 가격 ===
 @jp_bp.route('/realtime-prices', methods=['POST'])
-def get_realtime_prices():
-    """실시간 가격 조회 (yfinance Batch)"""
+async def get_realtime_prices():
+    """실시간 가격 조회 (공유 시세 서비스 - yfinance 는 루프의 블로킹 실행기에서)"""
     try:
+        import asyncio
+        from engine.quote_service import get_quote_service
+        
         data = request.get_json()
         tickers = data.get('tickers', [])
         
         if not tickers:
             return jsonify({})
         
-        # 티커 변환 (.T 접미사)
-        valid_tickers = []
-        ticker_map = {}
-        
-        for t in tickers:
-            if not t.endswith('.T'):
-                symbol = f"{t}.T"
-            else:
-                symbol = t
-            valid_tickers.append(symbol)
-            ticker_map[symbol] = t
-        
-        # Batch Download
-        df = yf.download(valid_tickers, period="1d", group_by='ticker', progress=False)
-        
-        prices = {}
-        
-        if df.empty:
-            return jsonify({})
-        
-        if len(valid_tickers) == 1:
-            symbol = valid_tickers[0]
-            try:
-                if isinstance(df.columns, pd.MultiIndex):
-                    series = df[symbol]['Close'] if symbol in df.columns.levels[0] else None
-                else:
-                    series = df['Close']
-                
-                if series is not None and not series.dropna().empty:
-                    prices[ticker_map[symbol]] = float(series.dropna().iloc[-1])
-            except:
-                pass
-        else:
-            for symbol in valid_tickers:
-                try:
-                    if isinstance(df.columns, pd.MultiIndex) and symbol in df.columns.levels[0]:
-                        series = df[symbol]['Close']
-                        if not series.dropna().empty:
-                            prices[ticker_map[symbol]] = float(series.dropna().iloc[-1])
-                except:
-                    continue
+        # .T 접미사 변환 + 짧은 TTL 캐시 / 동시 요청 병합
+        prices = await asyncio.to_thread(get_quote_service().get_jp_prices, tickers)
         
         return jsonify(prices)
         
@@ -719,6 +660,8 @@ def get_realtime_prices():
 def analyze_performance():
     """성과 분석 (과거 포착 종목의 이후 주가 추적)"""
     try:
+        from engine.performance import analyze_signal_performance
+        
         req_data = request.get_json()
         target_date_str = req_data.get('date')  # 2026-01-20
         target_type = req_data.get('type', 'n225') # n225 | n400
@@ -747,8 +690,14 @@ def analyze_performance():
         signals = []
         found_any = False
         
+        # 우선순위 파일별로 DB 우선 조회, DB 기록이 없거나 파일이 더 새로우면 파일 (jongga_v2_n225_results_ -> jongga_v2_n225)
         for filename in files_to_check:
             file_path = os.path.join(data_dir, filename)
+            stored = stored_run('JP', filename.split('_results_')[0], date_nohol, file_path)
+            if stored and stored.get('signals'):
+                signals = stored['signals']
+                found_any = True
+                break
             if os.path.exists(file_path):
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
@@ -767,47 +716,19 @@ def analyze_performance():
             return jsonify({'dates': [], 'rows': []})
         
         # Collect tickers (JP uses .T suffix)
-        tickers = []
-        ticker_map = {}  # symbol -> signal object
+        symbols, entry_prices, infos = [], [], []
         
         for s in signals:
             code = s.get('code') or s.get('ticker')
             if not code:
                 continue
             
-            # JP market uses .T suffix
             code_clean = code.replace('.T', '')
-            symbol = f"{code_clean}.T"
-            tickers.append(symbol)
-            ticker_map[symbol] = s
-            ticker_map[code_clean] = s
-            
-        if not tickers:
-            return jsonify({'dates': [], 'rows': []})
-             
-        # Fetch History
-        print(f"[JP] Analyzing performance for {target_date_str}. Tickers: {len(tickers)}")
-        
-        # Download
-        df = yf.download(tickers, start=target_date_str, group_by='ticker', progress=False, threads=False)
-        
-        if df.empty:
-            return jsonify({'dates': [], 'rows': []})
-             
-        # Extract dates
-        market_dates = [d.strftime('%Y-%m-%d') for d in df.index]
-        
-        # Build Rows
-        rows = []
-        is_multi = len(tickers) > 1
-        
-        for symbol in tickers:
-            s = ticker_map.get(symbol)
-            if not s:
-                continue
+            symbols.append(f"{code_clean}.T")
+            entry_prices.append(s.get('close', 0))
             
             # Convert signal to match KR format expected by frontend
-            signal_info = {
+            infos.append({
                 'stock_code': s.get('code', ''),
                 'stock_name': s.get('name', ''),
                 'grade': s.get('grade', 'C'),
@@ -815,57 +736,17 @@ def analyze_performance():
                 'current_price': s.get('close', 0),
                 'entry_price': s.get('close', 0),
                 'market': 'TSE'
-            }
-            
-            row = {
-                'signal_info': signal_info,
-                'daily_stats': []
-            }
+            })
             
-            try:
-                # Get close series
-                series = None
-                if is_multi:
-                    if isinstance(df.columns, pd.MultiIndex):
-                        if symbol in df.columns.levels[0]:
-                            series = df[symbol]['Close']
-                else:
-                    if isinstance(df.columns, pd.MultiIndex):
-                        if symbol in df.columns.levels[0]:
-                            series = df[symbol]['Close']
-                        else:
-                            series = df['Close']
-                    else:
-                        series = df['Close']
-                        
-                if series is not None:
-                    entry_price = s.get('close', 0)
-                    
-                    for date_val in df.index:
-                        d_str = date_val.strftime('%Y-%m-%d')
-                        if d_str not in market_dates:
-                            continue
-                        
-                        try:
-                            val = float(series.loc[date_val])
-                            if pd.isna(val):
-                                row['daily_stats'].append({'date': d_str, 'close': None, 'return_pct': None})
-                            else:
-                                ret = 0
-                                if entry_price and entry_price > 0:
-                                    ret = ((val - entry_price) / entry_price) * 100
-                                row['daily_stats'].append({
-                                    'date': d_str, 
-                                    'close': val, 
-                                    'return_pct': round(ret, 2)
-                                })
-                        except:
-                            row['daily_stats'].append({'date': d_str, 'close': None, 'return_pct': None})
-            except Exception as e:
-                print(f"Error processing {symbol}: {e}")
-                pass
-                
-            rows.append(row)
+        if not symbols:
+            return jsonify({'dates': [], 'rows': []})
+             
+        print(f"[JP] Analyzing performance for {target_date_str}. Tickers: {len(symbols)}")
+        
+        # 종가 매트릭스 1회 구성 (OHLCV 캐시, 부족분만 일괄 다운로드)
+        market_dates, rows = analyze_signal_performance(
+            symbols, entry_prices, infos, target_date_str
+        )
             
         return jsonify({
             'dates': market_dates,
@@ -877,18 +758,69 @@ def analyze_performance():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+
+@jp_bp.route('/performance/matrix')
+def performance_matrix():
+    """전체 히스토리 시그널의 1/3/5/10일 수익률, MFE/MAE, 등급별 적중률"""
+    try:
+        from app.store import get_store
+        from engine.performance import build_performance_matrix, summarize_by_grade, FORWARD_HORIZONS
+        
+        target_type = request.args.get('type', 'n225')  # n225 | n400 | vcp
+        run_types = {
+            'n225': ['jongga_v2_n225', 'jongga_v2'],  # Legacy 포함
+            'n400': ['jongga_v2_n400'],
+            'vcp': ['vcp'],
+        }.get(target_type)
+        if not run_types:
+            return jsonify({'error': f'Unknown type: {target_type}'}), 400
+        
+        store = get_store()
+        all_rows = []
+        for run_type in run_types:
+            history = store.query_signals('JP', run_type)
+            if not history:
+                continue
+            
+            signals = []
+            for h in history:
+                code_clean = h['code'].replace('.T', '')
+                signals.append({
+                    'signal_date': h['signal_date'],
+                    'code': h['code'],
+                    'name': h['name'],
+                    'symbol': f"{code_clean}.T",
+                    'grade': h['grade'],
+                    'entry_price': h['entry_price'],
+                })
+            
+            # 확정된 날짜는 캐시(signal_performance) 재사용, 나머지만 1회 일괄 계산
+            rows, computed = build_performance_matrix(signals, store.get_performance('JP', run_type))
+            if computed:
+                store.save_performance('JP', run_type, computed)
+            all_rows.extend(rows)
+        
+        return jsonify({
+            'horizons': list(FORWARD_HORIZONS),
+            'summary': summarize_by_grade(all_rows),
+            'dates': sorted({r['signal_date'] for r in all_rows}),
+            'rows': all_rows
+        })
+        
+    except Exception as e:
+        print("JP Performance Matrix Error:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
 @jp_bp.route('/chart/<code>')
-def get_jp_chart(code):
-    """특정 종목의 차트 데이터 조회"""
+async def get_jp_chart(code):
+    """특정 종목의 차트 데이터 조회 (공유 이벤트 루프 + 공유 HTTP 세션)"""
     try:
-        import asyncio
+        from app.utils.aio import http_session
         from engine.jp_collectors import JPXCollector
         
-        async def _fetch():
-            async with JPXCollector() as collector:
-                return await collector.get_chart_data(code, days=180) # Support 6 months
-        
-        charts = asyncio.run(_fetch())
+        async with JPXCollector(session=await http_session()) as collector:
+            charts = await collector.get_chart_data(code, days=180) # Support 6 months
         
         # JSON 직렬화 가능한 형태로 변환
         result = []
@@ -932,7 +864,13 @@ def get_vcp_dates():
     """VCP 데이터가 존재하는 날짜 목록"""
     try:
         data_dir = get_jp_data_dir()
-        files = glob.glob(os.path.join(data_dir, 'vcp_*.json'))
+        pattern = os.path.join(data_dir, 'vcp_*.json')
+        dates = stored_dates('JP', 'vcp', pattern)
+        if dates:
+            return jsonify(dates)
+        
+        # DB 미사용 시 파일 스캔 폴백
+        files = glob.glob(pattern)
         
         dates = []
         for f in files:
@@ -959,6 +897,11 @@ def get_vcp_history(date_str):
         filename = f"vcp_{date_str}.json"
         file_path = os.path.join(data_dir, filename)
         
+        # DB 우선 (DB 기록 이후 파일이 다시 저장됐으면 파일)
+        data = stored_run('JP', 'vcp', date_str, file_path)
+        if data is not None:
+            return jsonify(data)
+        
         if not os.path.exists(file_path):
             return jsonify({"error": "Data not found"}), 404
         
@@ -970,31 +913,35 @@ def get_vcp_history(date_str):
 
 @jp_bp.route('/vcp/run', methods=['POST'])
 def run_jp_vcp():
-    """JP VCP 스크리너 실행 (Background)"""
-    if not jp_screener_manager.start('VCP'):
-        return jsonify({"status": "error", "message": "Already running"}), 409
-
-    def _run_task():
-        try:
-            import asyncio
-            from engine.jp_vcp import JPVCPScreener
-            
-            jp_screener_manager.update_message("Scanning Nikkei 225/400 signals for VCP patterns & Supply...")
-            screener = JPVCPScreener()
-            result = asyncio.run(screener.run_vcp_scan())
-            
-            if "status" in result and result["status"] == "error":
-                jp_screener_manager.stop(f"Error: {result['message']}")
-            else:
-                jp_screener_manager.stop(f"VCP Scan Completed. Found {result.get('total_count', 0)} signals.")
-        except Exception as e:
-            traceback.print_exc()
-            jp_screener_manager.stop(f"Error: {str(e)}")
-
-    thread = threading.Thread(target=_run_task)
-    thread.start()
+    """JP VCP 스크리너 실행 (Background Job)"""
+    job, created = jp_screener_manager.submit('jp.vcp', 'VCP')
+    if not created:
+        return jsonify({"status": "error", "message": "Already running", "job_id": job['id']}), 409
 
     return jsonify({
         "status": "accepted",
-        "message": "JP VCP check started in background"
+        "message": "JP VCP check started in background",
+        "job_id": job['id']
     }), 202
+
+
+@job_handler('jp.vcp')
+def _run_vcp_job(ctx):
+    import asyncio
+    from engine.jp_vcp import JPVCPScreener
+    
+    ctx.progress("Scanning Nikkei 225/400 signals for VCP patterns & Supply...", 5)
+    screener = JPVCPScreener()
+    result = asyncio.run(screener.run_vcp_scan(cancel_check=ctx.check_cancelled))
+    
+    if "status" in result and result["status"] == "error":
+        return {"status": "error", "message": f"Error: {result['message']}"}
+    
+    return {
+        "message": f"VCP Scan Completed. Found {result.get('total_count', 0)} signals.",
+        "market": "JP",
+        "run_type": "vcp",
+        "date": date.today().isoformat(),
+        "files": [os.path.join(screener.data_dir, f"vcp_{date.today().strftime('%Y%m%d')}.json")],
+        "count": result.get('total_count', 0)
+    }
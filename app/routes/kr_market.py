@@ -6,56 +6,60 @@ import json
 import traceback
 from datetime import datetime, date
 import glob
-import pandas as pd
-import yfinance as yf
 from flask import Blueprint, jsonify, request, current_app
+from app.store import (
+    record_run, record_market_gate, stored_dates, stored_run, stored_gate_dates, stored_gate
+)
+from engine.persist import save_daily_and_latest, save_scan_result
+from engine.locks import load_json_if_newer, single_flight
+from app.utils.events import tail_job_status
+from app.jobs import ACTIVE_STATUSES, get_job_queue, job_handler
+from engine.kr_symbols import get_kr_resolver
 
 
 kr_bp = Blueprint('kr', __name__)
 
 # --- Screener Status Management ---
-import threading
 import time
 
 class ScreenerManager:
-    def __init__(self):
-        self.is_running = False
-        self.current_task = None  # 'vcp' or 'jongga'
-        self.start_time = None
-        self.message = ""
-        self.lock = threading.Lock()
-
-    def start(self, task_name):
-        with self.lock:
-            if self.is_running:
-                return False
-            self.is_running = True
-            self.current_task = task_name
-            self.start_time = datetime.now()
-            self.message = f"Starting {task_name}..."
-            return True
-
-    def update_message(self, msg):
-        with self.lock:
-            self.message = msg
-
-    def stop(self, msg="Completed"):
-        with self.lock:
-            self.is_running = False
-            self.current_task = None
-            self.message = msg
-
-screener_manager = ScreenerManager()
+    """스크리너 실행 상태 (작업 큐 기반 - gunicorn 워커 간 공유)"""
+
+    def __init__(self, market):
+        self.market = market
+        self.kind_prefix = f"{market}."
+        self.dedupe_key = f"{market}.screener"  # 시장별 스크리너는 동시에 1개만
+
+    def submit(self, kind, task_name, params=None):
+        """작업 등록 -> (job, created). 이미 실행 중이면 created=False"""
+        params = dict(params or {}, _task=task_name)
+        return get_job_queue().submit(kind, params, dedupe_key=self.dedupe_key)
+
+    def reset(self):
+        return get_job_queue().cancel_active(self.kind_prefix)
+
+    def status(self, job=None):
+        job = job or get_job_queue().latest(self.kind_prefix)
+        if not job:
+            return {"isRunning": False, "task": None, "message": "", "startTime": None}
+        running = job['status'] in ACTIVE_STATUSES
+        return {
+            "isRunning": running,
+            "task": job['params'].get('_task') if running else None,
+            "message": job['message'],
+            "startTime": job['started_at'] or job['created_at'],
+            "jobId": job['id'],
+            "status": job['status'],
+            "progress": job['progress'],
+        }
+
+screener_manager = ScreenerManager('kr')
+tail_job_status('kr_screener', screener_manager.status)
 
 @kr_bp.route('/screener/status')
 def get_screener_status():
     """스크리너 실행 상태 조회"""
-    return jsonify({
-        "isRunning": screener_manager.is_running,
-        "task": screener_manager.current_task,
-        "message": screener_manager.message,
-        "startTime": screener_manager.start_time.isoformat() if screener_manager.start_time else None
-    })
+    return jsonify(screener_manager.status())
 
 
 @kr_bp.route('/market-status')
@@ -115,6 +119,40 @@ def get_kr_signals():
         return jsonify({'error': str(e)}), 500
 
 
+def _refresh_kr_market_gate(data_dir, latest_file, result_data=None):
+    """KR Market Gate 실시간 계산 + 저장 (result_data: 일괄 계산된 결과 재사용)"""
+    from engine.market_gate import compute_market_gate
+    from engine.regime import get_regime_engine
+
+    if result_data is None:
+        result_data = compute_market_gate('KR')
+    
+    # MA20/MA60 + 환율 + 외인 수급 레짐 (실패해도 게이트는 저장)
+    try:
+        result_data['regime'] = get_regime_engine().update().to_dict()
+    except Exception as e:
+        print(f"[Regime] 갱신 실패: {e}")
+    
+    # 일자별 백업 + 캐시(최신 데이터) 저장
+    today_str = date.today().strftime('%Y%m%d')
+    daily_file = os.path.join(data_dir, f'market_gate_{today_str}.json')
+    save_daily_and_latest(daily_file, latest_file, result_data)
+    record_market_gate('KR', date.today(), result_data)
+
+    return result_data
+
+
+def refresh_market_gate(result_data=None):
+    """KR Market Gate 갱신 (프로세스 간 single-flight)"""
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
+    latest_file = os.path.join(data_dir, 'market_gate_latest.json')
+    return single_flight(
+        'market_gate.kr',
+        lambda: _refresh_kr_market_gate(data_dir, latest_file, result_data),
+        lambda since: load_json_if_newer(latest_file, since),
+    )
+
+
 @kr_bp.route('/market-gate')
 def kr_market_gate():
     """KR Market Gate 상태 (캐시 기반, refresh=true 시 실시간 조회)"""
@@ -132,43 +170,8 @@ def kr_market_gate():
                 cached_data = json.load(f)
             return jsonify(cached_data)
         
-        # 실시간 데이터 조회
-        from market_gate import run_kr_market_gate
-        res = run_kr_market_gate()
-        
-        # 섹터 데이터 변환
-        sectors_data = []
-        for s in res.get('sectors', []):
-            sectors_data.append({
-                'name': s.get('name', ''),
-                'signal': s.get('signal', 'neutral'),
-                'change_pct': round(s.get('change_1d', 0), 2),
-                'score': s.get('score', 50)
-            })
-        
-        result_data = {
-            'status': res.get('gate', 'NEUTRAL'),
-            'score': res.get('score', 50),
-            'label': res.get('label', 'NEUTRAL'),
-            'reasons': res.get('reasons', []),
-            'sectors': sectors_data,
-            'metrics': res.get('metrics', {}),
-            'kospi_close': res.get('kospi_close', 0),
-            'kospi_change_pct': res.get('kospi_change_pct', 0),
-            'kosdaq_close': res.get('kosdaq_close', 0),
-            'kosdaq_change_pct': res.get('kosdaq_change_pct', 0),
-            'updated_at': datetime.now().isoformat()
-        }
-        
-        # 캐시에 저장 (최신 데이터)
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
-        
-        # 일자별 백업 저장
-        today_str = date.today().strftime('%Y%m%d')
-        daily_file = os.path.join(data_dir, f'market_gate_{today_str}.json')
-        with open(daily_file, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
+        # 실시간 데이터 조회 (동시 요청/다른 워커와 1회로 합침)
+        result_data = refresh_market_gate()
         
         return jsonify(result_data)
     except Exception as e:
@@ -191,12 +194,34 @@ def kr_market_gate():
         })
 
 
+@kr_bp.route('/market-regime')
+def kr_market_regime():
+    """KR 시장 레짐 (MA20/MA60, USD/KRW, 외인 수급) - refresh=true 시 재계산"""
+    try:
+        from engine.regime import get_regime_engine
+        engine = get_regime_engine()
+        if request.args.get('refresh', 'false').lower() == 'true':
+            status = single_flight('market_regime.kr', engine.update, engine.current)
+        else:
+            status = engine.current() or engine.update()
+        return jsonify(status.to_dict())
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+
 @kr_bp.route('/market-gate/dates', methods=['GET'])
 def get_market_gate_dates():
     """Market Gate 데이터가 존재하는 날짜 목록 조회"""
     try:
         data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-        files = glob.glob(os.path.join(data_dir, 'market_gate_*.json'))
+        pattern = os.path.join(data_dir, 'market_gate_*.json')
+        dates = stored_gate_dates('KR', pattern)
+        if dates:
+            return jsonify(dates)
+        
+        # DB 미사용 시 파일 스캔 폴백
+        files = glob.glob(pattern)
         
         dates = []
         for f in files:
@@ -227,6 +252,11 @@ def get_market_gate_history(date_str):
         filename = f"market_gate_{date_str}.json"
         file_path = os.path.join(data_dir, filename)
         
+        # DB 우선 (DB 기록 이후 파일이 다시 저장됐으면 파일)
+        data = stored_gate('KR', date_str, file_path)
+        if data is not None:
+            return jsonify(data)
+        
         if not os.path.exists(file_path):
             return jsonify({"error": "Data not found for this date"}), 404
         
@@ -262,12 +292,34 @@ def get_jongga_v2_latest():
         return jsonify({"error": str(e)}), 500
 
 
+@kr_bp.route('/jongga-v2/delta', methods=['GET'])
+def get_jongga_v2_delta():
+    """종가베팅 v2 마지막 증분 재스캔의 변경분 (추가/변경 시그널 + 제거 종목)"""
+    try:
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
+        delta_file = os.path.join(data_dir, 'jongga_v2_delta.json')
+
+        if not os.path.exists(delta_file):
+            return jsonify({"added": [], "changed": [], "removed": [], "message": "No incremental run yet"})
+
+        with open(delta_file, 'r', encoding='utf-8') as f:
+            return jsonify(json.load(f))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @kr_bp.route('/jongga-v2/dates', methods=['GET'])
 def get_jongga_v2_dates():
     """데이터가 존재하는 날짜 목록 조회"""
     try:
         data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-        files = glob.glob(os.path.join(data_dir, 'jongga_v2_results_*.json'))
+        pattern = os.path.join(data_dir, 'jongga_v2_results_*.json')
+        dates = stored_dates('KR', 'jongga_v2', pattern)
+        if dates:
+            return jsonify(dates)
+        
+        # DB 미사용 시 파일 스캔 폴백
+        files = glob.glob(pattern)
         
         dates = []
         for f in files:
@@ -296,6 +348,11 @@ def get_jongga_v2_history(date_str):
         filename = f"jongga_v2_results_{date_str}.json"
         file_path = os.path.join(data_dir, filename)
         
+        # DB 우선 (DB 기록 이후 파일이 다시 저장됐으면 파일)
+        data = stored_run('KR', 'jongga_v2', date_str, file_path)
+        if data is not None:
+            return jsonify(data)
+        
         if not os.path.exists(file_path):
             return jsonify({"error": "Data not found for this date"}), 404
         
@@ -309,97 +366,119 @@ def get_jongga_v2_history(date_str):
 
 @kr_bp.route('/jongga-v2/run', methods=['POST'])
 def run_jongga_v2():
-    """전체 종가베팅 v2 엔진 실행 (Background)"""
-    if not screener_manager.start('ClosingBet'):
-        return jsonify({"status": "error", "message": "Already running"}), 409
-
-    def _run_task():
-        try:
-            import asyncio
-            from engine.generator import run_screener
-            
-            # 실행 전 데이터 경로 확인
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-            if not os.path.exists(data_dir):
-                os.makedirs(data_dir)
-                
-            screener_manager.update_message("Running screener engine (300 stocks)...")
-            result = asyncio.run(run_screener(capital=50_000_000))
-            
-            screener_manager.stop(f"Completed. Filtered: {result.filtered_count}")
-        except Exception as e:
-            print(f"Error running Jongga V2 engine: {e}")
-            traceback.print_exc()
-            screener_manager.stop(f"Error: {str(e)}")
-
-    thread = threading.Thread(target=_run_task)
-    thread.start()
+    """전체 종가베팅 v2 엔진 실행 (Background Job)
+    force=true: Market Gate RED 에서도 전체 스캔
+    incremental=true: 장중 증분 재스캔 (입력이 바뀐 종목만 재채점)
+    """
+    force = request.args.get('force', 'false').lower() == 'true'
+    incremental = request.args.get('incremental', 'false').lower() == 'true'
+    job, created = screener_manager.submit(
+        'kr.jongga_v2', 'ClosingBet', {'gate_aware': not force, 'incremental': incremental}
+    )
+    if not created:
+        return jsonify({"status": "error", "message": "Already running", "job_id": job['id']}), 409
     
     return jsonify({
         "status": "accepted",
-        "message": "Background task started"
+        "message": "Background task started",
+        "job_id": job['id']
     }), 202
 
 
-@kr_bp.route('/vcp/run', methods=['POST'])
-def run_vcp_screener():
-    """VCP 패턴 + 수급 스크리너 실행 (Background)"""
-    if not screener_manager.start('VCP'):
-        return jsonify({"status": "error", "message": "Already running"}), 409
-
-    def _run_task():
-        try:
-            from screener import SmartMoneyScreener
-            
-            screener_manager.update_message("Scanning 300 stocks for VCP & Smart Money...")
-            screener = SmartMoneyScreener()
-            df = screener.run_screening(max_stocks=300) # 300개 전체 스캔
-            
-            if df.empty:
-                screener_manager.stop("No signals found.")
-                return
-                
-            signals = screener.generate_signals(df)
-            
-            # AI 분석 (제거됨 - 주석 처리하거나 로직 삭제)
-            # 여기서는 VCP 결과 저장 로직만 수행
-            
-            # VCP는 AI 분석 없으므로 바로 저장
-            result_data = {
-                "updated_at": datetime.now().isoformat(),
-                "total_count": len(signals),
-                "signals": signals
-            }
-            
-            # 결과 저장
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-            if not os.path.exists(data_dir):
-                os.makedirs(data_dir)
-                
-            with open(os.path.join(data_dir, 'vcp_latest.json'), 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, ensure_ascii=False, indent=2)
-            
-            # 일자별 백업 저장
-            today_str = date.today().strftime('%Y%m%d')
-            daily_file = os.path.join(data_dir, f'vcp_{today_str}.json')
-            with open(daily_file, 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, ensure_ascii=False, indent=2)
+@job_handler('kr.jongga_v2')
+def _run_jongga_v2_job(ctx, gate_aware=True, incremental=False):
+    import asyncio
+    from engine.config import SignalConfig
+    from engine.generator import run_screener
+    
+    # 실행 전 데이터 경로 확인
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir)
+        
+    ctx.progress("Running screener engine (300 stocks)...", 5)
+    result = asyncio.run(run_screener(
+        capital=50_000_000,
+        config=SignalConfig.load(gate_aware=gate_aware),
+        incremental=incremental,
+        cancel_check=ctx.check_cancelled,
+    ))
+    
+    date_str = result.date.strftime('%Y%m%d')
+    return {
+        "message": f"Completed. Filtered: {result.filtered_count}" + (" (reduced scan)" if result.reduced_scan else ""),
+        "market": "KR",
+        "run_type": "jongga_v2",
+        "date": result.date.isoformat(),
+        "files": [result.saved_path or os.path.join(data_dir, f"jongga_v2_results_{date_str}.json")],
+        "count": result.filtered_count,
+        "reduced_scan": result.reduced_scan,
+    }
 
-            screener_manager.stop(f"VCP Scan Completed. Found {len(signals)} signals.")
-            
-        except Exception as e:
-            traceback.print_exc()
-            screener_manager.stop(f"Error: {str(e)}")
 
-    thread = threading.Thread(target=_run_task)
-    thread.start()
+@kr_bp.route('/vcp/run', methods=['POST'])
+def run_vcp_screener():
+    """VCP 패턴 + 수급 스크리너 실행 (Background Job)
+    force=true: Market Gate RED 에서도 전체 스캔
+    """
+    force = request.args.get('force', 'false').lower() == 'true'
+    job, created = screener_manager.submit('kr.vcp', 'VCP', {'gate_aware': not force})
+    if not created:
+        return jsonify({"status": "error", "message": "Already running", "job_id": job['id']}), 409
 
     return jsonify({
         "status": "accepted",
-        "message": "VCP check started in background"
+        "message": "VCP check started in background",
+        "job_id": job['id']
     }), 202
 
 
+@job_handler('kr.vcp')
+def _run_vcp_job(ctx, gate_aware=True):
+    from screener import SmartMoneyScreener
+    
+    ctx.progress("Scanning 300 stocks for VCP & Smart Money...", 5)
+    screener = SmartMoneyScreener({'gate_aware': gate_aware})
+    df = screener.run_screening(max_stocks=300, cancel_check=ctx.check_cancelled) # 300개 전체 스캔
+    ctx.check_cancelled()
+    
+    if df.empty:
+        return {"message": "No signals found.", "market": "KR", "run_type": "vcp", "count": 0}
+        
+    signals = screener.generate_signals(df)
+    
+    # VCP는 AI 분석 없으므로 바로 저장
+    result_data = {
+        "updated_at": datetime.now().isoformat(),
+        "total_count": len(signals),
+        "signals": signals
+    }
+    
+    # 결과 저장
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir)
+        
+    # 일자별 저장 + latest 하드링크 (직렬화 1회, 원자적 교체) - 축소 스캔은 같은 날 전체 결과를 덮어쓰지 않음
+    today_str = date.today().strftime('%Y%m%d')
+    daily_file, published = save_scan_result(
+        os.path.join(data_dir, f'vcp_{today_str}.json'), os.path.join(data_dir, 'vcp_latest.json'),
+        result_data, screener.reduced_scan,
+    )
+    if published:
+        record_run('KR', 'vcp', date.today(), result_data)
+
+    return {
+        "message": f"VCP Scan Completed. Found {len(signals)} signals." + (" (reduced scan)" if screener.reduced_scan else ""),
+        "market": "KR",
+        "run_type": "vcp",
+        "date": date.today().isoformat(),
+        "files": [daily_file],
+        "count": len(signals),
+        "reduced_scan": screener.reduced_scan,
+    }
+
+
 @kr_bp.route('/vcp/latest', methods=['GET'])
 def get_vcp_latest():
     """VCP 최신 결과 조회"""
@@ -422,7 +501,13 @@ def get_vcp_dates():
     """VCP 데이터가 존재하는 날짜 목록 조회"""
     try:
         data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-        files = glob.glob(os.path.join(data_dir, 'vcp_*.json'))
+        pattern = os.path.join(data_dir, 'vcp_*.json')
+        dates = stored_dates('KR', 'vcp', pattern)
+        if dates:
+            return jsonify(dates)
+        
+        # DB 미사용 시 파일 스캔 폴백
+        files = glob.glob(pattern)
         
         dates = []
         for f in files:
@@ -453,6 +538,11 @@ def get_vcp_history(date_str):
         filename = f"vcp_{date_str}.json"
         file_path = os.path.join(data_dir, filename)
         
+        # DB 우선 (DB 기록 이후 파일이 다시 저장됐으면 파일)
+        data = stored_run('KR', 'vcp', date_str, file_path)
+        if data is not None:
+            return jsonify(data)
+        
         if not os.path.exists(file_path):
             return jsonify({"error": "Data not found for this date"}), 404
         
@@ -472,69 +562,20 @@ def _inject_realtime_prices(data):
     - return_pct 계산
     """
     try:
-        import yfinance as yf
+        from engine.quote_service import get_quote_service
         
         signals = data.get('signals', [])
         if not signals:
             return data
             
-        # 티커 맵핑 (ticker -> symbol)
-        symbols_map = {}
-        for s in signals:
-            ticker = s.get('ticker')
-            market = s.get('market', '')
-            
-            if not ticker:
-                continue
-                
-            # 심볼 생성
-            if market == 'KOSPI':
-                symbol = f"{ticker}.KS"
-            elif market == 'KOSDAQ':
-                symbol = f"{ticker}.KQ"
-            else:
-                # 마켓 정보 없으면 시도
-                symbol = f"{ticker}.KS" 
-                
-            symbols_map[symbol] = ticker
-            
-        if not symbols_map:
+        # 티커 -> 마켓 (거래소 접미사 결정용)
+        markets = {s['ticker']: s.get('market', '') for s in signals if s.get('ticker')}
+        if not markets:
             return data
             
-        # 가격 일괄 조회
-        tickers_list = list(symbols_map.keys())
-        # yfinance는 리스트 전달 시 일괄 조회 지원
-        # 너무 많으면 나눠서 조회하는게 좋지만, 300개 정도는 괜찮음
-        
-        print(f"Fetching realtime prices for {len(tickers_list)} stocks...")
-        
-        # 다운로드 (threads=True로 병렬 다운로드)
-        df = yf.download(tickers_list, period="1d", group_by='ticker', threads=True, progress=False)
-        
-        # 최신가 추출
-        latest_prices = {}
-        
-        # 단일 종목인 경우 구조가 다를 수 있음
-        if len(tickers_list) == 1:
-            symbol = tickers_list[0]
-            if not df.empty:
-                try:
-                    price = float(df['Close'].iloc[-1])
-                    latest_prices[symbols_map[symbol]] = price
-                except:
-                    pass
-        else:
-            # 다중 종목
-            for symbol in tickers_list:
-                try:
-                    # Multi-index or normal columns depending on yfinance version
-                    if symbol in df.columns.levels[0]: # Top level index is ticker
-                        price_series = df[symbol]['Close']
-                        if not price_series.empty:
-                            price = float(price_series.iloc[-1])
-                            latest_prices[symbols_map[symbol]] = price
-                except:
-                    continue
+        # 가격 일괄 조회 (공유 시세 서비스: 짧은 TTL + 동시 요청 병합)
+        print(f"Fetching realtime prices for {len(markets)} stocks...")
+        latest_prices = get_quote_service().get_kr_prices(list(markets), markets)
         
         # 데이터 업데이트
         for s in signals:
@@ -593,22 +634,31 @@ def get_backtest_summary():
         }
         
         data_dir = os.path.join('data')
-        history_files = glob.glob(os.path.join(data_dir, 'jongga_v2_results_*.json'))
+        stored = stored_dates('KR', 'jongga_v2')
+        history_files = stored or glob.glob(os.path.join(data_dir, 'jongga_v2_results_*.json'))
         
         if len(history_files) >= 2:
             all_signals = []
             today = datetime.now().strftime('%Y%m%d')
             
-            for file_path in sorted(history_files):
-                if today in file_path:
-                    continue
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    for signal in data.get('signals', []):
-                        all_signals.append(signal)
-                except:
-                    continue
+            if stored:
+                # 인덱스 조회 (오늘 제외)
+                from app.store import get_store
+                yesterday = date.fromordinal(date.today().toordinal() - 1)
+                all_signals = [
+                    r['signal'] for r in get_store().query_signals('KR', 'jongga_v2', end=yesterday)
+                ]
+            else:
+                for file_path in sorted(history_files):
+                    if today in file_path:
+                        continue
+                    try:
+                        with open(file_path, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
+                        for signal in data.get('signals', []):
+                            all_signals.append(signal)
+                    except:
+                        continue
             
             if all_signals:
                 wins = sum(1 for s in all_signals if s.get('change_pct', 0) > 0)
@@ -635,13 +685,13 @@ def get_backtest_summary():
 
 
 @kr_bp.route('/jongga-v2/reanalyze/<code>', methods=['POST'])
-def reanalyze_single_stock(code):
-    """단일 종목 재분석"""
+async def reanalyze_single_stock(code):
+    """단일 종목 재분석 (공유 이벤트 루프 + 공유 HTTP 세션)"""
     try:
-        import asyncio
+        from app.utils.aio import http_session
         from engine.generator import analyze_single_stock_by_code
         
-        result = asyncio.run(analyze_single_stock_by_code(code))
+        result = await analyze_single_stock_by_code(code, session=await http_session())
         
         if result:
             return jsonify({
@@ -662,10 +712,11 @@ def reanalyze_single_stock(code):
 
 
 @kr_bp.route('/realtime-prices', methods=['POST'])
-def get_realtime_prices():
-    """실시간 가격 조회 (yfinance Batch)"""
+async def get_realtime_prices():
+    """실시간 가격 조회 (공유 시세 서비스 - yfinance 는 루프의 블로킹 실행기에서)"""
     try:
-        import yfinance as yf
+        import asyncio
+        from engine.quote_service import get_quote_service
         
         data = request.get_json()
         tickers = data.get('tickers', [])
@@ -673,111 +724,10 @@ def get_realtime_prices():
         if not tickers:
             return jsonify({})
             
-        print(f"Batch fetching prices for {len(tickers)} stocks...")
-        
-        # 티커 변환
-        valid_tickers = []
-        ticker_map = {} # symbol -> original_ticker
-        
-        for t in tickers:
-            # .KS나 .KQ가 없으면 붙여서 시도
-            if not t.endswith('.KS') and not t.endswith('.KQ'):
-                # 우선 .KS로 가정, 둘 다 시도할 수도 있음
-                # 여기서는 간단히 .KS로 변환
-                symbol = f"{t}.KS"
-                valid_tickers.append(symbol)
-                ticker_map[symbol] = t
-                
-                # 혹시 모르니 .KQ도 추가? (yfinance는 알아서 필터링함)
-                symbol_kq = f"{t}.KQ"
-                valid_tickers.append(symbol_kq)
-                ticker_map[symbol_kq] = t
-            else:
-                valid_tickers.append(t)
-                ticker_map[t] = t
-        
-        # Batch Download
-        # threads=True (기본값)
-        print(f"Downloading tickers: {valid_tickers}")
-        df = yf.download(valid_tickers, period="1d", group_by='ticker', progress=False)
-        
-        print(f"Downloaded shape: {df.shape}")
-        print(f"Columns: {df.columns}")
-        
-        prices = {}
-        
-        if df.empty:
-            print("DataFrame is empty!")
-            return jsonify({})
-            
-        # 결과 파싱
-        # 단일 종목일 경우와 다중 종목일 경우 구조가 다름
-        if len(valid_tickers) == 1:
-             try:
-                 symbol = valid_tickers[0]
-                 # GroupBy ticker results in single level if only 1 ticker? No, usually not with group_by
-                 # But let's handle standard case
-                 series = None
-                 if isinstance(df.columns, pd.MultiIndex):
-                      if symbol in df.columns.levels[0]:
-                          series = df[symbol]['Close']
-                      else:
-                          # Try finding symbol in level 1
-                          try:
-                              series = df.xs(symbol, level=1, axis=1)['Close']
-                          except:
-                              pass
-                 else:
-                      series = df['Close']
-                      
-                 if series is not None:
-                     valid_series = series.dropna()
-                     if not valid_series.empty:
-                         price = float(valid_series.iloc[-1])
-                         original_ticker = ticker_map.get(symbol, symbol)
-                         prices[original_ticker] = price
-             except Exception as e:
-                 print(f"Error parsing single ticker: {e}")
-                 pass
-        else:
-            # Flatten columns for easier search if needed or inspect structure
-            # cols_flat = ["_".join(map(str, c)) if isinstance(c, tuple) else str(c) for c in df.columns]
-            # print(f"Flat columns sample: {cols_flat[:10]}")
-            
-            for symbol in valid_tickers:
-                try:
-                    series = None
-                    
-                    # 1. Standard group_by='ticker' (Ticker, Price)
-                    if isinstance(df.columns, pd.MultiIndex) and symbol in df.columns.levels[0]:
-                        series = df[symbol]['Close']
-                    
-                    # 2. Maybe (Price, Ticker) if group_by failed?
-                    elif isinstance(df.columns, pd.MultiIndex) and symbol in df.columns.levels[1]:
-                         try:
-                             series = df.xs(symbol, level=1, axis=1)['Close']
-                         except:
-                             try:
-                                 series = df['Close'][symbol]
-                             except:
-                                 pass
-                                 
-                    # 3. Direct access (flat columns)
-                    elif symbol in df.columns:
-                        series = df[symbol]['Close']
+        # 거래소(.KS/.KQ)가 확인된 종목은 해당 심볼만 조회, 미확인 종목만 .KQ 재시도
+        prices = await asyncio.to_thread(get_quote_service().get_kr_prices, tickers)
                     
-                    if series is not None:
-                        valid_series = series.dropna()
-                        if not valid_series.empty:
-                            price = float(valid_series.iloc[-1])
-                            # 원본 티커로 매핑 (KS/KQ 제거된 형태 등)
-                            original_ticker = ticker_map.get(symbol)
-                            if original_ticker:
-                                prices[original_ticker] = price
-                except:
-                    continue
-                    
-        print(f"Fetched {len(prices)} prices.")
+        print(f"Fetched {len(prices)}/{len(tickers)} prices.")
         return jsonify(prices)
         
     except Exception as e:
@@ -847,11 +797,7 @@ def chatbot_welcome():
 def analyze_performance():
     """성과 분석 (과거 포착 종목의 이후 주가 추적)"""
     try:
-        import yfinance as yf
-        from datetime import datetime, timedelta
-        import os
-        import json
-        import pandas as pd
+        from engine.performance import analyze_signal_performance
         
         req_data = request.get_json()
         target_date_str = req_data.get('date') # 2026-01-20
@@ -865,128 +811,135 @@ def analyze_performance():
         filename = f"jongga_v2_results_{date_nohol}.json"
         vcp_filename = f"vcp_{date_nohol}.json"
         
-        # Try finding jongga first, then vcp
-        file_path = os.path.join(data_dir, filename)
-        if not os.path.exists(file_path):
-             file_path = os.path.join(data_dir, vcp_filename)
-             if not os.path.exists(file_path):
-                 return jsonify({'error': f'Data not found for {target_date_str}'}), 404
-             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            signal_data = json.load(f)
+        # Try finding jongga first, then vcp (DB 우선, 파일 폴백)
+        signal_data = (stored_run('KR', 'jongga_v2', target_date_str, os.path.join(data_dir, filename))
+                       or stored_run('KR', 'vcp', target_date_str, os.path.join(data_dir, vcp_filename)))
+        if signal_data is None:
+            file_path = os.path.join(data_dir, filename)
+            if not os.path.exists(file_path):
+                 file_path = os.path.join(data_dir, vcp_filename)
+                 if not os.path.exists(file_path):
+                     return jsonify({'error': f'Data not found for {target_date_str}'}), 404
+                 
+            with open(file_path, 'r', encoding='utf-8') as f:
+                signal_data = json.load(f)
             
         signals = signal_data.get('signals', [])
         if not signals:
              return jsonify({'dates': [], 'rows': []})
         
-        # Collect tickers
-        tickers = []
-        ticker_map = {} # symbol -> signal object
+        # Collect tickers (거래소 접미사는 리졸버 기준)
+        resolver = get_kr_resolver()
+        symbols, entry_prices, infos = [], [], []
         for s in signals:
             code = s.get('stock_code') or s.get('ticker')
             if not code: continue
             
-            market = s.get('market', '')
-            suffix = '.KQ' if market == 'KOSDAQ' or market == 'KQ' else '.KS'
-            symbol = f"{code}{suffix}"
-            tickers.append(symbol)
-            ticker_map[symbol] = s
-            ticker_map[code] = s 
+            symbols.append(resolver.resolve(code, s.get('market', '')))
+            entry_prices.append(s.get('current_price') or s.get('entry_price'))
+            infos.append(s)
             
-        if not tickers:
+        if not symbols:
              return jsonify({'dates': [], 'rows': []})
              
-        # Fetch History
-        print(f"Analyzing performance for {target_date_str} to now. Tickers: {len(tickers)}")
+        print(f"Analyzing performance for {target_date_str} to now. Tickers: {len(symbols)}")
         
-        # Download
-        df = yf.download(tickers, start=target_date_str, group_by='ticker', progress=False, threads=False)
+        # 종가 매트릭스 1회 구성 (OHLCV 캐시, 부족분만 일괄 다운로드)
+        # 표시 날짜: 포착일 + 7일 이내 + 최신일
+        market_dates, rows = analyze_signal_performance(
+            symbols, entry_prices, infos, target_date_str, window_days=7
+        )
         
-        if df.empty:
-             return jsonify({'dates': [], 'rows': []})
-             
-        # Extract and Filter dates
-        all_dates = [d.strftime('%Y-%m-%d') for d in df.index]
+        return jsonify({
+            'dates': market_dates,
+            'rows': rows
+        })
         
-        market_dates = []
-        if all_dates:
-            start_d = datetime.strptime(all_dates[0], '%Y-%m-%d')
-            limit_d = start_d + timedelta(days=7) # Capture date + 7 days
-            
-            # 1. Add dates within 1 week
-            for d in all_dates:
-                curr = datetime.strptime(d, '%Y-%m-%d')
-                if curr <= limit_d:
-                    market_dates.append(d)
-            
-            # 2. Add latest date (Today) if not included
-            if all_dates[-1] not in market_dates:
-                market_dates.append(all_dates[-1])
+    except Exception as e:
+        print("Analysis Error:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+
+@kr_bp.route('/performance/matrix')
+def performance_matrix():
+    """전체 히스토리 시그널의 1/3/5/10일 수익률, MFE/MAE, 등급별 적중률"""
+    try:
+        from app.store import get_store
+        from engine.performance import build_performance_matrix, summarize_by_grade, FORWARD_HORIZONS
+        
+        run_type = request.args.get('type', 'jongga_v2')  # jongga_v2 | vcp
+        if run_type not in ('jongga_v2', 'vcp'):
+            return jsonify({'error': f'Unknown type: {run_type}'}), 400
+        
+        store = get_store()
+        history = store.query_signals('KR', run_type)
+        if not history:
+            return jsonify({'horizons': list(FORWARD_HORIZONS), 'summary': {}, 'rows': [], 'dates': []})
+        
+        resolver = get_kr_resolver()
+        signals = []
+        for h in history:
+            signals.append({
+                'signal_date': h['signal_date'],
+                'code': h['code'],
+                'name': h['name'],
+                'symbol': resolver.resolve(h['code'], h['market']),
+                'grade': h['grade'],
+                'entry_price': h['entry_price'],
+            })
         
-        # Build Rows
-        rows = []
-        is_multi = len(tickers) > 1
+        # 확정된 날짜는 캐시(signal_performance) 재사용, 나머지만 1회 일괄 계산
+        rows, computed = build_performance_matrix(signals, store.get_performance('KR', run_type))
+        if computed:
+            store.save_performance('KR', run_type, computed)
         
-        for symbol in tickers:
-            s = ticker_map.get(symbol)
-            if not s: continue
-            
-            row = {
-                'signal_info': s,
-                'daily_stats': []
-            }
-            
-            try:
-                # Get close series
-                series = None
-                if is_multi:
-                     if isinstance(df.columns, pd.MultiIndex):
-                         if symbol in df.columns.levels[0]:
-                             series = df[symbol]['Close']
-                         elif symbol.replace('.KS', '.KQ') in df.columns.levels[0]:
-                              series = df[symbol.replace('.KS', '.KQ')]['Close']
-                else:
-                    if isinstance(df.columns, pd.MultiIndex):
-                         if symbol in df.columns.levels[0]:
-                             series = df[symbol]['Close']
-                         else:
-                             series = df['Close']
-                    else:
-                        series = df['Close']
-                        
-                if series is not None:
-                    entry_price = s.get('current_price') or s.get('entry_price')
-                    
-                    for date_val in df.index:
-                        d_str = date_val.strftime('%Y-%m-%d')
-                        if d_str not in market_dates: continue
-                        
-                        try:
-                            val = float(series.loc[date_val])
-                            if pd.isna(val):
-                                row['daily_stats'].append({'date': d_str, 'close': None, 'return_pct': None})
-                            else:
-                                ret = 0
-                                if entry_price and entry_price > 0:
-                                    ret = ((val - entry_price) / entry_price) * 100
-                                row['daily_stats'].append({
-                                    'date': d_str, 
-                                    'close': val, 
-                                    'return_pct': round(ret, 2)
-                                })
-                        except:
-                             row['daily_stats'].append({'date': d_str, 'close': None, 'return_pct': None})
-            except Exception as e:
-                pass
-                
-            rows.append(row)
-            
         return jsonify({
-            'dates': market_dates,
+            'horizons': list(FORWARD_HORIZONS),
+            'summary': summarize_by_grade(rows),
+            'dates': sorted({r['signal_date'] for r in rows}),
             'rows': rows
         })
         
     except Exception as e:
-        print("Analysis Error:", e)
+        print("Performance Matrix Error:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+
+@kr_bp.route('/backtest')
+def run_signal_backtest():
+    """저장된 시그널 백테스트 (BacktestConfig 프리셋: default | conservative | aggressive)"""
+    try:
+        from config import BacktestConfig
+        from engine.backtest import load_kr_signals, prepare_data, run_backtest
+        
+        run_type = request.args.get('type', 'vcp')  # vcp | jongga_v2
+        if run_type not in ('jongga_v2', 'vcp'):
+            return jsonify({'error': f'Unknown type: {run_type}'}), 400
+        preset = request.args.get('preset', 'default')
+        presets = {
+            'default': BacktestConfig,
+            'conservative': BacktestConfig.conservative,
+            'aggressive': BacktestConfig.aggressive,
+        }
+        if preset not in presets:
+            return jsonify({'error': f'Unknown preset: {preset}'}), 400
+        include_trades = request.args.get('trades', 'true').lower() != 'false'
+        
+        signals = load_kr_signals(
+            run_type,
+            start=request.args.get('start') or None,
+            end=request.args.get('end') or None,
+        )
+        data = prepare_data(signals)
+        if data is None:
+            return jsonify({'error': 'No signals with price data'}), 404
+        
+        result = run_backtest(data, presets[preset](), config_name=preset, include_trades=include_trades)
+        return jsonify(result.to_dict())
+        
+    except Exception as e:
+        print("Backtest Error:", e)
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
@@ -6,8 +6,10 @@ import json
 import traceback
 from datetime import datetime, date
 import glob
-import yfinance as yf
 from flask import Blueprint, jsonify, request
+from app.store import record_market_gate, stored_gate_dates
+from engine.locks import load_json_if_newer, single_flight
+from engine.persist import write_json
 
 us_bp = Blueprint('us', __name__)
 
@@ -22,6 +24,34 @@ def get_us_data_dir():
             pass
     return data_dir
 
+def _refresh_us_market_gate(data_dir, latest_file, result_data=None):
+    """US Market Gate 실시간 계산 + 저장 (result_data: 일괄 계산된 결과 재사용)"""
+    if result_data is None:
+        from engine.market_gate import compute_market_gate
+        result_data = compute_market_gate('US')
+    
+    # 캐싱
+    if data_dir:
+        try:
+            write_json(latest_file, result_data)
+        except:
+            pass
+    record_market_gate('US', date.today(), result_data)
+
+    return result_data
+
+
+def refresh_market_gate(result_data=None):
+    """US Market Gate 갱신 (프로세스 간 single-flight)"""
+    data_dir = get_us_data_dir()
+    latest_file = os.path.join(data_dir, 'market_gate_latest.json')
+    return single_flight(
+        'market_gate.us',
+        lambda: _refresh_us_market_gate(data_dir, latest_file, result_data),
+        lambda since: load_json_if_newer(latest_file, since),
+    )
+
+
 @us_bp.route('/market-gate')
 def us_market_gate():
     """US Market Gate 상태 (NASDAQ, S&P 500 기반)"""
@@ -36,105 +66,8 @@ def us_market_gate():
                 cached_data = json.load(f)
             return jsonify(cached_data)
         
-        # 실시간 데이터 조회 (yfinance)
-        # ^IXIC: NASDAQ Composite, ^GSPC: S&P 500, ^DJI: Dow Jones
-        nasdaq = yf.Ticker("^IXIC")
-        sp500 = yf.Ticker("^GSPC")
-        dow = yf.Ticker("^DJI")
-        
-        nasdaq_hist = nasdaq.history(period="5d")
-        sp500_hist = sp500.history(period="5d")
-        dow_hist = dow.history(period="5d")
-        
-        def calc_change(hist):
-            if hist.empty or len(hist) < 2:
-                return 0.0, 0.0
-            close = float(hist['Close'].iloc[-1])
-            prev = float(hist['Close'].iloc[-2])
-            change_pct = ((close - prev) / prev * 100) if prev > 0 else 0
-            return round(close, 2), round(change_pct, 2)
-
-        nasdaq_close, nasdaq_change = calc_change(nasdaq_hist)
-        sp500_close, sp500_change = calc_change(sp500_hist)
-        dow_close, dow_change = calc_change(dow_hist)
-        
-        # 점수 계산
-        avg_change = (nasdaq_change + sp500_change) / 2
-        if avg_change >= 1.0:
-            status = 'GREEN'
-            score = min(100, int(60 + avg_change * 10))
-            label = 'BULLISH'
-        elif avg_change <= -1.0:
-            status = 'RED'
-            score = max(0, int(40 + avg_change * 10))
-            label = 'BEARISH'
-        else:
-            status = 'YELLOW'
-            score = int(50 + avg_change * 5)
-            label = 'NEUTRAL'
-        
-        # 섹터 데이터 (US 주요 섹터 ETF)
-        sectors_data = []
-        sector_etfs = [
-            ("XLK", "IT/기술주"),
-            ("XLV", "헬스케어"),
-            ("XLF", "금융"),
-            ("XLY", "임의소비재"),
-            ("XLP", "필수소비재"),
-            ("XLE", "에너지"),
-            ("XLI", "산업재"),
-            ("XLB", "소재"),
-            ("XLRE", "부동산"),
-            ("XLC", "통신서비스"),
-            ("XLU", "유틸리티")
-        ]
-        
-        # Batch Fetch logic (simplified for US)
-        tickers_list = [t for t, n in sector_etfs]
-        data = yf.download(tickers_list, period="5d", interval="1d", group_by='ticker', progress=False)
-        
-        for ticker, name in sector_etfs:
-            try:
-                if ticker in data.columns.levels[0]:
-                    hist = data[ticker]
-                    close, change = calc_change(hist)
-                    sectors_data.append({
-                        'name': name,
-                        'signal': 'bullish' if change > 0 else 'bearish',
-                        'change_pct': change,
-                        'score': int(50 + change * 5)
-                    })
-            except:
-                continue
-
-        reasons = [
-            f"NASDAQ {nasdaq_change:+.2f}%",
-            f"S&P 500 {sp500_change:+.2f}%",
-            f"DOW {dow_change:+.2f}%"
-        ]
-        
-        result_data = {
-            'status': status,
-            'score': score,
-            'label': label,
-            'reasons': reasons,
-            'sectors': sectors_data,
-            'nasdaq_close': nasdaq_close,
-            'nasdaq_change_pct': nasdaq_change,
-            'sp500_close': sp500_close,
-            'sp500_change_pct': sp500_change,
-            'dow_close': dow_close,
-            'dow_change_pct': dow_change,
-            'updated_at': datetime.now().isoformat()
-        }
-        
-        # 캐싱
-        if data_dir:
-            try:
-                with open(latest_file, 'w', encoding='utf-8') as f:
-                    json.dump(result_data, f, ensure_ascii=False, indent=2)
-            except:
-                pass
+        # 실시간 데이터 조회 (동시 요청/다른 워커와 1회로 합침)
+        result_data = refresh_market_gate()
             
         return jsonify(result_data)
         
@@ -151,9 +84,13 @@ def us_market_gate():
 @us_bp.route('/market-gate/dates')
 def get_market_gate_dates():
     data_dir = get_us_data_dir()
+    pattern = os.path.join(data_dir, 'market_gate_*.json')
+    dates = stored_gate_dates('US', pattern)
+    if dates:
+        return jsonify(dates)
     if not os.path.exists(data_dir):
         return jsonify([])
-    files = glob.glob(os.path.join(data_dir, 'market_gate_*.json'))
+    files = glob.glob(pattern)
     dates = []
     for f in files:
         basename = os.path.basename(f)
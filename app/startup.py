@@ -0,0 +1,134 @@
+"""
+시작 프로파일 / 워밍업
+- create_app 단계별 소요 시간 + 무거운 모듈 import 시간 기록 → GET /api/startup
+- gunicorn preload_app 사용 시 마스터에서 warm_up() → fork 된 워커가 import 된 페이지를 copy-on-write 로 공유
+  (gunicorn.conf.py 의 when_ready / post_fork 훅)
+- preload 모드에서는 워커 풀/DB 커넥션을 fork 이후 워커마다 새로 준비 (after_fork)
+- CLI: python -m app.startup  (콜드 import 프로파일)
+"""
+
+import importlib
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+# 라우트 핸들러/작업에서 지연 import 하는 무거운 모듈 (의존 순서대로 - 앞 모듈 비용이 뒤 모듈에 중복 계산되지 않도록)
+HEAVY_MODULES = (
+    'numpy',
+    'pandas',
+    'yfinance',
+    'pykrx.stock',
+    'bs4',
+    'aiohttp',
+    'google.generativeai',
+    'engine.market_gate',
+    'engine.regime',
+    'engine.generator',
+    'engine.jp_collectors',
+)
+# grpc 기반 - fork 전에 import 하면 워커에서 채널이 멈출 수 있어 마스터 워밍업에서 제외, fork 후 워커에서 로드
+FORK_UNSAFE = ('google.generativeai',)
+
+PRELOAD_ENV = 'APP_PRELOAD'       # gunicorn.conf.py 가 preload_app 일 때 '1' 로 설정
+
+_lock = threading.Lock()
+_started_at = datetime.now().isoformat()
+_phases: List[Dict] = []
+_imports: Dict[str, Dict] = {}     # 모듈별 {ms, ok, pid} - pid 가 워커 pid 와 다르면 마스터에서 로드된 것
+
+
+def is_preload() -> bool:
+    return os.environ.get(PRELOAD_ENV) == '1'
+
+
+@contextmanager
+def phase(name: str):
+    """시작 단계 소요 시간 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = round((time.perf_counter() - started) * 1000, 1)
+        with _lock:
+            _phases.append({'phase': name, 'ms': elapsed, 'pid': os.getpid()})
+
+
+def _import_timed(name: str) -> Dict:
+    if name in sys.modules:
+        return {'ms': 0.0, 'ok': True, 'cached': True}
+    started = time.perf_counter()
+    try:
+        importlib.import_module(name)
+        entry = {'ok': True}
+    except Exception as e:
+        entry = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    entry['ms'] = round((time.perf_counter() - started) * 1000, 1)
+    entry['pid'] = os.getpid()
+    return entry
+
+
+def warm_up(modules: Iterable[str] = HEAVY_MODULES, exclude: Iterable[str] = ()) -> Dict[str, Dict]:
+    """무거운 모듈 선 import (best-effort). 모듈별 {ms, ok, error} 반환"""
+    exclude = set(exclude)
+    results = {}
+    with phase('warm_up'):
+        for name in modules:
+            if name in exclude:
+                continue
+            results[name] = _import_timed(name)
+            if not results[name]['ok']:
+                print(f"[Startup] {name} import 실패: {results[name]['error']}")
+    with _lock:
+        _imports.update(results)
+    total = sum(r['ms'] for r in results.values())
+    print(f"[Startup] 워밍업 {len(results)}개 모듈 {total:.0f}ms (pid {os.getpid()})")
+    return results
+
+
+def after_fork(app=None):
+    """preload 모드 fork 직후 (워커): 마스터에서 만든 DB 커넥션 버리고 워커 풀 시작, fork 비안전 모듈 백그라운드 로드"""
+    from app.database import dispose_engines
+    from app.jobs import start_worker_pool
+
+    dispose_engines(app)
+    start_worker_pool()
+    threading.Thread(target=warm_up, args=(FORK_UNSAFE,), name='warm-up', daemon=True).start()
+
+
+def startup_report() -> Dict:
+    """/api/startup 응답"""
+    with _lock:
+        return {
+            'pid': os.getpid(),
+            'started_at': _started_at,
+            'preload': is_preload(),
+            'phases': list(_phases),
+            'imports': dict(_imports),
+            'loaded': {name: name in sys.modules for name in HEAVY_MODULES},
+            'module_count': len(sys.modules),
+        }
+
+
+def main():
+    """콜드 프로세스에서 앱 생성 + 워밍업 프로파일 출력"""
+    os.environ.setdefault('JOB_WORKER_MODE', 'external')   # 프로파일 중 워커 풀 미실행
+
+    from app import create_app
+
+    create_app()
+    warm_up()
+
+    report = startup_report()
+    for p in report['phases']:
+        print(f"  {p['phase']:<20} {p['ms']:>8.1f} ms")
+    for name, r in report['imports'].items():
+        status = '' if r['ok'] else f"  ({r['error']})"
+        print(f"  import {name:<24} {r['ms']:>8.1f} ms{status}")
+
+
+if __name__ == "__main__":
+    main()
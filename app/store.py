@@ -0,0 +1,559 @@
+"""
+결과 저장소 (SQLite / Turso)
+- 스크리너 결과, Market Gate, 추적 시그널을 테이블에 기록
+- 히스토리 조회는 인덱스 기반 쿼리로 처리 (파일 스캔 대체)
+- JSON 파일은 호환성을 위해 계속 생성 (export 지원)
+- DB 우선 조회, 단 DB 기록 없이 생성된 더 새 JSON 파일(DB 최신 날짜 이후 / 행보다 나중에 수정)은 파일 우선
+- 기존 JSON 히스토리 적재는 store_migrations 기록으로 DB 당 1회
+"""
+
+import os
+import glob
+import json
+import re
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from app.database import Base, get_engine, session_scope
+from app.models import (
+    DailyRun, SignalRecord, MarketGateSnapshot, SignalPerformance, TrackedSignal, StoreMigration
+)
+
+JSON_BACKFILL_MIGRATION = 'json_history_backfill'
+_FILE_DATE = re.compile(r'_(\d{8})\.json$')
+
+
+def _to_date(value) -> date:
+    """'2026-01-25' / '20260125' / date / datetime -> date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()[:10]
+    if '-' in text:
+        return datetime.strptime(text, '%Y-%m-%d').date()
+    return datetime.strptime(text[:8], '%Y%m%d').date()
+
+
+def _normalize_signal(s: Dict) -> Dict:
+    """시장/엔진별로 다른 시그널 키를 공통 컬럼으로 정규화"""
+    score = s.get('score', 0)
+    if isinstance(score, dict):
+        score = score.get('total', 0)
+    return {
+        'code': str(s.get('stock_code') or s.get('code') or s.get('ticker') or ''),
+        'name': str(s.get('stock_name') or s.get('name') or ''),
+        'exchange': str(s.get('market') or ''),
+        'grade': str(s.get('grade') or ''),
+        'score': float(score or 0),
+        'entry_price': float(s.get('entry_price') or s.get('current_price') or s.get('close') or 0),
+        'change_pct': float(s.get('change_pct') or 0),
+    }
+
+
+class ResultStore:
+    """스크리너 결과 저장소"""
+
+    def __init__(self):
+        self._schema_ready = False
+        self._lock = threading.Lock()
+
+    def ensure_schema(self):
+        """테이블 생성 (최초 1회)"""
+        if self._schema_ready:
+            return
+        with self._lock:
+            if not self._schema_ready:
+                Base.metadata.create_all(get_engine())
+                self._schema_ready = True
+
+    # === 일별 실행 결과 ===
+    def save_run(self, market: str, run_type: str, run_date, payload: Dict) -> int:
+        """일별 실행 결과 저장 (같은 날짜 재실행 시 교체)"""
+        self.ensure_schema()
+        run_date = _to_date(run_date)
+        signals = payload.get('signals', []) or []
+
+        with session_scope() as session:
+            old_ids = session.scalars(
+                select(DailyRun.id).where(
+                    DailyRun.market == market,
+                    DailyRun.run_type == run_type,
+                    DailyRun.run_date == run_date,
+                )
+            ).all()
+            if old_ids:
+                session.execute(delete(SignalRecord).where(SignalRecord.run_id.in_(old_ids)))
+                session.execute(delete(DailyRun).where(DailyRun.id.in_(old_ids)))
+
+            run = DailyRun(
+                market=market,
+                run_type=run_type,
+                run_date=run_date,
+                generated_at=datetime.now(),
+                total_candidates=int(payload.get('total_candidates') or payload.get('total_scanned') or len(signals)),
+                signal_count=len(signals),
+                payload=json.dumps(payload, ensure_ascii=False, default=str),
+            )
+            session.add(run)
+            session.flush()
+
+            session.add_all([
+                SignalRecord(
+                    run_id=run.id,
+                    market=market,
+                    run_type=run_type,
+                    signal_date=run_date,
+                    payload=json.dumps(s, ensure_ascii=False, default=str),
+                    **_normalize_signal(s),
+                )
+                for s in signals
+            ])
+            return run.id
+
+    def get_run(self, market: str, run_type: str, run_date) -> Optional[Dict]:
+        """특정 날짜 실행 결과 (JSON 원본)"""
+        entry = self.get_run_entry(market, run_type, run_date)
+        return entry[0] if entry else None
+
+    def get_run_entry(self, market: str, run_type: str, run_date) -> Optional[Tuple[Dict, datetime]]:
+        """특정 날짜 실행 결과 + 기록 시각"""
+        self.ensure_schema()
+        with session_scope() as session:
+            row = session.execute(
+                select(DailyRun.payload, DailyRun.generated_at).where(
+                    DailyRun.market == market,
+                    DailyRun.run_type == run_type,
+                    DailyRun.run_date == _to_date(run_date),
+                )
+            ).first()
+        return (json.loads(row[0]), row[1]) if row and row[0] else None
+
+    def get_latest_run(self, market: str, run_type: str) -> Optional[Dict]:
+        """가장 최근 실행 결과"""
+        self.ensure_schema()
+        with session_scope() as session:
+            payload = session.scalar(
+                select(DailyRun.payload)
+                .where(DailyRun.market == market, DailyRun.run_type == run_type)
+                .order_by(DailyRun.run_date.desc())
+                .limit(1)
+            )
+        return json.loads(payload) if payload else None
+
+    def list_run_dates(self, market: str, run_type: str) -> List[str]:
+        """실행 결과가 존재하는 날짜 목록 (최신순, YYYY-MM-DD)"""
+        self.ensure_schema()
+        with session_scope() as session:
+            rows = session.scalars(
+                select(DailyRun.run_date)
+                .where(DailyRun.market == market, DailyRun.run_type == run_type)
+                .order_by(DailyRun.run_date.desc())
+            ).all()
+        return [d.isoformat() for d in rows]
+
+    def query_signals(
+        self,
+        market: str,
+        run_type: str = None,
+        start=None,
+        end=None,
+        code: str = None,
+        grade: str = None,
+    ) -> List[Dict]:
+        """시그널 조회 (market, date, code, grade 인덱스 사용)"""
+        self.ensure_schema()
+        stmt = select(SignalRecord).where(SignalRecord.market == market)
+        if run_type:
+            stmt = stmt.where(SignalRecord.run_type == run_type)
+        if start:
+            stmt = stmt.where(SignalRecord.signal_date >= _to_date(start))
+        if end:
+            stmt = stmt.where(SignalRecord.signal_date <= _to_date(end))
+        if code:
+            stmt = stmt.where(SignalRecord.code == code)
+        if grade:
+            stmt = stmt.where(SignalRecord.grade == grade)
+        stmt = stmt.order_by(SignalRecord.signal_date, SignalRecord.id)
+
+        with session_scope() as session:
+            rows = session.scalars(stmt).all()
+            return [
+                {
+                    'signal_date': r.signal_date.isoformat(),
+                    'run_type': r.run_type,
+                    'code': r.code,
+                    'name': r.name,
+                    'market': r.exchange,
+                    'grade': r.grade,
+                    'score': r.score,
+                    'entry_price': r.entry_price,
+                    'change_pct': r.change_pct,
+                    'signal': json.loads(r.payload),
+                }
+                for r in rows
+            ]
+
+    # === Market Gate ===
+    def save_market_gate(self, market: str, snapshot_date, payload: Dict):
+        """Market Gate 스냅샷 저장 (일자별 1건)"""
+        self.ensure_schema()
+        snapshot_date = _to_date(snapshot_date)
+        with session_scope() as session:
+            session.execute(delete(MarketGateSnapshot).where(
+                MarketGateSnapshot.market == market,
+                MarketGateSnapshot.snapshot_date == snapshot_date,
+            ))
+            session.add(MarketGateSnapshot(
+                market=market,
+                snapshot_date=snapshot_date,
+                status=str(payload.get('status') or payload.get('gate') or 'NEUTRAL'),
+                score=float(payload.get('score') or 0),
+                updated_at=datetime.now(),
+                payload=json.dumps(payload, ensure_ascii=False, default=str),
+            ))
+
+    def get_market_gate(self, market: str, snapshot_date) -> Optional[Dict]:
+        """특정 날짜 Market Gate"""
+        entry = self.get_market_gate_entry(market, snapshot_date)
+        return entry[0] if entry else None
+
+    def get_market_gate_entry(self, market: str, snapshot_date) -> Optional[Tuple[Dict, datetime]]:
+        """특정 날짜 Market Gate + 기록 시각"""
+        self.ensure_schema()
+        with session_scope() as session:
+            row = session.execute(
+                select(MarketGateSnapshot.payload, MarketGateSnapshot.updated_at).where(
+                    MarketGateSnapshot.market == market,
+                    MarketGateSnapshot.snapshot_date == _to_date(snapshot_date),
+                )
+            ).first()
+        return (json.loads(row[0]), row[1]) if row and row[0] else None
+
+    def list_market_gate_dates(self, market: str) -> List[str]:
+        """Market Gate 스냅샷 날짜 목록 (최신순)"""
+        self.ensure_schema()
+        with session_scope() as session:
+            rows = session.scalars(
+                select(MarketGateSnapshot.snapshot_date)
+                .where(MarketGateSnapshot.market == market)
+                .order_by(MarketGateSnapshot.snapshot_date.desc())
+            ).all()
+        return [d.isoformat() for d in rows]
+
+    # === 시그널 성과 ===
+    def save_performance(self, market: str, run_type: str, rows: List[Dict]):
+        """시그널 성과 저장 (market, run_type, signal_date, code 기준 교체)"""
+        if not rows:
+            return
+        self.ensure_schema()
+        with session_scope() as session:
+            for row in rows:
+                signal_date = _to_date(row['signal_date'])
+                session.execute(delete(SignalPerformance).where(
+                    SignalPerformance.market == market,
+                    SignalPerformance.run_type == run_type,
+                    SignalPerformance.signal_date == signal_date,
+                    SignalPerformance.code == row['code'],
+                ))
+                session.add(SignalPerformance(
+                    market=market,
+                    run_type=run_type,
+                    signal_date=signal_date,
+                    code=row['code'],
+                    grade=row.get('grade', ''),
+                    entry_price=float(row.get('entry_price') or 0),
+                    ret_1d=row.get('ret_1d'),
+                    ret_3d=row.get('ret_3d'),
+                    ret_5d=row.get('ret_5d'),
+                    ret_10d=row.get('ret_10d'),
+                    mfe_pct=row.get('mfe_pct'),
+                    mae_pct=row.get('mae_pct'),
+                    is_final=bool(row.get('is_final', False)),
+                    computed_at=datetime.now(),
+                ))
+
+    def get_performance(self, market: str, run_type: str, signal_date=None) -> List[Dict]:
+        """시그널 성과 (signal_date 생략 시 전체 기간)"""
+        self.ensure_schema()
+        stmt = select(SignalPerformance).where(
+            SignalPerformance.market == market,
+            SignalPerformance.run_type == run_type,
+        )
+        if signal_date is not None:
+            stmt = stmt.where(SignalPerformance.signal_date == _to_date(signal_date))
+        with session_scope() as session:
+            rows = session.scalars(stmt).all()
+            return [
+                {
+                    'signal_date': r.signal_date.isoformat(),
+                    'code': r.code,
+                    'grade': r.grade,
+                    'entry_price': r.entry_price,
+                    'ret_1d': r.ret_1d,
+                    'ret_3d': r.ret_3d,
+                    'ret_5d': r.ret_5d,
+                    'ret_10d': r.ret_10d,
+                    'mfe_pct': r.mfe_pct,
+                    'mae_pct': r.mae_pct,
+                    'is_final': r.is_final,
+                }
+                for r in rows
+            ]
+
+    # === SignalTracker ===
+    def upsert_tracked_signals(self, signals: List[Dict]):
+        """추적 시그널 저장 (ticker, signal_date 기준 교체)"""
+        if not signals:
+            return
+        self.ensure_schema()
+        with session_scope() as session:
+            for s in signals:
+                signal_date = _to_date(s['signal_date'])
+                session.execute(delete(TrackedSignal).where(
+                    TrackedSignal.ticker == s['ticker'],
+                    TrackedSignal.signal_date == signal_date,
+                ))
+                session.add(TrackedSignal(
+                    ticker=s['ticker'],
+                    name=s.get('name', ''),
+                    market=s.get('market', 'KOSPI'),
+                    signal_date=signal_date,
+                    status=s.get('status', 'OPEN'),
+                    score=float(s.get('score') or 0),
+                    entry_price=float(s.get('entry_price') or 0),
+                    current_price=float(s.get('current_price') or 0),
+                    return_pct=float(s.get('return_pct') or 0),
+                    exit_date=_to_date(s['exit_date']) if s.get('exit_date') else None,
+                    exit_price=s.get('exit_price'),
+                    exit_reason=s.get('exit_reason'),
+                    payload=json.dumps(s, ensure_ascii=False, default=str),
+                ))
+
+    def list_tracked_signals(self, status: str = None) -> List[Dict]:
+        """추적 시그널 조회"""
+        self.ensure_schema()
+        stmt = select(TrackedSignal.payload).order_by(TrackedSignal.signal_date, TrackedSignal.id)
+        if status:
+            stmt = stmt.where(TrackedSignal.status == status)
+        with session_scope() as session:
+            return [json.loads(p) for p in session.scalars(stmt).all()]
+
+    # === JSON 호환 ===
+    def export_json(self, market: str, run_type: str, run_date, path: str) -> bool:
+        """DB에 저장된 실행 결과를 JSON 파일로 내보내기"""
+        data = self.get_run(market, run_type, run_date)
+        if data is None:
+            return False
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return True
+
+    def is_empty(self) -> bool:
+        """저장된 실행 결과/스냅샷이 하나도 없는지"""
+        self.ensure_schema()
+        with session_scope() as session:
+            has_run = session.scalar(select(DailyRun.id).limit(1)) is not None
+            has_gate = session.scalar(select(MarketGateSnapshot.id).limit(1)) is not None
+        return not (has_run or has_gate)
+
+    def claim_migration(self, name: str) -> bool:
+        """1회성 작업 선점 (이미 적용됐거나 다른 워커가 선점했으면 False)"""
+        self.ensure_schema()
+        try:
+            with session_scope() as session:
+                session.add(StoreMigration(name=name, applied_at=datetime.now()))
+            return True
+        except IntegrityError:
+            return False
+
+    def release_migration(self, name: str):
+        """선점 취소 (작업 실패 시 다음 기동에서 재시도)"""
+        with session_scope() as session:
+            session.execute(delete(StoreMigration).where(StoreMigration.name == name))
+
+    def import_json_history(self, data_dir: str) -> int:
+        """기존 data/*.json 파일을 DB로 일괄 적재 (마이그레이션)"""
+        patterns = [
+            ('KR', 'jongga_v2', os.path.join(data_dir, 'jongga_v2_results_*.json')),
+            ('KR', 'vcp', os.path.join(data_dir, 'vcp_*.json')),
+            ('JP', 'jongga_v2_n225', os.path.join(data_dir, 'jp', 'jongga_v2_n225_results_*.json')),
+            ('JP', 'jongga_v2_n400', os.path.join(data_dir, 'jp', 'jongga_v2_n400_results_*.json')),
+            ('JP', 'jongga_v2', os.path.join(data_dir, 'jp', 'jongga_v2_results_*.json')),
+            ('JP', 'vcp', os.path.join(data_dir, 'jp', 'vcp_*.json')),
+        ]
+        count = 0
+        for market, run_type, pattern in patterns:
+            for path in sorted(glob.glob(pattern)):
+                match = _FILE_DATE.search(path)
+                if not match:
+                    continue
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        self.save_run(market, run_type, match.group(1), json.load(f))
+                    count += 1
+                except Exception as e:
+                    print(f"[Store] {path} 적재 실패: {e}")
+
+        for market, sub in [('KR', ''), ('JP', 'jp'), ('US', 'us')]:
+            for path in sorted(glob.glob(os.path.join(data_dir, sub, 'market_gate_*.json'))):
+                match = re.search(r'market_gate_(\d{8})\.json$', path)
+                if not match:
+                    continue
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        self.save_market_gate(market, match.group(1), json.load(f))
+                    count += 1
+                except Exception as e:
+                    print(f"[Store] {path} 적재 실패: {e}")
+        return count
+
+
+_store: Optional[ResultStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ResultStore:
+    """프로세스 공용 저장소 인스턴스"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ResultStore()
+    return _store
+
+
+def record_run(market: str, run_type: str, run_date, payload: Dict):
+    """실행 결과 DB 기록 (실패해도 JSON 저장 흐름은 유지)"""
+    try:
+        get_store().save_run(market, run_type, run_date, payload)
+    except Exception as e:
+        print(f"[Store] {market}/{run_type} 저장 실패: {e}")
+
+
+def _file_dates(pattern: str) -> List[str]:
+    """파일명 날짜 목록 (xxx_YYYYMMDD.json → YYYY-MM-DD)"""
+    dates = set()
+    for path in glob.glob(pattern):
+        match = _FILE_DATE.search(path)
+        if match:
+            d = match.group(1)
+            dates.add(f"{d[:4]}-{d[4:6]}-{d[6:]}")
+    return sorted(dates, reverse=True)
+
+
+def _with_newer_files(dates: List[str], pattern: Optional[str]) -> List[str]:
+    """DB 날짜 목록 + DB 최신 날짜 이후의 파일 날짜 (DB 기록 없이 생성된 결과)"""
+    if not dates or not pattern:
+        return dates
+    newer = [d for d in _file_dates(pattern) if d > dates[0]]
+    return sorted(set(dates) | set(newer), reverse=True) if newer else dates
+
+
+def _file_is_newer(path: Optional[str], recorded_at: Optional[datetime]) -> bool:
+    if not path or recorded_at is None:
+        return False
+    try:
+        return datetime.fromtimestamp(os.path.getmtime(path)) > recorded_at
+    except OSError:
+        return False
+
+
+def stored_dates(market: str, run_type: str, pattern: str = None) -> List[str]:
+    """DB 날짜 목록 (실패 시 빈 리스트 -> 호출측 파일 스캔 폴백)
+    pattern: 결과 파일 glob - DB 최신 날짜보다 새 파일 날짜를 합침
+    """
+    try:
+        dates = get_store().list_run_dates(market, run_type)
+    except Exception as e:
+        print(f"[Store] {market}/{run_type} 날짜 조회 실패: {e}")
+        return []
+    return _with_newer_files(dates, pattern)
+
+
+def stored_run(market: str, run_type: str, run_date, path: str = None) -> Optional[Dict]:
+    """DB 실행 결과 (실패 시 None -> 호출측 파일 폴백)
+    path: 같은 날짜 결과 파일 - DB 행보다 나중에 수정됐으면 None (파일 우선)
+    """
+    try:
+        entry = get_store().get_run_entry(market, run_type, run_date)
+    except Exception as e:
+        print(f"[Store] {market}/{run_type} 결과 조회 실패: {e}")
+        return None
+    if entry is None or _file_is_newer(path, entry[1]):
+        return None
+    return entry[0]
+
+
+def stored_gate_dates(market: str, pattern: str = None) -> List[str]:
+    """DB Market Gate 날짜 목록 (실패 시 빈 리스트, pattern 은 stored_dates 와 동일)"""
+    try:
+        dates = get_store().list_market_gate_dates(market)
+    except Exception as e:
+        print(f"[Store] {market} Market Gate 날짜 조회 실패: {e}")
+        return []
+    return _with_newer_files(dates, pattern)
+
+
+def stored_gate(market: str, snapshot_date, path: str = None) -> Optional[Dict]:
+    """DB Market Gate 스냅샷 (실패 시 None, path 는 stored_run 과 동일)"""
+    try:
+        entry = get_store().get_market_gate_entry(market, snapshot_date)
+    except Exception as e:
+        print(f"[Store] {market} Market Gate 조회 실패: {e}")
+        return None
+    if entry is None or _file_is_newer(path, entry[1]):
+        return None
+    return entry[0]
+
+
+def backfill_once(data_dir: str):
+    """기존 JSON 히스토리 적재 - DB 당 1회 (store_migrations 기록, 워커 기동마다 반복하지 않음)"""
+    try:
+        store = get_store()
+        if not store.claim_migration(JSON_BACKFILL_MIGRATION):
+            return
+    except Exception as e:
+        print(f"[Store] 히스토리 적재 확인 실패: {e}")
+        return
+    try:
+        # 이전 버전에서 이미 적재된 DB 는 기록만 남김
+        if store.is_empty():
+            n = store.import_json_history(data_dir)
+            print(f"[Store] 기존 JSON 히스토리 {n}개 적재")
+    except Exception as e:
+        print(f"[Store] 히스토리 적재 실패: {e}")
+        try:
+            store.release_migration(JSON_BACKFILL_MIGRATION)
+        except Exception:
+            pass
+
+
+def record_market_gate(market: str, snapshot_date, payload: Dict):
+    """Market Gate DB 기록 (실패해도 무시)"""
+    try:
+        get_store().save_market_gate(market, snapshot_date, payload)
+    except Exception as e:
+        print(f"[Store] {market} Market Gate 저장 실패: {e}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = sys.argv[1] if len(sys.argv) > 1 else 'import'
+
+    if command == 'import':
+        n = get_store().import_json_history(os.path.join(base_dir, 'data'))
+        print(f"✅ {n}개 파일 적재 완료")
+    elif command == 'export' and len(sys.argv) >= 6:
+        # python -m app.store export KR jongga_v2 2026-01-25 out.json
+        ok = get_store().export_json(sys.argv[2], sys.argv[3], sys.argv[4], sys.argv[5])
+        print("✅ 내보내기 완료" if ok else "❌ 데이터 없음")
+    else:
+        print("Usage: python -m app.store [import | export MARKET RUN_TYPE DATE PATH]")
@@ -0,0 +1,146 @@
+"""
+비동기 서빙 (프로세스당 이벤트 루프 1개)
+- 백그라운드 스레드에서 도는 영구 이벤트 루프 + 공유 aiohttp 세션 (요청마다 루프/세션 생성 X)
+- async def 뷰는 AsyncFlask.ensure_sync 가 이 루프에 제출 (요청 컨텍스트 유지) → asgiref 불필요
+- 루프 안 블로킹 호출(yfinance 등)은 asyncio.to_thread → 크기 제한 실행기 (AIO_BLOCKING_THREADS, 기본 16)
+- fork 이후(gunicorn preload) 첫 사용 시 워커 프로세스에서 새로 생성
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Any, Awaitable, Dict, Optional
+
+from flask import Flask
+
+DEFAULT_HTTP_TIMEOUT = 30
+
+
+async def _run_in_context(coro: Awaitable, context: contextvars.Context):
+    # 호출 스레드의 컨텍스트(Flask request/app context)로 태스크 실행
+    # create_task(context=) 는 3.11+ → 태스크는 생성 시점 컨텍스트를 복사하므로 context.run 안에서 생성
+    return await context.run(asyncio.get_running_loop().create_task, coro)
+
+
+class AsyncLoop:
+    """영구 이벤트 루프 스레드 + 공유 HTTP 세션"""
+
+    def __init__(self, blocking_threads: int = None):
+        self.blocking_threads = blocking_threads or int(os.environ.get('AIO_BLOCKING_THREADS', '16'))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._sessions: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._pid != os.getpid():
+            with self._lock:
+                if self._loop is None or self._pid != os.getpid():
+                    self._start()
+        return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(ThreadPoolExecutor(self.blocking_threads, thread_name_prefix='aio-blocking'))
+        started = threading.Event()
+
+        def _run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        # fork 이전 루프/세션은 부모 소유라 그대로 버림
+        self._sessions = {}
+        self._thread = threading.Thread(target=_run, name='aio-loop', daemon=True)
+        self._thread.start()
+        started.wait()
+        self._loop, self._pid = loop, os.getpid()
+        print(f"[AIO] 이벤트 루프 시작 (pid {self._pid}, 블로킹 실행기 {self.blocking_threads})")
+
+    def in_loop(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro: Awaitable, timeout: float = None, context: contextvars.Context = None):
+        """동기 코드에서 코루틴 실행 (결과 반환, 예외 전파). 루프 스레드 안에서 호출하면 교착이므로 금지"""
+        if self.in_loop():
+            coro.close()
+            raise RuntimeError("이벤트 루프 스레드에서 run() 호출 불가 - await 사용")
+        future = asyncio.run_coroutine_threadsafe(
+            _run_in_context(coro, context or contextvars.copy_context()), self.loop
+        )
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:   # 3.11 미만은 내장 TimeoutError 와 별개
+            future.cancel()
+            raise
+
+    async def http_session(self, name: str = 'default', timeout: float = DEFAULT_HTTP_TIMEOUT):
+        """공유 aiohttp 세션 (루프 안에서 호출)"""
+        import aiohttp
+
+        session = self._sessions.get(name)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout))
+            self._sessions[name] = session
+        return session
+
+    async def _close_sessions(self):
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def shutdown(self):
+        if self._loop is None or self._pid != os.getpid():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_sessions(), self._loop).result(5)
+        except Exception as e:
+            print(f"[AIO] 세션 종료 실패: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+        self._loop = None
+
+
+_async_loop: Optional[AsyncLoop] = None
+_async_loop_lock = threading.Lock()
+
+
+def get_async_loop() -> AsyncLoop:
+    global _async_loop
+    if _async_loop is None:
+        with _async_loop_lock:
+            if _async_loop is None:
+                _async_loop = AsyncLoop()
+                atexit.register(_async_loop.shutdown)
+    return _async_loop
+
+
+def run_async(coro: Awaitable, timeout: float = None):
+    """공유 루프에서 코루틴 실행 (asyncio.run 대체 - 요청마다 루프를 만들지 않음)"""
+    return get_async_loop().run(coro, timeout)
+
+
+async def http_session(name: str = 'default', timeout: float = DEFAULT_HTTP_TIMEOUT):
+    return await get_async_loop().http_session(name, timeout)
+
+
+class AsyncFlask(Flask):
+    """async def 뷰/훅을 요청마다 새 루프가 아닌 공유 이벤트 루프에서 실행"""
+
+    def ensure_sync(self, func):
+        if not asyncio.iscoroutinefunction(func):
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return run_async(func(*args, **kwargs))
+
+        return wrapper
@@ -0,0 +1,246 @@
+"""
+SSE 이벤트 브로커
+- 채널별 publish / subscribe (프로세스 내)
+- 채널마다 마지막 이벤트 보관 → 새 구독자에게 즉시 전달
+- 실시간 시세는 백그라운드 poller 1개가 구독자 전체의 관심 종목을 합쳐 조회
+- 스크리너 진행 상황은 작업 큐 DB 행을 tail (다른 gunicorn 워커/외부 워커에서 도는 작업도 전달)
+"""
+
+import json
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set
+
+HEARTBEAT_SECONDS = 15
+
+
+class Subscription:
+    """구독자 1명 (SSE 연결 1개)"""
+
+    def __init__(self, broker: 'EventBroker', channels: Set[str], watch: Dict[str, Set[str]] = None,
+                 maxsize: int = 100):
+        self.broker = broker
+        self.channels = channels
+        self.watch = watch or {}          # {'KR': {'005930', ...}, 'JP': {'7203', ...}}
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+
+    def put(self, channel: str, data: dict):
+        try:
+            self.queue.put_nowait((channel, data))
+        except queue.Full:
+            # 느린 클라이언트: 가장 오래된 이벤트를 버리고 최신 이벤트 유지
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait((channel, data))
+            except queue.Full:
+                pass
+
+    def stream(self) -> Iterator[str]:
+        """SSE 텍스트 스트림 (연결 종료 시 구독 해제)"""
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                try:
+                    channel, data = self.queue.get(timeout=HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield f"event: {channel}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+        finally:
+            self.broker.unsubscribe(self)
+
+
+class EventBroker:
+    """채널 기반 pub/sub"""
+
+    def __init__(self):
+        self._subscribers: Set[Subscription] = set()
+        self._last: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channels: Iterable[str], watch: Dict[str, Set[str]] = None) -> Subscription:
+        sub = Subscription(self, set(channels), watch)
+        with self._lock:
+            self._subscribers.add(sub)
+            last = [(c, self._last[c]) for c in sub.channels if c in self._last]
+        for channel, data in last:
+            sub.put(channel, data)
+        if 'quotes' in sub.channels and sub.watch:
+            get_quote_poller().ensure_running()
+        tail = get_job_tail()
+        if sub.channels & tail.channels():
+            # 새 구독자에게 현재 상태를 바로 보내도록 다음 조회에서 전 채널 재발행
+            tail.ensure_running(refresh=True)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def publish(self, channel: str, data: dict, retain: bool = True):
+        with self._lock:
+            if retain:
+                self._last[channel] = data
+            targets = [s for s in self._subscribers if channel in s.channels]
+        for sub in targets:
+            sub.put(channel, data)
+
+    def publish_quotes(self, market: str, prices: Dict[str, float]):
+        """시세 이벤트 - 구독자별 관심 종목만 골라 전달"""
+        updated_at = datetime.now().isoformat()
+        with self._lock:
+            targets = [s for s in self._subscribers if 'quotes' in s.channels and s.watch.get(market)]
+        for sub in targets:
+            picked = {code: prices[code] for code in sub.watch[market] if code in prices}
+            if picked:
+                sub.put('quotes', {'market': market, 'prices': picked, 'updated_at': updated_at})
+
+    def subscribed_channels(self) -> Set[str]:
+        with self._lock:
+            return set().union(*(s.channels for s in self._subscribers))
+
+    def watched_codes(self) -> Dict[str, Set[str]]:
+        """시세 채널 구독자 전체의 관심 종목 (시장별 합집합)"""
+        merged: Dict[str, Set[str]] = {}
+        with self._lock:
+            for sub in self._subscribers:
+                if 'quotes' not in sub.channels:
+                    continue
+                for market, codes in sub.watch.items():
+                    merged.setdefault(market, set()).update(codes)
+        return merged
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+class QuotePoller:
+    """구독자 전체가 공유하는 시세 조회 루프 (구독자가 없으면 종료)"""
+
+    def __init__(self, broker: EventBroker, interval: float = 5.0):
+        self.broker = broker
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def ensure_running(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='quote-poller', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        from engine.quote_service import get_quote_service
+
+        service = get_quote_service()
+        while True:
+            # 종료 판정은 lock 안에서 (종료 직전 들어온 구독자 누락 방지)
+            with self._lock:
+                watched = self.broker.watched_codes()
+                if not any(watched.values()):
+                    self._thread = None
+                    return
+
+            started = time.time()
+            for market, codes in watched.items():
+                if not codes:
+                    continue
+                try:
+                    if market == 'KR':
+                        prices = service.get_kr_prices(codes)
+                    elif market == 'JP':
+                        prices = service.get_jp_prices(codes)
+                    else:
+                        prices = service.get_prices(codes)
+                except Exception as e:
+                    print(f"[SSE] {market} 시세 조회 실패: {e}")
+                    continue
+                self.broker.publish_quotes(market, prices)
+
+            time.sleep(max(0.5, self.interval - (time.time() - started)))
+
+
+class JobTail:
+    """작업 상태 채널 tail - 구독자가 있는 채널만 DB 에서 주기적으로 읽어 바뀐 경우 push (구독자가 없으면 종료)"""
+
+    def __init__(self, broker: EventBroker, interval: float = 1.0):
+        self.broker = broker
+        self.interval = interval
+        self._sources: Dict[str, Callable[[], dict]] = {}
+        self._seen: Dict[str, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def register(self, channel: str, fetch: Callable[[], dict]):
+        """channel 구독 중에 fetch() 결과(현재 상태)를 tail"""
+        self._sources[channel] = fetch
+
+    def channels(self) -> Set[str]:
+        return set(self._sources)
+
+    def ensure_running(self, refresh: bool = False):
+        with self._lock:
+            if refresh:
+                self._seen.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='job-tail', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                active = self.broker.subscribed_channels() & self.channels()
+                if not active:
+                    self._seen.clear()
+                    self._thread = None
+                    return
+
+            for channel in active:
+                try:
+                    data = self._sources[channel]()
+                except Exception as e:
+                    print(f"[SSE] {channel} 작업 상태 조회 실패: {e}")
+                    continue
+                key = json.dumps(data, sort_keys=True, default=str)
+                with self._lock:
+                    changed = self._seen.get(channel) != key
+                    self._seen[channel] = key
+                if changed:
+                    self.broker.publish(channel, data, retain=False)
+
+            time.sleep(self.interval)
+
+
+broker = EventBroker()
+_poller: Optional[QuotePoller] = None
+_poller_lock = threading.Lock()
+_job_tail = JobTail(broker)
+
+
+def get_quote_poller() -> QuotePoller:
+    global _poller
+    if _poller is None:
+        with _poller_lock:
+            if _poller is None:
+                _poller = QuotePoller(broker)
+    return _poller
+
+
+def get_job_tail() -> JobTail:
+    return _job_tail
+
+
+def tail_job_status(channel: str, fetch: Callable[[], dict]):
+    """작업 상태 채널 등록 (fetch: DB 에서 최신 작업 상태 조회)"""
+    _job_tail.register(channel, fetch)
+
+
+def publish(channel: str, data: dict, retain: bool = True):
+    """이벤트 발행 (구독자 없으면 마지막 값만 보관)"""
+    broker.publish(channel, data, retain)
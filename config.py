@@ -86,6 +86,7 @@ class BacktestConfig:
     # === Market Regime ===
     allowed_regimes: List[str] = field(default_factory=lambda: ["KR_BULLISH", "KR_NEUTRAL"])
     use_usd_krw_gate: bool = True           # 환율 게이트 사용
+    exit_on_regime_change: bool = True      # 허용되지 않은 레짐으로 바뀌면 종가 청산
     
     # === 자금 관리 ===
     initial_capital: float = 100_000_000    # 초기 자본 (1억원)
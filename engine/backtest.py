@@ -0,0 +1,414 @@
+"""
+벡터화 백테스터 (config.BacktestConfig 기반)
+- 저장된 일별 시그널을 OHLCV 스토어의 시가/고가/저가/종가 매트릭스로 재생
+- 청산(손절/익절/트레일링/보유기간)은 시그널 × 보유일 2차원 배열로 한 번에 판정
+- 포트폴리오(최대 보유 종목 수, 포지션 비중)는 일 단위 루프 + 배열 상태(보유 수, 평가액, 현금 흐름)
+- 결과: models.BacktestResult (equity curve, MDD, Sharpe, 시그널 유형별 통계)
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import BacktestConfig, MarketGateConfig
+from models import BacktestResult
+from engine.exits import EXIT_END, EXIT_REASONS, make_trade, resolve_exits
+from engine.ohlcv_store import OHLCVStore, get_ohlcv_store
+
+KOSPI = '^KS11'
+KOSDAQ = '^KQ11'
+USD_KRW = 'KRW=X'
+TRADING_DAYS = 252
+
+def classify_signal(signal: Dict) -> str:
+    """시그널 유형: 수급 정보가 있으면 DOUBLE_BUY / FOREIGNER_BUY / INST_SCOOP, 없으면 GRADE_<등급>"""
+    foreign = signal.get('foreign_5d')
+    inst = signal.get('inst_5d')
+    if foreign is None and inst is None:
+        return f"GRADE_{signal.get('grade') or 'N/A'}"
+    foreign, inst = foreign or 0, inst or 0
+    if foreign > 0 and inst > 0:
+        return 'DOUBLE_BUY'
+    if foreign > 0:
+        return 'FOREIGNER_BUY'
+    if inst > 0:
+        return 'INST_SCOOP'
+    return 'NO_FLOW'
+
+
+# 진입 트리거별 허용 유형
+TRIGGER_TYPES = {
+    'DOUBLE_BUY': {'DOUBLE_BUY'},
+    'FOREIGNER_BUY': {'FOREIGNER_BUY', 'DOUBLE_BUY'},
+    'INST_SCOOP': {'INST_SCOOP', 'DOUBLE_BUY'},
+}
+
+
+def regime_series(kospi_close: np.ndarray, gate_config: MarketGateConfig = None) -> np.ndarray:
+    """일별 레짐 (가격 기준): KOSPI > MA단기 > MA장기 = 강세, KOSPI < MA단기 < MA장기 = 약세"""
+    gate_config = gate_config or MarketGateConfig()
+    close = pd.Series(kospi_close).ffill()
+    ma_s = close.rolling(gate_config.kospi_ma_short).mean().to_numpy()
+    ma_l = close.rolling(gate_config.kospi_ma_long).mean().to_numpy()
+    c = close.to_numpy()
+    with np.errstate(invalid='ignore'):
+        bull = (c > ma_s) & (ma_s > ma_l)
+        bear = (c < ma_s) & (ma_s < ma_l)
+    regime = np.full(len(c), 'KR_NEUTRAL', dtype=object)
+    regime[bull] = 'KR_BULLISH'
+    regime[bear] = 'KR_BEARISH'
+    return regime
+
+
+@dataclass
+class BacktestData:
+    """백테스트 입력 배열 (설정과 무관 - 파라미터 스윕에서 공유)"""
+    dates: pd.DatetimeIndex
+    open: np.ndarray            # (D, S+1) 마지막 열은 NaN (데이터 없는 심볼)
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    cols: np.ndarray            # (N,) 시그널별 심볼 열
+    base: np.ndarray            # (N,) 진입일 위치 (-1: 진입 불가)
+    entry_price: np.ndarray     # (N,)
+    score: np.ndarray           # (N,)
+    signal_type: np.ndarray     # (N,) object
+    regime: np.ndarray          # (D,) object
+    usd_krw: np.ndarray         # (D,)
+    kospi: np.ndarray           # (D,)
+    kosdaq: np.ndarray          # (D,)
+    codes: List[str]
+    names: List[str]
+    has_flow: np.ndarray        # (N,) 수급 정보 유무
+
+    @property
+    def n_days(self) -> int:
+        return len(self.dates)
+
+
+def prepare_data(
+    signals: List[Dict],
+    store: Optional[OHLCVStore] = None,
+) -> Optional[BacktestData]:
+    """시그널 + OHLCV 매트릭스 준비
+
+    signals: [{'signal_date', 'code', 'name', 'symbol', 'grade', 'score', 'entry_price',
+               'foreign_5d'?, 'inst_5d'?}, ...]
+    - 진입: 시그널 날짜 이하 마지막 거래일 종가 (진입가가 있으면 진입가)
+    """
+    if not signals:
+        return None
+    store = store or get_ohlcv_store()
+
+    signals = sorted(signals, key=lambda s: str(s['signal_date'])[:10])
+    symbols = list(dict.fromkeys(s['symbol'] for s in signals))
+    start = pd.Timestamp(str(signals[0]['signal_date'])[:10]) - timedelta(days=7)
+    # MA60 레짐 계산용 여유 구간
+    bench_start = start - timedelta(days=120)
+
+    history = store.get_history(symbols, start)
+    close_m = pd.DataFrame({sym: df['Close'] for sym, df in history.items()}).sort_index().dropna(how='all')
+    if close_m.empty:
+        return None
+    index = close_m.index
+
+    def _matrix(field: str) -> np.ndarray:
+        m = pd.DataFrame({sym: df[field] for sym, df in history.items()})
+        m = m.reindex(index=index, columns=close_m.columns).to_numpy(dtype=float)
+        return np.hstack([m, np.full((len(index), 1), np.nan)])
+
+    bench = store.get_close_matrix([KOSPI, KOSDAQ, USD_KRW], bench_start)
+    bench = bench.reindex(bench.index.union(index)).ffill()
+    kospi_full = bench[KOSPI].to_numpy(dtype=float) if KOSPI in bench else np.full(len(bench), np.nan)
+    regime_full = pd.Series(regime_series(kospi_full), index=bench.index)
+
+    col_index = {sym: i for i, sym in enumerate(close_m.columns)}
+    nan_col = len(close_m.columns)
+    cols = np.fromiter((col_index.get(s['symbol'], nan_col) for s in signals), dtype=np.intp, count=len(signals))
+    sig_dates = pd.DatetimeIndex([pd.Timestamp(str(s['signal_date'])[:10]) for s in signals])
+    base = index.searchsorted(sig_dates, side='right') - 1
+
+    closes = _matrix('Close')
+    entries = np.asarray([float(s.get('entry_price') or 0) for s in signals], dtype=float)
+    base_close = closes[np.clip(base, 0, len(index) - 1), cols]
+    entries = np.where(entries > 0, entries, base_close)
+    valid = (base >= 0) & (entries > 0) & ~np.isnan(entries)
+    base = np.where(valid, base, -1)
+
+    def _bench(sym: str) -> np.ndarray:
+        if sym not in bench:
+            return np.full(len(index), np.nan)
+        return bench[sym].reindex(index).to_numpy(dtype=float)
+
+    return BacktestData(
+        dates=index,
+        open=_matrix('Open'),
+        high=_matrix('High'),
+        low=_matrix('Low'),
+        close=closes,
+        cols=cols,
+        base=base,
+        entry_price=entries,
+        score=np.asarray([float(s.get('score') or 0) for s in signals], dtype=float),
+        signal_type=np.asarray([classify_signal(s) for s in signals], dtype=object),
+        regime=regime_full.reindex(index).fillna('KR_NEUTRAL').to_numpy(dtype=object),
+        usd_krw=_bench(USD_KRW),
+        kospi=_bench(KOSPI),
+        kosdaq=_bench(KOSDAQ),
+        codes=[s['code'] for s in signals],
+        names=[s.get('name', '') for s in signals],
+        has_flow=np.asarray([s.get('foreign_5d') is not None or s.get('inst_5d') is not None
+                             for s in signals], dtype=bool),
+    )
+
+
+def load_kr_signals(run_type: str = 'vcp', start=None, end=None) -> List[Dict]:
+    """저장된 KR 시그널 → prepare_data 입력 형식 (심볼 해석 + 수급 정보)"""
+    from app.store import get_store
+    from engine.kr_symbols import get_kr_resolver
+
+    resolver = get_kr_resolver()
+    signals = []
+    for h in get_store().query_signals('KR', run_type, start=start, end=end):
+        payload = h.get('signal') or {}
+        signals.append({
+            'signal_date': h['signal_date'],
+            'code': h['code'],
+            'name': h['name'],
+            'symbol': resolver.resolve(h['code'], h['market']),
+            'grade': h['grade'],
+            'score': h['score'],
+            'entry_price': h['entry_price'],
+            'foreign_5d': payload.get('foreign_5d'),
+            'inst_5d': payload.get('inst_5d'),
+        })
+    return signals
+
+
+def simulate_exits(
+    data: BacktestData,
+    idx: np.ndarray,
+    config: BacktestConfig,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """시그널 idx 전체의 청산일 / 청산가 / 사유를 일괄 판정 (engine.exits.resolve_exits)
+
+    - 보유 1일차부터 max_hold_days 까지 (N, H) 일봉 경로
+    - 거래정지일 종가는 직전 종가로 채움, 레짐 청산은 그날 레짐 기준
+    - 기간 내 청산이 없고 데이터가 끝나면 마지막 종가 (END_OF_DATA)
+
+    Returns: (exit_day (N,), exit_price (N,), reason (N,))
+    """
+    n_days = data.n_days
+    H = max(1, int(config.max_hold_days))
+    base = data.base[idx]
+    cols = data.cols[idx][:, None]
+    entry = data.entry_price[idx]
+
+    rows = base[:, None] + np.arange(1, H + 1)[None, :]             # (N, H)
+    in_data = rows < n_days
+    r = np.clip(rows, 0, n_days - 1)
+
+    def _path(mat: np.ndarray) -> np.ndarray:
+        return np.where(in_data, mat[r, cols], np.nan)
+
+    # 종가 forward-fill (거래정지일 대비), 0열 = 진입가
+    path = np.hstack([entry[:, None], _path(data.close)])
+    pos = np.where(np.isnan(path), 0, np.arange(H + 1)[None, :])
+    filled = np.take_along_axis(path, np.maximum.accumulate(pos, axis=1), axis=1)[:, 1:]
+
+    held = np.where(in_data, np.arange(1, H + 1)[None, :], 0)
+    regime_ok = np.where(in_data, np.isin(data.regime[r], list(config.allowed_regimes)), True)
+    decision = resolve_exits(
+        entry, _path(data.open), _path(data.high), _path(data.low),
+        np.where(in_data, filled, np.nan), held, config, regime_ok=regime_ok,
+    )
+
+    # 미청산 = 보유 기간 전에 데이터가 끝남 → 마지막 종가 (-1: 진입일이 마지막 날)
+    end_off = np.clip(n_days - 1 - base, 0, H) - 1
+    ar = np.arange(len(idx))
+    end_price = np.where(end_off >= 0, filled[ar, np.maximum(end_off, 0)], entry)
+
+    exited = decision.exited
+    exit_off = np.where(exited, decision.bar, end_off)
+    exit_price = np.where(exited, decision.price, end_price)
+    reason = np.where(exited, decision.reason, EXIT_END).astype(np.int8)
+
+    exit_day = base + 1 + exit_off                                    # 진입일 당일 종료 시 exit_off=-1 → base
+    return exit_day, exit_price, reason
+
+
+def _entry_mask(data: BacktestData, config: BacktestConfig, gate_config: MarketGateConfig) -> np.ndarray:
+    """진입 후보 필터 (진입 트리거 / 최소 점수 / 레짐 / 환율 게이트)"""
+    ok = data.base >= 0
+    allowed = TRIGGER_TYPES.get(config.entry_trigger)
+    if allowed:
+        # 수급 정보가 있는 시그널(VCP)에만 트리거/점수 조건 적용
+        type_ok = np.isin(data.signal_type, list(allowed))
+        ok &= ~data.has_flow | (type_ok & (data.score >= config.min_score))
+    b = np.clip(data.base, 0, data.n_days - 1)
+    ok &= np.isin(data.regime[b], list(config.allowed_regimes))
+    if config.use_usd_krw_gate:
+        with np.errstate(invalid='ignore'):
+            ok &= ~(data.usd_krw[b] >= gate_config.usd_krw_danger)
+    return ok
+
+
+def run_backtest(
+    data: BacktestData,
+    config: BacktestConfig = None,
+    config_name: str = 'default',
+    gate_config: MarketGateConfig = None,
+    include_trades: bool = True,
+) -> BacktestResult:
+    """백테스트 실행 (data 는 재사용 가능 - 설정만 바꿔 반복 실행)"""
+    config = config or BacktestConfig()
+    gate_config = gate_config or MarketGateConfig()
+    n_days = data.n_days
+
+    cand = np.flatnonzero(_entry_mask(data, config, gate_config))
+    exit_day, exit_px, reason = simulate_exits(data, cand, config)
+    # 데이터 마지막 날 진입 시그널은 결과가 없으므로 제외
+    has_path = exit_day > data.base[cand]
+    cand, exit_day, exit_px, reason = cand[has_path], exit_day[has_path], exit_px[has_path], reason[has_path]
+
+    buy_cost = (config.commission_pct + config.slippage_pct / 2) / 100
+    sell_cost = (config.commission_pct + config.slippage_pct / 2 + config.tax_pct) / 100
+    entry_eff = data.entry_price[cand] * (1 + buy_cost)
+    exit_eff = exit_px * (1 - sell_cost)
+
+    # 같은 날 후보는 점수 높은 순으로 슬롯 배정
+    base = data.base[cand]
+    order = np.lexsort((-data.score[cand], base))
+    day_starts = np.searchsorted(base[order], np.arange(n_days + 1))
+
+    # 배열 상태 (일 단위)
+    open_count = np.zeros(n_days + 1, dtype=np.int64)
+    pos_value = np.zeros(n_days + 1)             # 종가 기준 보유 평가액
+    exit_cash = np.zeros(n_days + 1)             # 청산일 현금 유입
+    qty = np.zeros(len(cand), dtype=np.int64)
+
+    cash = float(config.initial_capital)
+    equity = np.zeros(n_days)
+    prev_equity = cash
+    size_pct = config.position_size_pct / 100
+    closes = data.close
+
+    for d in range(n_days):
+        cash += exit_cash[d]
+        todays = order[day_starts[d]:day_starts[d + 1]]
+        slots = config.max_positions - open_count[d]
+        for k in todays[:max(0, slots)]:
+            budget = min(cash, prev_equity * size_pct)
+            q = int(budget // entry_eff[k])
+            if q <= 0:
+                continue
+            qty[k] = q
+            cash -= q * entry_eff[k]
+            e = exit_day[k]
+            open_count[d:e] += 1
+            # 진입일 ~ 청산 전일 평가액 (종가, 거래정지일은 직전 종가)
+            path = closes[d:e, data.cols[cand[k]]]
+            if len(path):
+                path = pd.Series(path).ffill().fillna(data.entry_price[cand[k]]).to_numpy()
+                pos_value[d:e] += q * path
+            exit_cash[e] += q * exit_eff[k]
+        equity[d] = cash + pos_value[d]
+        prev_equity = equity[d]
+
+    taken = qty > 0
+
+    return _build_result(data, config, config_name, cand[taken], base[taken], exit_day[taken],
+                         entry_eff[taken], exit_eff[taken], reason[taken], qty[taken], equity,
+                         include_trades)
+
+
+def _max_streak(flags: np.ndarray, value: bool) -> int:
+    return max((len(list(g)) for k, g in groupby(flags.tolist()) if k == value), default=0)
+
+
+def _build_result(data, config, config_name, idx, base, exit_day, entry, exit_, reason, qty, equity,
+                  include_trades) -> BacktestResult:
+    dates = data.dates
+    n = len(idx)
+    stop = entry * (1 - config.stop_loss_pct / 100)
+    ret = (exit_ - entry) / entry * 100
+    # 손절 폭 0 이하(stop_loss_pct <= 0)면 R 정의 불가 → 0 (models.Trade.r_multiple 과 동일)
+    risk = entry - stop
+    r_mult = np.divide(exit_ - entry, risk, out=np.zeros(n), where=risk > 0)
+    win = ret > 0
+
+    result = BacktestResult(
+        config_name=config_name,
+        start_date=dates[0].strftime('%Y-%m-%d'),
+        end_date=dates[-1].strftime('%Y-%m-%d'),
+        initial_capital=float(config.initial_capital),
+        final_capital=round(float(equity[-1]), 0) if len(equity) else float(config.initial_capital),
+    )
+
+    if len(equity):
+        result.total_return_pct = round(float(equity[-1] / config.initial_capital - 1) * 100, 2)
+        peak = np.maximum.accumulate(equity)
+        result.max_drawdown_pct = round(float(((equity - peak) / peak).min()) * 100, 2)
+        daily = np.diff(equity) / equity[:-1]
+        if len(daily) > 1 and daily.std() > 0:
+            result.sharpe_ratio = round(float(daily.mean() / daily.std() * np.sqrt(TRADING_DAYS)), 2)
+        ts = (dates.asi8 // 10**9).tolist()
+        result.equity_curve = list(zip(ts, np.round(equity, 0).tolist()))
+
+    for attr, series in (('kospi_return_pct', data.kospi), ('kosdaq_return_pct', data.kosdaq)):
+        valid = series[~np.isnan(series)]
+        if len(valid) > 1:
+            setattr(result, attr, round(float(valid[-1] / valid[0] - 1) * 100, 2))
+    result.alpha = round(result.total_return_pct - result.kospi_return_pct, 2)
+
+    if n == 0:
+        return result
+
+    # 청산 순서 기준 연승/연패
+    by_exit = np.lexsort((base, exit_day))
+    result.total_trades = n
+    result.winners = int(win.sum())
+    result.losers = int(n - win.sum())
+    result.win_rate = round(float(win.mean()) * 100, 1)
+    result.avg_return_pct = round(float(ret.mean()), 2)
+    result.avg_winner_pct = round(float(ret[win].mean()), 2) if win.any() else 0.0
+    result.avg_loser_pct = round(float(ret[~win].mean()), 2) if (~win).any() else 0.0
+    result.avg_r_multiple = round(float(r_mult.mean()), 2)
+    result.total_r = round(float(r_mult.sum()), 2)
+    result.avg_holding_days = round(float((exit_day - base).mean()), 1)
+    result.max_consecutive_wins = _max_streak(win[by_exit], True)
+    result.max_consecutive_losses = _max_streak(win[by_exit], False)
+
+    types = data.signal_type[idx]
+    for t in np.unique(types):
+        m = types == t
+        result.signal_stats[str(t)] = {
+            'count': int(m.sum()),
+            'win_rate': round(float(win[m].mean()) * 100, 1),
+            'avg_return_pct': round(float(ret[m].mean()), 2),
+            'avg_r_multiple': round(float(r_mult[m].mean()), 2),
+            'total_r': round(float(r_mult[m].sum()), 2),
+        }
+
+    if include_trades:
+        entry_ts = dates.asi8[base] // 10**9
+        exit_ts = dates.asi8[np.minimum(exit_day, len(dates) - 1)] // 10**9
+        regime = data.regime[base]
+        result.trades = [
+            make_trade(
+                data.codes[k], data.names[k],
+                entry_ts[i], entry[i], exit_ts[i], exit_[i],
+                EXIT_REASONS.get(int(reason[i])), config,
+                entry_type=str(types[i]),
+                entry_score=int(data.score[k]),
+                quantity=int(qty[i]),
+                position_value=round(float(entry[i] * qty[i]), 0),
+                market_regime=str(regime[i]),
+            )
+            for i, k in enumerate(idx)
+        ]
+    return result
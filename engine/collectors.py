@@ -11,103 +11,66 @@ import os
 import re
 
 from engine.config import SignalConfig
+from engine.kr_symbols import get_kr_resolver
 from engine.models import StockData, ChartData, SupplyData, NewsItem
 
-# 주요 한국 주식 리스트 (File generated by fetch_stock_list.py)
-try:
-    from engine.stock_list_data import KR_TOP_STOCKS
-except ImportError:
-    # Fallback if file not found
-    print("Warning: stock_list_data.py not found. Using fallback list.")
-    KR_TOP_STOCKS = [
-        ("005930.KS", "삼성전자", "KOSPI"),
-        ("000660.KS", "SK하이닉스", "KOSPI"),
-        ("373220.KS", "LG에너지솔루션", "KOSPI"),
-        ("207940.KS", "삼성바이오로직스", "KOSPI"),
-        ("005380.KS", "현대차", "KOSPI"),
-        ("005490.KS", "POSCO홀딩스", "KOSPI"),
-        ("035420.KS", "NAVER", "KOSPI"),
-        ("000270.KS", "기아", "KOSPI"),
-        ("247540.KQ", "에코프로비엠", "KOSDAQ"),
-        ("086520.KQ", "에코프로", "KOSDAQ"),
-    ]
-
 
 class KRXCollector:
     """KRX 데이터 수집기 (yfinance 기반)"""
     
-    def __init__(self, config: SignalConfig = None):
+    def __init__(self, config: SignalConfig = None, session: aiohttp.ClientSession = None):
         self.config = config or SignalConfig()
-        self._session = None
+        self._session = session             # 공유 세션 (서빙 루프) - 받은 세션은 닫지 않음
+        self._owns_session = session is None
     
     async def __aenter__(self):
-        timeout = aiohttp.ClientTimeout(total=600)
-        self._session = aiohttp.ClientSession(timeout=timeout)
+        if self._session is None:
+            timeout = aiohttp.ClientTimeout(total=600)
+            self._session = aiohttp.ClientSession(timeout=timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
     
     async def get_top_gainers(self, market: str, top_n: int = 30) -> List[StockData]:
-        """상승률 상위 종목 조회 (yfinance 기반)"""
+        """상승률 상위 종목 조회 (KRX 전종목 스냅샷 1회 → 벡터 필터 → 상위 N 힙)"""
         try:
-            import yfinance as yf
+            from engine.kr_universe import fetch_krx_snapshot, load_krx_universe
+            from engine.topn import TopN
             
-            result = []
+            universe = load_krx_universe([market])
+            snapshot = await asyncio.to_thread(fetch_krx_snapshot, None, load_krx_universe())
+            df = snapshot.join(universe, how='inner')
             
-            # 시장별 필터링
-            stocks_to_check = [s for s in KR_TOP_STOCKS if s[2] == market]
-            
-            for ticker, name, mkt in stocks_to_check:
-                try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(period="5d")
-                    
-                    if hist.empty or len(hist) < 2:
-                        continue
-                    
-                    close = float(hist['Close'].iloc[-1])
-                    prev_close = float(hist['Close'].iloc[-2])
-                    volume = int(hist['Volume'].iloc[-1])
-                    
-                    if prev_close <= 0:
-                        continue
-                    
-                    change_pct = ((close - prev_close) / prev_close) * 100
-                    trading_value = close * volume
-                    
-                    # 필터링
-                    if trading_value < self.config.min_trading_value:
-                        continue
-                    if change_pct < self.config.min_change_pct or change_pct > self.config.max_change_pct:
-                        continue
-                    
-                    # 제외 키워드 체크
-                    if any(kw in name for kw in self.config.exclude_keywords):
-                        continue
-                    
-                    code = ticker.replace(".KS", "").replace(".KQ", "")
-                    
-                    result.append(StockData(
-                        code=code,
-                        name=name,
-                        market=mkt,
-                        sector="",
-                        close=close,
-                        change_pct=round(change_pct, 2),
-                        volume=volume,
-                        trading_value=int(trading_value),
-                        marcap=0,
-                    ))
-                    
-                except Exception as e:
-                    continue
+            # 필터링 (전종목 일괄)
+            mask = (
+                (df['TradingValue'] >= self.config.min_trading_value)
+                & df['ChangePct'].between(self.config.min_change_pct, self.config.max_change_pct)
+            )
+            keywords = [re.escape(kw) for kw in self.config.exclude_keywords]
+            if keywords:
+                mask &= ~df['name'].str.contains('|'.join(keywords), na=False)
+            df = df[mask]
             
-            # 등락률 정렬
-            result.sort(key=lambda x: x.change_pct, reverse=True)
+            # 통과 종목 중 등락률 상위 N개만 StockData 로 변환
+            top = TopN(top_n, key=lambda row: row.ChangePct)
+            top.extend(df.itertuples())
             
-            return result[:top_n]
+            return [
+                StockData(
+                    code=row.Index,
+                    name=row.name,
+                    market=row.market,
+                    sector="",
+                    close=float(row.Close),
+                    change_pct=round(float(row.ChangePct), 2),
+                    volume=int(row.Volume),
+                    trading_value=int(row.TradingValue),
+                    marcap=0,
+                )
+                for row in top.items()
+            ]
             
         except Exception as e:
             print(f"[KRX] 상승률 조회 오류: {e}")
@@ -118,19 +81,23 @@ class KRXCollector:
         try:
             import yfinance as yf
             
-            # 코드 변환
-            ticker = f"{code}.KS" if len(code) == 6 else code
-            
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period="1y")
+            # 코드 변환 (거래소 확인된 종목은 첫 시도에 올바른 심볼)
+            resolver = get_kr_resolver()
+            # yfinance 는 블로킹 → 스레드에서 (이벤트 루프를 막지 않도록)
+            for ticker in resolver.candidates(code):
+                stock = yf.Ticker(ticker)
+                hist = await asyncio.to_thread(stock.history, period="1y")
+                if not hist.empty:
+                    resolver.learn(ticker)
+                    break
+            info = await asyncio.to_thread(lambda: stock.info)
             
             high_52w = float(hist['High'].max()) if not hist.empty else 0
             
             return StockData(
                 code=code,
                 name=info.get('longName', info.get('shortName', code)),
-                market="",
+                market=resolver.market_of(code),
                 high_52w=high_52w
             )
         except Exception as e:
@@ -142,18 +109,16 @@ class KRXCollector:
         try:
             import yfinance as yf
             
-            ticker = f"{code}.KS" if len(code) == 6 and not code.endswith(('.KS', '.KQ')) else code
-            
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="3mo")
-            
-            if hist.empty:
-                # KOSDAQ 티커로 재시도
-                ticker = f"{code}.KQ"
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="3mo")
+            # 거래소 미확인 종목만 반대 거래소로 재시도
+            resolver = get_kr_resolver()
+            hist = None
+            for ticker in resolver.candidates(code):
+                hist = await asyncio.to_thread(yf.Ticker(ticker).history, period="3mo")
+                if not hist.empty:
+                    resolver.learn(ticker)
+                    break
             
-            if hist.empty:
+            if hist is None or hist.empty:
                 return []
             
             result = []
@@ -201,17 +166,19 @@ class EnhancedNewsCollector:
         "아시아경제": 0.8,
     }
     
-    def __init__(self, config: SignalConfig = None):
+    def __init__(self, config: SignalConfig = None, session: aiohttp.ClientSession = None):
         self.config = config or SignalConfig()
-        self._session = None
+        self._session = session             # 공유 세션 (서빙 루프) - 받은 세션은 닫지 않음
+        self._owns_session = session is None
     
     async def __aenter__(self):
-        timeout = aiohttp.ClientTimeout(total=600)
-        self._session = aiohttp.ClientSession(timeout=timeout)
+        if self._session is None:
+            timeout = aiohttp.ClientTimeout(total=600)
+            self._session = aiohttp.ClientSession(timeout=timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
     
     async def get_stock_news(self, code: str, limit: int = 5, stock_name: str = "") -> List[NewsItem]:
@@ -2,10 +2,26 @@
 종가베팅 시그널 생성기 설정
 """
 
+import json
+import os
 from dataclasses import dataclass, field
 from typing import Dict, List
 from enum import Enum
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# engine.score_optimizer 가 생성하는 튜닝 결과 (점수 가중치 / 등급 컷)
+TUNED_SCORER_PATH = os.path.join(BASE_DIR, 'data', 'scorer_tuned.json')
+
+# 점수 항목별 기본 만점 (score_weights 가 이 값과 같으면 원점수 그대로 사용)
+SCORE_COMPONENT_MAX: Dict[str, int] = {
+    "news": 3,
+    "volume": 3,
+    "chart": 2,
+    "candle": 1,
+    "consolidation": 1,
+    "supply": 2,
+}
+
 
 class Grade(Enum):
     """종목 등급"""
@@ -47,8 +63,12 @@ class SignalConfig:
         "1우", "2우", "3우", "인버스", "레버리지"
     ])
     
-    # === 점수 가중치 (12점 만점) ===
-    score_weights: Dict[str, int] = field(default_factory=lambda: {
+    # === Market Gate 연동 === (RED 장세: 후보 축소 + 뉴스/LLM/수급 단계 생략)
+    gate_aware: bool = True
+    red_top_n: int = 10                           # RED 시 시장별 상승률 상위 후보 수
+    
+    # === 점수 가중치 (12점 만점) === 항목별 만점 - 원점수를 (가중치 / 기본 만점) 배로 환산
+    score_weights: Dict[str, float] = field(default_factory=lambda: {
         "news": 3,           # 뉴스/재료 (필수)
         "volume": 3,         # 거래대금 (필수)
         "chart": 2,          # 차트패턴
@@ -57,6 +77,13 @@ class SignalConfig:
         "supply": 2,         # 수급
     })
     
+    # === 등급 점수 컷 === (B는 등락률 3% 이상이어도 부여)
+    grade_thresholds: Dict[str, float] = field(default_factory=lambda: {
+        "S": 8,
+        "A": 6,
+        "B": 4,
+    })
+    
     # === 등급별 기준 === (완화된 기준)
     grade_configs: Dict[Grade, GradeConfig] = field(default_factory=lambda: {
         Grade.S: GradeConfig(
@@ -136,3 +163,23 @@ class SignalConfig:
     @classmethod
     def default(cls):
         return cls()
+    
+    @classmethod
+    def load(cls, path: str = TUNED_SCORER_PATH, **overrides) -> "SignalConfig":
+        """튜닝 파일의 score_weights / grade_thresholds 적용 (파일이 없거나 깨졌으면 기본값)"""
+        config = cls(**overrides)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                tuned = json.load(f)
+        except FileNotFoundError:
+            return config
+        except (OSError, ValueError) as e:
+            print(f"[SignalConfig] 튜닝 파일 로드 실패: {e}")
+            return config
+        
+        # 명시적으로 넘긴 값이 튜닝 결과보다 우선
+        weights = {} if 'score_weights' in overrides else (tuned.get('score_weights') or {})
+        config.score_weights.update({k: float(v) for k, v in weights.items() if k in SCORE_COMPONENT_MAX})
+        thresholds = {} if 'grade_thresholds' in overrides else (tuned.get('grade_thresholds') or {})
+        config.grade_thresholds.update({k: float(v) for k, v in thresholds.items() if k in ('S', 'A', 'B')})
+        return config
@@ -0,0 +1,99 @@
+"""
+cron 트리거 (분 시 일 월 요일 5필드)
+- 지원: *, */n, a-b, a-b/n, 목록(,), 요일 이름(mon..sun), 월 이름(jan..dec)
+- 요일: 0=일 ~ 6=토 (7도 일요일)
+- 시각은 호출하는 쪽이 넘긴 datetime 의 시간대 기준 (시장 캘린더의 현지 시각)
+"""
+
+from datetime import datetime, timedelta
+from typing import FrozenSet, Optional, Tuple
+
+_DOW_NAMES = {'sun': 0, 'mon': 1, 'tue': 2, 'wed': 3, 'thu': 4, 'fri': 5, 'sat': 6}
+_MONTH_NAMES = {m: i + 1 for i, m in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])}
+
+# (최소, 최대, 이름표)
+_FIELDS = (
+    (0, 59, None),
+    (0, 23, None),
+    (1, 31, None),
+    (1, 12, _MONTH_NAMES),
+    (0, 7, _DOW_NAMES),
+)
+
+
+def _value(token: str, names) -> int:
+    token = token.strip().lower()
+    if names and token in names:
+        return names[token]
+    return int(token)
+
+
+def _parse_field(text: str, lo: int, hi: int, names) -> Tuple[FrozenSet[int], bool]:
+    """필드 1개 → (허용 값 집합, '*' 여부)"""
+    values = set()
+    wildcard = False
+    for part in text.split(','):
+        part, _, step_text = part.partition('/')
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"잘못된 step: {text}")
+        if part == '*':
+            start, end = lo, hi
+            wildcard = wildcard or not step_text
+        elif '-' in part:
+            a, b = part.split('-', 1)
+            start, end = _value(a, names), _value(b, names)
+        else:
+            start = _value(part, names)
+            end = hi if step_text else start
+        if not (lo <= start <= hi and lo <= end <= hi and start <= end):
+            raise ValueError(f"범위 초과: {text} ({lo}-{hi})")
+        values.update(range(start, end + 1, step))
+    return frozenset(values), wildcard
+
+
+class CronTrigger:
+    """cron 표현식 매칭 / 다음 실행 시각 계산 (분 단위)"""
+
+    def __init__(self, expr: str):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron 필드는 5개여야 합니다: {expr!r}")
+        self.expr = expr
+        parsed = [_parse_field(p, lo, hi, names) for p, (lo, hi, names) in zip(parts, _FIELDS)]
+        (self.minutes, _), (self.hours, _), (self.days, day_any), (self.months, _), (dow, dow_any) = parsed
+        self.weekdays = frozenset(d % 7 for d in dow)
+        self._day_any = day_any
+        self._dow_any = dow_any
+
+    def __repr__(self) -> str:
+        return f"CronTrigger({self.expr!r})"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        dom = dt.day in self.days
+        dow = (dt.weekday() + 1) % 7 in self.weekdays
+        # 표준 cron: 일/요일이 둘 다 지정되면 OR
+        if self._day_any or self._dow_any:
+            return dom and dow
+        return dom or dow
+
+    def matches(self, dt: datetime) -> bool:
+        return (dt.minute in self.minutes and dt.hour in self.hours
+                and dt.month in self.months and self._day_matches(dt))
+
+    def next_after(self, dt: datetime, limit_days: int = 366) -> Optional[datetime]:
+        """dt 이후(초과) 첫 실행 시각 (limit_days 안에 없으면 None)"""
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        end = t + timedelta(days=limit_days)
+        while t < end:
+            if t.month not in self.months or not self._day_matches(t):
+                t = (t + timedelta(days=1)).replace(hour=0, minute=0)
+            elif t.hour not in self.hours:
+                t = (t + timedelta(hours=1)).replace(minute=0)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        return None
+
@@ -0,0 +1,153 @@
+"""
+청산 엔진 (백테스터 / SignalTracker 공용, config.BacktestConfig 기반)
+- 보유 포지션 N개 × 봉 H개 배열에서 손절 / 익절 / 트레일링 / 보유기간 / 레짐 규칙을 한 번에 판정
+- 일봉·분봉 모두 사용 가능: 봉마다 누적 보유 거래일 수(held)를 함께 전달
+- 같은 봉에서 여러 규칙이 걸리면 손절 > 익절 > 보유기간 > 레짐 순 (포지션당 청산 1회)
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from config import BacktestConfig
+from models import Trade
+
+# 청산 사유 코드 (배열 연산용) → Trade.exit_reason
+EXIT_NONE, EXIT_STOP, EXIT_TRAIL, EXIT_TARGET, EXIT_TIME, EXIT_REGIME, EXIT_END = range(7)
+EXIT_REASONS = {
+    EXIT_STOP: 'STOP_LOSS',
+    EXIT_TRAIL: 'TRAILING_STOP',
+    EXIT_TARGET: 'TAKE_PROFIT',
+    EXIT_TIME: 'TIME_EXIT',
+    EXIT_REGIME: 'REGIME_EXIT',
+    EXIT_END: 'END_OF_DATA',
+}
+
+
+@dataclass
+class ExitDecision:
+    """포지션별 청산 판정 결과"""
+    bar: np.ndarray      # (N,) 청산 봉 위치 (-1: 청산 없음)
+    price: np.ndarray    # (N,) 청산가 (청산 없음: NaN)
+    reason: np.ndarray   # (N,) EXIT_* 코드
+    peak: np.ndarray     # (N,) 청산 봉(또는 마지막 봉)까지의 최고가 - 트레일링 상태 갱신용
+
+    @property
+    def exited(self) -> np.ndarray:
+        return self.bar >= 0
+
+    def reason_names(self) -> List[Optional[str]]:
+        return [EXIT_REASONS.get(int(r)) for r in self.reason]
+
+
+def first_true(mask: np.ndarray) -> np.ndarray:
+    """행별 첫 True 위치 (없으면 열 개수)"""
+    idx = np.argmax(mask, axis=1)
+    return np.where(mask.any(axis=1), idx, mask.shape[1])
+
+
+def resolve_exits(
+    entry: np.ndarray,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    held: np.ndarray,
+    config: BacktestConfig,
+    prior_peak: Optional[np.ndarray] = None,
+    regime_ok: Optional[np.ndarray] = None,
+) -> ExitDecision:
+    """청산 규칙 일괄 판정
+
+    entry: (N,) 진입가 / opens~closes: (N, H) 봉 (없는 봉은 NaN)
+    held: (N, H) 봉 시점 누적 보유 거래일 수 (0: 평가 제외)
+    prior_peak: (N,) 이전 평가까지의 최고가 (없으면 진입가)
+    regime_ok: (N, H) 봉 시점 레짐이 허용 목록에 있는지
+
+    - 손절선 = max(고정 손절, 직전 봉까지 최고가 × (1 - 트레일링%)) → 저가 도달 시 청산 (갭하락이면 시가)
+    - 익절: 고가가 목표가 도달 (갭상승이면 시가)
+    - 보유기간 / 레짐: 종가 청산
+    """
+    entry = np.asarray(entry, dtype=float)
+    n, h = closes.shape
+    base = entry[:, None]
+    stop = base * (1 - config.stop_loss_pct / 100)
+    target = base * (1 + config.take_profit_pct / 100)
+
+    prior = base if prior_peak is None else np.fmax(np.asarray(prior_peak, dtype=float)[:, None], base)
+    peak = np.fmax(np.fmax.accumulate(np.where(np.isnan(highs), -np.inf, highs), axis=1), prior)
+    peak_before = np.hstack([prior, peak[:, :-1]])
+    if config.trailing_stop_pct > 0:
+        eff_stop = np.maximum(stop, peak_before * (1 - config.trailing_stop_pct / 100))
+    else:
+        eff_stop = np.broadcast_to(stop, (n, h))
+
+    active = held > 0
+    has_close = ~np.isnan(closes) & active
+    with np.errstate(invalid='ignore'):
+        stop_hit = (lows <= eff_stop) & active
+        target_hit = (highs >= target) & active
+    time_hit = has_close & (held >= config.max_hold_days)
+    regime_hit = np.zeros((n, h), dtype=bool)
+    if regime_ok is not None and config.exit_on_regime_change:
+        regime_hit = has_close & ~np.asarray(regime_ok, dtype=bool)
+
+    f_stop = first_true(stop_hit)
+    f_target = first_true(target_hit)
+    f_close = first_true(time_hit | regime_hit)
+    bar = np.minimum(np.minimum(f_stop, f_target), f_close)
+    exited = bar < h
+
+    ar = np.arange(n)
+    b = np.minimum(bar, h - 1)
+    use_stop = exited & (f_stop == bar)
+    use_target = exited & ~use_stop & (f_target == bar)
+    use_close = exited & ~use_stop & ~use_target
+
+    level = eff_stop[ar, b]
+    bar_open = opens[ar, b]
+    stop_price = np.where(np.isnan(bar_open), level, np.minimum(bar_open, level))
+    target_price = np.where(np.isnan(bar_open), target[:, 0], np.maximum(bar_open, target[:, 0]))
+
+    price = np.select([use_stop, use_target, use_close], [stop_price, target_price, closes[ar, b]], np.nan)
+    reason = np.select(
+        [use_stop & (level > stop[:, 0] + 1e-12), use_stop, use_target, use_close & time_hit[ar, b], use_close],
+        [EXIT_TRAIL, EXIT_STOP, EXIT_TARGET, EXIT_TIME, EXIT_REGIME],
+        EXIT_NONE,
+    ).astype(np.int8)
+
+    return ExitDecision(
+        bar=np.where(exited, bar, -1),
+        price=price,
+        reason=reason,
+        peak=np.where(exited, peak[ar, b], peak[:, -1]),
+    )
+
+
+def make_trade(
+    ticker: str,
+    name: str,
+    entry_time: int,
+    entry_price: float,
+    exit_time: int,
+    exit_price: float,
+    exit_reason: Optional[str],
+    config: BacktestConfig,
+    **fields,
+) -> Trade:
+    """청산 결과 → models.Trade (손절가/목표가는 설정 기준 - R-Multiple 계산용)"""
+    return Trade(
+        ticker=ticker,
+        name=name,
+        entry_time=int(entry_time),
+        entry_price=round(float(entry_price), 2),
+        entry_type=fields.pop('entry_type', ''),
+        entry_score=int(fields.pop('entry_score', 0) or 0),
+        exit_time=int(exit_time),
+        exit_price=round(float(exit_price), 2),
+        exit_reason=exit_reason,
+        stop_loss=round(float(entry_price) * (1 - config.stop_loss_pct / 100), 2),
+        take_profit=round(float(entry_price) * (1 + config.take_profit_pct / 100), 2),
+        **fields,
+    )
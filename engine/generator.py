@@ -8,7 +8,7 @@
 
 import asyncio
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict
 import time
 import sys
 import os
@@ -20,12 +20,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engine.config import SignalConfig, Grade
 from engine.models import (
     StockData, Signal, SignalStatus, 
-    ScoreDetail, ChecklistDetail, ScreenerResult
+    ScoreDetail, ChecklistDetail, ScreenerResult,
+    ChartData, NewsItem, SupplyData,
 )
 from engine.collectors import KRXCollector, EnhancedNewsCollector
 from engine.scorer import Scorer
 from engine.position_sizer import PositionSizer
 from engine.llm_analyzer import LLMAnalyzer
+from engine.persist import save_daily_and_latest, save_scan_result, write_json
+from engine.market_gate import is_gate_red
 
 
 class SignalGenerator:
@@ -35,27 +38,33 @@ class SignalGenerator:
         self,
         config: SignalConfig = None,
         capital: float = 10_000_000,
+        session=None,
     ):
         """
         Args:
             capital: 총 자본금 (기본 1천만원)
-            config: 설정 (기본 설정 사용)
+            config: 설정 (기본: 튜닝 파일이 있으면 적용한 설정)
+            session: 공유 aiohttp 세션 (없으면 수집기가 직접 생성/종료)
         """
-        self.config = config or SignalConfig()
+        self.config = config or SignalConfig.load()
         self.capital = capital
         
         self.scorer = Scorer(self.config)
         self.position_sizer = PositionSizer(capital, self.config)
         self.llm_analyzer = LLMAnalyzer()  # API Key from env
+        self._shared_session = session
         
         self._collector: Optional[KRXCollector] = None
         self._news: Optional[EnhancedNewsCollector] = None
+        
+        # RED 장세 축소 스캔 (뉴스/LLM/수급 단계 생략)
+        self.reduced_scan = False
     
     async def __aenter__(self):
-        self._collector = KRXCollector(self.config)
+        self._collector = KRXCollector(self.config, session=self._shared_session)
         await self._collector.__aenter__()
         
-        self._news = EnhancedNewsCollector(self.config)
+        self._news = EnhancedNewsCollector(self.config, session=self._shared_session)
         await self._news.__aenter__()
         return self
     
@@ -70,6 +79,7 @@ class SignalGenerator:
         target_date: date = None,
         markets: List[str] = None,
         top_n: int = 30,
+        cancel_check: Optional[Callable[[], None]] = None,
     ) -> List[Signal]:
         """
         시그널 생성
@@ -78,6 +88,7 @@ class SignalGenerator:
             target_date: 대상 날짜 (기본: 오늘)
             markets: 대상 시장 (기본: KOSPI, KOSDAQ)
             top_n: 상승률 상위 N개 종목
+            cancel_check: 취소 체크포인트 (취소 시 예외 발생 - 시장/종목 단위로 호출)
         
         Returns:
             Signal 리스트 (등급순 정렬)
@@ -85,9 +96,13 @@ class SignalGenerator:
         target_date = target_date or date.today()
         markets = markets or ["KOSPI", "KOSDAQ"]
         
+        top_n = self.prepare_scan(top_n)
+        
         all_signals = []
         
         for market in markets:
+            if cancel_check:
+                cancel_check()
             print(f"\n[{market}] Screening top gainers...")
             
             # 1. 상승률 상위 종목 조회
@@ -99,6 +114,9 @@ class SignalGenerator:
             
             async def _analyze_with_semaphore(stock, total_cnt, current_idx):
                 async with semaphore:
+                    # 취소 예외는 아래 except 에 삼켜지지 않도록 try 밖에서
+                    if cancel_check:
+                        cancel_check()
                     try:
                         # 진행률 표시 (대략적으로)
                         print(f"  Processing {stock.name}...", end='\r')
@@ -121,17 +139,24 @@ class SignalGenerator:
                     all_signals.append(signal)
                     print(f"\n    [OK] {signal.stock_name}: Grade {signal.grade.value} Signal created! (Score: {signal.score.total})")
         
-        # 3. 등급순 정렬 (S > A > B)
-        grade_order = {Grade.S: 0, Grade.A: 1, Grade.B: 2, Grade.C: 3}
-        all_signals.sort(key=lambda s: (grade_order[s.grade], -s.score.total))
-        
-        # 4. 최대 포지션 수 제한
-        if len(all_signals) > self.config.max_positions:
-            all_signals = all_signals[:self.config.max_positions]
-        
+        all_signals = self.rank_signals(all_signals)
         print(f"\nTotal {len(all_signals)} signals created.")
         return all_signals
     
+    def prepare_scan(self, top_n: int) -> int:
+        """Market Gate RED → 후보 축소 + 고비용 단계 생략. 적용할 top_n 반환"""
+        self.reduced_scan = self.config.gate_aware and is_gate_red('KR')
+        if self.reduced_scan:
+            top_n = min(top_n, self.config.red_top_n)
+            print(f"[Gate] KR Market Gate RED - 상위 {top_n}개만, 뉴스/LLM/수급 생략")
+        return top_n
+    
+    def rank_signals(self, signals: List[Signal]) -> List[Signal]:
+        """등급순 정렬 (S > A > B) + 최대 포지션 수 제한"""
+        grade_order = {Grade.S: 0, Grade.A: 1, Grade.B: 2, Grade.C: 3}
+        signals = sorted(signals, key=lambda s: (grade_order[s.grade], -s.score.total))
+        return signals[:self.config.max_positions]
+    
     async def _analyze_stock(
         self,
         stock: StockData,
@@ -147,74 +172,93 @@ class SignalGenerator:
             # 2. 차트 데이터 조회
             charts = await self._collector.get_chart_data(stock.code, 60)
             
-            # 3. 뉴스 조회
-            news_list = await self._news.get_stock_news(stock.code, 3, stock.name)
+            # 3. 뉴스 조회 (RED 축소 스캔 시 생략)
+            news_list = []
+            if not self.reduced_scan:
+                news_list = await self._news.get_stock_news(stock.code, 3, stock.name)
             
             # 4. LLM 뉴스 분석
-            llm_result = None
-            if news_list and self.llm_analyzer.is_available():
-                # Rate Limit 방지 (병렬 처리 시 각 Task 내 대기시간 축소)
-                await asyncio.sleep(0.5) 
-                
-                print(f"    [LLM] Analyzing {stock.name} news...")
-                news_dicts = [{"title": n.title, "summary": n.summary} for n in news_list]
-                llm_result = await self.llm_analyzer.analyze_news_sentiment(stock.name, news_dicts)
-                if llm_result:
-                    print(f"      -> Score: {llm_result.get('score')}")
-            
-            # 5. 수급 데이터 조회
-            supply = await self._collector.get_supply_data(stock.code)
-            
-            # 6. 점수 계산
-            score, checklist = self.scorer.calculate(stock, charts, news_list, supply, llm_result)
+            llm_result = await self.analyze_news(stock, news_list)
             
-            # 7. 등급 결정
-            grade = self.scorer.determine_grade(stock, score)
+            # 5. 수급 데이터 조회 (RED 축소 스캔 시 생략)
+            supply = None
+            if not self.reduced_scan:
+                supply = await self._collector.get_supply_data(stock.code)
             
-            # C등급은 제외
-            if grade == Grade.C:
-                return None
-            
-            # 8. 포지션 계산
-            position = self.position_sizer.calculate(stock.close, grade)
-            
-            # 9. 시그널 생성
-            signal = Signal(
-                stock_code=stock.code,
-                stock_name=stock.name,
-                market=stock.market,
-                sector=stock.sector,
-                signal_date=target_date,
-                signal_time=datetime.now(),
-                grade=grade,
-                score=score,
-                checklist=checklist,
-                news_items=[{
-                    "title": n.title,
-                    "source": n.source,
-                    "published_at": n.published_at.isoformat() if n.published_at else "",
-                    "url": n.url
-                } for n in news_list[:5]],
-                current_price=stock.close,
-                entry_price=position.entry_price,
-                stop_price=position.stop_price,
-                target_price=position.target_price,
-                r_value=position.r_value,
-                position_size=position.position_size,
-                quantity=position.quantity,
-                r_multiplier=position.r_multiplier,
-                trading_value=stock.trading_value,
-                change_pct=stock.change_pct,
-                status=SignalStatus.PENDING,
-                created_at=datetime.now(),
-            )
-            
-            return signal
+            return self.build_signal(stock, target_date, charts, news_list, supply, llm_result)
             
         except Exception as e:
             print(f"    Analysis failed: {e}")
             return None
     
+    async def analyze_news(self, stock: StockData, news_list: List[NewsItem]) -> Optional[Dict]:
+        """LLM 뉴스 감성 분석 (뉴스가 없거나 API 키가 없으면 None)"""
+        if not news_list or not self.llm_analyzer.is_available():
+            return None
+        # Rate Limit 방지 (병렬 처리 시 각 Task 내 대기시간 축소)
+        await asyncio.sleep(0.5) 
+        
+        print(f"    [LLM] Analyzing {stock.name} news...")
+        news_dicts = [{"title": n.title, "summary": n.summary} for n in news_list]
+        llm_result = await self.llm_analyzer.analyze_news_sentiment(stock.name, news_dicts)
+        if llm_result:
+            print(f"      -> Score: {llm_result.get('score')}")
+        return llm_result
+    
+    def build_signal(
+        self,
+        stock: StockData,
+        target_date: date,
+        charts: List[ChartData],
+        news_list: List[NewsItem],
+        supply: Optional[SupplyData],
+        llm_result: Optional[Dict],
+    ) -> Optional[Signal]:
+        """수집된 입력으로 채점 → 등급 → 포지션 → Signal (C등급은 None)"""
+        # 6. 점수 계산
+        score, checklist = self.scorer.calculate(stock, charts, news_list, supply, llm_result)
+        
+        # 7. 등급 결정
+        grade = self.scorer.determine_grade(stock, score)
+        
+        # C등급은 제외
+        if grade == Grade.C:
+            return None
+        
+        # 8. 포지션 계산
+        position = self.position_sizer.calculate(stock.close, grade)
+        
+        # 9. 시그널 생성
+        return Signal(
+            stock_code=stock.code,
+            stock_name=stock.name,
+            market=stock.market,
+            sector=stock.sector,
+            signal_date=target_date,
+            signal_time=datetime.now(),
+            grade=grade,
+            score=score,
+            checklist=checklist,
+            news_items=[{
+                "title": n.title,
+                "source": n.source,
+                "published_at": n.published_at.isoformat() if n.published_at else "",
+                "url": n.url
+            } for n in news_list[:5]],
+            current_price=stock.close,
+            entry_price=position.entry_price,
+            stop_price=position.stop_price,
+            target_price=position.target_price,
+            r_value=position.r_value,
+            position_size=position.position_size,
+            quantity=position.quantity,
+            r_multiplier=position.r_multiplier,
+            trading_value=stock.trading_value,
+            change_pct=stock.change_pct,
+            status=SignalStatus.PENDING,
+            created_at=datetime.now(),
+        )
+    
     def get_summary(self, signals: List[Signal]) -> Dict:
         """시그널 요약 정보"""
         summary = {
@@ -237,13 +281,27 @@ class SignalGenerator:
 async def run_screener(
     capital: float = 50_000_000,
     markets: List[str] = None,
+    config: SignalConfig = None,
+    incremental: bool = False,
+    cancel_check: Optional[Callable[[], None]] = None,
 ) -> ScreenerResult:
-    """스크리너 실행 (간편 함수)"""
+    """스크리너 실행 (간편 함수)
+    
+    incremental: 장중 재스캔 - 직전 사이클 상태를 재사용하고 입력이 바뀐 종목만 재채점 (engine.incremental)
+    cancel_check: 작업 큐 취소 체크포인트 (예: JobContext.check_cancelled) - 취소 시 결과 저장 없이 예외 전파
+    """
     start_time = time.time()
     
-    async with SignalGenerator(capital=capital) as generator:
-        signals = await generator.generate(markets=markets)
+    scanner = None
+    async with SignalGenerator(config=config, capital=capital) as generator:
+        if incremental:
+            from engine.incremental import IncrementalScanner
+            scanner = IncrementalScanner(generator)
+            signals = await scanner.run(markets=markets, cancel_check=cancel_check)
+        else:
+            signals = await generator.generate(markets=markets, cancel_check=cancel_check)
         summary = generator.get_summary(signals)
+        reduced = bool(generator.reduced_scan)
     
     processing_time = (time.time() - start_time) * 1000
     
@@ -255,16 +313,19 @@ async def run_screener(
         by_grade=summary["by_grade"],
         by_market=summary["by_market"],
         processing_time_ms=processing_time,
+        reduced_scan=reduced,
     )
     
-    # 결과 저장
-    save_result_to_json(result)
+    # 결과 저장 (증분 모드: 병합 결과 + 변경분)
+    result.saved_path = save_result_to_json(result, extra=scanner.summary() if scanner else None)
+    if scanner:
+        scanner.publish_delta(result.date)
     
     return result
 
 
-def save_result_to_json(result: ScreenerResult):
-    """결과 JSON 저장 (Daily + Latest)"""
+def save_result_to_json(result: ScreenerResult, extra: Dict = None) -> str:
+    """결과 JSON 저장 (Daily + Latest, 축소 스캔은 같은 날 전체 결과를 덮어쓰지 않음)"""
     data = {
         "date": result.date.isoformat(),
         "total_candidates": result.total_candidates,
@@ -275,6 +336,8 @@ def save_result_to_json(result: ScreenerResult):
         "processing_time_ms": result.processing_time_ms,
         "updated_at": datetime.now().isoformat()
     }
+    if extra:
+        data.update(extra)
     
     # 1. 날짜별 파일 저장
     date_str = result.date.strftime("%Y%m%d")
@@ -285,17 +348,27 @@ def save_result_to_json(result: ScreenerResult):
     
     save_path = os.path.join(base_dir, filename)
     
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n[Saved] Daily: {save_path}")
-    
-    # 2. Latest 파일 업데이트
+    # 2. Latest 파일 업데이트 (일자별 파일 하드링크, 직렬화 1회 + 원자적 교체)
     latest_path = os.path.join(base_dir, "jongga_v2_latest.json")
-    with open(latest_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    save_path, published = save_scan_result(save_path, latest_path, data, result.reduced_scan)
     
+    print(f"\n[Saved] Daily: {save_path}")
+    if not published:
+        return save_path
     print(f"[Saved] Latest: {latest_path}")
+    
+    # 3. DB 기록 (인덱스 기반 히스토리 조회용)
+    _record_run('KR', 'jongga_v2', result.date, data)
+    return save_path
+
+
+def _record_run(market: str, run_type: str, run_date, data: Dict):
+    """결과 저장소(DB) 기록 - 실패해도 JSON 저장은 유지"""
+    try:
+        from app.store import record_run
+        record_run(market, run_type, run_date, data)
+    except Exception as e:
+        print(f"[Store] DB 기록 생략: {e}")
 
 
 # 테스트용 메인
@@ -341,6 +414,7 @@ if __name__ == "__main__":
 async def analyze_single_stock_by_code(
     code: str,
     capital: float = 50_000_000,
+    session=None,
 ) -> Optional[Signal]:
     """
     단일 종목 재분석 및 결과 JSON 업데이트
@@ -348,11 +422,12 @@ async def analyze_single_stock_by_code(
     Args:
         code: 종목 코드 (예: "005930")
         capital: 자본금
+        session: 공유 aiohttp 세션 (API 서빙 루프)
         
     Returns:
         재분석된 Signal 또는 None
     """
-    async with SignalGenerator(capital=capital) as generator:
+    async with SignalGenerator(capital=capital, session=session) as generator:
         # 1. 최신 JSON 로드 (이전 데이터 기반)
         base_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
         latest_path = os.path.join(base_dir, "jongga_v2_latest.json")
@@ -399,16 +474,14 @@ async def analyze_single_stock_by_code(
             data["signals"] = updated_signals
             data["updated_at"] = datetime.now().isoformat()
             
-            # 파일 저장 - Latest
-            with open(latest_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
-            # 파일 저장 - Daily
+            # 파일 저장 - Daily (+ Latest 하드링크) / 오늘자 파일이 없으면 Latest만
             date_str = date.today().strftime("%Y%m%d")
             daily_path = os.path.join(base_dir, f"jongga_v2_results_{date_str}.json")
             if os.path.exists(daily_path):
-                with open(daily_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                save_daily_and_latest(daily_path, latest_path, data)
+                _record_run('KR', 'jongga_v2', date.today(), data)
+            else:
+                write_json(latest_path, data)
             
             return new_signal
             
@@ -0,0 +1,323 @@
+"""
+종가베팅 V2 증분 스캔 (장중 재스캔)
+- 직전 사이클의 종목별 상태(최근 봉, 52주 고가, 뉴스 해시, LLM 결과, 수급, 시그널)를 data/jongga_v2_state.json 에 보관
+- 봉: OHLCVStore 일괄 조회 (캐시된 종목은 최근 며칠만 재다운로드, 종목별 상세/차트 호출 없음)
+- 뉴스: 헤드라인 목록만 다시 받아 새 제목이 있을 때만 LLM 재분석
+- 수급: 거래일당 1회
+- 입력 해시가 직전과 같은 종목은 재채점 없이 직전 결과 재사용
+- 발행: 병합 결과(jongga_v2_latest.json) + 직전 발행본 대비 변경분(jongga_v2_delta.json)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from engine.models import ChartData, NewsItem, Signal, StockData, SupplyData
+from engine.persist import write_json
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+STATE_PATH = os.path.join(DATA_DIR, 'jongga_v2_state.json')
+DELTA_PATH = os.path.join(DATA_DIR, 'jongga_v2_delta.json')
+LATEST_PATH = os.path.join(DATA_DIR, 'jongga_v2_latest.json')
+
+CHART_DAYS = 60         # 채점용 일봉 수 (get_chart_data 와 동일)
+HIGH_52W_DAYS = 252     # 52주 고가 구간 (거래일)
+HISTORY_DAYS = 400      # OHLCVStore 조회 구간 (달력일)
+NEWS_LIMIT = 3
+
+
+def _digest(obj) -> str:
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def news_digest(news: List[NewsItem]) -> str:
+    """헤드라인 집합 해시 (순서/요약 무관)"""
+    return _digest(sorted(n.title for n in news))
+
+
+@dataclass
+class TickerState:
+    """종목별 직전 사이클 입력/결과"""
+    code: str
+    bar: List = field(default_factory=list)     # 최근 봉 [날짜, 시, 고, 저, 종, 거래량]
+    high_52w: float = 0
+    news_hash: str = ""
+    llm: Optional[Dict] = None
+    supply: Optional[Dict] = None
+    supply_date: str = ""
+    inputs_hash: str = ""
+    signal: Optional[Dict] = None               # C등급이면 None
+    updated_at: str = ""
+
+
+class ScanState:
+    """증분 스캔 상태 파일 (거래일/설정이 바뀌면 초기화)"""
+
+    def __init__(self, path: str = STATE_PATH):
+        self.path = path
+        self.tickers: Dict[str, TickerState] = {}
+
+    def load(self, trading_date: date, config_key: str) -> Dict[str, TickerState]:
+        self.tickers = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return self.tickers
+        except Exception as e:
+            print(f"[Incremental] 상태 로드 실패 - 전체 스캔: {e}")
+            return self.tickers
+
+        if raw.get('date') != trading_date.isoformat() or raw.get('config') != config_key:
+            print("[Incremental] 거래일/설정 변경 - 전체 스캔")
+            return self.tickers
+        for code, d in raw.get('tickers', {}).items():
+            try:
+                self.tickers[code] = TickerState(**d)
+            except TypeError:
+                continue
+        return self.tickers
+
+    def save(self, trading_date: date, config_key: str):
+        write_json(self.path, {
+            'date': trading_date.isoformat(),
+            'config': config_key,
+            'updated_at': datetime.now().isoformat(),
+            'tickers': {code: asdict(t) for code, t in self.tickers.items()},
+        })
+
+
+def load_published(trading_date: date, path: str = None) -> Dict[str, Dict]:
+    """현재 발행된 결과 (같은 날짜만) → {종목코드: 시그널 dict}"""
+    try:
+        with open(path or LATEST_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    if data.get('date') != trading_date.isoformat():
+        return {}
+    return {s['stock_code']: s for s in data.get('signals', []) if s.get('stock_code')}
+
+
+def compute_delta(prev: Dict[str, Dict], curr: Dict[str, Dict]) -> Dict:
+    """발행본 비교 → 추가 / 제거 / 변경(등급·점수·가격) / 유지"""
+    def view(s: Dict) -> Tuple:
+        return (s.get('grade'), (s.get('score') or {}).get('total'), s.get('current_price'), s.get('quantity'))
+
+    added = [c for c in curr if c not in prev]
+    removed = [c for c in prev if c not in curr]
+    changed = [c for c in curr if c in prev and view(curr[c]) != view(prev[c])]
+    return {
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+        'unchanged': len(curr) - len(added) - len(changed),
+    }
+
+
+class IncrementalScanner:
+    """SignalGenerator 위에서 동작하는 증분 재스캔"""
+
+    def __init__(self, generator, state: ScanState = None, delta_path: str = DELTA_PATH):
+        self.generator = generator
+        self.state = state or ScanState()
+        self.delta_path = delta_path
+        self.stats: Dict[str, int] = {}
+        self.delta: Dict = {}
+        self.current: Dict[str, Dict] = {}     # 이번 발행본 {종목코드: 시그널 dict}
+
+    def _config_key(self) -> str:
+        # 가중치/등급 기준 등 설정이 바뀌면 전체 재채점 (dataclass repr 은 필드 순서 고정)
+        return _digest(repr(self.generator.config))
+
+    # === 입력 수집 ===
+    def _load_bars(self, stocks: List[StockData]) -> Dict[str, Tuple[List[ChartData], float]]:
+        """후보 전체 일봉 1회 일괄 조회 → {코드: (최근 60봉, 52주 고가)}"""
+        from engine.kr_symbols import get_kr_resolver
+        from engine.ohlcv_store import get_ohlcv_store
+
+        resolver = get_kr_resolver()
+        symbols = {s.code: resolver.resolve(s.code, s.market) for s in stocks}
+        start = date.today() - timedelta(days=HISTORY_DAYS)
+        history = get_ohlcv_store().get_history(list(symbols.values()), start)
+
+        bars = {}
+        for code, symbol in symbols.items():
+            df = history.get(symbol)
+            if df is None or df.empty:
+                continue
+            df = df.dropna(subset=['Close'])
+            tail = df.tail(CHART_DAYS)
+            charts = [
+                ChartData(
+                    date=idx.date(),
+                    open=float(o), high=float(h), low=float(l), close=float(c),
+                    volume=int(v) if v == v else 0,
+                )
+                for idx, o, h, l, c, v in zip(
+                    tail.index, tail['Open'], tail['High'], tail['Low'], tail['Close'], tail['Volume'])
+            ]
+            bars[code] = (charts, float(df['High'].tail(HIGH_52W_DAYS).max()))
+        return bars
+
+    async def _refresh_news(self, stock: StockData, prev: Optional[TickerState]) -> Tuple[List[NewsItem], str, Optional[Dict]]:
+        """헤드라인 재조회 → 새 제목이 있을 때만 LLM 재분석"""
+        gen = self.generator
+        news = await gen._news.get_stock_news(stock.code, NEWS_LIMIT, stock.name)
+        self.stats['news_fetched'] += 1
+        digest = news_digest(news)
+        if prev is not None and prev.news_hash == digest:
+            return news, digest, prev.llm
+        llm = await gen.analyze_news(stock, news)
+        if news and gen.llm_analyzer.is_available():
+            self.stats['llm_calls'] += 1
+        return news, digest, llm
+
+    async def _refresh_supply(self, stock: StockData, prev: Optional[TickerState], today: str) -> Tuple[Optional[SupplyData], str]:
+        """수급 (일 단위 데이터 - 거래일당 1회)"""
+        if prev is not None and prev.supply is not None and prev.supply_date == today:
+            return SupplyData(**prev.supply), today
+        self.stats['supply_fetched'] += 1
+        return await self.generator._collector.get_supply_data(stock.code), today
+
+    async def _scan_one(self, stock: StockData, target_date: date, bars, semaphore, cancel_check=None) -> Optional[Signal]:
+        gen = self.generator
+        prev = self.state.tickers.get(stock.code)
+        today = target_date.isoformat()
+
+        async with semaphore:
+            if cancel_check:
+                cancel_check()
+            charts, high_52w = bars.get(stock.code) or (None, 0.0)
+            if charts is None:
+                # 일괄 조회에서 빠진 종목 → 기존 종목별 경로
+                charts = await gen._collector.get_chart_data(stock.code, CHART_DAYS)
+                detail = await gen._collector.get_stock_detail(stock.code)
+                high_52w = detail.high_52w if detail else 0.0
+            stock.high_52w = high_52w
+
+            news, digest, llm, supply, supply_date = [], "", None, None, ""
+            if not gen.reduced_scan:
+                news, digest, llm = await self._refresh_news(stock, prev)
+                supply, supply_date = await self._refresh_supply(stock, prev, today)
+
+        last = charts[-1] if charts else None
+        bar = [last.date.isoformat(), last.open, last.high, last.low, last.close, last.volume] if last else []
+        inputs_hash = _digest([
+            bar, high_52w, stock.close, stock.change_pct, stock.trading_value, stock.sector,
+            digest, llm, asdict(supply) if supply else None, gen.reduced_scan,
+        ])
+
+        if prev is not None and prev.inputs_hash == inputs_hash:
+            self.stats['reused'] += 1
+            signal = Signal.from_dict(prev.signal) if prev.signal else None
+        else:
+            self.stats['rescored'] += 1
+            signal = gen.build_signal(stock, target_date, charts, news, supply, llm)
+
+        self.state.tickers[stock.code] = TickerState(
+            code=stock.code,
+            bar=bar,
+            high_52w=high_52w,
+            news_hash=digest,
+            llm=llm,
+            supply=asdict(supply) if supply else None,
+            supply_date=supply_date,
+            inputs_hash=inputs_hash,
+            signal=signal.to_dict() if signal else None,
+            updated_at=datetime.now().isoformat(),
+        )
+        return signal
+
+    # === 실행 ===
+    async def run(
+        self,
+        target_date: date = None,
+        markets: List[str] = None,
+        top_n: int = 30,
+        cancel_check: Optional[Callable[[], None]] = None,
+    ) -> List[Signal]:
+        """증분 재스캔 → 병합된 시그널 목록 (SignalGenerator.generate 와 같은 형식)"""
+        gen = self.generator
+        target_date = target_date or date.today()
+        markets = markets or ["KOSPI", "KOSDAQ"]
+        config_key = self._config_key()
+
+        self.stats = {'candidates': 0, 'rescored': 0, 'reused': 0, 'news_fetched': 0, 'llm_calls': 0, 'supply_fetched': 0}
+        previous = self.state.load(target_date, config_key)
+        published = load_published(target_date)
+        print(f"[Incremental] 직전 상태 {len(previous)}종목 / 발행본 {len(published)}개")
+
+        top_n = gen.prepare_scan(top_n)
+        candidates: List[StockData] = []
+        for market in markets:
+            if cancel_check:
+                cancel_check()
+            candidates.extend(await gen._collector.get_top_gainers(market, top_n))
+        self.stats['candidates'] = len(candidates)
+
+        if cancel_check:
+            cancel_check()
+        bars = await asyncio.to_thread(self._load_bars, candidates)
+
+        # 이번 후보에서 빠진 종목은 상태에서도 제거
+        codes = {s.code for s in candidates}
+        self.state.tickers = {c: t for c, t in previous.items() if c in codes}
+
+        semaphore = asyncio.Semaphore(10)
+        # 취소 후 남은 종목은 분석 없이 끝남 (취소 예외도 gather 결과로 모이므로 끝나고 한 번 더 확인)
+        results = await asyncio.gather(
+            *(self._scan_one(stock, target_date, bars, semaphore, cancel_check) for stock in candidates),
+            return_exceptions=True,
+        )
+        if cancel_check:
+            cancel_check()
+        signals = []
+        for stock, res in zip(candidates, results):
+            if isinstance(res, Exception):
+                print(f"    Analysis failed ({stock.name}): {res}")
+                self.state.tickers.pop(stock.code, None)
+            elif res is not None:
+                signals.append(res)
+
+        signals = gen.rank_signals(signals)
+        self.current = {s.stock_code: s.to_dict() for s in signals}
+        self.delta = compute_delta(published, self.current)
+
+        try:
+            self.state.save(target_date, config_key)
+        except Exception as e:
+            print(f"[Incremental] 상태 저장 실패: {e}")
+
+        s = self.stats
+        print(f"[Incremental] 후보 {s['candidates']} / 재채점 {s['rescored']} / 재사용 {s['reused']} / "
+              f"LLM {s['llm_calls']}회 / 추가 {len(self.delta['added'])} 변경 {len(self.delta['changed'])} "
+              f"제거 {len(self.delta['removed'])}")
+        return signals
+
+    def publish_delta(self, target_date: date):
+        """변경분 발행 (추가/변경 시그널 본문 + 제거 종목 코드)"""
+        current = self.current
+        write_json(self.delta_path, {
+            'date': target_date.isoformat(),
+            'updated_at': datetime.now().isoformat(),
+            'added': [current[c] for c in self.delta.get('added', [])],
+            'changed': [current[c] for c in self.delta.get('changed', [])],
+            'removed': self.delta.get('removed', []),
+            'unchanged': self.delta.get('unchanged', 0),
+            'stats': self.stats,
+        })
+
+    def summary(self) -> Dict:
+        """latest 결과에 함께 싣는 증분 요약"""
+        return {
+            'mode': 'incremental',
+            'delta': {k: self.delta.get(k) for k in ('added', 'changed', 'removed', 'unchanged')},
+            'stats': self.stats,
+        }
@@ -1,153 +1,172 @@
 """
 일본 시장 데이터 수집기 - yfinance 기반
-JPX Nikkei 400 종목 대상
+TSE 유니버스(engine.jp_universe, 기본 프라임 시장) 대상 - 유니버스 파일이 없으면 JPX Nikkei 400
 """
 
 import asyncio
 import aiohttp
+from collections import deque
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Dict, Tuple
 import pandas as pd
 import os
 import re
 
 from engine.jp_config import JPSignalConfig
 from engine.models import StockData, ChartData, SupplyData, NewsItem
-from engine.jp_stock_list import JPX_NIKKEI_400
+from engine.jp_universe import load_tse_universe
+from engine.ohlcv_store import split_download
+from engine.topn import TopN
 
 
 class JPXCollector:
     """JPX(도쿄증권거래소) 데이터 수집기 (yfinance 기반)"""
     
-    def __init__(self, config: JPSignalConfig = None):
+    def __init__(self, config: JPSignalConfig = None, session: aiohttp.ClientSession = None):
         self.config = config or JPSignalConfig()
-        self._session = None
+        self._session = session             # 공유 세션 (서빙 루프) - 받은 세션은 닫지 않음
+        self._owns_session = session is None
     
     async def __aenter__(self):
-        timeout = aiohttp.ClientTimeout(total=30)  # 30초로 단축
-        self._session = aiohttp.ClientSession(timeout=timeout)
+        if self._session is None:
+            timeout = aiohttp.ClientTimeout(total=30)  # 30초로 단축
+            self._session = aiohttp.ClientSession(timeout=timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
     
-    async def get_top_gainers(self, sector: str = None, top_n: int = 30) -> List[StockData]:
-        """상승률 상위 종목 조회 (yfinance Batch Download)"""
+    def _universe(self, sector: str = None) -> List[Tuple[str, str, str]]:
+        """스캔 대상 (티커, 종목명, 섹터) - TSE 유니버스 파일, 없으면 JPX400"""
+        stocks = load_tse_universe(self.config.universe_segments)
+        if sector:
+            stocks = [s for s in stocks if s[2] == sector]
+        return stocks
+    
+    def _download_chunk(self, chunk: List[Tuple[str, str, str]]) -> List[StockData]:
+        """청크 1개 다운로드 → 필터 통과 종목 (원본 프레임은 청크 안에서 버림)"""
+        import yfinance as yf
+        
+        tickers = [s[0] for s in chunk]
+        df = yf.download(tickers, period="5d", progress=False, threads=True, group_by='ticker', timeout=10)
+        frames = split_download(df, tickers)
+        
+        result = []
+        for ticker, name, sec in chunk:
+            hist = frames.get(ticker)
+            if hist is None:
+                continue
+            hist = hist.dropna(subset=['Close'])
+            if len(hist) < 2:
+                continue
+            
+            close = float(hist['Close'].iloc[-1])
+            prev_close = float(hist['Close'].iloc[-2])
+            volume = int(hist['Volume'].iloc[-1]) if hist['Volume'].iloc[-1] == hist['Volume'].iloc[-1] else 0
+            if prev_close <= 0:
+                continue
+            
+            change_pct = ((close - prev_close) / prev_close) * 100
+            trading_value = close * volume
+            
+            # 필터링
+            if trading_value < self.config.min_trading_value:
+                continue
+            if change_pct < self.config.min_change_pct or change_pct > self.config.max_change_pct:
+                continue
+            # 제외 키워드 체크
+            if any(kw in name for kw in self.config.exclude_keywords):
+                continue
+            
+            result.append(StockData(
+                code=ticker.replace(".T", ""),
+                name=name,
+                market="TSE",
+                sector=sec,
+                close=close,
+                change_pct=round(change_pct, 2),
+                volume=volume,
+                trading_value=int(trading_value),
+                marcap=0,
+            ))
+        return result
+    
+    async def stream_gainers(self, sector: str = None) -> AsyncIterator[List[StockData]]:
+        """청크 단위 스트리밍 (scan_prefetch 개 청크를 미리 받아 소비 측 처리와 겹침)"""
+        stocks = self._universe(sector)
+        size = max(1, self.config.scan_chunk_size)
+        chunks = [stocks[i:i + size] for i in range(0, len(stocks), size)]
+        print(f"[JPX] Streaming {len(stocks)} tickers in {len(chunks)} chunks", flush=True)
+        
+        pending = deque()
+        next_idx = 0
         try:
-            import yfinance as yf
-            
-            result = []
-            
-            # 1. 대상 종목 선정
-            if sector:
-                stocks_to_check = [s for s in JPX_NIKKEI_400 if s[2] == sector]
-            else:
-                stocks_to_check = JPX_NIKKEI_400
-
-            # 2. 티커 리스트 생성 (.T 제거된 코드를 키로 매핑)
-            code_map = {s[0]: s for s in stocks_to_check}  # "6501.T": (ticker, name, sector)
-            tickers = list(code_map.keys())
-            
-            print(f"[JPX] Starting batch download for {len(tickers)} tickers", flush=True)
-            
-            # 3. yfinance 배치 다운로드 (청크 단위: 50개로 줄임)
-            chunk_size = 50  # 100 -> 50으로 줄여서 안정성 향상
-            for i in range(0, len(tickers), chunk_size):
-                chunk = tickers[i:i+chunk_size]
-                
+            while pending or next_idx < len(chunks):
+                while next_idx < len(chunks) and len(pending) < max(1, self.config.scan_prefetch):
+                    pending.append(asyncio.create_task(asyncio.to_thread(self._download_chunk, chunks[next_idx])))
+                    next_idx += 1
+                task = pending.popleft()
                 try:
-                    print(f"[JPX] Downloading chunk {i//chunk_size + 1}/{(len(tickers)-1)//chunk_size + 1} ({len(chunk)} tickers)", flush=True)
-                    
-                    # threads=True로 병렬 다운로드 (속도 향상)
-                    df = yf.download(chunk, period="5d", progress=False, threads=True, group_by='ticker', timeout=10)
-                    
-                    if df.empty:
-                        print(f"[JPX] Chunk {i//chunk_size + 1} returned empty", flush=True)
-                        continue
-                    
-                    print(f"[JPX] Chunk {i//chunk_size + 1} downloaded successfully")                    # DataFrame 구조 처리
-                    # MultiIndex인 경우와 SingleIndex인 경우 처리
-                    is_multi = isinstance(df.columns, pd.MultiIndex)
-                    
-                    for ticker in chunk:
-                        try:
-                            # 데이터 추출
-                            if is_multi:
-                                try:
-                                    hist = df[ticker].dropna()
-                                except KeyError:
-                                    continue
-                            else:
-                                if len(chunk) == 1:
-                                    hist = df.dropna()
-                                else:
-                                    # should not happen with group_by='ticker' usually
-                                    continue
-                                    
-                            if hist.empty or len(hist) < 2:
-                                continue
-
-                            # 종가, 전일종가, 거래량
-                            # yfinance 최신 버전은 'Close', 'Volume' 등 대소문자 주의
-                            # 보통 'Close', 'Volume'
-                            close = float(hist['Close'].iloc[-1])
-                            prev_close = float(hist['Close'].iloc[-2])
-                            volume = int(hist['Volume'].iloc[-1])
-
-                            if prev_close <= 0:
-                                continue
-
-                            change_pct = ((close - prev_close) / prev_close) * 100
-                            trading_value = close * volume
-
-                            # 필터링
-                            if trading_value < self.config.min_trading_value:
-                                continue
-                            if change_pct < self.config.min_change_pct or change_pct > self.config.max_change_pct:
-                                continue
-                            
-                            # 정보 매핑
-                            origin_info = code_map.get(ticker)
-                            if not origin_info:
-                                continue
-                                
-                            _, name, sec = origin_info
-                            
-                            # 제외 키워드 체크
-                            if any(kw in name for kw in self.config.exclude_keywords):
-                                continue
-                            
-                            code = ticker.replace(".T", "")
-                            
-                            result.append(StockData(
-                                code=code,
-                                name=name,
-                                market="TSE",
-                                sector=sec,
-                                close=close,
-                                change_pct=round(change_pct, 2),
-                                volume=volume,
-                                trading_value=int(trading_value),
-                                marcap=0,
-                            ))
-                            
-                        except Exception:
-                            continue
-                            
+                    yield await task
                 except Exception as e:
                     print(f"Batch download error: {e}")
-                    continue
-            
-            # 등락률 정렬
-            result.sort(key=lambda x: x.change_pct, reverse=True)
-            
-            return result[:top_n]
-            
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def get_top_gainers(self, sector: str = None, top_n: int = 30) -> List[StockData]:
+        """상승률 상위 종목 조회 (청크 스트리밍 + 상위 N 힙 - 메모리는 N에 비례)"""
+        try:
+            heap = TopN(top_n, key=lambda s: s.change_pct)
+            async for batch in self.stream_gainers(sector):
+                heap.extend(batch)
+            return heap.items()
         except Exception as e:
             print(f"[JPX] 상승률 조회 오류: {e}")
             return []
     
+    async def scan_top_gainers(
+        self,
+        analyze: Callable[[StockData], Awaitable[Any]],
+        top_n: int = 30,
+        sector: str = None,
+        concurrency: int = 20,
+    ) -> List[Tuple[StockData, Any]]:
+        """상위 N 후보 분석 파이프라인
+        
+        청크가 도착하는 대로 힙에 들어간 종목은 바로 analyze 시작 (다운로드와 분석이 겹침).
+        이후 청크에서 밀려난 종목의 분석은 취소. 반환: 최종 상위 N (등락률순) × 분석 결과
+        """
+        heap = TopN(top_n, key=lambda s: s.change_pct)
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks: Dict[int, asyncio.Task] = {}
+        
+        async def _run(stock: StockData):
+            async with semaphore:
+                return await analyze(stock)
+        
+        try:
+            async for batch in self.stream_gainers(sector):
+                for stock in batch:
+                    admitted, evicted = heap.push(stock)
+                    if evicted is not None:
+                        task = tasks.pop(id(evicted), None)
+                        if task is not None:
+                            task.cancel()
+                    if admitted:
+                        tasks[id(stock)] = asyncio.create_task(_run(stock))
+            
+            final = heap.items()
+            results = await asyncio.gather(*(tasks[id(s)] for s in final), return_exceptions=True)
+            return [
+                (stock, None if isinstance(res, BaseException) else res)
+                for stock, res in zip(final, results)
+            ]
+        finally:
+            for task in tasks.values():
+                task.cancel()
+    
     async def get_stock_detail(self, code: str) -> Optional[StockData]:
         """종목 상세 정보 조회"""
         try:
@@ -156,9 +175,10 @@ class JPXCollector:
             # 코드 변환 (6501 -> 6501.T)
             ticker = f"{code}.T" if not code.endswith(".T") else code
             
+            # yfinance 는 블로킹 → 스레드에서 (이벤트 루프를 막지 않도록)
             stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period="1y")
+            info = await asyncio.to_thread(lambda: stock.info)
+            hist = await asyncio.to_thread(stock.history, period="1y")
             
             high_52w = float(hist['High'].max()) if not hist.empty else 0
             
@@ -180,7 +200,7 @@ class JPXCollector:
             ticker = f"{code}.T" if not code.endswith(".T") else code
             
             stock = yf.Ticker(ticker)
-            hist = stock.history(period="6mo")
+            hist = await asyncio.to_thread(stock.history, period="6mo")
             
             if hist.empty:
                 return []
@@ -231,17 +251,19 @@ class YahooJapanNewsCollector:
         "ダイヤモンド": 0.85,
     }
     
-    def __init__(self, config: JPSignalConfig = None):
+    def __init__(self, config: JPSignalConfig = None, session: aiohttp.ClientSession = None):
         self.config = config or JPSignalConfig()
-        self._session = None
+        self._session = session             # 공유 세션 (서빙 루프) - 받은 세션은 닫지 않음
+        self._owns_session = session is None
     
     async def __aenter__(self):
-        timeout = aiohttp.ClientTimeout(total=30)  # 30초로 단축
-        self._session = aiohttp.ClientSession(timeout=timeout)
+        if self._session is None:
+            timeout = aiohttp.ClientTimeout(total=30)  # 30초로 단축
+            self._session = aiohttp.ClientSession(timeout=timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
     
     async def get_stock_news(self, code: str, limit: int = 5, stock_name: str = "") -> List[NewsItem]:
@@ -47,6 +47,15 @@ class JPSignalConfig:
         "ブル", "ベア", "ダブル", "トリプル",
     ])
     
+    # === 스캔 유니버스 === (engine.jp_universe - data/jp/tse_universe.csv, 없으면 JPX400)
+    universe_segments: List[str] = field(default_factory=lambda: ["prime"])  # 빈 목록: 전 시장
+    scan_chunk_size: int = 100                  # yfinance 일괄 다운로드 단위
+    scan_prefetch: int = 2                      # 미리 받아 두는 청크 수 (분석과 겹쳐 진행)
+    
+    # === Market Gate 연동 === (RED 장세: 후보 축소 + 뉴스 단계 생략)
+    gate_aware: bool = True
+    red_top_n: int = 40                         # RED 시 분석 후보 수
+    
     # === 점수 가중치 (12점 만점) ===
     score_weights: Dict[str, int] = field(default_factory=lambda: {
         "news": 3,           # 뉴스/재료 (필수)
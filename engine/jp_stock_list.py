@@ -1,567 +1,118 @@
 """
-JPX Nikkei 400 종목 리스트 (Full Expanded)
+JPX Nikkei 400 종목 리스트
 도쿄증권거래소 (TSE) 상장 - .T 접미사 사용
 
 JPX Nikkei 400: 일본 거래소 그룹(JPX)과 닛케이가 공동 개발한 지수
 투자자 매력도가 높은 400개 종목으로 구성
 (시가총액 상위 400위 수준 커버)
-"""
-
-JPX_NIKKEI_400 = [
-    # === 水産・農林業 (수산/농림) ===
-    ("1332.T", "ニッスイ (Nissui)", "水産・農林業"),
-    ("1333.T", "マルハニチロ (Maruha Nichiro)", "水産・農林業"),
-    ("1377.T", "サカタのタネ (Sakata Seed)", "水産・農林業"),
-
-    # === 鉱業 (광업) ===
-    ("1605.T", "INPEX", "鉱業"),
-
-    # === 建設業 (건설) ===
-    ("1721.T", "コムシスHD (Comsys)", "建設業"),
-    ("1762.T", "高松コンストラクション (Takamatsu)", "建設業"),
-    ("1801.T", "大成建設 (Taisei)", "建設業"),
-    ("1802.T", "大林組 (Obayashi)", "建設業"),
-    ("1803.T", "清水建設 (Shimizu)", "建設業"),
-    ("1808.T", "長谷工コーポ (Haseko)", "建設業"),
-    ("1812.T", "鹿島建設 (Kajima)", "建設業"),
-    ("1820.T", "西松建設 (Nishimatsu)", "建設業"),
-    ("1821.T", "三井住友建設 (Sumitomo Mitsui Const)", "建設業"),
-    ("1833.T", "奥村組 (Okumura)", "建設業"),
-    ("1860.T", "戸田建設 (Toda)", "建設業"),
-    ("1861.T", "熊谷組 (Kumagai Gumi)", "建設業"),
-    ("1878.T", "大東建託 (Daito Trust)", "建設業"),
-    ("1881.T", "NIPPO", "建設業"),
-    ("1893.T", "五洋建設 (Penta-Ocean)", "建設業"),
-    ("1911.T", "住友林業 (Sumitomo Forestry)", "建設業"),
-    ("1925.T", "大和ハウス (Daiwa House)", "建設業"),
-    ("1928.T", "積水ハウス (Sekisui House)", "建設業"),
-    ("1941.T", "中電工 (Chudenko)", "建設業"),
-    ("1942.T", "関電工 (Kandenko)", "建設業"),
-    ("1944.T", "きんでん (Kinden)", "建設業"),
-    ("1951.T", "エクシオグループ (Exeo)", "建設業"),
-    ("1959.T", "九電工 (Kyudenko)", "建設業"),
-    ("1963.T", "日揮HD (JGC)", "建設業"),
-
-    # === 食料品 (식품) ===
-    ("2002.T", "日清製粉 (Nisshin Seifun)", "食料品"),
-    ("2201.T", "森永製菓 (Morinaga)", "食料品"),
-    ("2206.T", "江崎グリコ (Ezaki Glico)", "食料品"),
-    ("2212.T", "山崎製パン (Yamazaki Baking)", "食料品"),
-    ("2229.T", "カルビー (Calbee)", "食料品"),
-    ("2264.T", "森永乳業 (Morinaga Milk)", "食料品"),
-    ("2267.T", "ヤクルト本社 (Yakult)", "食料品"),
-    ("2269.T", "明治HD (Meiji)", "食料品"),
-    ("2282.T", "日本ハム (NH Foods)", "食料品"),
-    ("2501.T", "サッポロHD (Sapporo)", "食料品"),
-    ("2502.T", "アサヒグループHD (Asahi)", "食料品"),
-    ("2503.T", "キリンHD (Kirin)", "食料品"),
-    ("2531.T", "宝HD (Takara)", "食料品"),
-    ("2587.T", "サントリーBF (Suntory BF)", "食料品"),
-    ("2607.T", "不二製油 (Fuji Oil)", "食料品"),
-    ("2801.T", "キッコーマン (Kikkoman)", "食料品"),
-    ("2802.T", "味の素 (Ajinomoto)", "食料品"),
-    ("2871.T", "ニチレイ (Nichirei)", "食料品"),
-    ("2897.T", "日清食品HD (Nissin Foods)", "食料品"),
-    ("2914.T", "JT (Japan Tobacco)", "食料品"),
-
-    # === 繊維製品 (섬유) ===
-    ("3101.T", "東洋紡 (Toyobo)", "繊維製品"),
-    ("3402.T", "東レ (Toray)", "繊維製品"),
-    ("3002.T", "グンゼ (Gunze)", "繊維製品"),
-
-    # === パルプ・紙 (펄프/제지) ===
-    ("3861.T", "王子HD (Oji)", "パルプ・紙"),
-    ("3863.T", "日本製紙 (Nippon Paper)", "パルプ・紙"),
-
-    # === 化学 (화학) ===
-    ("3401.T", "帝人 (Teijin)", "化学"),
-    ("3405.T", "クラレ (Kuraray)", "化学"),
-    ("3407.T", "旭化成 (Asahi Kasei)", "化学"),
-    ("4004.T", "レゾナックHD (Resonac)", "化学"),
-    ("4005.T", "住友化学 (Sumitomo Chem)", "化学"),
-    ("4021.T", "日産化学 (Nissan Chem)", "化学"),
-    ("4042.T", "東ソー (Tosoh)", "化学"),
-    ("4043.T", "トクヤマ (Tokuyama)", "化学"),
-    ("4061.T", "デンカ (Denka)", "化学"),
-    ("4062.T", "イビデン (Ibiden)", "化学"),
-    ("4063.T", "信越化学 (Shin-Etsu)", "化学"),
-    ("4088.T", "エア・ウォーター (Air Water)", "化学"),
-    ("4091.T", "日本酸素HD (Nippon Sanso)", "化学"),
-    ("4182.T", "三菱ガス化学 (MGC)", "化学"),
-    ("4183.T", "三井化学 (Mitsui Chem)", "化学"),
-    ("4185.T", "JSR", "化学"), # To be acquired?
-    ("4186.T", "東京応化工業 (TOK)", "化学"),
-    ("4188.T", "三菱ケミカルG (Mitsubishi Chem)", "化学"),
-    ("4202.T", "ダイセル (Daicel)", "化学"),
-    ("4204.T", "積水化学 (Sekisui Chem)", "化学"),
-    ("4205.T", "日本ゼオン (Zeon)", "化学"),
-    ("4208.T", "UBE", "化学"),
-    ("4401.T", "ADEKA", "化学"),
-    ("4452.T", "花王 (Kao)", "化学"),
-    ("4612.T", "日本ペイント (Nippon Paint)", "化学"),
-    ("4613.T", "関西ペイント (Kansai Paint)", "化学"),
-    ("4631.T", "DIC", "化学"),
-    ("4901.T", "富士フイルム (Fujifilm)", "化学"),
-    ("4911.T", "資生堂 (Shiseido)", "化学"),
-    ("4912.T", "ライオン (Lion)", "化学"),
-    ("4921.T", "ファンケル (Fancl)", "化学"),
-    ("4922.T", "コーセー (Kose)", "化学"),
-    ("4927.T", "ポーラ・オルビス (Pola Orbis)", "化学"),
-    ("4967.T", "小林製薬 (Kobayashi)", "化学"),
-    ("6988.T", "日東電工 (Nitto Denko)", "化学"),
-    ("8113.T", "ユニ・チャーム (Unicharm)", "化学"),
-
-    # === 医薬品 (의약품) ===
-    ("4151.T", "協和キリン (Kyowa Kirin)", "医薬品"),
-    ("4502.T", "武田薬品 (Takeda)", "医薬品"),
-    ("4503.T", "アステラス製薬 (Astellas)", "医薬品"),
-    ("4506.T", "住友ファーマ (Sumitomo Pharma)", "医薬品"),
-    ("4507.T", "塩野義製薬 (Shionogi)", "医薬品"),
-    ("4508.T", "田辺三菱製薬 (Tanabe Mitsubishi)", "医薬品"),
-    ("4519.T", "中外製薬 (Chugai)", "医薬品"),
-    ("4523.T", "エーザイ (Eisai)", "医薬品"),
-    ("4527.T", "ロート製薬 (Rohto)", "医薬品"),
-    ("4528.T", "小野薬品 (Ono)", "医薬品"),
-    ("4536.T", "参天製薬 (Santen)", "医薬品"),
-    ("4543.T", "テルモ (Terumo)", "精密機器"),
-    ("4552.T", "JCRファーマ (JCR)", "医薬品"),
-    ("4555.T", "沢井製薬 (Sawai)", "医薬品"),
-    ("4568.T", "第一三共 (Daiichi Sankyo)", "医薬品"),
-    ("4578.T", "大塚HD (Otsuka)", "医薬品"),
-
-    # === 石油・石炭製品 (석유/석탄) ===
-    ("5019.T", "出光興産 (Idemitsu)", "石油・石炭製品"),
-    ("5020.T", "ENEOS HD", "石油・石炭製品"),
-    ("5021.T", "コスモエネルギー (Cosmo)", "石油・石炭製品"),
-
-    # === ゴム製品 (고무) ===
-    ("5101.T", "横浜ゴム (Yokohama Rubber)", "ゴム製品"),
-    ("5105.T", "TOYO TIRE", "ゴム製品"),
-    ("5108.T", "ブリヂストン (Bridgestone)", "ゴム製品"),
 
-    # === ガラス・土石製品 (유리/토석) ===
-    ("5201.T", "AGC", "ガラス・土石製品"),
-    ("5214.T", "日本電気硝子 (NEG)", "ガラス・土石製品"),
-    ("5232.T", "住友大阪セメント (Sumitomo Osaka)", "ガラス・土石製品"),
-    ("5233.T", "太平洋セメント (Taiheiyo Cement)", "ガラス・土石製品"),
-    ("5301.T", "東海カーボン (Tokai Carbon)", "ガラス・土石製品"),
-    ("5332.T", "TOTO", "ガラス・土石製品"),
-    ("5333.T", "日本ガイシ (NGK Insulators)", "ガラス・土石製品"),
-    ("5334.T", "日本特殊陶業 (NGK Spark Plug)", "ガラス・土石製品"),
-
-    # === 鉄鋼 (철강) ===
-    ("5401.T", "日本製鉄 (Nippon Steel)", "鉄鋼"),
-    ("5406.T", "神戸製鋼所 (Kobe Steel)", "鉄鋼"),
-    ("5411.T", "JFE HD", "鉄鋼"),
-    ("5444.T", "大和工業 (Yamato Kogyo)", "鉄鋼"),
-    ("5463.T", "丸一鋼管 (Maruichi)", "鉄鋼"),
-    ("5471.T", "大同特殊鋼 (Daido)", "鉄鋼"),
-    ("5486.T", "プロテリアル (旧日立金属)", "鉄鋼"), # Proterial
-
-    # === 非鉄金属 (비철금속) ===
-    ("5703.T", "日本軽金属HD (Nikkeikin)", "非鉄金属"),
-    ("5706.T", "三井金属 (Mitsui Mining)", "非鉄金属"),
-    ("5711.T", "三菱マテリアル (Mitsubishi Mat)", "非鉄金属"),
-    ("5713.T", "住友金属鉱山 (Sumitomo Metal)", "非鉄金属"),
-    ("5714.T", "DOWA", "非鉄金属"),
-    ("5801.T", "古河電工 (Furukawa Electric)", "非鉄金属"),
-    ("5802.T", "住友電工 (Sumitomo Electric)", "非鉄金属"),
-    ("5803.T", "フジクラ (Fujikura)", "非鉄金属"),
-
-    # === 金属製品 (금속제품) ===
-    ("5901.T", "東洋製罐 (Toyo Seikan)", "金属製品"),
-    ("5929.T", "三和HD (Sanwa)", "金属製品"),
-    ("5938.T", "LIXIL", "金属製品"),
-    ("5947.T", "リンナイ (Rinnai)", "金属製品"),
-    ("6248.T", "横河ブリッジ (Yokogawa Bridge)", "金属製品"),
+- 데이터: engine/data/jpx_nikkei400.csv (ticker,name,sector,n225 - n225 는 Nikkei 225 편입 순번)
+- 첫 사용 시 1회 로드, 코드 → 종목명/섹터/N225 편입 조회는 dict/set (O(1))
+- 기존 이름(JPX_NIKKEI_400, NIKKEI_225, NIKKEI_225_LIST, JPX_400_OTHERS_LIST, TOTAL_STOCKS)은 모듈 __getattr__ 로 유지
+"""
 
-    # === 機械 (기계) ===
-    ("6005.T", "三浦工業 (Miura)", "機械"),
-    ("6103.T", "オークマ (Okuma)", "機械"),
-    ("6113.T", "アマダ (Amada)", "機械"),
-    ("6135.T", "牧野フライス (Makino)", "機械"),
-    ("6141.T", "DMG森精機 (DMG Mori)", "機械"),
-    ("6146.T", "ディスコ (Disco)", "機械"),
-    ("6201.T", "豊田自動織機 (Toyota Ind)", "機械"),
-    ("6268.T", "ナブテスコ (Nabtesco)", "機械"),
-    ("6273.T", "SMC", "機械"),
-    ("6301.T", "小松製作所 (Komatsu)", "機械"),
-    ("6302.T", "住友重機械 (Sumitomo Heavy)", "機械"),
-    ("6305.T", "日立建機 (Hitachi CM)", "機械"),
-    ("6326.T", "クボタ (Kubota)", "機械"),
-    ("6361.T", "荏原 (Ebara)", "機械"),
-    ("6367.T", "ダイキン (Daikin)", "機械"),
-    ("6370.T", "栗田工業 (Kurita)", "機械"),
-    ("6383.T", "ダイフク (Daifuku)", "機械"),
-    ("6406.T", "フジテック (Fujitec)", "機械"),
-    ("6417.T", "SANKYO", "機械"),
-    ("6432.T", "竹内製作所 (Takeuchi)", "機械"),
-    ("6448.T", "ブラザー工業 (Brother)", "機械"),
-    ("6460.T", "セガサミー (Sega Sammy)", "機械"),
-    ("6465.T", "ホシザキ (Hoshizaki)", "機械"),
-    ("6471.T", "日本精工 (NSK)", "機械"),
-    ("6472.T", "NTN", "機械"),
-    ("6473.T", "ジェイテクト (JTEKT)", "機械"),
-    ("6479.T", "ミネベアミツミ (Minebea)", "機械"),
-    ("7011.T", "三菱重工 (MHI)", "機械"),
-    ("7012.T", "川崎重工 (KHI)", "機械"),
-    ("7013.T", "IHI", "機械"),
+import csv
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-    # === 電気機器 (전기기기) ===
-    ("6501.T", "日立 (Hitachi)", "電気機器"),
-    ("6503.T", "三菱電機 (Mitsubishi Elec)", "電気機器"),
-    ("6504.T", "富士電機 (Fuji Elec)", "電気機器"),
-    ("6506.T", "安川電機 (Yaskawa)", "電気機器"),
-    ("6594.T", "ニデック (Nidec)", "電気機器"),
-    ("6645.T", "オムロン (Omron)", "電気機器"),
-    ("6674.T", "GSユアサ (GS Yuasa)", "電気機器"),
-    ("6701.T", "NEC", "電気機器"),
-    ("6702.T", "富士通 (Fujitsu)", "電気機器"),
-    ("6703.T", "OKI", "電気機器"),
-    ("6723.T", "ルネサス (Renesas)", "電気機器"),
-    ("6724.T", "エプソン (Epson)", "電気機器"),
-    ("6752.T", "パナソニック (Panasonic)", "電気機器"),
-    ("6753.T", "シャープ (Sharp)", "電気機器"),
-    ("6758.T", "ソニーG (Sony)", "電気機器"),
-    ("6762.T", "TDK", "電気機器"),
-    ("6770.T", "アルプスアルパイン (Alps)", "電気機器"),
-    ("6841.T", "横河電機 (Yokogawa)", "電気機器"),
-    ("6845.T", "アズビル (Azbil)", "電気機器"),
-    ("6857.T", "アドバンテスト (Advantest)", "電気機器"),
-    ("6861.T", "キーエンス (Keyence)", "電気機器"),
-    ("6866.T", "HIOKI", "電気機器"),
-    ("6869.T", "シスメックス (Sysmex)", "電気機器"),
-    ("6902.T", "デンソー (Denso)", "電気機器"),
-    ("6920.T", "レーザーテック (Lasertec)", "電気機器"),
-    ("6952.T", "カシオ (Casio)", "電気機器"),
-    ("6954.T", "ファナック (Fanuc)", "電気機器"),
-    ("6963.T", "ローム (Rohm)", "電気機器"),
-    ("6965.T", "浜松ホトニクス (Hamamatsu)", "電気機器"),
-    ("6971.T", "京セラ (Kyocera)", "電気機器"),
-    ("6976.T", "太陽誘電 (Taiyo Yuden)", "電気機器"),
-    ("6981.T", "村田製作所 (Murata)", "電気機器"),
-    ("7735.T", "SCREEN", "電気機器"),
-    ("7751.T", "キヤノン (Canon)", "電気機器"),
-    ("7752.T", "リコー (Ricoh)", "電気機器"),
-    ("8035.T", "東京エレクトロン (TEL)", "電気機器"),
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'jpx_nikkei400.csv')
 
-    # === 輸送用機器 (운송기기/자동차) ===
-    ("7201.T", "日産自動車 (Nissan)", "輸送用機器"),
-    ("7202.T", "いすゞ (Isuzu)", "輸送用機器"),
-    ("7203.T", "トヨタ (Toyota)", "輸送用機器"),
-    ("7205.T", "日野自 (Hino)", "輸送用機器"),
-    ("7211.T", "三菱自 (Mitsubishi Motors)", "輸送用機器"),
-    ("7240.T", "NOK", "輸送用機器"),
-    ("7259.T", "アイシン (Aisin)", "輸送用機器"),
-    ("7261.T", "マツダ (Mazda)", "輸送用機器"),
-    ("7267.T", "ホンダ (Honda)", "輸送用機器"),
-    ("7269.T", "スズキ (Suzuki)", "輸送用機器"),
-    ("7270.T", "SUBARU", "輸送用機器"),
-    ("7272.T", "ヤマハ発動機 (Yamaha Motor)", "輸送用機器"),
-    ("7282.T", "豊田合成 (Toyoda Gosei)", "輸送用機器"),
-    ("7313.T", "TSテック (TS Tech)", "輸送用機器"),
-    
-    # === 精密機器 (정밀기기) ===
-    ("7701.T", "島津製作所 (Shimadzu)", "精密機器"),
-    ("7731.T", "ニコン (Nikon)", "精密機器"),
-    ("7733.T", "オリンパス (Olympus)", "精密機器"),
-    ("7741.T", "HOYA", "精密機器"),
-    ("7747.T", "朝日インテック (Asahi Intecc)", "精密機器"),
-    ("7762.T", "シチズン (Citizen)", "精密機器"),
+StockRow = Tuple[str, str, str]   # (티커 "6501.T", 종목명, 섹터)
 
-    # === その他製品 (기타제품) ===
-    ("7911.T", "TOPPAN", "その他製品"),
-    ("7912.T", "大日本印刷 (DNP)", "その他製品"),
-    ("7936.T", "アシックス (Asics)", "その他製品"),
-    ("7951.T", "ヤマハ (Yamaha)", "その他製品"),
-    ("7974.T", "任天堂 (Nintendo)", "その他製品"),
-    ("7988.T", "ニフコ (Nifco)", "その他製品"),
-    ("7832.T", "バンダイナムコ (Bandai Namco)", "その他製品"),
-    ("7984.T", "コクヨ (Kokuyo)", "その他製品"),
 
-    # === 情報・通信業 (정보통신) ===
-    ("2413.T", "エムスリー (M3)", "情報・通信業"),
-    ("3626.T", "TIS", "情報・通信業"),
-    ("3632.T", "グリー (GREE)", "情報・通信業"),
-    ("3659.T", "ネクソン (Nexon)", "情報・通信業"),
-    ("3697.T", "SHIFT", "情報・通信業"),
-    ("3765.T", "ガンホー (GungHo)", "情報・通信業"),
-    ("3769.T", "GMO-PG", "情報・通信業"),
-    ("3923.T", "ラクス (Raksul/Rakus)", "情報・通信業"),
-    ("3994.T", "マネーフォワード (Money Forward)", "情報・通信業"),
-    ("4194.T", "ビジョナル (Visional)", "情報・通信業"),
-    ("4307.T", "野村総研 (NRI)", "情報・通信業"),
-    ("4385.T", "メルカリ (Mercari)", "情報・通信業"),
-    ("4443.T", "Sansan", "情報・通信業"),
-    ("4478.T", "フリー (freee)", "情報・通信業"),
-    ("4684.T", "オービック (Obic)", "情報・通信業"),
-    ("4686.T", "ジャストシステム (JustSystems)", "情報・通信業"),
-    ("4689.T", "LY Corp (Line Yahoo)", "情報・通信業"),
-    ("4704.T", "トレンドマイクロ (Trend Micro)", "情報・通信業"),
-    ("4716.T", "日本オラクル (Oracle JP)", "情報・通信業"),
-    ("4732.T", "ユー・エス・エス (USS)", "情報・通信業"),
-    ("4739.T", "CTC (Itochu Techno)", "情報・通信業"),
-    ("4751.T", "サイバー (CyberAgent)", "情報・通信業"),
-    ("4755.T", "楽天G (Rakuten)", "情報・通信業"),
-    ("4768.T", "大塚商会 (Otsuka Corp)", "情報・通信業"),
-    ("9432.T", "NTT", "情報・通信業"),
-    ("9433.T", "KDDI", "情報・通信業"),
-    ("9434.T", "ソフトバンク (SoftBank)", "情報・通信業"),
-    ("9449.T", "GMO", "情報・通信業"),
-    ("9468.T", "KADOKAWA", "情報・通信業"),
-    ("9602.T", "東宝 (Toho)", "情報・通信業"),
-    ("9613.T", "NTTデータ (NTT Data)", "情報・通信業"),
-    ("9684.T", "スクエニ (Square Enix)", "情報・通信業"),
-    ("9697.T", "カプコン (Capcom)", "情報・通信業"),
-    ("9719.T", "SCSK", "情報・通信業"),
-    ("9753.T", "IX", "情報・通信業"), 
-    ("9984.T", "SBG (SoftBank Group)", "情報・通信業"),
+class _StockList(NamedTuple):
+    stocks: List[StockRow]
+    by_code: Dict[str, StockRow]
+    by_sector: Dict[str, List[StockRow]]
+    n225: List[str]
+    n225_set: frozenset
+    n225_list: List[StockRow]
+    others_list: List[StockRow]
 
-    # === 卸売業 (도매) ===
-    ("2768.T", "双日 (Sojitz)", "卸売業"),
-    ("3038.T", "神戸物産 (Kobe Bussan)", "卸売業"),
-    ("7459.T", "メディパル (Medipal)", "卸売業"),
-    ("8001.T", "伊藤忠 (Itochu)", "卸売業"),
-    ("8002.T", "丸紅 (Marubeni)", "卸売業"),
-    ("8015.T", "豊田通商 (Toyota Tsusho)", "卸売業"),
-    ("8020.T", "兼松 (Kanematsu)", "卸売業"),
-    ("8031.T", "三井物産 (Mitsui)", "卸売業"),
-    ("8053.T", "住友商事 (Sumitomo Corp)", "卸売業"),
-    ("8058.T", "三菱商事 (Mitsubishi Corp)", "卸売業"),
-    ("8060.T", "キヤノンMJ (Canon MJ)", "卸売業"),
-    ("9987.T", "スズケン (Suzuken)", "卸売業"),
 
-    # === 小売業 (소매) ===
-    ("2670.T", "ABC-MART", "小売業"),
-    ("3064.T", "MonotaRO", "小売業"),
-    ("3086.T", "Jフロント (J.Front)", "小売業"),
-    ("3088.T", "マツキヨココカラ (Matsukiyo)", "小売業"),
-    ("3092.T", "ZOZO", "小売業"),
-    ("3099.T", "三越伊勢丹 (Isetan Mitsukoshi)", "小売業"),
-    ("3141.T", "ウエルシア (Welcia)", "小売業"),
-    ("3382.T", "セブン&アイ (Seven & i)", "小売業"),
-    ("3391.T", "ツルハHD (Tsuruha)", "小売業"),
-    ("7453.T", "良品計画 (Ryohin Keikaku)", "小売業"),
-    ("7532.T", "パンパシHD (PPIH)", "小売業"),
-    ("8233.T", "高島屋 (Takashimaya)", "小売業"),
-    ("8252.T", "丸井G (Marui)", "小売業"),
-    ("8267.T", "イオン (Aeon)", "小売業"),
-    ("9831.T", "ヤマダHD (Yamada)", "小売業"),
-    ("9843.T", "ニトリHD (Nitori)", "小売業"),
-    ("9983.T", "ファストリ (Fast Retailing)", "小売業"),
+_data: Optional[_StockList] = None
+_lock = threading.Lock()
 
-    # === 銀行業 (은행) ===
-    ("5831.T", "しずおかFG (Shizuoka)", "銀行業"),
-    ("5838.T", "楽天銀行 (Rakuten Bank)", "銀行業"),
-    ("7181.T", "かんぽ生命 (Japan Post Ins)", "保険業"), # 보험이지만 금융권
-    ("7182.T", "ゆうちょ銀行 (Japan Post Bank)", "銀行業"),
-    ("7186.T", "コンコルディア (Concordia)", "銀行業"),
-    ("8304.T", "あおぞら (Aozora)", "銀行業"),
-    ("8306.T", "三菱UFJ (MUFG)", "銀行業"),
-    ("8308.T", "りそなHD (Resona)", "銀行業"),
-    ("8309.T", "三井住友トラスト (SuMi Trust)", "銀行業"),
-    ("8316.T", "三井住友FG (SMFG)", "銀行業"),
-    ("8331.T", "千葉銀行 (Chiba)", "銀行業"),
-    ("8334.T", "群馬銀行 (Gunma)", "銀行業"),
-    ("8354.T", "ふくおかFG (Fukuoka)", "銀行業"),
-    ("8359.T", "八十二 (Hachijuni)", "銀行業"),
-    ("8411.T", "みずほFG (Mizuho)", "銀行業"),
 
-    # === 証券・商品先物 (증권) ===
-    ("8601.T", "大和証券 (Daiwa)", "証券"),
-    ("8604.T", "野村HD (Nomura)", "証券"),
-    ("8697.T", "日本取引所 (JPX)", "その他金融業"),
-    ("8473.T", "SBI HD", "証券"),
+def _load() -> _StockList:
+    global _data
+    if _data is not None:
+        return _data
+    with _lock:
+        if _data is None:
+            stocks, by_code, by_sector, ranked = [], {}, {}, []
+            with open(DATA_PATH, 'r', encoding='utf-8', newline='') as f:
+                for ticker, name, sector, n225 in csv.reader(f):
+                    if ticker == 'ticker' or ticker in by_code:
+                        continue
+                    row = (ticker, name, sector)
+                    stocks.append(row)
+                    by_code[ticker] = row
+                    by_sector.setdefault(sector, []).append(row)
+                    if n225:
+                        ranked.append((int(n225), ticker))
+            n225 = [t for _, t in sorted(ranked)]
+            n225_set = frozenset(n225)
+            _data = _StockList(
+                stocks=stocks,
+                by_code=by_code,
+                by_sector=by_sector,
+                n225=n225,
+                n225_set=n225_set,
+                n225_list=[s for s in stocks if s[0] in n225_set],
+                others_list=[s for s in stocks if s[0] not in n225_set],
+            )
+    return _data
 
-    # === 保険業 (보험) ===
-    ("8630.T", "SOMPO", "保険業"),
-    ("8725.T", "MS&AD", "保険業"),
-    ("8750.T", "第一生命 (Dai-ichi Life)", "保険業"),
-    ("8766.T", "東京海上 (Tokio Marine)", "保険業"),
-    ("8795.T", "T&D", "保険業"),
 
-    # === その他金融 (기타금융) ===
-    ("8253.T", "クレディセゾン (Credit Saison)", "その他金融業"),
-    ("8439.T", "東京センチュリー (Tokyo Century)", "その他金融業"),
-    ("8570.T", "イオンFS (Aeon Fin)", "その他金融業"),
-    ("8572.T", "アコム (Acom)", "その他金融業"),
-    ("8585.T", "オリコ (Orioc)", "その他金融業"),
-    ("8591.T", "オリックス (Orix)", "その他金融業"),
-    ("8593.T", "三菱HCキャピタル (Mitsubishi HC)", "その他金融業"),
+def _ticker(code: str) -> str:
+    return code if code.endswith('.T') else f"{code}.T"
 
-    # === 不動産業 (부동산) ===
-    ("3003.T", "ヒューリック (Hulic)", "不動産業"),
-    ("3231.T", "野村不HD (Nomura Real Est)", "不動産業"),
-    ("3289.T", "東急不HD (Tokyu Fudosan)", "不動産業"),
-    ("8801.T", "三井不動産 (Mitsui Fudosan)", "不動産業"),
-    ("8802.T", "三菱地所 (Mitsubishi Estate)", "不動産業"),
-    ("8804.T", "東京建物 (Tokyo Tatemono)", "不動産業"),
-    ("8830.T", "住友不動産 (Sumitomo Realty)", "不動産業"),
-    ("8876.T", "リログループ (Relo)", "不動産業"),
 
-    # === REIT (리츠) ===
-    ("3281.T", "GLP", "REIT"),
-    ("3283.T", "プロロジス (Prologis)", "REIT"),
-    ("3462.T", "野村不マスター (NMF)", "REIT"),
-    ("8951.T", "日本ビルファンド (NBF)", "REIT"),
-    ("8952.T", "ジャパンリアル (JRE)", "REIT"),
-    ("8953.T", "日本都市ファンド (JMF)", "REIT"),
-    ("8954.T", "オリックスREIT (OJR)", "REIT"),
-    ("8960.T", "ユナイテッド (UUR)", "REIT"),
-    ("8984.T", "大和ハウスREIT (DHR)", "REIT"),
-    
-    # === 陸運業 (육운) ===
-    ("9005.T", "東急 (Tokyu Corp)", "陸運業"),
-    ("9006.T", "京急 (Keikyu)", "陸運業"),
-    ("9007.T", "小田急 (Odakyu)", "陸運業"),
-    ("9008.T", "京王 (Keio)", "陸運業"),
-    ("9009.T", "京成 (Keisei)", "陸運業"),
-    ("9020.T", "JR東日本 (JR East)", "陸運業"),
-    ("9021.T", "JR西日本 (JR West)", "陸運業"),
-    ("9022.T", "JR東海 (JR Central)", "陸運業"),
-    ("9024.T", "西武HD (Seibu)", "陸運業"),
-    ("9041.T", "近鉄GHD (Kintetsu)", "陸運業"),
-    ("9042.T", "阪急阪神 (Hankyu Hanshin)", "陸運業"),
-    ("9045.T", "京阪HD (Keihan)", "陸運業"),
-    ("9048.T", "名古屋鉄道 (Meitetsu)", "陸運業"),
-    ("9064.T", "ヤマトHD (Yamato)", "陸運業"),
-    ("9143.T", "SG HD (Sagawa)", "陸運業"),
-    ("9147.T", "NX HD (Nippon Exp)", "陸運業"),
+def get_stock(code: str) -> Optional[StockRow]:
+    """'6501' / '6501.T' → (티커, 종목명, 섹터), 없으면 None"""
+    return _load().by_code.get(_ticker(code))
 
-    # === 海運業 (해운) ===
-    ("9101.T", "日本郵船 (NYK)", "海運業"),
-    ("9104.T", "商船三井 (MOL)", "海運業"),
-    ("9107.T", "川崎汽船 (K-Line)", "海運業"),
 
-    # === 空運業 (항공) ===
-    ("9201.T", "JAL", "空運業"),
-    ("9202.T", "ANA", "空運業"),
+def is_n225(code: str) -> bool:
+    return _ticker(code) in _load().n225_set
 
-    # === 電気・ガス業 (전기/가스) ===
-    ("9501.T", "東京電力HD (TEPCO)", "電気・ガス業"),
-    ("9502.T", "中部電力 (Chubu)", "電気・ガス業"),
-    ("9503.T", "関西電力 (KEPCO)", "電気・ガス業"),
-    ("9504.T", "中国電力 (Chugoku)", "電気・ガス業"),
-    ("9506.T", "東北電力 (Tohoku)", "電気・ガス業"),
-    ("9508.T", "九州電力 (Kyushu)", "電気・ガス業"),
-    ("9531.T", "東京ガス (Tokyo Gas)", "電気・ガス業"),
-    ("9532.T", "大阪ガス (Osaka Gas)", "電気・ガス業"),
 
-    # === サービス業 (서비스) ===
-    ("2121.T", "MIXI", "サービス業"),
-    ("2127.T", "日本M&A (Nihon M&A)", "サービス業"),
-    ("2175.T", "SMS", "サービス業"),
-    ("2181.T", "パーソル (Persol)", "サービス業"),
-    ("2371.T", "カカクコム (Kakaku.com)", "サービス業"),
-    ("2432.T", "DeNA", "サービス業"),
-    ("2433.T", "博報堂DY (Hakuhodo)", "サービス業"),
-    ("4324.T", "電通グループ (Dentsu)", "サービス業"),
-    ("4661.T", "OLC (Oriental Land)", "サービス業"),
-    ("4666.T", "パーク24 (Park24)", "サービス業"),
-    ("4751.T", "サイバー (CyberAgent)", "サービス業"),
-    ("6098.T", "リクルート (Recruit)", "サービス業"),
-    ("6178.T", "日本郵政 (Japan Post)", "サービス業"), 
-    ("9602.T", "東宝 (Toho)", "サービス業"), 
-    ("9735.T", "セコム (Secom)", "サービス業"),
-    ("9766.T", "コナミG (Konami)", "サービス業"),
-    ("9783.T", "ベネッセ (Benesse)", "サービス業"),
-]
+def get_n225_codes() -> frozenset:
+    """N225 편입 티커 집합"""
+    return _load().n225_set
 
-# 중복 제거 (코드 기준)
-_seen = set()
-_unique_list = []
-for item in JPX_NIKKEI_400:
-    if item[0] not in _seen:
-        _seen.add(item[0])
-        _unique_list.append(item)
-JPX_NIKKEI_400 = _unique_list
 
 # 섹터별 분류를 위한 유틸리티
 def get_stocks_by_sector(sector: str):
     """특정 섹터의 종목 리스트 반환"""
-    return [s for s in JPX_NIKKEI_400 if s[2] == sector]
+    return list(_load().by_sector.get(sector, []))
+
 
 def get_all_sectors():
     """모든 섹터 목록 반환"""
-    return list(set(s[2] for s in JPX_NIKKEI_400))
+    return list(_load().by_sector)
 
-# NIKKEI 225 Constituents (Approximate based on Major Stocks in JPX 400)
-# Note: This list should be updated with official constituents data
-NIKKEI_225 = [
-    # Foods
-    "2002.T", "2269.T", "2282.T", "2501.T", "2502.T", "2503.T", "2531.T", "2801.T", "2802.T", "2871.T", "2914.T",
-    # Textile
-    "3101.T", "3402.T",
-    # Pulp/Paper
-    "3861.T", "3863.T",
-    # Chemicals
-    "3401.T", "3405.T", "3407.T", "4004.T", "4005.T", "4021.T", "4042.T", "4043.T", "4061.T", "4063.T", 
-    "4183.T", "4188.T", "4208.T", "4452.T", "4612.T", "4901.T", "4911.T", "6988.T",
-    # Pharma
-    "4151.T", "4502.T", "4503.T", "4506.T", "4507.T", "4519.T", "4523.T", "4543.T", "4568.T", "4578.T",
-    # Oil/Coal
-    "5019.T", "5020.T",
-    # Rubber
-    "5101.T", "5108.T",
-    # Glass/Ceramics
-    "5201.T", "5214.T", "5233.T", "5301.T", "5332.T", "5333.T",
-    # Steel
-    "5401.T", "5406.T", "5411.T",
-    # Non-ferrous
-    "5703.T", "5706.T", "5711.T", "5713.T", "5714.T", "5801.T", "5802.T", "5803.T",
-    # Machinery
-    "6005.T", "6103.T", "6113.T", "6301.T", "6302.T", "6305.T", "6326.T", "6361.T", "6367.T", "6471.T", "6472.T", "6473.T", "7011.T", "7012.T", "7013.T",
-    # Electric
-    "6501.T", "6503.T", "6504.T", "6506.T", "6645.T", "6674.T", "6701.T", "6702.T", "6703.T", "6724.T", "6752.T", "6753.T", "6758.T", "6762.T", "6770.T",
-    "6841.T", "6857.T", "6902.T", "6952.T", "6954.T", "6971.T", "6976.T", "6981.T", "7735.T", "7751.T", "7752.T", "8035.T",
-    # Auto
-    "7201.T", "7202.T", "7203.T", "7205.T", "7211.T", "7261.T", "7267.T", "7269.T", "7270.T", "7272.T",
-    # Precision
-    "7701.T", "7731.T", "7733.T", "7762.T",
-    # Other Products
-    "7911.T", "7912.T", "7951.T", "7974.T",
-    # Info/Comm
-    "2413.T", "3659.T", "4324.T", "4689.T", "4704.T", "4751.T", "4755.T", "9432.T", "9433.T", "9434.T", "9602.T", "9613.T", "9766.T", "9984.T",
-    # Wholesale
-    "2768.T", "8001.T", "8002.T", "8015.T", "8031.T", "8053.T", "8058.T",
-    # Retail
-    "3086.T", "3099.T", "3382.T", "8233.T", "8252.T", "8267.T", "9983.T",
-    # Banks
-    "8304.T", "8306.T", "8308.T", "8309.T", "8316.T", "8331.T", "8354.T", "8411.T",
-    # Securities
-    "8601.T", "8604.T", "8697.T",
-    # Insurance
-    "8630.T", "8725.T", "8750.T", "8766.T", "8795.T",
-    # Other Fin
-    "8253.T", "8572.T", "8591.T",
-    # Real Estate
-    "3289.T", "8801.T", "8802.T", "8804.T", "8830.T",
-    # Railway/Bus
-    "9005.T", "9006.T", "9007.T", "9008.T", "9009.T", "9020.T", "9021.T", "9022.T", "9024.T", "9041.T", "9042.T", "9045.T", "9064.T", "9147.T",
-    # Marine
-    "9101.T", "9104.T", "9107.T",
-    # Air
-    "9201.T", "9202.T",
-    # Electric Power
-    "9501.T", "9502.T", "9503.T", "9531.T", "9532.T",
-    # Service
-    "2432.T", "4661.T", "6098.T", "6178.T", "9735.T",
-]
 
-# Create Sets for Fast Lookup
-_N225_SET = set(NIKKEI_225)
-
-# Separate Lists
-NIKKEI_225_LIST = [s for s in JPX_NIKKEI_400 if s[0] in _N225_SET]
-JPX_400_OTHERS_LIST = [s for s in JPX_NIKKEI_400 if s[0] not in _N225_SET]
-
-# 확인용
 def get_n225_list():
-    return NIKKEI_225_LIST
+    return _load().n225_list
+
 
 def get_n400_others_list():
-    return JPX_400_OTHERS_LIST
+    return _load().others_list
+
+
+_LAZY_ATTRS = {
+    'JPX_NIKKEI_400': lambda d: d.stocks,
+    'NIKKEI_225': lambda d: d.n225,
+    'NIKKEI_225_LIST': lambda d: d.n225_list,
+    'JPX_400_OTHERS_LIST': lambda d: d.others_list,
+    'TOTAL_STOCKS': lambda d: len(d.stocks),
+}
 
-# 총 종목 수 확인
-TOTAL_STOCKS = len(JPX_NIKKEI_400)
 
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return _LAZY_ATTRS[name](_load())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
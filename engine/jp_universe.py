@@ -0,0 +1,143 @@
+"""
+TSE 종목 유니버스 (데이터 파일 기반)
+- data/jp/tse_universe.csv (code,name,sector,segment)
+  → `python -m engine.jp_universe --refresh` 로 JPX 상장종목 일람(data_j.xls)에서 갱신
+- JPX 원본 형식(コード/銘柄名/市場・商品区分/33業種区分)과 jpx400_raw.csv(証券コード/銘柄/市場)도 그대로 읽음
+- 파일은 저장소에 포함되지 않음 - 없으면 engine.jp_stock_list.JPX_NIKKEI_400 (경로별 1회 경고 로그)
+- 반환 형식은 JPX_NIKKEI_400 과 같은 (티커, 종목명, 섹터) 튜플 목록
+"""
+
+import argparse
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UNIVERSE_PATH = os.path.join(BASE_DIR, 'data', 'jp', 'tse_universe.csv')
+JPX_LIST_URL = 'https://www.jpx.co.jp/markets/statistics-equities/misc/tvdivq0000001vg2-att/data_j.xls'
+
+PRIME, STANDARD, GROWTH = 'プライム', 'スタンダード', 'グロース'
+SEGMENT_ALIASES = {'prime': PRIME, 'standard': STANDARD, 'growth': GROWTH}
+
+_COLUMN_MAP = {
+    'コード': 'code', '証券コード': 'code',
+    '銘柄名': 'name', '銘柄': 'name',
+    '市場・商品区分': 'segment', '市場': 'segment',
+    '33業種区分': 'sector',
+}
+
+UniverseRow = Tuple[str, str, str]   # (티커 "6501.T", 종목명, 섹터)
+
+_cache: Dict[Tuple, List[UniverseRow]] = {}
+_cache_lock = threading.Lock()
+_missing_warned: set = set()
+
+
+def normalize_universe(df: pd.DataFrame) -> pd.DataFrame:
+    """원본 표 → code / name / sector / segment (내국 보통주 3개 시장만)"""
+    df = df.rename(columns={c: _COLUMN_MAP.get(str(c).strip(), str(c).strip()) for c in df.columns})
+    if 'code' not in df.columns or 'name' not in df.columns:
+        raise ValueError(f"종목코드/종목명 컬럼 없음: {list(df.columns)}")
+    for col in ('sector', 'segment'):
+        if col not in df.columns:
+            df[col] = ''
+
+    out = df[['code', 'name', 'sector', 'segment']].copy()
+    code = out['code'].astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+    out['code'] = code.str.upper()
+    out['name'] = out['name'].astype(str).str.strip()
+    out['sector'] = out['sector'].fillna('').astype(str).str.strip().replace('-', '')
+    # 'プライム（内国株式）' → 'プライム', ETF/REIT/PRO Market 등은 제외
+    segment = out['segment'].fillna('').astype(str).str.split('（').str[0].str.strip()
+    out['segment'] = segment
+    if segment.ne('').any():
+        foreign = df['segment'].astype(str).str.contains('外国', na=False)
+        out = out[segment.isin([PRIME, STANDARD, GROWTH]) & ~foreign]
+    out = out[out['code'].str.fullmatch(r'[0-9][0-9A-Z]{3}')]
+    return out.drop_duplicates('code').reset_index(drop=True)
+
+
+def _resolve_segments(segments: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    if not segments:
+        return None
+    return tuple(sorted(SEGMENT_ALIASES.get(s.lower(), s) for s in segments))
+
+
+def _read_file(path: str) -> pd.DataFrame:
+    if path.lower().endswith(('.xls', '.xlsx')):
+        return pd.read_excel(path, dtype=str)
+    return pd.read_csv(path, dtype=str, encoding='utf-8-sig')
+
+
+def load_tse_universe(
+    segments: Optional[Iterable[str]] = (PRIME,),
+    path: str = None,
+) -> List[UniverseRow]:
+    """TSE 유니버스 (segments=None: 전 시장). 파일 mtime 기준 캐시"""
+    path = path or UNIVERSE_PATH
+    segments = _resolve_segments(segments)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        from engine.jp_stock_list import JPX_NIKKEI_400
+        if path not in _missing_warned:
+            _missing_warned.add(path)
+            print(f"[JPUniverse] 유니버스 파일 없음 ({path}) - JPX400 {len(JPX_NIKKEI_400)}종목으로 대체. "
+                  f"`python -m engine.jp_universe --refresh` 로 생성")
+        return list(JPX_NIKKEI_400)
+
+    key = (path, mtime, segments)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        df = normalize_universe(_read_file(path))
+    except Exception as e:
+        print(f"[JPUniverse] 유니버스 파일 로드 실패 ({path}): {e} - JPX400 사용")
+        from engine.jp_stock_list import JPX_NIKKEI_400
+        return list(JPX_NIKKEI_400)
+
+    if segments and df['segment'].ne('').any():
+        df = df[df['segment'].isin(segments)]
+    rows = [(f"{c}.T", n, s) for c, n, s in zip(df['code'], df['name'], df['sector'])]
+
+    with _cache_lock:
+        _cache.clear()
+        _cache[key] = rows
+    return rows
+
+
+def refresh_universe(source: str = JPX_LIST_URL, path: str = None) -> int:
+    """JPX 상장종목 일람(URL 또는 로컬 xls/csv) → data/jp/tse_universe.csv (원자적 저장). 종목 수 반환"""
+    from engine.persist import atomic_write_bytes
+
+    path = path or UNIVERSE_PATH
+    raw = _read_file(source) if os.path.exists(source) else pd.read_excel(source, dtype=str)
+    df = normalize_universe(raw)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    atomic_write_bytes(path, df.to_csv(index=False).encode('utf-8-sig'))
+    return len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TSE universe file')
+    parser.add_argument('--refresh', action='store_true', help='JPX 상장종목 일람으로 갱신')
+    parser.add_argument('--source', default=JPX_LIST_URL, help='data_j.xls URL 또는 로컬 경로 (jpx400_raw.csv 도 가능)')
+    parser.add_argument('--segments', default='prime', help="prime,standard,growth 또는 all")
+    args = parser.parse_args()
+
+    if args.refresh:
+        count = refresh_universe(args.source)
+        print(f"[JPUniverse] {count}종목 저장: {UNIVERSE_PATH}")
+
+    segments = None if args.segments == 'all' else args.segments.split(',')
+    rows = load_tse_universe(segments)
+    print(f"[JPUniverse] {args.segments}: {len(rows)}종목")
+
+
+if __name__ == "__main__":
+    main()
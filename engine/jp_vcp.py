@@ -10,8 +10,9 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from engine.models import StockData, ChartData
+from engine.persist import save_daily_and_latest
 
 class JPVCPScreener:
     """니케이 225/400 상위 시그널 대상 VCP 분석가"""
@@ -21,8 +22,8 @@ class JPVCPScreener:
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir, exist_ok=True)
             
-    async def run_vcp_scan(self) -> Dict:
-        """VCP 스캔 실행"""
+    async def run_vcp_scan(self, cancel_check: Optional[Callable[[], None]] = None) -> Dict:
+        """VCP 스캔 실행 (cancel_check: 취소 체크포인트 - 다운로드 전후 + 50종목마다, 취소 시 저장 없이 예외 전파)"""
         try:
             # 1. 대상 종목 로드
             targets = self._load_target_stocks()
@@ -33,10 +34,14 @@ class JPVCPScreener:
             
             # 2. 일괄 데이터 다운로드 (Rate Limit 방지 및 속도 향상)
             tickers = [f"{t['code']}.T" for t in targets]
+            if cancel_check:
+                cancel_check()
             df_all = yf.download(tickers, period="3mo", progress=False, group_by='ticker')
             
             results = []
-            for stock in targets:
+            for i, stock in enumerate(targets):
+                if cancel_check and i % 50 == 0:
+                    cancel_check()
                 code = stock['code']
                 ticker_key = f"{code}.T"
                 
@@ -91,17 +96,23 @@ class JPVCPScreener:
             
             # 결과 저장
             save_path = os.path.join(self.data_dir, 'vcp_latest.json')
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(final_data, f, ensure_ascii=False, indent=2)
-                
             daily_path = os.path.join(self.data_dir, f"vcp_{date.today().strftime('%Y%m%d')}.json")
-            with open(daily_path, 'w', encoding='utf-8') as f:
-                json.dump(final_data, f, ensure_ascii=False, indent=2)
+            save_daily_and_latest(daily_path, save_path, final_data)
+            
+            # DB 기록 (실패해도 JSON 결과는 유지)
+            try:
+                from app.store import record_run
+                record_run('JP', 'vcp', date.today(), final_data)
+            except Exception as e:
+                print(f"[JP VCP] DB 기록 생략: {e}")
                 
             print(f"[JP VCP] Scan Completed. Found {len(results)} signals.")
             return final_data
             
         except Exception as e:
+            # 취소로 중단된 경우는 오류 결과로 바꾸지 않고 그대로 전파
+            if cancel_check:
+                cancel_check()
             import traceback
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
@@ -0,0 +1,118 @@
+"""
+KR 종목코드 → Yahoo 심볼(.KS/.KQ) 리졸버
+- KRX 유니버스(engine.kr_universe) 로 초기화
+- 조회에 성공한 심볼로 학습, data/kr_symbol_suffix.json 에 저장 (재시작 후에도 유지)
+- 거래소가 확인된 종목은 첫 시도에 올바른 심볼로 조회
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+from engine.persist import write_json
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'data', 'kr_symbol_suffix.json')
+
+KR_SUFFIXES = ('.KS', '.KQ')
+MARKET_SUFFIX = {'KOSPI': '.KS', 'KS': '.KS', 'KOSDAQ': '.KQ', 'KQ': '.KQ'}
+SUFFIX_MARKET = {'.KS': 'KOSPI', '.KQ': 'KOSDAQ'}
+
+
+def split_symbol(symbol: str):
+    """'005930.KS' -> ('005930', '.KS') / '005930' -> ('005930', None)"""
+    for suffix in KR_SUFFIXES:
+        if symbol.endswith(suffix):
+            return symbol[:-len(suffix)], suffix
+    return symbol, None
+
+
+class KRSymbolResolver:
+    """종목코드별 거래소 접미사 캐시 (디스크 영속)"""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._suffix: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                from engine.kr_universe import load_krx_universe
+                universe = load_krx_universe()
+                self._suffix.update(zip(universe.index, universe['market'].map(MARKET_SUFFIX).fillna('.KS')))
+            except Exception as e:
+                print(f"[KRSymbol] 종목 리스트 로드 실패: {e}")
+
+            # 학습된 매핑이 우선
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        learned = json.load(f)
+                    self._suffix.update({k: v for k, v in learned.items() if v in KR_SUFFIXES})
+                except Exception as e:
+                    print(f"[KRSymbol] 캐시 로드 실패: {e}")
+            self._loaded = True
+
+    def known(self, code: str) -> Optional[str]:
+        """확인된 접미사 (없으면 None)"""
+        self._ensure_loaded()
+        return self._suffix.get(split_symbol(code)[0])
+
+    def resolve(self, code: str, market: str = None) -> str:
+        """최선의 Yahoo 심볼 (명시된 접미사 > 학습/종목리스트 > 시장 힌트 > .KS)"""
+        code, suffix = split_symbol(code)
+        if suffix:
+            return f"{code}{suffix}"
+        suffix = self.known(code) or MARKET_SUFFIX.get((market or '').upper(), '.KS')
+        return f"{code}{suffix}"
+
+    def candidates(self, code: str, market: str = None) -> List[str]:
+        """조회 시도 순서. 거래소가 확인된 종목은 1개, 아니면 반대 거래소까지 2개"""
+        base, suffix = split_symbol(code)
+        if suffix or self.known(base):
+            return [self.resolve(code, market)]
+        first = self.resolve(base, market)
+        other = '.KQ' if first.endswith('.KS') else '.KS'
+        return [first, f"{base}{other}"]
+
+    def market_of(self, code: str) -> str:
+        """KOSPI / KOSDAQ (미확인 시 빈 문자열)"""
+        suffix = self.known(code)
+        return SUFFIX_MARKET.get(suffix, '') if suffix else ''
+
+    def learn(self, symbol: str):
+        """조회 성공한 심볼 기록 (변경 시에만 저장)"""
+        code, suffix = split_symbol(symbol)
+        if not suffix:
+            return
+        self._ensure_loaded()
+        with self._lock:
+            if self._suffix.get(code) == suffix:
+                return
+            self._suffix[code] = suffix
+            snapshot = dict(self._suffix)
+        try:
+            write_json(self.path, snapshot)
+        except Exception as e:
+            print(f"[KRSymbol] 캐시 저장 실패: {e}")
+
+
+_resolver: Optional[KRSymbolResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_kr_resolver() -> KRSymbolResolver:
+    """프로세스 공유 리졸버"""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = KRSymbolResolver()
+    return _resolver
@@ -0,0 +1,206 @@
+"""
+KRX 종목 유니버스 + 전종목 시세 스냅샷
+- data/krx_universe.csv (code,name,market) - KOSPI/KOSDAQ 전 상장종목
+  → `python -m engine.kr_universe --refresh` 로 pykrx 상장종목 목록에서 갱신
+  → KRX 정보데이터시스템 CSV(단축코드/한글 종목약명/시장구분), FinanceDataReader(Code/Name/Market) 형식도 그대로 읽음
+- 파일은 저장소에 포함되지 않음 - 없으면 engine.stock_list_data.KR_TOP_STOCKS (경고 로그)
+- 스냅샷: pykrx 전종목 일봉 1회 조회 (실패 시 yfinance 일괄 다운로드 1회), 날짜별 단기 캐시
+"""
+
+import argparse
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UNIVERSE_PATH = os.path.join(BASE_DIR, 'data', 'krx_universe.csv')
+
+MARKETS = ('KOSPI', 'KOSDAQ')
+MARKET_SUFFIX = {'KOSPI': '.KS', 'KOSDAQ': '.KQ'}
+
+_COLUMN_MAP = {
+    'code': 'code', 'Code': 'code', 'Symbol': 'code', '단축코드': 'code', '종목코드': 'code', '티커': 'code',
+    'name': 'name', 'Name': 'name', '한글 종목약명': 'name', '종목명': 'name',
+    'market': 'market', 'Market': 'market', '시장구분': 'market',
+}
+
+# pykrx 전종목 시세 컬럼
+SNAPSHOT_COLUMNS = {
+    '시가': 'Open', '고가': 'High', '저가': 'Low', '종가': 'Close', '거래량': 'Volume',
+    '거래대금': 'TradingValue', '등락률': 'ChangePct',
+}
+SNAPSHOT_TTL = 60   # 같은 날짜 스냅샷 재사용 (초) - KOSPI/KOSDAQ 연속 조회가 1회 조회를 공유
+
+_cache: Dict[Tuple, pd.DataFrame] = {}
+_cache_lock = threading.Lock()
+_snapshot_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+_snapshot_lock = threading.Lock()
+
+
+def normalize_universe(df: pd.DataFrame) -> pd.DataFrame:
+    """원본 표 → code / name / market (KOSPI·KOSDAQ 만, KONEX 제외)"""
+    df = df.rename(columns={c: _COLUMN_MAP.get(str(c).strip(), str(c).strip()) for c in df.columns})
+    if 'code' not in df.columns or 'name' not in df.columns:
+        raise ValueError(f"종목코드/종목명 컬럼 없음: {list(df.columns)}")
+    if 'market' not in df.columns:
+        df['market'] = ''
+
+    out = df[['code', 'name', 'market']].copy()
+    code = out['code'].astype(str).str.strip().str.replace(r'\.(KS|KQ)$', '', regex=True)
+    out['code'] = code.str.zfill(6).str.upper()
+    out['name'] = out['name'].astype(str).str.strip()
+    # 'KOSDAQ GLOBAL' → 'KOSDAQ'
+    out['market'] = out['market'].fillna('').astype(str).str.upper().str.split().str[0].fillna('')
+    out = out[out['market'].isin(MARKETS) & out['code'].str.fullmatch(r'[0-9][0-9A-Z]{5}')]
+    return out.drop_duplicates('code').reset_index(drop=True)
+
+
+def _fallback_universe() -> pd.DataFrame:
+    from engine.stock_list_data import KR_TOP_STOCKS
+    return normalize_universe(pd.DataFrame(KR_TOP_STOCKS, columns=['code', 'name', 'market']))
+
+
+def load_krx_universe(markets: Optional[Iterable[str]] = None, path: str = None) -> pd.DataFrame:
+    """KRX 유니버스 (index: 종목코드, columns: name/market). 파일 mtime 기준 캐시"""
+    path = path or UNIVERSE_PATH
+    markets = tuple(sorted(m.upper() for m in markets)) if markets else None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    key = (path, mtime)
+    with _cache_lock:
+        df = _cache.get(key)
+    if df is None:
+        try:
+            if mtime:
+                df = normalize_universe(pd.read_csv(path, dtype=str, encoding='utf-8-sig'))
+            else:
+                df = _fallback_universe()
+                print(f"[KRUniverse] 유니버스 파일 없음 ({path}) - 기본 종목 리스트 {len(df)}종목으로 대체. "
+                      f"`python -m engine.kr_universe --refresh` 로 생성")
+        except Exception as e:
+            print(f"[KRUniverse] 유니버스 파일 로드 실패 ({path}): {e} - 기본 종목 리스트 사용")
+            df = _fallback_universe()
+        df = df.set_index('code')
+        with _cache_lock:
+            _cache.clear()
+            _cache[key] = df
+
+    if markets:
+        df = df[df['market'].isin(markets)]
+    return df
+
+
+def _pykrx_snapshot(date: str) -> pd.DataFrame:
+    from pykrx import stock
+
+    date = stock.get_nearest_business_day_in_a_week(date)
+    df = stock.get_market_ohlcv(date, market="ALL")
+    df = df.rename(columns=SNAPSHOT_COLUMNS)
+    df = df[[c for c in SNAPSHOT_COLUMNS.values() if c in df.columns]].astype(float)
+    df.index = df.index.astype(str)
+    if 'TradingValue' not in df.columns:
+        df['TradingValue'] = df['Close'] * df['Volume']
+    df.attrs['date'] = date
+    return df
+
+
+def _yf_snapshot(universe: pd.DataFrame) -> pd.DataFrame:
+    """pykrx 실패 시: 유니버스 전체 5일봉 일괄 다운로드 1회 → 당일 행만"""
+    import yfinance as yf
+    from engine.ohlcv_store import split_download
+
+    symbols = {f"{code}{MARKET_SUFFIX[m]}": code for code, m in zip(universe.index, universe['market'])}
+    raw = yf.download(list(symbols), period="5d", progress=False, threads=True, group_by='ticker', timeout=30)
+    frames = split_download(raw, list(symbols))
+    if not frames:
+        return pd.DataFrame(columns=list(SNAPSHOT_COLUMNS.values()))
+
+    closes = pd.DataFrame({symbols[s]: f['Close'] for s, f in frames.items()}).ffill()
+    last = {col: pd.Series({symbols[s]: f[col].iloc[-1] for s, f in frames.items() if len(f)})
+            for col in ('Open', 'High', 'Low', 'Volume')}
+    df = pd.DataFrame({
+        'Open': last['Open'], 'High': last['High'], 'Low': last['Low'],
+        'Close': closes.iloc[-1], 'Volume': last['Volume'].fillna(0),
+    })
+    prev = closes.iloc[-2] if len(closes) >= 2 else pd.Series(dtype=float)
+    df['TradingValue'] = df['Close'] * df['Volume']
+    df['ChangePct'] = (df['Close'] / prev.reindex(df.index) - 1) * 100
+    df.attrs['date'] = closes.index[-1].strftime("%Y%m%d")
+    return df
+
+
+def fetch_krx_snapshot(date: str = None, universe: pd.DataFrame = None) -> pd.DataFrame:
+    """전종목 당일 시세 (index: 종목코드, columns: Open/High/Low/Close/Volume/TradingValue/ChangePct)
+    - 거래정지(종가 0) 제외, date 생략 시 오늘 기준 가장 가까운 영업일
+    """
+    date = date or datetime.now().strftime("%Y%m%d")
+    with _snapshot_lock:
+        cached = _snapshot_cache.get(date)
+        if cached and time.time() - cached[0] < SNAPSHOT_TTL:
+            return cached[1]
+
+        try:
+            df = _pykrx_snapshot(date)
+        except Exception as e:
+            print(f"[KRUniverse] pykrx 전종목 시세 조회 실패 ({date}): {e} - yfinance 일괄 조회")
+            df = pd.DataFrame()
+        if df.empty:
+            try:
+                df = _yf_snapshot(universe if universe is not None else load_krx_universe())
+            except Exception as e:
+                print(f"[KRUniverse] yfinance 일괄 조회 실패: {e}")
+                return pd.DataFrame(columns=list(SNAPSHOT_COLUMNS.values()))
+
+        df = df[df['Close'] > 0]
+        _snapshot_cache.clear()
+        _snapshot_cache[date] = (time.time(), df)
+        return df
+
+
+def refresh_universe(source: str = None, path: str = None, date: str = None) -> int:
+    """상장종목 목록(로컬 csv 또는 pykrx) → data/krx_universe.csv (원자적 저장). 종목 수 반환"""
+    from engine.persist import atomic_write_bytes
+
+    path = path or UNIVERSE_PATH
+    if source:
+        raw = pd.read_csv(source, dtype=str, encoding='utf-8-sig')
+    else:
+        from pykrx import stock
+        date = stock.get_nearest_business_day_in_a_week(date or datetime.now().strftime("%Y%m%d"))
+        rows = []
+        for market in MARKETS:
+            for code in stock.get_market_ticker_list(date, market=market):
+                rows.append((code, stock.get_market_ticker_name(code), market))
+        raw = pd.DataFrame(rows, columns=['code', 'name', 'market'])
+
+    df = normalize_universe(raw)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    atomic_write_bytes(path, df.to_csv(index=False).encode('utf-8-sig'))
+    return len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KRX universe file')
+    parser.add_argument('--refresh', action='store_true', help='상장종목 목록으로 갱신 (기본: pykrx)')
+    parser.add_argument('--source', default=None, help='KRX 정보데이터시스템/FinanceDataReader CSV 경로')
+    parser.add_argument('--date', default=None, help='기준일 YYYYMMDD (pykrx)')
+    args = parser.parse_args()
+
+    if args.refresh:
+        count = refresh_universe(args.source, date=args.date)
+        print(f"[KRUniverse] {count}종목 저장: {UNIVERSE_PATH}")
+
+    df = load_krx_universe()
+    counts = df['market'].value_counts().to_dict()
+    print(f"[KRUniverse] {len(df)}종목 " + ", ".join(f"{m} {counts.get(m, 0)}" for m in MARKETS))
+
+
+if __name__ == "__main__":
+    main()
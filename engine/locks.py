@@ -0,0 +1,132 @@
+"""
+프로세스 간 single-flight 잠금 (파일 락)
+- data/locks/<name>.lock 에 OS 배타 락 (POSIX: fcntl.flock / Windows: msvcrt.locking)
+- gunicorn 워커, 스케줄러, 수동 실행 스크립트가 같은 이름으로 잠그면 한 번에 1개만 실행
+- single_flight: 먼저 잡은 쪽이 갱신하고, 기다린 쪽은 그 사이 갱신된 결과를 재사용
+"""
+
+import json
+import os
+import time
+from typing import Any, Callable, Optional
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCK_DIR = os.path.join(BASE_DIR, 'data', 'locks')
+POLL_SECONDS = 0.1
+MTIME_SLACK = 1.0      # 파일시스템 타임스탬프 해상도 여유
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class LockTimeout(TimeoutError):
+    """대기 시간 내에 락을 얻지 못함"""
+
+
+class FileLock:
+    """이름 기반 배타 락 (프로세스/스레드 공통 - 획득마다 파일을 새로 연다)
+
+    timeout: None=무한 대기, 0=즉시 실패, 그 외 초 단위 대기
+    """
+
+    def __init__(self, name: str, timeout: Optional[float] = None, lock_dir: str = LOCK_DIR):
+        self.name = name
+        self.timeout = timeout
+        self.path = os.path.join(lock_dir, f"{name}.lock")
+        self._fd: Optional[int] = None
+
+    def acquire(self, timeout: Optional[float] = -1) -> bool:
+        if timeout == -1:
+            timeout = self.timeout
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not _try_lock(fd):
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                return False
+            time.sleep(POLL_SECONDS)
+        try:
+            # 디버깅용: 현재 소유 프로세스 기록
+            os.ftruncate(fd, 0)
+            os.write(fd, f"{os.getpid()}\n".encode())
+        except OSError:
+            pass
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            _unlock(fd)
+        finally:
+            os.close(fd)
+
+    @property
+    def locked(self) -> bool:
+        return self._fd is not None
+
+    def __enter__(self) -> 'FileLock':
+        if not self.acquire():
+            raise LockTimeout(f"lock '{self.name}' busy")
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def single_flight(
+    name: str,
+    compute: Callable[[], Any],
+    load_recent: Callable[[float], Optional[Any]],
+    timeout: Optional[float] = 120,
+) -> Any:
+    """동시 갱신 요청을 1회로 합침
+
+    compute: 실제 갱신 (락 보유 중 실행)
+    load_recent(since): since(time.time()) 이후 저장된 결과가 있으면 반환, 없으면 None
+    - 락을 기다리는 동안 다른 프로세스가 갱신을 끝냈으면 compute 없이 그 결과 반환
+    """
+    requested_at = time.time()
+    with FileLock(name, timeout=timeout):
+        recent = load_recent(requested_at)
+        if recent is not None:
+            return recent
+        return compute()
+
+
+def load_json_if_newer(path: str, since: float) -> Optional[Any]:
+    """파일이 since 이후 갱신됐으면 JSON 로드 (single_flight의 load_recent 용)"""
+    try:
+        if os.path.getmtime(path) < since - MTIME_SLACK:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,228 @@
+"""
+시장 캘린더 (KR / JP / US)
+- 시장 현지 시간대 기준 정규장 시간 / 주말 / 휴장일 판정
+- 휴장일: exchange_calendars 설치 시 거래소 캘린더(XKRX/XTKS/XNYS), 없으면 내장 규칙
+  + data/market_holidays.json ({"KR": ["2026-06-03", ...]}) 로 임시 휴장일 보완
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Dict, Optional, Set, Tuple
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOLIDAYS_FILE = os.path.join(BASE_DIR, 'data', 'market_holidays.json')
+
+
+@dataclass(frozen=True)
+class Session:
+    """정규장 구성"""
+    tz: str
+    utc_offset: int       # tzdata 가 없을 때(Windows) 대체 오프셋 (시간)
+    open: time
+    close: time
+    exchange: str         # exchange_calendars 코드
+
+
+SESSIONS: Dict[str, Session] = {
+    'KR': Session('Asia/Seoul', 9, time(9, 0), time(15, 30), 'XKRX'),
+    'JP': Session('Asia/Tokyo', 9, time(9, 0), time(15, 30), 'XTKS'),
+    'US': Session('America/New_York', -5, time(9, 30), time(16, 0), 'XNYS'),
+}
+
+# 음력 공휴일 · 임시공휴일 · 선거일 등 규칙으로 계산할 수 없는 KRX 휴장일
+KR_LUNAR_HOLIDAYS = {
+    2025: ['01-27', '01-28', '01-29', '01-30', '05-06', '06-03', '10-06', '10-07', '10-08'],
+    2026: ['02-16', '02-17', '02-18', '05-25', '06-03', '09-24', '09-25', '09-28'],
+}
+
+
+def _load_timezone(session: Session) -> tzinfo:
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(session.tz)
+    except Exception:
+        return timezone(timedelta(hours=session.utc_offset), session.tz)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """month 의 n번째 weekday (n=-1: 마지막)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = (date(year, month % 12 + 1, 1) if month < 12 else date(year + 1, 1, 1)) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """부활절 (그레고리력, Anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _kr_holidays(year: int) -> Set[date]:
+    fixed = [(1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25), (12, 31)]
+    days = {date(year, m, d) for m, d in fixed}
+    # 대체공휴일 (어린이날/광복절/개천절/한글날/성탄절이 주말이면 다음 평일)
+    for m, d in [(3, 1), (5, 5), (8, 15), (10, 3), (10, 9), (12, 25)]:
+        day = date(year, m, d)
+        if day.weekday() >= 5:
+            sub = day + timedelta(days=7 - day.weekday())
+            while sub in days:
+                sub += timedelta(days=1)
+            days.add(sub)
+    days.update(date.fromisoformat(f"{year}-{md}") for md in KR_LUNAR_HOLIDAYS.get(year, []))
+    return days
+
+
+def _jp_holidays(year: int) -> Set[date]:
+    fixed = [(1, 1), (1, 2), (1, 3), (2, 11), (2, 23), (4, 29), (5, 3), (5, 4), (5, 5),
+             (8, 11), (11, 3), (11, 23), (12, 31)]
+    days = {date(year, m, d) for m, d in fixed}
+    days.update({
+        _nth_weekday(year, 1, 0, 2),    # 성인의 날
+        _nth_weekday(year, 7, 0, 3),    # 바다의 날
+        _nth_weekday(year, 9, 0, 3),    # 경로의 날
+        _nth_weekday(year, 10, 0, 2),   # 스포츠의 날
+        date(year, 3, int(20.8431 + 0.242194 * (year - 1980) - (year - 1980) // 4)),   # 춘분
+        date(year, 9, int(23.2488 + 0.242194 * (year - 1980) - (year - 1980) // 4)),   # 추분
+    })
+    # 振替休日: 공휴일이 일요일이면 다음 비공휴 평일
+    for day in sorted(days):
+        if day.weekday() == 6:
+            sub = day + timedelta(days=1)
+            while sub in days:
+                sub += timedelta(days=1)
+            days.add(sub)
+    # 国民の休日: 두 공휴일 사이에 낀 평일
+    for day in sorted(days):
+        mid = day + timedelta(days=1)
+        if mid not in days and mid + timedelta(days=1) in days and mid.weekday() < 5:
+            days.add(mid)
+    return days
+
+
+def _us_holidays(year: int) -> Set[date]:
+    def observed(day: date) -> date:
+        if day.weekday() == 5:
+            return day - timedelta(days=1)
+        if day.weekday() == 6:
+            return day + timedelta(days=1)
+        return day
+
+    days = {
+        _nth_weekday(year, 1, 0, 3),              # MLK
+        _nth_weekday(year, 2, 0, 3),              # Presidents' Day
+        _easter(year) - timedelta(days=2),        # Good Friday
+        _nth_weekday(year, 5, 0, -1),             # Memorial Day
+        observed(date(year, 6, 19)),              # Juneteenth
+        observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),              # Labor Day
+        _nth_weekday(year, 11, 3, 4),             # Thanksgiving
+        observed(date(year, 12, 25)),
+    }
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:                   # NYSE: 토요일 신정은 대체 휴장 없음
+        days.add(observed(new_year))
+    return days
+
+
+_RULES = {'KR': _kr_holidays, 'JP': _jp_holidays, 'US': _us_holidays}
+
+
+def _load_extra_holidays() -> Dict[str, Set[date]]:
+    try:
+        with open(HOLIDAYS_FILE, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        return {m.upper(): {date.fromisoformat(d) for d in days} for m, days in raw.items()}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"[Calendar] 휴장일 파일 로드 실패: {e}")
+        return {}
+
+
+class MarketCalendar:
+    """시장별 거래일 / 정규장 판정 (모든 시각은 시장 현지 시간 기준)"""
+
+    def __init__(self, market: str):
+        self.market = market.upper()
+        self.session = SESSIONS[self.market]
+        self.tz = _load_timezone(self.session)
+        self._extra = _load_extra_holidays().get(self.market, set())
+        self._years: Dict[int, Set[date]] = {}
+        self._exchange = None
+        try:
+            import exchange_calendars as xcals
+            self._exchange = xcals.get_calendar(self.session.exchange)
+        except Exception:
+            pass
+
+    def now(self) -> datetime:
+        return datetime.now(self.tz)
+
+    def localize(self, at: Optional[datetime] = None) -> datetime:
+        """시장 현지 시각으로 변환 (naive 는 로컬 시간으로 간주)"""
+        if at is None:
+            return self.now()
+        return at.astimezone(self.tz)
+
+    def holidays(self, year: int) -> Set[date]:
+        if year not in self._years:
+            self._years[year] = _RULES[self.market](year)
+        return self._years[year]
+
+    def is_trading_day(self, day: date) -> bool:
+        if day.weekday() >= 5 or day in self._extra:
+            return False
+        if self._exchange is not None:
+            try:
+                return bool(self._exchange.is_session(day.isoformat()))
+            except Exception:
+                pass  # 캘린더 범위 밖 → 내장 규칙
+        return day not in self.holidays(day.year)
+
+    def is_open(self, at: Optional[datetime] = None) -> bool:
+        """정규장 진행 중 여부"""
+        local = self.localize(at)
+        return (self.is_trading_day(local.date())
+                and self.session.open <= local.time() < self.session.close)
+
+    def previous_trading_day(self, day: date) -> date:
+        day -= timedelta(days=1)
+        while not self.is_trading_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def last_close_date(self, at: Optional[datetime] = None) -> date:
+        """at 시점까지 마감된 가장 최근 거래일"""
+        local = self.localize(at)
+        day = local.date()
+        if self.is_trading_day(day) and local.time() >= self.session.close:
+            return day
+        return self.previous_trading_day(day)
+
+    def session_state(self, at: Optional[datetime] = None) -> Tuple[str, str]:
+        """('open', 거래일) 또는 ('closed', 마지막 마감 거래일)"""
+        local = self.localize(at)
+        if self.is_open(local):
+            return 'open', local.date().isoformat()
+        return 'closed', self.last_close_date(local).isoformat()
+
+
+_calendars: Dict[str, MarketCalendar] = {}
+
+
+def get_calendar(market: str) -> MarketCalendar:
+    market = market.upper()
+    if market not in _calendars:
+        _calendars[market] = MarketCalendar(market)
+    return _calendars[market]
@@ -0,0 +1,354 @@
+"""
+Market Gate 엔진 (KR / JP / US 공통)
+- 시장별 지수 + 섹터 ETF 심볼을 yf.download 1회로 일괄 조회
+- 전일 대비 등락률은 종가 매트릭스에서 한 번에 계산 (심볼별 history() 반복 호출 제거)
+- 여러 시장을 함께 갱신할 때도 다운로드 1회 (yfinance 내부 스레드로 동시 조회)
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from engine.ohlcv_store import split_download
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LATEST_GATE_FILES = {
+    'KR': os.path.join(BASE_DIR, 'data', 'market_gate_latest.json'),
+    'JP': os.path.join(BASE_DIR, 'data', 'jp', 'market_gate_latest.json'),
+    'US': os.path.join(BASE_DIR, 'data', 'us', 'market_gate_latest.json'),
+}
+# 이보다 오래된 게이트 상태는 무시 (주말/연휴 포함 여유)
+GATE_MAX_AGE_SECONDS = 4 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class GateSpec:
+    """시장별 Market Gate 구성"""
+    market: str
+    indices: Tuple[Tuple[str, str], ...]          # (심볼, 키)
+    sectors: Tuple[Tuple[str, str], ...]          # (심볼, 표시명)
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(dict.fromkeys([s for s, _ in self.indices] + [s for s, _ in self.sectors]))
+
+
+KR_GATE = GateSpec(
+    market='KR',
+    indices=(("^KS11", "kospi"), ("^KQ11", "kosdaq")),
+    sectors=(
+        ("091160.KS", "반도체"),      # KODEX 반도체
+        ("305720.KS", "2차전지"),     # KODEX 2차전지산업
+        ("091170.KS", "자동차"),      # KODEX 자동차
+        ("091180.KS", "헬스케어"),    # TIGER 200 헬스케어
+        ("139260.KS", "IT"),          # TIGER 200 IT
+        ("091190.KS", "철강/조선"),   # TIGER 200 중공업
+    ),
+)
+
+JP_GATE = GateSpec(
+    market='JP',
+    # ^N225 for Nikkei, 1306.T ETF for TOPIX (^TPX는 yfinance에서 작동 안함)
+    indices=(("^N225", "nikkei"), ("1306.T", "topix")),
+    sectors=(
+        # 주요 지수 ETF
+        ("1321.T", "닛케이225"),      # NEXT FUNDS 日経225連動型ETF
+        ("1306.T", "TOPIX"),          # TOPIX連動型ETF
+        # 섹터별 ETF
+        ("1617.T", "식품"),           # NOMURA 食品
+        ("1618.T", "에너지"),         # NOMURA エネルギー資源
+        ("1619.T", "건설"),           # NOMURA 建設・資材
+        ("1620.T", "소재"),           # NOMURA 素材・化学
+        ("1621.T", "의료"),           # NOMURA 医薬品
+        ("1625.T", "은행"),           # NOMURA 銀行
+        ("1628.T", "운송"),           # NOMURA 運輸・物流
+        ("1633.T", "전자"),           # NOMURA 電機・精密
+    ),
+)
+
+US_GATE = GateSpec(
+    market='US',
+    # ^IXIC: NASDAQ Composite, ^GSPC: S&P 500, ^DJI: Dow Jones
+    indices=(("^IXIC", "nasdaq"), ("^GSPC", "sp500"), ("^DJI", "dow")),
+    sectors=(
+        ("XLK", "IT/기술주"),
+        ("XLV", "헬스케어"),
+        ("XLF", "금융"),
+        ("XLY", "임의소비재"),
+        ("XLP", "필수소비재"),
+        ("XLE", "에너지"),
+        ("XLI", "산업재"),
+        ("XLB", "소재"),
+        ("XLRE", "부동산"),
+        ("XLC", "통신서비스"),
+        ("XLU", "유틸리티"),
+    ),
+)
+
+GATE_SPECS: Dict[str, GateSpec] = {spec.market: spec for spec in (KR_GATE, JP_GATE, US_GATE)}
+
+
+# === 데이터 ===
+def download_closes(symbols: List[str], period: str = "5d") -> pd.DataFrame:
+    """심볼 전체 종가 매트릭스 (dates × symbols) - yf.download 1회"""
+    import yfinance as yf
+
+    df = yf.download(symbols, period=period, interval="1d", group_by='ticker',
+                     threads=True, progress=False)
+    frames = split_download(df, symbols)
+    closes = {s: f['Close'] for s, f in frames.items() if 'Close' in f.columns}
+    return pd.DataFrame(closes).reindex(columns=symbols)
+
+
+def last_changes(closes: pd.DataFrame) -> pd.DataFrame:
+    """심볼별 마지막 종가 / 직전 종가 / 등락률(%) - 열마다 유효값 기준 (휴장일 NaN 무시)
+
+    Returns: index=symbol, columns=['close', 'prev', 'change_pct', 'valid']
+    """
+    values = closes.to_numpy(dtype=float)
+    n_rows, n_cols = values.shape
+    cols = np.arange(n_cols)
+    if n_rows == 0:
+        empty = np.full(n_cols, np.nan)
+        return pd.DataFrame({'close': empty, 'prev': empty, 'change_pct': empty,
+                             'valid': np.zeros(n_cols, dtype=bool)}, index=closes.columns)
+
+    valid = ~np.isnan(values)
+    last = n_rows - 1 - np.argmax(valid[::-1], axis=0)
+    has_last = valid.any(axis=0)
+
+    # 마지막 유효값을 지우고 다시 찾으면 직전 유효값
+    valid_prev = valid.copy()
+    valid_prev[last, cols] = False
+    prev = n_rows - 1 - np.argmax(valid_prev[::-1], axis=0)
+    has_prev = has_last & valid_prev.any(axis=0)
+
+    close = np.where(has_last, values[last, cols], np.nan)
+    prev_close = np.where(has_prev, values[prev, cols], np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        change = np.where(has_prev & (prev_close > 0), (close - prev_close) / prev_close * 100, 0.0)
+
+    return pd.DataFrame({'close': close, 'prev': prev_close, 'change_pct': change, 'valid': has_prev},
+                        index=closes.columns)
+
+
+def _index_values(spec: GateSpec, changes: pd.DataFrame) -> Dict[str, Tuple[float, float]]:
+    """지수 키 -> (종가, 등락률). 데이터 없으면 (0, 0)"""
+    out = {}
+    for symbol, key in spec.indices:
+        close = changes.at[symbol, 'close'] if symbol in changes.index else np.nan
+        change = changes.at[symbol, 'change_pct'] if symbol in changes.index else 0.0
+        out[key] = (0.0 if np.isnan(close) else float(close), float(change))
+    return out
+
+
+def _sector_rows(spec: GateSpec, changes: pd.DataFrame) -> List[Tuple[str, float]]:
+    """(표시명, 등락률) - 2일 이상 데이터가 있는 섹터만"""
+    picked = changes.reindex([s for s, _ in spec.sectors])
+    return [
+        (name, float(change))
+        for (_, name), change, ok in zip(spec.sectors, picked['change_pct'], picked['valid'].fillna(False))
+        if ok
+    ]
+
+
+# === 시장별 판정 (기존 라우트/market_gate.py 로직 그대로) ===
+def evaluate_kr(changes: pd.DataFrame) -> Dict:
+    idx = _index_values(KR_GATE, changes)
+    kospi_close, kospi_change_pct = idx['kospi']
+    kosdaq_close, kosdaq_change_pct = idx['kosdaq']
+
+    sectors = []
+    for name, change in _sector_rows(KR_GATE, changes):
+        signal = "neutral"
+        if change >= 1.0:
+            signal = "bullish"
+        elif change <= -1.0:
+            signal = "bearish"
+        sectors.append({
+            'name': name,
+            'signal': signal,
+            'change_pct': round(change, 2),
+            'score': max(0, min(100, 50 + int(change * 10))),
+        })
+
+    avg_change = (kospi_change_pct + kosdaq_change_pct) / 2
+    score = max(0, min(100, 50 + int(avg_change * 10)))
+    if score >= 70:
+        status, label = "GREEN", "BULLISH"
+    elif score >= 40:
+        status, label = "YELLOW", "NEUTRAL"
+    else:
+        status, label = "RED", "BEARISH"
+
+    reasons = []
+    if kospi_change_pct >= 1.0:
+        reasons.append("KOSPI 강세")
+    elif kospi_change_pct <= -1.0:
+        reasons.append("KOSPI 약세")
+    if kosdaq_change_pct >= 1.0:
+        reasons.append("KOSDAQ 강세")
+    elif kosdaq_change_pct <= -1.0:
+        reasons.append("KOSDAQ 약세")
+
+    return {
+        'status': status,
+        'score': score,
+        'label': label,
+        'reasons': reasons,
+        'sectors': sectors,
+        'metrics': {
+            'kospi_change': round(kospi_change_pct, 2),
+            'kosdaq_change': round(kosdaq_change_pct, 2),
+        },
+        'kospi_close': round(kospi_close, 2),
+        'kospi_change_pct': round(kospi_change_pct, 2),
+        'kosdaq_close': round(kosdaq_close, 2),
+        'kosdaq_change_pct': round(kosdaq_change_pct, 2),
+    }
+
+
+def evaluate_jp(changes: pd.DataFrame) -> Dict:
+    idx = _index_values(JP_GATE, changes)
+    nikkei_close, nikkei_change_pct = idx['nikkei']
+    topix_etf_close, topix_change_pct = idx['topix']
+    # TOPIX ETF 가격을 대략적인 TOPIX 지수로 환산 (변동률은 동일)
+    topix_close = topix_etf_close * 0.7
+
+    avg_change = (nikkei_change_pct + topix_change_pct) / 2
+    if avg_change >= 1.5:
+        status, score, label = 'GREEN', min(100, int(50 + avg_change * 10)), 'BULLISH'
+    elif avg_change <= -1.5:
+        status, score, label = 'RED', max(0, int(50 + avg_change * 10)), 'BEARISH'
+    else:
+        status, score, label = 'YELLOW', int(50 + avg_change * 5), 'NEUTRAL'
+
+    sectors = [
+        {
+            'name': name,
+            'signal': 'bullish' if change > 0 else 'bearish',
+            'change_pct': round(change, 2),
+            'score': int(50 + change * 5),
+        }
+        for name, change in _sector_rows(JP_GATE, changes)
+    ]
+
+    return {
+        'status': status,
+        'score': score,
+        'label': label,
+        'reasons': [
+            f"日経225 +{nikkei_change_pct:.2f}%" if nikkei_change_pct > 0 else f"日経225 {nikkei_change_pct:.2f}%",
+            f"TOPIX +{topix_change_pct:.2f}%" if topix_change_pct > 0 else f"TOPIX {topix_change_pct:.2f}%",
+        ],
+        'sectors': sectors,
+        'metrics': {},
+        'nikkei_close': round(nikkei_close, 2),
+        'nikkei_change_pct': round(nikkei_change_pct, 2),
+        'topix_close': round(topix_close, 2),
+        'topix_change_pct': round(topix_change_pct, 2),
+    }
+
+
+def evaluate_us(changes: pd.DataFrame) -> Dict:
+    idx = {k: (round(c, 2), round(p, 2)) for k, (c, p) in _index_values(US_GATE, changes).items()}
+    nasdaq_close, nasdaq_change = idx['nasdaq']
+    sp500_close, sp500_change = idx['sp500']
+    dow_close, dow_change = idx['dow']
+
+    avg_change = (nasdaq_change + sp500_change) / 2
+    if avg_change >= 1.0:
+        status, score, label = 'GREEN', min(100, int(60 + avg_change * 10)), 'BULLISH'
+    elif avg_change <= -1.0:
+        status, score, label = 'RED', max(0, int(40 + avg_change * 10)), 'BEARISH'
+    else:
+        status, score, label = 'YELLOW', int(50 + avg_change * 5), 'NEUTRAL'
+
+    sectors = [
+        {
+            'name': name,
+            'signal': 'bullish' if change > 0 else 'bearish',
+            'change_pct': round(change, 2),
+            'score': int(50 + round(change, 2) * 5),
+        }
+        for name, change in _sector_rows(US_GATE, changes)
+    ]
+
+    return {
+        'status': status,
+        'score': score,
+        'label': label,
+        'reasons': [
+            f"NASDAQ {nasdaq_change:+.2f}%",
+            f"S&P 500 {sp500_change:+.2f}%",
+            f"DOW {dow_change:+.2f}%",
+        ],
+        'sectors': sectors,
+        'nasdaq_close': nasdaq_close,
+        'nasdaq_change_pct': nasdaq_change,
+        'sp500_close': sp500_close,
+        'sp500_change_pct': sp500_change,
+        'dow_close': dow_close,
+        'dow_change_pct': dow_change,
+    }
+
+
+EVALUATORS: Dict[str, Callable[[pd.DataFrame], Dict]] = {
+    'KR': evaluate_kr,
+    'JP': evaluate_jp,
+    'US': evaluate_us,
+}
+
+
+def compute_market_gates(markets: Iterable[str] = ('KR', 'JP', 'US')) -> Dict[str, Dict]:
+    """여러 시장 Market Gate 동시 계산 (심볼 전체를 다운로드 1회로)
+
+    Returns: {market: payload} - payload는 /market-gate API 응답 형식 (updated_at 포함)
+    """
+    markets = [m.upper() for m in markets]
+    symbols = list(dict.fromkeys(s for m in markets for s in GATE_SPECS[m].symbols))
+    changes = last_changes(download_closes(symbols))
+
+    updated_at = datetime.now().isoformat()
+    results = {}
+    for market in markets:
+        payload = EVALUATORS[market](changes)
+        payload['updated_at'] = updated_at
+        results[market] = payload
+    return results
+
+
+def compute_market_gate(market: str) -> Dict:
+    """단일 시장 Market Gate (다운로드 1회)"""
+    return compute_market_gates([market])[market.upper()]
+
+
+# === 스크리너용 게이트 조회 (네트워크 없음) ===
+def _saved_gate_status(market: str) -> Optional[str]:
+    path = LATEST_GATE_FILES.get(market)
+    try:
+        if time.time() - os.path.getmtime(path) > GATE_MAX_AGE_SECONDS:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('status')
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def current_gate(market: str) -> Optional[str]:
+    """저장된 최신 게이트 상태 GREEN / YELLOW / RED (없거나 오래됐으면 None)
+
+    게이트 색은 점수 기반 그대로 사용 (레짐 엔진의 is_gate_open 은 별도 신호라 섞지 않음)
+    """
+    return _saved_gate_status(market.upper())
+
+
+def is_gate_red(market: str) -> bool:
+    """RED 장세 여부 (스캔 축소 판단용)"""
+    return current_gate(market) == 'RED'
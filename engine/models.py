@@ -74,6 +74,7 @@ class ScoreDetail:
     consolidation: int = 0  # 기간조정 (0-1)
     supply: int = 0         # 수급 (0-2)
     llm_reason: str = ""    # LLM 분석 이유
+    raw: Dict = field(default_factory=dict)  # 가중치 적용 전 원점수 (기본 가중치면 비어 있음)
     
     @property
     def total(self) -> int:
@@ -83,6 +84,10 @@ class ScoreDetail:
         d = asdict(self)
         d['total'] = self.total
         return d
+    
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'ScoreDetail':
+        return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
 
 
 @dataclass
@@ -97,6 +102,10 @@ class ChecklistDetail:
     
     def to_dict(self) -> Dict:
         return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'ChecklistDetail':
+        return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
 
 
 @dataclass
@@ -162,6 +171,26 @@ class Signal:
             "status": self.status.value if hasattr(self.status, 'value') else str(self.status),
             "created_at": self.created_at.isoformat() if self.created_at else "",
         }
+    
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'Signal':
+        """to_dict() 결과 복원 (증분 스캔에서 직전 시그널 재사용)"""
+        from engine.config import Grade
+        
+        def _dt(value):
+            return datetime.fromisoformat(value) if value else None
+        
+        fields = {k: v for k, v in d.items() if k in cls.__dataclass_fields__}
+        fields.update(
+            signal_date=date.fromisoformat(d['signal_date']) if d.get('signal_date') else None,
+            signal_time=_dt(d.get('signal_time')),
+            grade=Grade(d['grade']),
+            score=ScoreDetail.from_dict(d.get('score') or {}),
+            checklist=ChecklistDetail.from_dict(d.get('checklist') or {}),
+            status=SignalStatus(d.get('status') or SignalStatus.PENDING.value),
+            created_at=_dt(d.get('created_at')) or datetime.now(),
+        )
+        return cls(**fields)
 
 
 @dataclass
@@ -174,6 +203,8 @@ class ScreenerResult:
     by_grade: Dict[str, int] = field(default_factory=dict)
     by_market: Dict[str, int] = field(default_factory=dict)
     processing_time_ms: float = 0
+    reduced_scan: bool = False          # Market Gate RED 축소 스캔
+    saved_path: Optional[str] = None    # 저장된 결과 파일 (축소 스캔이 전체 결과를 덮어쓰지 않으면 reduced_*.json)
     
     def to_dict(self) -> Dict:
         return {
@@ -184,6 +215,7 @@ class ScreenerResult:
             "by_grade": self.by_grade,
             "by_market": self.by_market,
             "processing_time_ms": self.processing_time_ms,
+            "reduced_scan": self.reduced_scan,
         }
 
 
@@ -0,0 +1,260 @@
+"""
+OHLCV 캐시 저장소
+- 종목(yfinance 심볼)별 일봉을 메모리 + data/ohlcv/*.pkl 에 보관
+- 부족한 구간/오래된 종목만 모아서 1회 일괄 다운로드 (threads=True)
+- 종가 매트릭스 (dates × symbols) 제공
+"""
+
+import os
+import pickle
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from engine.persist import atomic_write_bytes
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, 'data', 'ohlcv')
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def _to_timestamp(value) -> pd.Timestamp:
+    if isinstance(value, str):
+        value = value.replace('-', '')
+        return pd.Timestamp(datetime.strptime(value[:8], '%Y%m%d'))
+    return pd.Timestamp(value).normalize()
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """인덱스 tz 제거 + 컬럼 정리 + 전부 NaN인 행 제거"""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    df = df.copy()
+    idx = pd.to_datetime(df.index)
+    if getattr(idx, 'tz', None) is not None:
+        idx = idx.tz_localize(None)
+    df.index = idx.normalize()
+    cols = [c for c in OHLCV_COLUMNS if c in df.columns]
+    df = df[cols].dropna(how='all')
+    return df[~df.index.duplicated(keep='last')].sort_index()
+
+
+def split_download(df: pd.DataFrame, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """yf.download(group_by='ticker') 결과를 심볼별 프레임으로 분리"""
+    frames = {}
+    if df is None or df.empty:
+        return frames
+
+    if isinstance(df.columns, pd.MultiIndex):
+        level0 = set(df.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol in level0:
+                frames[symbol] = _normalize_frame(df[symbol])
+        # 단일 종목 + (Price, Ticker) 형태
+        if not frames and len(symbols) == 1:
+            level1 = set(df.columns.get_level_values(1))
+            if symbols[0] in level1:
+                frames[symbols[0]] = _normalize_frame(df.xs(symbols[0], axis=1, level=1))
+    elif len(symbols) == 1:
+        frames[symbols[0]] = _normalize_frame(df)
+
+    return frames
+
+
+class _Entry:
+    __slots__ = ('df', 'covered_from', 'fetched_at')
+
+    def __init__(self, df: pd.DataFrame, covered_from: pd.Timestamp, fetched_at: float):
+        self.df = df
+        self.covered_from = covered_from    # 이 날짜 이후 데이터는 모두 받아둔 상태
+        self.fetched_at = fetched_at        # 마지막 다운로드 시각 (epoch)
+
+
+class OHLCVStore:
+    """일봉 OHLCV 캐시 (프로세스 공유)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, refresh_seconds: int = 600):
+        self.cache_dir = cache_dir
+        self.refresh_seconds = refresh_seconds
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # 디스크 캐시
+    # ------------------------------------------------------------------
+    def _path(self, symbol: str) -> str:
+        safe = symbol.replace('/', '_').replace('^', '_idx_').replace('=', '_eq_')
+        return os.path.join(self.cache_dir, f'{safe}.pkl')
+
+    def _load_entry(self, symbol: str) -> Optional[_Entry]:
+        entry = self._entries.get(symbol)
+        if entry is not None:
+            return entry
+        path = self._path(symbol)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                raw = pickle.load(f)
+            entry = _Entry(raw['df'], raw['covered_from'], raw['fetched_at'])
+        except Exception as e:
+            print(f"[OHLCV] 캐시 로드 실패 {symbol}: {e}")
+            return None
+        self._entries[symbol] = entry
+        return entry
+
+    def _save_entry(self, symbol: str, entry: _Entry):
+        self._entries[symbol] = entry
+        try:
+            payload = pickle.dumps(
+                {'df': entry.df, 'covered_from': entry.covered_from, 'fetched_at': entry.fetched_at},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            atomic_write_bytes(self._path(symbol), payload)
+        except Exception as e:
+            print(f"[OHLCV] 캐시 저장 실패 {symbol}: {e}")
+
+    # ------------------------------------------------------------------
+    # 다운로드
+    # ------------------------------------------------------------------
+    def _download(self, symbols: List[str], start: pd.Timestamp, end: Optional[pd.Timestamp]) -> Dict[str, pd.DataFrame]:
+        import yfinance as yf
+
+        if not symbols:
+            return {}
+        kwargs = {
+            'start': start.strftime('%Y-%m-%d'),
+            'group_by': 'ticker',
+            'progress': False,
+            'threads': True,
+        }
+        if end is not None:
+            # yfinance end는 미포함
+            kwargs['end'] = (end + timedelta(days=1)).strftime('%Y-%m-%d')
+        df = yf.download(symbols, **kwargs)
+        return split_download(df, symbols)
+
+    def _is_fresh(self, entry: _Entry, end: Optional[pd.Timestamp], now: float) -> bool:
+        if end is not None and not entry.df.empty and entry.df.index[-1] >= end:
+            return True
+        return now - entry.fetched_at < self.refresh_seconds
+
+    def refresh(self, symbols: Iterable[str], start, end=None, force: bool = False) -> None:
+        """요청 구간이 캐시에 없거나 오래된 종목만 일괄 다운로드
+        다운로드는 락 밖에서 (그동안 get/다른 종목 조회는 대기하지 않음), 병합/저장만 락 안에서
+        """
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        start_ts = _to_timestamp(start)
+        end_ts = _to_timestamp(end) if end is not None else None
+        now = time.time()
+
+        with self._lock:
+            full, incremental = [], []
+            inc_start = None
+            for symbol in symbols:
+                entry = self._load_entry(symbol)
+                if entry is None or entry.covered_from > start_ts:
+                    full.append(symbol)
+                elif force or not self._is_fresh(entry, end_ts, now):
+                    incremental.append(symbol)
+                    last = entry.df.index[-1] if not entry.df.empty else start_ts
+                    # 직전 며칠은 다시 받아 수정주가/당일 봉 갱신
+                    cand = max(start_ts, last - timedelta(days=5))
+                    inc_start = cand if inc_start is None else min(inc_start, cand)
+
+        batches = []
+        if full:
+            batches.append((full, start_ts))
+        if incremental:
+            batches.append((incremental, inc_start))
+
+        for batch, batch_start in batches:
+            try:
+                frames = self._download(batch, batch_start, end_ts)
+            except Exception as e:
+                print(f"[OHLCV] 다운로드 실패 ({len(batch)}종목): {e}")
+                continue
+
+            fetched_at = time.time()
+            with self._lock:
+                for symbol in batch:
+                    self._merge(symbol, frames.get(symbol), batch_start, end_ts, fetched_at)
+
+    def _merge(self, symbol: str, new_df: Optional[pd.DataFrame], batch_start: pd.Timestamp,
+               end_ts: Optional[pd.Timestamp], fetched_at: float):
+        """다운로드 결과를 현재 캐시에 병합 (락 안에서 호출 - 다운로드 중 다른 스레드가 갱신한 항목 기준)"""
+        entry = self._entries.get(symbol)
+        if new_df is None or new_df.empty:
+            if entry is not None and not entry.df.empty:
+                # 응답 누락 → 기존 데이터 유지
+                entry.fetched_at = max(entry.fetched_at, fetched_at)
+                return
+            new_df = pd.DataFrame(columns=OHLCV_COLUMNS)
+        if entry is not None and not entry.df.empty:
+            old = entry.df
+            keep = old.index < batch_start
+            if end_ts is not None:
+                keep |= old.index > end_ts
+            merged = pd.concat([old[keep], new_df])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+            covered_from = min(entry.covered_from, batch_start)
+        else:
+            merged = new_df
+            covered_from = batch_start
+        self._save_entry(symbol, _Entry(merged, covered_from, fetched_at))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_history(self, symbols: Iterable[str], start, end=None) -> Dict[str, pd.DataFrame]:
+        """심볼별 OHLCV (start~end)"""
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        self.refresh(symbols, start, end)
+
+        start_ts = _to_timestamp(start)
+        end_ts = _to_timestamp(end) if end is not None else None
+        result = {}
+        with self._lock:
+            for symbol in symbols:
+                entry = self._entries.get(symbol)
+                if entry is None or entry.df.empty:
+                    continue
+                df = entry.df
+                df = df[df.index >= start_ts]
+                if end_ts is not None:
+                    df = df[df.index <= end_ts]
+                result[symbol] = df
+        return result
+
+    def get_field_matrix(self, symbols: Iterable[str], start, end=None, field: str = 'Close') -> pd.DataFrame:
+        """필드 매트릭스 (index: 날짜, columns: 심볼). 데이터 없는 심볼은 NaN 컬럼"""
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        history = self.get_history(symbols, start, end)
+        series = {s: df[field] for s, df in history.items() if field in df.columns}
+        if not series:
+            return pd.DataFrame(columns=symbols, dtype=float)
+        matrix = pd.DataFrame(series).sort_index()
+        return matrix.reindex(columns=symbols).astype(float)
+
+    def get_close_matrix(self, symbols: Iterable[str], start, end=None) -> pd.DataFrame:
+        """종가 매트릭스 (dates × symbols)"""
+        return self.get_field_matrix(symbols, start, end, 'Close')
+
+
+_store: Optional[OHLCVStore] = None
+_store_lock = threading.Lock()
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """프로세스 공유 OHLCVStore"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = OHLCVStore()
+    return _store
@@ -0,0 +1,238 @@
+"""
+시그널 성과 분석 엔진 (벡터화)
+- 종가 매트릭스 (dates × symbols) 한 번 구성
+- 진입가 대비 수익률을 NumPy 한 번의 연산으로 계산
+- 심볼 → 컬럼 인덱스는 미리 만들어 두고 fancy indexing으로 선택
+"""
+
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from engine.ohlcv_store import OHLCVStore, get_ohlcv_store
+
+
+def select_dates(index: pd.DatetimeIndex, window_days: Optional[int] = None) -> np.ndarray:
+    """표시할 날짜 위치 선택 (첫 거래일 + window_days 이내, 마지막 거래일은 항상 포함)"""
+    n = len(index)
+    if n == 0 or window_days is None:
+        return np.arange(n)
+    limit = index[0] + timedelta(days=window_days)
+    mask = np.asarray(index <= limit)
+    mask[-1] = True
+    return np.flatnonzero(mask)
+
+
+def compute_returns(closes: np.ndarray, entry_prices: np.ndarray) -> np.ndarray:
+    """진입가 대비 수익률(%) - closes: (D, N), entry_prices: (N,)
+    진입가가 없으면 0, 종가가 없으면 NaN
+    """
+    entry = np.where(entry_prices > 0, entry_prices, np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        returns = (closes - entry) / entry * 100
+    no_entry = ~(entry_prices > 0)
+    returns[:, no_entry] = np.where(np.isnan(closes[:, no_entry]), np.nan, 0.0)
+    return np.round(returns, 2)
+
+
+def analyze_signal_performance(
+    symbols: List[str],
+    entry_prices: List[float],
+    signal_infos: List[dict],
+    start_date: str,
+    window_days: Optional[int] = None,
+    store: Optional[OHLCVStore] = None,
+) -> Tuple[List[str], List[dict]]:
+    """시그널별 이후 주가 추적 → (dates, rows)
+
+    rows: [{'signal_info': ..., 'daily_stats': [{'date', 'close', 'return_pct'}, ...]}, ...]
+    """
+    if not symbols:
+        return [], []
+
+    store = store or get_ohlcv_store()
+    matrix = store.get_close_matrix(symbols, start_date)
+    matrix = matrix.dropna(how='all')
+    if matrix.empty:
+        return [], []
+
+    # 날짜 선택
+    date_pos = select_dates(matrix.index, window_days)
+    dates = [d.strftime('%Y-%m-%d') for d in matrix.index[date_pos]]
+
+    # 컬럼 인덱스 (심볼 → 열 번호), 데이터 없는 심볼은 마지막 NaN 열로
+    values = matrix.to_numpy(dtype=float)[date_pos]
+    values = np.hstack([values, np.full((len(date_pos), 1), np.nan)])
+    col_index: Dict[str, int] = {sym: i for i, sym in enumerate(matrix.columns)}
+    nan_col = values.shape[1] - 1
+    cols = np.fromiter((col_index.get(sym, nan_col) for sym in symbols), dtype=np.intp, count=len(symbols))
+
+    closes = values[:, cols]                                  # (D, N)
+    entries = np.asarray([float(p or 0) for p in entry_prices], dtype=float)
+    returns = compute_returns(closes, entries)
+
+    # JSON 변환 (NaN → None)
+    close_obj = closes.T.astype(object)
+    close_obj[np.isnan(closes.T)] = None
+    ret_obj = returns.T.astype(object)
+    ret_obj[np.isnan(returns.T)] = None
+
+    rows = []
+    for i, info in enumerate(signal_infos):
+        rows.append({
+            'signal_info': info,
+            'daily_stats': [
+                {'date': d, 'close': c, 'return_pct': r}
+                for d, c, r in zip(dates, close_obj[i].tolist(), ret_obj[i].tolist())
+            ],
+        })
+    return dates, rows
+
+
+# === 전체 히스토리 성과 매트릭스 ===
+FORWARD_HORIZONS = (1, 3, 5, 10)
+
+
+def compute_forward_performance(
+    signals: List[dict],
+    horizons: Tuple[int, ...] = FORWARD_HORIZONS,
+    store: Optional[OHLCVStore] = None,
+) -> List[dict]:
+    """시그널 전체의 N일 후 수익률 / MFE / MAE 일괄 계산
+
+    signals: [{'signal_date', 'code', 'symbol', 'grade', 'entry_price'}, ...]
+    - 모든 심볼을 합쳐 1회 조회한 Close/High/Low 매트릭스에서 계산
+    - 기준일 = 시그널 날짜 이하 마지막 거래일, 진입가 없으면 기준일 종가
+    - MFE/MAE: 이후 max(horizons) 거래일 동안 고가/저가 기준
+    - is_final: max(horizons) 거래일이 모두 지난 경우 (이후 값이 바뀌지 않음)
+    """
+    if not signals:
+        return []
+
+    store = store or get_ohlcv_store()
+    symbols = list(dict.fromkeys(s['symbol'] for s in signals))
+    # 주말/휴일 시그널의 기준 거래일까지 포함하도록 여유 구간 확보
+    start = pd.Timestamp(min(str(s['signal_date'])[:10] for s in signals)) - timedelta(days=7)
+
+    close_m = store.get_field_matrix(symbols, start, field='Close').dropna(how='all')
+    if close_m.empty:
+        return []
+    high_m = store.get_field_matrix(symbols, start, field='High').reindex(index=close_m.index, columns=close_m.columns)
+    low_m = store.get_field_matrix(symbols, start, field='Low').reindex(index=close_m.index, columns=close_m.columns)
+
+    n_days = len(close_m.index)
+    max_h = max(horizons)
+
+    # 데이터 없는 심볼용 NaN 열 추가
+    def _with_nan_col(m: pd.DataFrame) -> np.ndarray:
+        return np.hstack([m.to_numpy(dtype=float), np.full((n_days, 1), np.nan)])
+
+    closes = _with_nan_col(close_m)
+    highs = _with_nan_col(high_m)
+    lows = _with_nan_col(low_m)
+    nan_col = closes.shape[1] - 1
+
+    col_index = {sym: i for i, sym in enumerate(close_m.columns)}
+    cols = np.fromiter((col_index.get(s['symbol'], nan_col) for s in signals), dtype=np.intp, count=len(signals))
+    sig_dates = pd.DatetimeIndex([pd.Timestamp(s['signal_date']) for s in signals])
+    base = close_m.index.searchsorted(sig_dates, side='right') - 1          # (N,)
+    has_base = base >= 0
+    base_c = np.clip(base, 0, n_days - 1)
+
+    entries = np.asarray([float(s.get('entry_price') or 0) for s in signals], dtype=float)
+    entries = np.where(entries > 0, entries, closes[base_c, cols])
+    entries = np.where(has_base & (entries > 0), entries, np.nan)
+
+    def _forward(mat: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        rows = base[:, None] + offsets[None, :]                         # (N, K)
+        valid = has_base[:, None] & (rows < n_days)
+        vals = mat[np.clip(rows, 0, n_days - 1), cols[:, None]]
+        return np.where(valid, vals, np.nan)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fwd_close = _forward(closes, np.asarray(horizons))
+        returns = (fwd_close / entries[:, None] - 1) * 100
+
+        window = np.arange(1, max_h + 1)
+        fwd_high = _forward(highs, window)
+        fwd_low = _forward(lows, window)
+        has_window = ~np.all(np.isnan(fwd_high), axis=1)
+        mfe = (np.nanmax(np.where(has_window[:, None], fwd_high, 0), axis=1) / entries - 1) * 100
+        mae = (np.nanmin(np.where(has_window[:, None], fwd_low, 0), axis=1) / entries - 1) * 100
+    mfe = np.where(has_window, mfe, np.nan)
+    mae = np.where(has_window, mae, np.nan)
+    is_final = has_base & (base + max_h < n_days)
+
+    def _clean(v: float) -> Optional[float]:
+        return None if np.isnan(v) else round(float(v), 2)
+
+    result = []
+    for i, s in enumerate(signals):
+        row = {
+            'signal_date': str(s['signal_date'])[:10],
+            'code': s['code'],
+            'grade': s.get('grade', ''),
+            'entry_price': _clean(entries[i]) or 0.0,
+            'mfe_pct': _clean(mfe[i]),
+            'mae_pct': _clean(mae[i]),
+            'is_final': bool(is_final[i]),
+        }
+        for j, h in enumerate(horizons):
+            row[f'ret_{h}d'] = _clean(returns[i, j])
+        result.append(row)
+    return result
+
+
+def summarize_by_grade(rows: List[dict], horizons: Tuple[int, ...] = FORWARD_HORIZONS) -> Dict[str, dict]:
+    """등급별 적중률(수익률 > 0 비율) / 평균 수익률 / 평균 MFE·MAE"""
+    if not rows:
+        return {}
+    df = pd.DataFrame(rows)
+    df['grade'] = df['grade'].fillna('').replace('', 'N/A')
+
+    summary = {}
+    for grade, g in df.groupby('grade'):
+        stats = {'count': int(len(g))}
+        for h in horizons:
+            col = g[f'ret_{h}d'].astype(float)
+            valid = col.dropna()
+            stats[f'{h}d'] = {
+                'count': int(len(valid)),
+                'hit_rate': round(float((valid > 0).mean() * 100), 1) if len(valid) else None,
+                'avg_return': round(float(valid.mean()), 2) if len(valid) else None,
+            }
+        for key in ('mfe_pct', 'mae_pct'):
+            col = g[key].astype(float).dropna()
+            stats[f'avg_{key}'] = round(float(col.mean()), 2) if len(col) else None
+        summary[grade] = stats
+    return summary
+
+
+def build_performance_matrix(
+    signals: List[dict],
+    cached_rows: List[dict],
+    store: Optional[OHLCVStore] = None,
+) -> Tuple[List[dict], List[dict]]:
+    """확정된(is_final) 캐시는 재사용하고 나머지 시그널만 일괄 계산
+
+    Returns: (전체 rows, 새로 계산된 rows - 호출측에서 캐시 저장)
+    """
+    final = {
+        (r['signal_date'], r['code']): r
+        for r in cached_rows if r.get('is_final')
+    }
+    pending = [s for s in signals if (str(s['signal_date'])[:10], s['code']) not in final]
+    computed = compute_forward_performance(pending, store=store) if pending else []
+
+    by_key = dict(final)
+    by_key.update({(r['signal_date'], r['code']): r for r in computed})
+
+    rows = []
+    for s in signals:
+        row = by_key.get((str(s['signal_date'])[:10], s['code']))
+        if row is None:
+            continue
+        rows.append({**row, 'name': s.get('name', ''), 'grade': s.get('grade', row.get('grade', ''))})
+    return rows, computed
@@ -0,0 +1,129 @@
+"""
+결과 파일 저장 헬퍼
+- 페이로드는 한 번만 직렬화 (orjson 사용 가능 시 orjson, 없으면 표준 json)
+- 임시 파일 기록 → fsync → os.replace 로 원자적 교체 (읽는 쪽에서 반쯤 쓰인 JSON이 보이지 않음)
+- latest 파일은 일자별 파일의 하드링크 (지원하지 않는 파일시스템이면 같은 바이트를 원자적으로 기록)
+- 축소 스캔(Market Gate RED) 결과는 reduced_scan 플래그를 달고, 같은 날 전체 스캔 결과를 덮어쓰지 않음
+"""
+
+import json
+import os
+import tempfile
+from typing import Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+
+def dumps(data) -> bytes:
+    """JSON 직렬화 (compact, UTF-8)"""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _fsync_dir(dir_path: str):
+    """rename 결과를 디렉토리 엔트리까지 디스크에 반영 (POSIX 전용, 실패 무시)"""
+    if os.name != 'posix':
+        return
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: str, payload: bytes):
+    """임시 파일에 기록 후 원자적으로 교체"""
+    dir_path = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dir_path, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=dir_path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(dir_path)
+
+
+def _link_latest(daily_path: str, latest_path: str, payload: bytes):
+    """latest 파일을 일자별 파일의 하드링크로 원자적 교체"""
+    dir_path = os.path.dirname(os.path.abspath(latest_path))
+    tmp_path = os.path.join(dir_path, f'.{os.path.basename(latest_path)}.{os.getpid()}.lnk')
+    try:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        os.link(daily_path, tmp_path)
+        os.replace(tmp_path, latest_path)
+        _fsync_dir(dir_path)
+    except (OSError, NotImplementedError, AttributeError):
+        # 하드링크 미지원 (FAT, 일부 네트워크 드라이브 등) → 같은 바이트 기록
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        atomic_write_bytes(latest_path, payload)
+
+
+def write_json(path: str, data) -> bytes:
+    """단일 JSON 파일 원자적 저장. 직렬화된 바이트를 반환"""
+    payload = dumps(data)
+    atomic_write_bytes(path, payload)
+    return payload
+
+
+def save_daily_and_latest(daily_path: str, latest_path: str, data) -> bytes:
+    """일자별 파일 저장 + latest 파일 갱신 (직렬화 1회)"""
+    payload = dumps(data)
+    atomic_write_bytes(daily_path, payload)
+    _link_latest(daily_path, latest_path, payload)
+    return payload
+
+
+def reduced_path(path: str) -> str:
+    """축소 스캔 결과 별도 파일 경로 (vcp_20260105.json → reduced_vcp_20260105.json)
+    접두사라 기존 히스토리 glob(vcp_*.json 등)에 잡히지 않음"""
+    head, tail = os.path.split(path)
+    return os.path.join(head, f"reduced_{tail}")
+
+
+def _is_full_result(path: str) -> bool:
+    try:
+        with open(path, 'rb') as f:
+            return not json.loads(f.read()).get('reduced_scan')
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def save_scan_result(daily_path: str, latest_path: str, data: dict, reduced: bool = False) -> Tuple[str, bool]:
+    """스캔 결과 저장 (data 에 reduced_scan 플래그 기록)
+    - 축소 스캔인데 같은 날 전체 스캔 결과가 있으면 일자별/latest 는 그대로 두고 reduced_*.json 에만 저장
+    Returns: (저장 경로, 일자별/latest 갱신 여부) - 갱신하지 않았으면 DB 기록도 생략할 것
+    """
+    data['reduced_scan'] = bool(reduced)
+    if reduced and _is_full_result(daily_path):
+        path = reduced_path(daily_path)
+        write_json(path, data)
+        print(f"[Persist] 축소 스캔 결과는 전체 결과를 덮어쓰지 않음: {path}")
+        return path, False
+    save_daily_and_latest(daily_path, latest_path, data)
+    return daily_path, True
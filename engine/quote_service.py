@@ -0,0 +1,142 @@
+"""
+실시간 시세 서비스 (프로세스 공유)
+- 심볼별 짧은 TTL 캐시 (기본 5초)
+- 동시 요청 coalescing (singleflight): 같은 심볼을 여러 요청이 동시에 찾으면 다운로드는 1회
+- KR 종목코드 → 거래소 접미사(.KS/.KQ)는 KRSymbolResolver 사용: 확인된 거래소만 조회
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from engine.kr_symbols import get_kr_resolver
+from engine.ohlcv_store import split_download
+
+
+def _last_close(df) -> Optional[float]:
+    if df is None or df.empty or 'Close' not in df.columns:
+        return None
+    series = df['Close'].dropna()
+    if series.empty:
+        return None
+    return float(series.iloc[-1])
+
+
+class QuoteService:
+    """yfinance 최신가 조회 (TTL + singleflight)"""
+
+    def __init__(self, ttl_seconds: float = 5.0, wait_timeout: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self.wait_timeout = wait_timeout
+        self._quotes: Dict[str, Tuple[Optional[float], float]] = {}   # symbol -> (price, fetched_at)
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 공통
+    # ------------------------------------------------------------------
+    def _download(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        import yfinance as yf
+
+        df = yf.download(symbols, period="1d", group_by='ticker', threads=True, progress=False)
+        frames = split_download(df, symbols)
+        return {symbol: _last_close(frames.get(symbol)) for symbol in symbols}
+
+    def get_prices(self, symbols: Iterable[str]) -> Dict[str, float]:
+        """심볼별 최신가 (조회 실패 심볼은 제외)"""
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        if not symbols:
+            return {}
+
+        now = time.time()
+        to_fetch, waits = [], []
+        with self._lock:
+            for symbol in symbols:
+                cached = self._quotes.get(symbol)
+                if cached is not None and now - cached[1] < self.ttl_seconds:
+                    continue
+                event = self._inflight.get(symbol)
+                if event is not None:
+                    waits.append(event)             # 다른 요청이 조회 중 → 결과 대기
+                else:
+                    self._inflight[symbol] = threading.Event()
+                    to_fetch.append(symbol)
+
+        if to_fetch:
+            try:
+                fetched = self._download(to_fetch)
+            except Exception as e:
+                print(f"[Quote] 시세 조회 실패 ({len(to_fetch)}종목): {e}")
+                fetched = {}
+            fetched_at = time.time()
+            with self._lock:
+                for symbol in to_fetch:
+                    # 실패 심볼도 TTL 동안 캐시 (반복 조회 방지)
+                    self._quotes[symbol] = (fetched.get(symbol), fetched_at)
+                    self._inflight.pop(symbol).set()
+
+        for event in waits:
+            event.wait(self.wait_timeout)
+
+        with self._lock:
+            return {
+                symbol: self._quotes[symbol][0]
+                for symbol in symbols
+                if symbol in self._quotes and self._quotes[symbol][0] is not None
+            }
+
+    # ------------------------------------------------------------------
+    # KR (.KS / .KQ)
+    # ------------------------------------------------------------------
+    def get_kr_prices(self, codes: Iterable[str], markets: Dict[str, str] = None) -> Dict[str, float]:
+        """KR 종목 최신가 {code: price}
+        거래소가 확인된 종목은 해당 심볼만, 미확인 종목만 실패 시 반대 거래소 재조회
+        """
+        resolver = get_kr_resolver()
+        markets = markets or {}
+        symbol_map, fallback = {}, {}
+        for code in dict.fromkeys(c for c in codes if c):
+            candidates = resolver.candidates(code, markets.get(code))
+            symbol_map[candidates[0]] = code
+            if len(candidates) > 1:
+                fallback[candidates[1]] = code
+
+        prices = {}
+        for symbol, price in self.get_prices(symbol_map).items():
+            prices[symbol_map[symbol]] = price
+            resolver.learn(symbol)
+
+        retry = {symbol: code for symbol, code in fallback.items() if code not in prices}
+        if retry:
+            for symbol, price in self.get_prices(retry).items():
+                prices[retry[symbol]] = price
+                resolver.learn(symbol)
+
+        return prices
+
+    # ------------------------------------------------------------------
+    # JP (.T)
+    # ------------------------------------------------------------------
+    def get_jp_prices(self, codes: Iterable[str]) -> Dict[str, float]:
+        """JP 종목 최신가 {원본 code: price}"""
+        symbol_map = {}
+        for code in codes:
+            if not code:
+                continue
+            symbol = code if code.endswith('.T') else f"{code}.T"
+            symbol_map[symbol] = code
+        return {symbol_map[s]: p for s, p in self.get_prices(symbol_map).items()}
+
+
+_service: Optional[QuoteService] = None
+_service_lock = threading.Lock()
+
+
+def get_quote_service() -> QuoteService:
+    """프로세스 공유 QuoteService"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = QuoteService()
+    return _service
@@ -0,0 +1,368 @@
+"""
+KR 시장 레짐 엔진 (MarketGateConfig 기반)
+- KOSPI/KOSDAQ/USD-KRW 일봉은 OHLCVStore 에 보관 (증분 다운로드)
+- KOSPI MA20/MA60 은 이동합(rolling sum)으로 일 단위 증분 갱신, 상태는 data/market_regime.json 에 저장
+- 당일(미확정) 봉은 이동합을 바꾸지 않고 미리보기 값으로만 반영
+- 외국인/기관/개인 시장 전체 순매수 (pykrx, 실패 시 생략)
+- 결과: models.MarketStatus / 스크리너용 저비용 조회 get_market_status()
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from config import MarketGateConfig
+from models import MarketStatus
+from engine.ohlcv_store import OHLCVStore, get_ohlcv_store
+from engine.persist import write_json
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STATE_PATH = os.path.join(BASE_DIR, 'data', 'market_regime.json')
+
+KOSPI = '^KS11'
+KOSDAQ = '^KQ11'
+USD_KRW = 'KRW=X'
+
+# 콜드 스타트 시 MA 계산용 히스토리 (영업일 60일 + 여유)
+HISTORY_DAYS = 140
+
+
+class RollingMean:
+    """고정 길이 이동평균 (push 1회 = O(1))"""
+
+    def __init__(self, window: int, values: Iterable[float] = ()):
+        self.window = window
+        self.values = deque((float(v) for v in values), maxlen=window)
+        self.total = sum(self.values)
+
+    def push(self, value: float):
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(float(value))
+        self.total += float(value)
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self.values) < self.window:
+            return None
+        return self.total / self.window
+
+    def peek(self, value: float) -> Optional[float]:
+        """value 를 push 했다고 가정한 평균 (상태 변경 없음)"""
+        n = len(self.values)
+        if n + 1 < self.window:
+            return None
+        total = self.total + value - (self.values[0] if n == self.window else 0.0)
+        return total / self.window
+
+
+class _Series:
+    """확정 봉까지 반영된 지수 1개의 이동평균 상태"""
+
+    def __init__(self, windows: Dict[str, int], last_date: Optional[str] = None,
+                 values: Iterable[float] = ()):
+        values = list(values)
+        self.windows = windows
+        self.last_date = last_date
+        self.means = {k: RollingMean(w, values[-w:]) for k, w in windows.items()}
+        # 저장용 최근 종가 (가장 긴 이동평균 기간만큼)
+        self.recent = deque(values, maxlen=max(max(windows.values()), 2))
+
+    @property
+    def last_close(self) -> Optional[float]:
+        return self.recent[-1] if self.recent else None
+
+    @property
+    def prev_close(self) -> Optional[float]:
+        return self.recent[-2] if len(self.recent) >= 2 else None
+
+    def push(self, day: str, close: float):
+        for mean in self.means.values():
+            mean.push(close)
+        self.recent.append(close)
+        self.last_date = day
+
+    def to_dict(self) -> Dict:
+        return {'last_date': self.last_date, 'values': list(self.recent)}
+
+    @classmethod
+    def from_dict(cls, windows: Dict[str, int], data: Dict) -> '_Series':
+        return cls(windows, data.get('last_date'), data.get('values', []))
+
+    def advance(self, closes: pd.Series, today: pd.Timestamp) -> Tuple[Optional[float], Dict[str, Optional[float]], Optional[float]]:
+        """last_date 이후 확정 봉만 push, 당일 봉은 미리보기
+
+        Returns: (현재가, {ma 키: 값}, 전일 종가)
+        """
+        closes = closes.dropna()
+        closes.index = pd.DatetimeIndex(closes.index)
+        if self.last_date is not None:
+            closes = closes[closes.index > pd.Timestamp(self.last_date)]
+        confirmed = closes[closes.index < today]
+        for ts, close in confirmed.items():
+            self.push(ts.strftime('%Y-%m-%d'), float(close))
+
+        provisional = closes[closes.index >= today]
+        if not provisional.empty:
+            current = float(provisional.iloc[-1])
+            return current, {k: m.peek(current) for k, m in self.means.items()}, self.last_close
+        return self.last_close, {k: m.value for k, m in self.means.items()}, self.prev_close
+
+
+def _pct(current: Optional[float], prev: Optional[float]) -> float:
+    if not current or not prev:
+        return 0.0
+    return round((current - prev) / prev * 100, 2)
+
+
+class RegimeEngine:
+    """KR 레짐 계산 + 상태 영속"""
+
+    def __init__(self, config: MarketGateConfig = None, store: OHLCVStore = None,
+                 state_path: str = DEFAULT_STATE_PATH):
+        self.config = config or MarketGateConfig()
+        self.store = store
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._status: Optional[MarketStatus] = None
+        self._state_mtime = 0.0
+        self._series: Dict[str, _Series] = {}
+        self._flows: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def _windows(self) -> Dict[str, Dict[str, int]]:
+        c = self.config
+        return {
+            KOSPI: {'ma_short': c.kospi_ma_short, 'ma_long': c.kospi_ma_long},
+            KOSDAQ: {'ma_short': c.kospi_ma_short},
+            USD_KRW: {'ma_short': c.kospi_ma_short},
+        }
+
+    # ------------------------------------------------------------------
+    # 상태 파일
+    # ------------------------------------------------------------------
+    def _load_state(self):
+        """다른 프로세스가 갱신했으면 다시 읽음 (stat 1회)"""
+        try:
+            mtime = os.path.getmtime(self.state_path)
+        except OSError:
+            return
+        if mtime <= self._state_mtime:
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[Regime] 상태 로드 실패: {e}")
+            return
+
+        windows = self._windows
+        series = state.get('series', {})
+        self._series = {
+            sym: _Series.from_dict(windows[sym], series[sym])
+            for sym in windows if sym in series
+            # 설정(MA 기간)이 바뀌었으면 재계산
+            and state.get('windows', {}).get(sym) == windows[sym]
+        }
+        self._flows = state.get('flows', {})
+        if state.get('status'):
+            self._status = MarketStatus(**state['status'])
+        self._state_mtime = mtime
+
+    def _save_state(self):
+        state = {
+            'windows': self._windows,
+            'series': {sym: s.to_dict() for sym, s in self._series.items()},
+            'flows': self._flows,
+            'status': self._status.to_dict() if self._status else None,
+        }
+        try:
+            write_json(self.state_path, state)
+            self._state_mtime = os.path.getmtime(self.state_path)
+        except Exception as e:
+            print(f"[Regime] 상태 저장 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 데이터
+    # ------------------------------------------------------------------
+    def _fetch_flows(self, day: date) -> Optional[Dict[str, int]]:
+        """KOSPI 투자자별 순매수 금액 (원) - pykrx, 실패 시 None"""
+        key = day.isoformat()
+        if key in self._flows:
+            return self._flows[key]
+        try:
+            from pykrx import stock
+
+            start = (day - timedelta(days=7)).strftime('%Y%m%d')
+            df = stock.get_market_trading_value_by_date(start, day.strftime('%Y%m%d'), 'KOSPI')
+            if df is None or df.empty:
+                return None
+            row = df.iloc[-1]
+            flows = {
+                'date': pd.Timestamp(df.index[-1]).strftime('%Y-%m-%d'),
+                'foreign': int(row.get('외국인합계', 0)),
+                'inst': int(row.get('기관합계', 0)),
+                'retail': int(row.get('개인', 0)),
+            }
+        except Exception as e:
+            print(f"[Regime] 투자자별 수급 조회 실패: {e}")
+            return None
+        # 장 마감 후 확정된 값만 보관 (최근 10일)
+        if flows['date'] < key or datetime.now().hour >= 18:
+            self._flows = dict(sorted({**self._flows, key: flows}.items())[-10:])
+        return flows
+
+    def _series_for(self, symbol: str) -> _Series:
+        if symbol not in self._series:
+            self._series[symbol] = _Series(self._windows[symbol])
+        return self._series[symbol]
+
+    # ------------------------------------------------------------------
+    # 판정
+    # ------------------------------------------------------------------
+    def evaluate(self, kospi: float, kospi_ma: Dict[str, Optional[float]], usd_krw: float,
+                 foreign_net: Optional[int]) -> Tuple[str, float, bool, str]:
+        """(regime, regime_score, is_gate_open, gate_reason)"""
+        c = self.config
+        ma_short, ma_long = kospi_ma.get('ma_short'), kospi_ma.get('ma_long')
+        score = 50.0
+        reasons = []
+
+        above_short = bool(ma_short) and kospi > ma_short
+        short_above_long = bool(ma_short and ma_long) and ma_short > ma_long
+        if ma_short:
+            score += 15 if above_short else -15
+            reasons.append(f"KOSPI {'>' if above_short else '<'} MA{c.kospi_ma_short}")
+        if ma_short and ma_long:
+            score += 10 if short_above_long else -10
+
+        if usd_krw:
+            if usd_krw < c.usd_krw_safe:
+                score += 10
+            elif usd_krw >= c.usd_krw_danger:
+                score -= 20
+                reasons.append(f"USD/KRW {usd_krw:,.0f} ≥ {c.usd_krw_danger:,.0f}")
+            elif usd_krw >= c.usd_krw_warning:
+                score -= 10
+                reasons.append(f"USD/KRW {usd_krw:,.0f} 주의")
+
+        if foreign_net is not None:
+            if foreign_net >= c.foreign_net_buy_threshold:
+                score += 15
+            elif foreign_net <= -c.foreign_net_buy_threshold:
+                score -= 15
+            else:
+                score += 5 if foreign_net > 0 else -5
+            reasons.append(f"외인 {foreign_net / 1e8:+,.0f}억")
+
+        foreign_buying = foreign_net is None or foreign_net >= 0
+        if above_short and short_above_long and foreign_buying:
+            regime = 'KR_BULLISH'
+        elif ma_short and not above_short and (
+            (foreign_net is not None and foreign_net < 0) or (ma_long and not short_above_long)
+        ):
+            regime = 'KR_BEARISH'
+        else:
+            regime = 'KR_NEUTRAL'
+
+        fx_blocked = bool(usd_krw) and usd_krw >= c.usd_krw_danger
+        is_open = regime != 'KR_BEARISH' and not fx_blocked
+        return regime, max(0.0, min(100.0, score)), is_open, ', '.join(reasons)
+
+    def update(self, today: date = None) -> MarketStatus:
+        """OHLCV 증분 갱신 → 새 확정 봉만 이동평균 반영 → MarketStatus 저장"""
+        today = today or date.today()
+        today_ts = pd.Timestamp(today)
+        store = self.store or get_ohlcv_store()
+
+        with self._lock:
+            self._load_state()
+            symbols = list(self._windows)
+            # 상태가 있으면 최근 구간만, 없으면 MA 계산용 전체 구간
+            # (이전 갱신이 종가를 못 받아 last_date 가 비어 있는 시리즈도 전체 구간)
+            last_dates = [pd.Timestamp(s.last_date) for s in self._series.values() if s.last_date]
+            if len(last_dates) == len(symbols):
+                start = min(min(last_dates), today_ts - timedelta(days=10))
+            else:
+                start = today_ts - timedelta(days=HISTORY_DAYS)
+            history = store.get_history(symbols, start)
+
+            values = {}
+            for symbol in symbols:
+                df = history.get(symbol)
+                closes = df['Close'] if df is not None and 'Close' in df.columns else pd.Series(dtype=float)
+                values[symbol] = self._series_for(symbol).advance(closes, today_ts)
+
+            kospi, kospi_ma, kospi_prev = values[KOSPI]
+            kosdaq, _, kosdaq_prev = values[KOSDAQ]
+            usd_krw, _, usd_prev = values[USD_KRW]
+
+            flows = self._fetch_flows(today)
+            foreign_net = flows['foreign'] if flows else None
+            regime, score, is_open, reason = self.evaluate(kospi or 0.0, kospi_ma, usd_krw or 0.0, foreign_net)
+
+            self._status = MarketStatus(
+                timestamp=int(time.time()),
+                kospi=round(kospi or 0.0, 2),
+                kospi_change_pct=_pct(kospi, kospi_prev),
+                kosdaq=round(kosdaq or 0.0, 2),
+                kosdaq_change_pct=_pct(kosdaq, kosdaq_prev),
+                usd_krw=round(usd_krw or 0.0, 2),
+                usd_krw_change_pct=_pct(usd_krw, usd_prev),
+                foreign_net_total=int(flows['foreign'] / 1e8) if flows else 0,
+                inst_net_total=int(flows['inst'] / 1e8) if flows else 0,
+                retail_net_total=int(flows['retail'] / 1e8) if flows else 0,
+                regime=regime,
+                regime_score=round(score, 1),
+                is_gate_open=is_open,
+                gate_reason=reason,
+            )
+            self._save_state()
+            return self._status
+
+    def current(self, since: float = None) -> Optional[MarketStatus]:
+        """마지막 계산 결과 (네트워크 없음, 다른 프로세스 갱신은 파일로 반영)
+
+        since: 지정 시 그 이후(time.time 기준) 계산된 결과만 반환
+        """
+        with self._lock:
+            self._load_state()
+            status = self._status
+        if status is not None and since is not None and status.timestamp < int(since):
+            return None
+        return status
+
+
+_engine: Optional[RegimeEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_regime_engine() -> RegimeEngine:
+    """프로세스 공유 RegimeEngine"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = RegimeEngine()
+    return _engine
+
+
+def get_market_status(max_age_seconds: Optional[float] = None) -> Optional[MarketStatus]:
+    """스크리너용 KR 시장 상태 조회
+
+    max_age_seconds: 지정 시 그보다 오래된 상태면 update() 로 재계산
+    """
+    engine = get_regime_engine()
+    status = engine.current()
+    if status is None or (max_age_seconds is not None and time.time() - status.timestamp > max_age_seconds):
+        try:
+            status = engine.update()
+        except Exception as e:
+            print(f"[Regime] 갱신 실패: {e}")
+    return status
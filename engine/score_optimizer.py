@@ -0,0 +1,316 @@
+"""
+Scorer 가중치 / 등급 컷 walk-forward 최적화 (오프라인)
+- 저장된 종가베팅 시그널의 항목별 원점수(news, volume, ...) → 특성 매트릭스 F (N × 6)
+- 가중치 그리드 M (G × 6) → 점수 매트릭스 F @ M.T (N × G) 행렬곱 1회
+- 등급 컷 조합마다 등급 / 일자별 순위(max_positions) / 등급별 비중을 배열 연산으로 계산
+- 날짜 구간별 합계를 먼저 집계 → walk-forward 학습/검증은 구간 합의 누적으로 평가
+- 결과: data/scorer_tuned.json (SignalConfig.load 로 적용)
+
+주의: 저장된 시그널은 당시 C등급을 제외한 종목뿐이라, 기존 B컷 아래로 내려가는 조합은 평가되지 않음
+
+사용 예:
+    python -m engine.score_optimizer --horizon 5 --folds 4
+"""
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine.config import Grade, SCORE_COMPONENT_MAX, SignalConfig, TUNED_SCORER_PATH
+
+COMPONENTS = tuple(SCORE_COMPONENT_MAX)
+GRADES = ('S', 'A', 'B')
+
+DEFAULT_MULTIPLIERS = (0.5, 1.0, 1.5)
+DEFAULT_THRESHOLDS = {'S': (7, 8, 9, 10), 'A': (5, 6, 7), 'B': (3, 4, 5)}
+B_CHANGE_PCT = 3.0          # Scorer.determine_grade: 등락률 3% 이상이면 B
+WEIGHT_BLOCK = 512          # 점수 매트릭스 열 블록 (메모리 상한)
+
+
+@dataclass
+class FeatureSet:
+    """시그널별 특성 (날짜순 정렬)"""
+    dates: List[str]
+    day: np.ndarray         # (N,) 날짜 위치
+    points: np.ndarray      # (N, C) 항목별 원점수
+    change_pct: np.ndarray  # (N,)
+    returns: np.ndarray     # (N,) horizon 일 후 수익률 (%)
+
+
+def build_features(history: List[Dict], perf_rows: List[Dict], horizon: int = 5) -> Optional[FeatureSet]:
+    """query_signals 결과 + 성과 행 → FeatureSet (수익률이 확정된 시그널만)"""
+    key = f'ret_{horizon}d'
+    returns = {
+        (r['signal_date'], r['code']): r.get(key)
+        for r in perf_rows if r.get(key) is not None
+    }
+
+    dates, points, change, rets = [], [], [], []
+    for h in history:
+        ret = returns.get((h['signal_date'], h['code']))
+        score = (h.get('signal') or {}).get('score')
+        if ret is None or not isinstance(score, dict):
+            continue
+        raw = score.get('raw') or {}
+        points.append([float(raw.get(c, score.get(c)) or 0) for c in COMPONENTS])
+        change.append(float((h.get('signal') or {}).get('change_pct') or h.get('change_pct') or 0))
+        dates.append(h['signal_date'])
+        rets.append(float(ret))
+
+    if not dates:
+        return None
+    order = np.argsort(np.asarray(dates), kind='stable')
+    unique, day = np.unique(np.asarray(dates)[order], return_inverse=True)
+    return FeatureSet(
+        dates=unique.tolist(),
+        day=day.astype(np.intp),
+        points=np.asarray(points, dtype=float)[order],
+        change_pct=np.asarray(change, dtype=float)[order],
+        returns=np.asarray(rets, dtype=float)[order],
+    )
+
+
+def weight_grid(multipliers: Sequence[float] = DEFAULT_MULTIPLIERS) -> np.ndarray:
+    """항목별 배율 조합 (G × C)"""
+    return np.asarray(list(product(multipliers, repeat=len(COMPONENTS))), dtype=float)
+
+
+def threshold_grid(thresholds: Dict[str, Sequence[float]] = None) -> np.ndarray:
+    """등급 컷 조합 (T × 3), S > A > B 인 것만"""
+    thresholds = thresholds or DEFAULT_THRESHOLDS
+    rows = [(s, a, b) for s, a, b in product(thresholds['S'], thresholds['A'], thresholds['B']) if s > a > b]
+    return np.asarray(rows, dtype=float)
+
+
+@dataclass
+class GridStats:
+    """구간(K) × 컷(T) × 가중치(G) 별 합계"""
+    weighted_return: np.ndarray   # Σ 비중 × 수익률
+    weight: np.ndarray            # Σ 비중
+    count: np.ndarray             # 선택된 시그널 수
+    wins: np.ndarray              # 수익률 > 0 인 선택 시그널 수
+
+    def total(self, chunks: slice) -> 'GridStats':
+        return GridStats(*(getattr(self, f)[chunks].sum(axis=0) for f in
+                           ('weighted_return', 'weight', 'count', 'wins')))
+
+
+def evaluate_grid(
+    fs: FeatureSet,
+    weights: np.ndarray,
+    thresholds: np.ndarray,
+    n_chunks: int,
+    max_positions: int,
+    grade_multiplier: Dict[str, float],
+) -> GridStats:
+    """모든 (컷, 가중치) 조합의 구간별 성과 합계
+
+    - 일자별로 등급 → 점수 순 상위 max_positions 개만 선택 (SignalGenerator 와 동일)
+    - 비중: 등급별 r_multiplier (S 1.5 / A 1.0 / B 0.5)
+    """
+    n = len(fs.day)
+    n_days = len(fs.dates)
+    chunk = np.minimum(fs.day * n_chunks // max(n_days, 1), n_chunks - 1)
+    onehot = (chunk[None, :] == np.arange(n_chunks)[:, None]).astype(float)   # (K, N)
+    day_start = np.searchsorted(fs.day, np.arange(n_days))                      # 날짜순 정렬 전제
+    ret = fs.returns[:, None]
+    win = (fs.returns > 0)[:, None]
+    b_by_change = (fs.change_pct >= B_CHANGE_PCT)[:, None]
+    mult_lookup = np.asarray([grade_multiplier[g] for g in GRADES] + [0.0])
+    positions = np.broadcast_to(np.arange(n)[:, None], (n, min(WEIGHT_BLOCK, len(weights))))
+
+    shape = (n_chunks, len(thresholds), len(weights))
+    stats = GridStats(*(np.zeros(shape) for _ in range(4)))
+
+    for g0 in range(0, len(weights), WEIGHT_BLOCK):
+        block = weights[g0:g0 + WEIGHT_BLOCK]
+        scores = fs.points @ block.T                                            # (N, G)
+        span = float(np.abs(scores).max()) + 1.0
+        pos = positions[:, :len(block)]
+        for t, (cut_s, cut_a, cut_b) in enumerate(thresholds):
+            grade = np.select(
+                [scores >= cut_s, scores >= cut_a, (scores >= cut_b) | b_by_change],
+                [0, 1, 2], 3,
+            )
+            # 같은 날 안에서 등급 → 점수 내림차순 순위
+            key = fs.day[:, None] * (4 * span) + grade * span - scores
+            order = np.argsort(key, axis=0, kind='stable')
+            rank = np.empty_like(order)
+            np.put_along_axis(rank, order, pos, axis=0)
+            rank -= day_start[fs.day][:, None]
+
+            selected = (grade < 3) & (rank < max_positions)
+            w = np.where(selected, mult_lookup[grade], 0.0)
+            cols = slice(g0, g0 + len(block))
+            stats.weighted_return[:, t, cols] = onehot @ (w * ret)
+            stats.weight[:, t, cols] = onehot @ w
+            stats.count[:, t, cols] = onehot @ selected
+            stats.wins[:, t, cols] = onehot @ (selected & win)
+    return stats
+
+
+def _objective(stats: GridStats, min_trades: int) -> np.ndarray:
+    """비중 가중 평균 수익률 (거래 수 부족 조합은 -inf)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        obj = stats.weighted_return / stats.weight
+    return np.where((stats.count >= min_trades) & (stats.weight > 0), obj, -np.inf)
+
+
+def _metrics(stats: GridStats, t: int, g: int) -> Dict:
+    count = int(stats.count[t, g])
+    weight = stats.weight[t, g]
+    return {
+        'count': count,
+        'avg_return': round(float(stats.weighted_return[t, g] / weight), 3) if weight > 0 else None,
+        'hit_rate': round(float(stats.wins[t, g] / count) * 100, 1) if count else None,
+    }
+
+
+def _params(weights: np.ndarray, thresholds: np.ndarray, t: int, g: int) -> Dict:
+    return {
+        'score_weights': {c: round(SCORE_COMPONENT_MAX[c] * float(m), 2) for c, m in zip(COMPONENTS, weights[g])},
+        'grade_thresholds': {k: float(v) for k, v in zip(GRADES, thresholds[t])},
+    }
+
+
+def _find(rows: np.ndarray, target: Sequence[float]) -> Optional[int]:
+    hit = np.flatnonzero(np.all(np.isclose(rows, np.asarray(target, dtype=float)), axis=1))
+    return int(hit[0]) if len(hit) else None
+
+
+def optimize(
+    fs: FeatureSet,
+    folds: int = 4,
+    min_trades: int = 20,
+    multipliers: Sequence[float] = DEFAULT_MULTIPLIERS,
+    thresholds: Dict[str, Sequence[float]] = None,
+    config: SignalConfig = None,
+) -> Dict:
+    """walk-forward (확장 윈도우) 평가 + 전체 기간 최적 조합
+
+    날짜를 folds+1 개 구간으로 나눠 k번째 구간은 0..k-1 구간으로 학습한 조합으로 검증
+    """
+    config = config or SignalConfig()
+    weights = weight_grid(multipliers)
+    cuts = threshold_grid(thresholds)
+    n_chunks = folds + 1
+    grade_multiplier = {g.value: config.grade_configs[g].r_multiplier for g in (Grade.S, Grade.A, Grade.B)}
+
+    stats = evaluate_grid(fs, weights, cuts, n_chunks, config.max_positions, grade_multiplier)
+
+    # 기본 설정 (배율 1, 컷 8/6/4) 위치 - 비교 기준
+    base_g = _find(weights, [1.0] * len(COMPONENTS))
+    base_t = _find(cuts, [SignalConfig().grade_thresholds[g] for g in GRADES])
+    has_base = base_g is not None and base_t is not None
+
+    chunk_bounds = np.minimum(np.arange(n_chunks + 1) * len(fs.dates) // n_chunks, len(fs.dates))
+    walk = []
+    for k in range(1, n_chunks):
+        train = stats.total(slice(0, k))
+        test = stats.total(slice(k, k + 1))
+        obj = _objective(train, min_trades)
+        if not np.isfinite(obj).any():
+            continue
+        t, g = np.unravel_index(np.argmax(obj), obj.shape)
+        lo, hi = chunk_bounds[k], chunk_bounds[k + 1] - 1
+        walk.append({
+            'train_end': fs.dates[lo - 1],
+            'test_start': fs.dates[lo],
+            'test_end': fs.dates[hi],
+            **_params(weights, cuts, t, g),
+            'train': _metrics(train, t, g),
+            'test': _metrics(test, t, g),
+            'baseline_test': _metrics(test, base_t, base_g) if has_base else None,
+        })
+
+    full = stats.total(slice(None))
+    obj = _objective(full, min_trades)
+    if not np.isfinite(obj).any():
+        return {'error': f'min_trades={min_trades} 을 만족하는 조합 없음', 'signals': len(fs.day)}
+    t, g = np.unravel_index(np.argmax(obj), obj.shape)
+
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'signals': int(len(fs.day)),
+        'start_date': fs.dates[0],
+        'end_date': fs.dates[-1],
+        'combinations': int(len(weights) * len(cuts)),
+        **_params(weights, cuts, t, g),
+        'in_sample': _metrics(full, t, g),
+        'baseline': _metrics(full, base_t, base_g) if has_base else None,
+        'walk_forward': walk,
+    }
+
+
+def load_history(horizon: int = 5) -> Optional[FeatureSet]:
+    """저장된 KR 종가베팅 시그널 + 성과 캐시 → FeatureSet"""
+    from app.store import get_store
+    from engine.kr_symbols import get_kr_resolver
+    from engine.performance import build_performance_matrix
+
+    store = get_store()
+    history = store.query_signals('KR', 'jongga_v2')
+    if not history:
+        return None
+    resolver = get_kr_resolver()
+    signals = [
+        {
+            'signal_date': h['signal_date'],
+            'code': h['code'],
+            'name': h['name'],
+            'symbol': resolver.resolve(h['code'], h['market']),
+            'grade': h['grade'],
+            'entry_price': h['entry_price'],
+        }
+        for h in history
+    ]
+    rows, computed = build_performance_matrix(signals, store.get_performance('KR', 'jongga_v2'))
+    if computed:
+        store.save_performance('KR', 'jongga_v2', computed)
+    return build_features(history, rows, horizon)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scorer weight / grade threshold optimizer')
+    parser.add_argument('--horizon', type=int, default=5, choices=[1, 3, 5, 10])
+    parser.add_argument('--folds', type=int, default=4)
+    parser.add_argument('--min-trades', type=int, default=20)
+    parser.add_argument('--multipliers', default=','.join(str(m) for m in DEFAULT_MULTIPLIERS))
+    parser.add_argument('--out', default=TUNED_SCORER_PATH)
+    parser.add_argument('--dry-run', action='store_true', help='파일 저장 없이 결과만 출력')
+    args = parser.parse_args()
+
+    fs = load_history(args.horizon)
+    if fs is None:
+        print("[Optimizer] 수익률이 확정된 시그널 없음")
+        return
+
+    multipliers = [float(m) for m in args.multipliers.split(',') if m.strip()]
+    print(f"[Optimizer] 시그널 {len(fs.day)}개 / {len(fs.dates)}일, "
+          f"조합 {len(multipliers) ** len(COMPONENTS) * len(threshold_grid())}개 평가...")
+    result = optimize(fs, folds=args.folds, min_trades=args.min_trades, multipliers=multipliers)
+    result['horizon'] = args.horizon
+
+    if 'error' in result:
+        print(f"[Optimizer] {result['error']}")
+        return
+
+    for w in result['walk_forward']:
+        base = (w['baseline_test'] or {}).get('avg_return')
+        print(f"  {w['test_start']}~{w['test_end']}: test {w['test']['avg_return']}% "
+              f"(n={w['test']['count']}) / baseline {base}%")
+    print(f"[Optimizer] weights={result['score_weights']} thresholds={result['grade_thresholds']}")
+    print(f"[Optimizer] in-sample {result['in_sample']} / baseline {result['baseline']}")
+
+    if not args.dry_run:
+        from engine.persist import write_json
+        write_json(args.out, result)
+        print(f"[Optimizer] 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
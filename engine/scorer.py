@@ -4,7 +4,7 @@
 """
 
 from typing import List, Optional, Tuple, Dict
-from engine.config import SignalConfig, Grade
+from engine.config import SignalConfig, Grade, SCORE_COMPONENT_MAX
 from engine.models import StockData, ChartData, NewsItem, SupplyData, ScoreDetail, ChecklistDetail
 
 
@@ -61,8 +61,19 @@ class Scorer:
         if score.total < 2 and stock.change_pct > 0:
             score.chart = max(score.chart, 1.0)
         
+        self._apply_weights(score)
         return score, checklist
 
+    def _apply_weights(self, score: ScoreDetail):
+        """score_weights 가 기본 만점과 다르면 항목 점수를 (가중치 / 기본 만점) 배로 환산"""
+        weights = self.config.score_weights
+        for key, max_points in SCORE_COMPONENT_MAX.items():
+            weight = weights.get(key, max_points)
+            if weight != max_points:
+                # 오프라인 최적화(engine.score_optimizer)가 원점수로 재평가할 수 있도록 보존
+                score.raw[key] = getattr(score, key)
+                setattr(score, key, round(getattr(score, key) * weight / max_points, 2))
+
     def _score_technical(self, charts: List[ChartData]) -> float:
         """기술적 지표 정밀 채점 (RSI, Bollinger, MACD) -> Max 3.0"""
         if not charts or len(charts) < 30:
@@ -396,21 +407,21 @@ class Scorer:
         return min(score, 2), is_positive
     
     def determine_grade(self, stock: StockData, score: ScoreDetail) -> Grade:
-        """등급 결정 - 완화된 기준"""
+        """등급 결정 - 완화된 기준 (컷: SignalConfig.grade_thresholds)"""
         total = score.total
-        trading_value = stock.trading_value
         change_pct = getattr(stock, 'change_pct', 0)
+        cut = self.config.grade_thresholds
         
         # S급: 8점 이상 (완화: 10→8)
-        if total >= 8:
+        if total >= cut['S']:
             return Grade.S
         
         # A급: 6점 이상 (완화: 8→6)
-        if total >= 6:
+        if total >= cut['A']:
             return Grade.A
         
         # B급: 4점 이상 또는 상승률 3% 이상 (완화: 6→4)
-        if total >= 4 or change_pct >= 3.0:
+        if total >= cut['B'] or change_pct >= 3.0:
             return Grade.B
         
         # C급: 나머지
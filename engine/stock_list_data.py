@@ -1,308 +1,44 @@
-# Auto-generated stock list by fetch_stock_list.py (via FinanceDataReader)
-# Generated at: 2026-01-25 13:35:01.996118
+"""
+KR 주요 종목 리스트 (KOSPI 시가총액 상위 200 + KOSDAQ 상위 100)
+- 데이터: engine/data/kr_top_stocks.csv (ticker,name,market) - fetch_stock_list.py 로 갱신
+- 첫 사용 시 1회 로드, KR_TOP_STOCKS 는 모듈 __getattr__ 로 유지
+- 전 상장종목 유니버스는 engine.kr_universe
+"""
 
-KR_TOP_STOCKS = [
-    # KOSPI Top 200
-    ('005930.KS', '삼성전자', 'KOSPI'),
-    ('000660.KS', 'SK하이닉스', 'KOSPI'),
-    ('005380.KS', '현대차', 'KOSPI'),
-    ('373220.KS', 'LG에너지솔루션', 'KOSPI'),
-    ('005935.KS', '삼성전자우', 'KOSPI'),
-    ('207940.KS', '삼성바이오로직스', 'KOSPI'),
-    ('329180.KS', 'HD현대중공업', 'KOSPI'),
-    ('012450.KS', '한화에어로스페이스', 'KOSPI'),
-    ('000270.KS', '기아', 'KOSPI'),
-    ('034020.KS', '두산에너빌리티', 'KOSPI'),
-    ('402340.KS', 'SK스퀘어', 'KOSPI'),
-    ('028260.KS', '삼성물산', 'KOSPI'),
-    ('105560.KS', 'KB금융', 'KOSPI'),
-    ('068270.KS', '셀트리온', 'KOSPI'),
-    ('042660.KS', '한화오션', 'KOSPI'),
-    ('035420.KS', 'NAVER', 'KOSPI'),
-    ('012330.KS', '현대모비스', 'KOSPI'),
-    ('055550.KS', '신한지주', 'KOSPI'),
-    ('015760.KS', '한국전력', 'KOSPI'),
-    ('032830.KS', '삼성생명', 'KOSPI'),
-    ('010130.KS', '고려아연', 'KOSPI'),
-    ('267260.KS', 'HD현대일렉트릭', 'KOSPI'),
-    ('009540.KS', 'HD한국조선해양', 'KOSPI'),
-    ('006400.KS', '삼성SDI', 'KOSPI'),
-    ('005490.KS', 'POSCO홀딩스', 'KOSPI'),
-    ('086790.KS', '하나금융지주', 'KOSPI'),
-    ('035720.KS', '카카오', 'KOSPI'),
-    ('010140.KS', '삼성중공업', 'KOSPI'),
-    ('051910.KS', 'LG화학', 'KOSPI'),
-    ('064350.KS', '현대로템', 'KOSPI'),
-    ('000810.KS', '삼성화재', 'KOSPI'),
-    ('298040.KS', '효성중공업', 'KOSPI'),
-    ('316140.KS', '우리금융지주', 'KOSPI'),
-    ('034730.KS', 'SK', 'KOSPI'),
-    ('009150.KS', '삼성전기', 'KOSPI'),
-    ('006800.KS', '미래에셋증권', 'KOSPI'),
-    ('267250.KS', 'HD현대', 'KOSPI'),
-    ('011200.KS', 'HMM', 'KOSPI'),
-    ('003670.KS', '포스코퓨처엠', 'KOSPI'),
-    ('086280.KS', '현대글로비스', 'KOSPI'),
-    ('096770.KS', 'SK이노베이션', 'KOSPI'),
-    ('138040.KS', '메리츠금융지주', 'KOSPI'),
-    ('066570.KS', 'LG전자', 'KOSPI'),
-    ('033780.KS', 'KT&G', 'KOSPI'),
-    ('272210.KS', '한화시스템', 'KOSPI'),
-    ('024110.KS', '기업은행', 'KOSPI'),
-    ('042700.KS', '한미반도체', 'KOSPI'),
-    ('352820.KS', '하이브', 'KOSPI'),
-    ('047810.KS', '한국항공우주', 'KOSPI'),
-    ('0126Z0.KS', '삼성에피스홀딩스', 'KOSPI'),
-    ('000150.KS', '두산', 'KOSPI'),
-    ('010120.KS', 'LS ELECTRIC', 'KOSPI'),
-    ('003550.KS', 'LG', 'KOSPI'),
-    ('030200.KS', 'KT', 'KOSPI'),
-    ('018260.KS', '삼성에스디에스', 'KOSPI'),
-    ('017670.KS', 'SK텔레콤', 'KOSPI'),
-    ('307950.KS', '현대오토에버', 'KOSPI'),
-    ('000720.KS', '현대건설', 'KOSPI'),
-    ('079550.KS', 'LIG넥스원', 'KOSPI'),
-    ('259960.KS', '크래프톤', 'KOSPI'),
-    ('323410.KS', '카카오뱅크', 'KOSPI'),
-    ('010950.KS', 'S-Oil', 'KOSPI'),
-    ('047050.KS', '포스코인터내셔널', 'KOSPI'),
-    ('071050.KS', '한국금융지주', 'KOSPI'),
-    ('278470.KS', '에이피알', 'KOSPI'),
-    ('005387.KS', '현대차2우B', 'KOSPI'),
-    ('326030.KS', 'SK바이오팜', 'KOSPI'),
-    ('003230.KS', '삼양식품', 'KOSPI'),
-    ('039490.KS', '키움증권', 'KOSPI'),
-    ('377300.KS', '카카오페이', 'KOSPI'),
-    ('005830.KS', 'DB손해보험', 'KOSPI'),
-    ('000880.KS', '한화', 'KOSPI'),
-    ('003490.KS', '대한항공', 'KOSPI'),
-    ('007660.KS', '이수페타시스', 'KOSPI'),
-    ('180640.KS', '한진칼', 'KOSPI'),
-    ('000100.KS', '유한양행', 'KOSPI'),
-    ('005940.KS', 'NH투자증권', 'KOSPI'),
-    ('443060.KS', 'HD현대마린솔루션', 'KOSPI'),
-    ('161390.KS', '한국타이어앤테크놀로지', 'KOSPI'),
-    ('090430.KS', '아모레퍼시픽', 'KOSPI'),
-    ('016360.KS', '삼성증권', 'KOSPI'),
-    ('454910.KS', '두산로보틱스', 'KOSPI'),
-    ('006260.KS', 'LS', 'KOSPI'),
-    ('064400.KS', 'LG씨엔에스', 'KOSPI'),
-    ('032640.KS', 'LG유플러스', 'KOSPI'),
-    ('005385.KS', '현대차우', 'KOSPI'),
-    ('011070.KS', 'LG이노텍', 'KOSPI'),
-    ('029780.KS', '삼성카드', 'KOSPI'),
-    ('034220.KS', 'LG디스플레이', 'KOSPI'),
-    ('022100.KS', '포스코DX', 'KOSPI'),
-    ('128940.KS', '한미약품', 'KOSPI'),
-    ('241560.KS', '두산밥캣', 'KOSPI'),
-    ('078930.KS', 'GS', 'KOSPI'),
-    ('001040.KS', 'CJ', 'KOSPI'),
-    ('021240.KS', '코웨이', 'KOSPI'),
-    ('088980.KS', '맥쿼리인프라', 'KOSPI'),
-    ('052690.KS', '한전기술', 'KOSPI'),
-    ('028050.KS', '삼성E&A', 'KOSPI'),
-    ('009830.KS', '한화솔루션', 'KOSPI'),
-    ('001440.KS', '대한전선', 'KOSPI'),
-    ('138930.KS', 'BNK금융지주', 'KOSPI'),
-    ('036570.KS', '엔씨소프트', 'KOSPI'),
-    ('066970.KS', '엘앤에프', 'KOSPI'),
-    ('004020.KS', '현대제철', 'KOSPI'),
-    ('175330.KS', 'JB금융지주', 'KOSPI'),
-    ('271560.KS', '오리온', 'KOSPI'),
-    ('082740.KS', '한화엔진', 'KOSPI'),
-    ('251270.KS', '넷마블', 'KOSPI'),
-    ('062040.KS', '산일전기', 'KOSPI'),
-    ('450080.KS', '에코프로머티', 'KOSPI'),
-    ('011790.KS', 'SKC', 'KOSPI'),
-    ('002380.KS', 'KCC', 'KOSPI'),
-    ('051900.KS', 'LG생활건강', 'KOSPI'),
-    ('302440.KS', 'SK바이오사이언스', 'KOSPI'),
-    ('000990.KS', 'DB하이텍', 'KOSPI'),
-    ('011780.KS', '금호석유화학', 'KOSPI'),
-    ('035250.KS', '강원랜드', 'KOSPI'),
-    ('036460.KS', '한국가스공사', 'KOSPI'),
-    ('111770.KS', '영원무역', 'KOSPI'),
-    ('017800.KS', '현대엘리베이터', 'KOSPI'),
-    ('018880.KS', '한온시스템', 'KOSPI'),
-    ('031210.KS', '서울보증보험', 'KOSPI'),
-    ('011170.KS', '롯데케미칼', 'KOSPI'),
-    ('103140.KS', '풍산', 'KOSPI'),
-    ('097950.KS', 'CJ제일제당', 'KOSPI'),
-    ('004990.KS', '롯데지주', 'KOSPI'),
-    ('071970.KS', 'HD현대마린엔진', 'KOSPI'),
-    ('204320.KS', 'HL만도', 'KOSPI'),
-    ('014680.KS', '한솔케미칼', 'KOSPI'),
-    ('088350.KS', '한화생명', 'KOSPI'),
-    ('012510.KS', '더존비즈온', 'KOSPI'),
-    ('103590.KS', '일진전기', 'KOSPI'),
-    ('457190.KS', '이수스페셜티케미컬', 'KOSPI'),
-    ('012750.KS', '에스원', 'KOSPI'),
-    ('004170.KS', '신세계', 'KOSPI'),
-    ('008930.KS', '한미사이언스', 'KOSPI'),
-    ('489790.KS', '한화비전', 'KOSPI'),
-    ('001720.KS', '신영증권', 'KOSPI'),
-    ('439260.KS', '대한조선', 'KOSPI'),
-    ('001430.KS', '세아베스틸지주', 'KOSPI'),
-    ('009970.KS', '영원무역홀딩스', 'KOSPI'),
-    ('009420.KS', '한올바이오파마', 'KOSPI'),
-    ('005850.KS', '에스엘', 'KOSPI'),
-    ('026960.KS', '동서', 'KOSPI'),
-    ('042670.KS', 'HD현대인프라코어', 'KOSPI'),
-    ('051600.KS', '한전KPS', 'KOSPI'),
-    ('004800.KS', '효성', 'KOSPI'),
-    ('383220.KS', 'F&F', 'KOSPI'),
-    ('000240.KS', '한국앤컴퍼니', 'KOSPI'),
-    ('004370.KS', '농심', 'KOSPI'),
-    ('001450.KS', '현대해상', 'KOSPI'),
-    ('353200.KS', '대덕전자', 'KOSPI'),
-    ('336260.KS', '두산퓨얼셀', 'KOSPI'),
-    ('081660.KS', '미스토홀딩스', 'KOSPI'),
-    ('030000.KS', '제일기획', 'KOSPI'),
-    ('139480.KS', '이마트', 'KOSPI'),
-    ('011210.KS', '현대위아', 'KOSPI'),
-    ('028670.KS', '팬오션', 'KOSPI'),
-    ('000120.KS', 'CJ대한통운', 'KOSPI'),
-    ('139130.KS', 'iM금융지주', 'KOSPI'),
-    ('010060.KS', 'OCI홀딩스', 'KOSPI'),
-    ('002790.KS', '아모레퍼시픽홀딩스', 'KOSPI'),
-    ('023530.KS', '롯데쇼핑', 'KOSPI'),
-    ('192820.KS', '코스맥스', 'KOSPI'),
-    ('003690.KS', '코리안리', 'KOSPI'),
-    ('047040.KS', '대우건설', 'KOSPI'),
-    ('097230.KS', 'HJ중공업', 'KOSPI'),
-    ('018670.KS', 'SK가스', 'KOSPI'),
-    ('361610.KS', 'SK아이이테크놀로지', 'KOSPI'),
-    ('000155.KS', '두산우', 'KOSPI'),
-    ('267270.KS', 'HD현대건설기계', 'KOSPI'),
-    ('069960.KS', '현대백화점', 'KOSPI'),
-    ('020150.KS', '롯데에너지머티리얼즈', 'KOSPI'),
-    ('282330.KS', 'BGF리테일', 'KOSPI'),
-    ('462870.KS', '시프트업', 'KOSPI'),
-    ('069620.KS', '대웅제약', 'KOSPI'),
-    ('006280.KS', '녹십자', 'KOSPI'),
-    ('023590.KS', '다우기술', 'KOSPI'),
-    ('00680K.KS', '미래에셋증권2우B', 'KOSPI'),
-    ('483650.KS', '달바글로벌', 'KOSPI'),
-    ('006040.KS', '동원산업', 'KOSPI'),
-    ('032350.KS', '롯데관광개발', 'KOSPI'),
-    ('008770.KS', '호텔신라', 'KOSPI'),
-    ('017960.KS', '한국카본', 'KOSPI'),
-    ('073240.KS', '금호타이어', 'KOSPI'),
-    ('007070.KS', 'GS리테일', 'KOSPI'),
-    ('375500.KS', 'DL이앤씨', 'KOSPI'),
-    ('112610.KS', '씨에스윈드', 'KOSPI'),
-    ('003570.KS', 'SNT다이내믹스', 'KOSPI'),
-    ('395400.KS', 'SK리츠', 'KOSPI'),
-    ('006360.KS', 'GS건설', 'KOSPI'),
-    ('085620.KS', '미래에셋생명', 'KOSPI'),
-    ('020560.KS', '아시아나항공', 'KOSPI'),
-    ('034230.KS', '파라다이스', 'KOSPI'),
-    ('161890.KS', '한국콜마', 'KOSPI'),
-    ('005070.KS', '코스모신소재', 'KOSPI'),
-    ('298020.KS', '효성티앤씨', 'KOSPI'),
-    ('007310.KS', '오뚜기', 'KOSPI'),
-    ('077970.KS', 'STX엔진', 'KOSPI'),
-    ('007810.KS', '코리아써키트', 'KOSPI'),
+import csv
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
 
-    # KOSDAQ Top 100
-    ('196170.KQ', '알테오젠', 'KOSDAQ'),
-    ('247540.KQ', '에코프로비엠', 'KOSDAQ'),
-    ('086520.KQ', '에코프로', 'KOSDAQ'),
-    ('298380.KQ', '에이비엘바이오', 'KOSDAQ'),
-    ('277810.KQ', '레인보우로보틱스', 'KOSDAQ'),
-    ('000250.KQ', '삼천당제약', 'KOSDAQ'),
-    ('028300.KQ', 'HLB', 'KOSDAQ'),
-    ('950160.KQ', '코오롱티슈진', 'KOSDAQ'),
-    ('141080.KQ', '리가켐바이오', 'KOSDAQ'),
-    ('087010.KQ', '펩트론', 'KOSDAQ'),
-    ('058470.KQ', '리노공업', 'KOSDAQ'),
-    ('214450.KQ', '파마리서치', 'KOSDAQ'),
-    ('214370.KQ', '케어젠', 'KOSDAQ'),
-    ('214150.KQ', '클래시스', 'KOSDAQ'),
-    ('240810.KQ', '원익IPS', 'KOSDAQ'),
-    ('319400.KQ', '현대무벡스', 'KOSDAQ'),
-    ('347850.KQ', '디앤디파마텍', 'KOSDAQ'),
-    ('039030.KQ', '이오테크닉스', 'KOSDAQ'),
-    ('310210.KQ', '보로노이', 'KOSDAQ'),
-    ('108490.KQ', '로보티즈', 'KOSDAQ'),
-    ('140410.KQ', '메지온', 'KOSDAQ'),
-    ('0009K0.KQ', '에임드바이오', 'KOSDAQ'),
-    ('145020.KQ', '휴젤', 'KOSDAQ'),
-    ('030530.KQ', '원익홀딩스', 'KOSDAQ'),
-    ('257720.KQ', '실리콘투', 'KOSDAQ'),
-    ('237690.KQ', '에스티팜', 'KOSDAQ'),
-    ('403870.KQ', 'HPSP', 'KOSDAQ'),
-    ('263750.KQ', '펄어비스', 'KOSDAQ'),
-    ('068760.KQ', '셀트리온제약', 'KOSDAQ'),
-    ('226950.KQ', '올릭스', 'KOSDAQ'),
-    ('357780.KQ', '솔브레인', 'KOSDAQ'),
-    ('041510.KQ', '에스엠', 'KOSDAQ'),
-    ('475830.KQ', '오름테라퓨틱', 'KOSDAQ'),
-    ('035900.KQ', 'JYP Ent.', 'KOSDAQ'),
-    ('058610.KQ', '에스피지', 'KOSDAQ'),
-    ('095340.KQ', 'ISC', 'KOSDAQ'),
-    ('160190.KQ', '하이젠알앤엠', 'KOSDAQ'),
-    ('445680.KQ', '큐리옥스바이오시스템즈', 'KOSDAQ'),
-    ('005290.KQ', '동진쎄미켐', 'KOSDAQ'),
-    ('476830.KQ', '알지노믹스', 'KOSDAQ'),
-    ('083650.KQ', '비에이치아이', 'KOSDAQ'),
-    ('064760.KQ', '티씨케이', 'KOSDAQ'),
-    ('437730.KQ', '삼현', 'KOSDAQ'),
-    ('098460.KQ', '고영', 'KOSDAQ'),
-    ('458870.KQ', '씨어스테크놀로지', 'KOSDAQ'),
-    ('222800.KQ', '심텍', 'KOSDAQ'),
-    ('090710.KQ', '휴림로봇', 'KOSDAQ'),
-    ('178320.KQ', '서진시스템', 'KOSDAQ'),
-    ('084370.KQ', '유진테크', 'KOSDAQ'),
-    ('065350.KQ', '신성델타테크', 'KOSDAQ'),
-    ('067310.KQ', '하나마이크론', 'KOSDAQ'),
-    ('140860.KQ', '파크시스템스', 'KOSDAQ'),
-    ('039200.KQ', '오스코텍', 'KOSDAQ'),
-    ('466100.KQ', '클로봇', 'KOSDAQ'),
-    ('099320.KQ', '쎄트렉아이', 'KOSDAQ'),
-    ('491000.KQ', '리브스메드', 'KOSDAQ'),
-    ('036930.KQ', '주성엔지니어링', 'KOSDAQ'),
-    ('323280.KQ', '태성', 'KOSDAQ'),
-    ('060370.KQ', 'LS마린솔루션', 'KOSDAQ'),
-    ('035760.KQ', 'CJ ENM', 'KOSDAQ'),
-    ('290650.KQ', '엘앤씨바이오', 'KOSDAQ'),
-    ('348370.KQ', '엔켐', 'KOSDAQ'),
-    ('348340.KQ', '뉴로메카', 'KOSDAQ'),
-    ('195940.KQ', 'HK이노엔', 'KOSDAQ'),
-    ('101490.KQ', '에스앤에스텍', 'KOSDAQ'),
-    ('253450.KQ', '스튜디오드래곤', 'KOSDAQ'),
-    ('089030.KQ', '테크윙', 'KOSDAQ'),
-    ('007390.KQ', '네이처셀', 'KOSDAQ'),
-    ('293490.KQ', '카카오게임즈', 'KOSDAQ'),
-    ('281740.KQ', '레이크머티리얼즈', 'KOSDAQ'),
-    ('122870.KQ', '와이지엔터테인먼트', 'KOSDAQ'),
-    ('003380.KQ', '하림지주', 'KOSDAQ'),
-    ('085660.KQ', '차바이오텍', 'KOSDAQ'),
-    ('031980.KQ', '피에스케이홀딩스', 'KOSDAQ'),
-    ('456160.KQ', '지투지바이오', 'KOSDAQ'),
-    ('096530.KQ', '씨젠', 'KOSDAQ'),
-    ('174900.KQ', '앱클론', 'KOSDAQ'),
-    ('388720.KQ', '유일로보틱스', 'KOSDAQ'),
-    ('204270.KQ', '제이앤티씨', 'KOSDAQ'),
-    ('232140.KQ', '와이씨', 'KOSDAQ'),
-    ('032820.KQ', '우리기술', 'KOSDAQ'),
-    ('397030.KQ', '에이프릴바이오', 'KOSDAQ'),
-    ('319660.KQ', '피에스케이', 'KOSDAQ'),
-    ('328130.KQ', '루닛', 'KOSDAQ'),
-    ('082270.KQ', '젬백스', 'KOSDAQ'),
-    ('115180.KQ', '큐리언트', 'KOSDAQ'),
-    ('078600.KQ', '대주전자재료', 'KOSDAQ'),
-    ('161580.KQ', '필옵틱스', 'KOSDAQ'),
-    ('166090.KQ', '하나머티리얼즈', 'KOSDAQ'),
-    ('295310.KQ', '에이치브이엠', 'KOSDAQ'),
-    ('056080.KQ', '유진로봇', 'KOSDAQ'),
-    ('131970.KQ', '두산테스나', 'KOSDAQ'),
-    ('440110.KQ', '파두', 'KOSDAQ'),
-    ('137400.KQ', '피엔티', 'KOSDAQ'),
-    ('183300.KQ', '코미코', 'KOSDAQ'),
-    ('376900.KQ', '로킷헬스케어', 'KOSDAQ'),
-    ('080220.KQ', '제주반도체', 'KOSDAQ'),
-    ('347700.KQ', '스피어', 'KOSDAQ'),
-    ('006730.KQ', '서부T&D', 'KOSDAQ'),
-    ('389470.KQ', '인벤티지랩', 'KOSDAQ'),
-]
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'kr_top_stocks.csv')
+
+StockRow = Tuple[str, str, str]   # (티커 "005930.KS", 종목명, 시장)
+
+_stocks: Optional[List[StockRow]] = None
+_by_code: Dict[str, StockRow] = {}
+_lock = threading.Lock()
+
+
+def get_kr_top_stocks() -> List[StockRow]:
+    global _stocks
+    if _stocks is not None:
+        return _stocks
+    with _lock:
+        if _stocks is None:
+            with open(DATA_PATH, 'r', encoding='utf-8', newline='') as f:
+                rows = [tuple(r) for r in csv.reader(f)][1:]
+            _by_code.update({r[0].split('.')[0]: r for r in rows})
+            _stocks = rows
+    return _stocks
+
+
+def get_stock(code: str) -> Optional[StockRow]:
+    """'005930' / '005930.KS' → (티커, 종목명, 시장), 없으면 None"""
+    get_kr_top_stocks()
+    return _by_code.get(code.split('.')[0])
+
+
+def __getattr__(name):
+    if name == 'KR_TOP_STOCKS':
+        return get_kr_top_stocks()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,238 @@
+"""
+백테스트 파라미터 스윕 (멀티코어)
+- BacktestData 배열을 shared_memory 블록 1개에 올리고 워커는 이름으로 붙어서 뷰로 사용 (데이터 복사 없음)
+- 파라미터 그리드를 프로세스 풀에 분배, 결과는 요약 지표만 담은 dict 테이블로 수집
+
+사용 예:
+    python -m engine.sweep --type vcp --stop 3,5,7 --target 10,15,20 --hold 5,10,15
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import product
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import BacktestConfig
+from engine.backtest import BacktestData, prepare_data, run_backtest
+
+# shared_memory 로 올리는 수치 배열 (object 배열/문자열은 워커 초기화 시 1회 전달)
+SHARED_FIELDS = (
+    'open', 'high', 'low', 'close', 'cols', 'base', 'entry_price', 'score',
+    'usd_krw', 'kospi', 'kosdaq', 'has_flow',
+)
+OBJECT_FIELDS = ('signal_type', 'regime', 'codes', 'names')
+
+# 결과 테이블 컬럼
+RESULT_FIELDS = (
+    'total_trades', 'win_rate', 'avg_return_pct', 'avg_r_multiple', 'total_r',
+    'total_return_pct', 'max_drawdown_pct', 'sharpe_ratio', 'alpha', 'avg_holding_days',
+)
+
+_ALIGN = 64
+
+
+class SharedBacktestData:
+    """BacktestData 를 공유 메모리에 배치 (생성한 프로세스가 해제 책임)"""
+
+    def __init__(self, data: BacktestData):
+        arrays = {f: np.ascontiguousarray(getattr(data, f)) for f in SHARED_FIELDS}
+        arrays['dates'] = np.ascontiguousarray(data.dates.asi8)
+
+        layout, offset = [], 0
+        for name, arr in arrays.items():
+            offset = -(-offset // _ALIGN) * _ALIGN
+            layout.append((name, arr.dtype.str, arr.shape, offset))
+            offset += arr.nbytes
+
+        self.shm = SharedMemory(create=True, size=max(offset, 1))
+        for name, dtype, shape, off in layout:
+            np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=off)[...] = arrays[name]
+
+        self.spec = {
+            'name': self.shm.name,
+            'layout': layout,
+            'objects': {f: getattr(data, f) for f in OBJECT_FIELDS},
+        }
+
+    def close(self):
+        if self.shm is None:
+            return
+        shm, self.shm = self.shm, None
+        shm.close()
+        shm.unlink()
+
+    def __enter__(self) -> 'SharedBacktestData':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _attach_shm(name: str) -> SharedMemory:
+    """기존 블록에 연결. 해제(unlink)는 만든 부모 프로세스 담당
+    - 3.13+: track=False 로 추적 제외
+    - 이전 버전: 워커는 부모의 resource_tracker 를 공유하므로 중복 등록만 되고 그대로 둠
+      (워커에서 unregister 하면 부모 등록까지 지워져 부모 비정상 종료 시 블록이 남음)
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def attach(spec: Dict) -> Tuple[SharedMemory, BacktestData]:
+    """공유 메모리 뷰로 BacktestData 재구성 (읽기 전용)"""
+    shm = _attach_shm(spec['name'])
+    views = {}
+    for name, dtype, shape, off in spec['layout']:
+        view = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=off)
+        view.flags.writeable = False
+        views[name] = view
+    data = BacktestData(
+        dates=pd.DatetimeIndex(views.pop('dates')),
+        **views,
+        **spec['objects'],
+    )
+    return shm, data
+
+
+# === 워커 ===
+_worker_shm: Optional[SharedMemory] = None
+_worker_data: Optional[BacktestData] = None
+
+
+def _init_worker(spec: Dict):
+    global _worker_shm, _worker_data
+    _worker_shm, _worker_data = attach(spec)
+
+
+def _summarize(name: str, params: Dict, data: BacktestData, config: BacktestConfig) -> Dict:
+    result = run_backtest(data, config, config_name=name, include_trades=False)
+    row = {'name': name, **params}
+    row.update({f: getattr(result, f) for f in RESULT_FIELDS})
+    return row
+
+
+def _run_one(item: Tuple[str, Dict, BacktestConfig]) -> Dict:
+    name, params, config = item
+    return _summarize(name, params, _worker_data, config)
+
+
+# === 그리드 ===
+def param_grid(base: BacktestConfig = None, **axes: Iterable) -> List[Tuple[str, Dict, BacktestConfig]]:
+    """BacktestConfig 필드별 값 목록의 데카르트 곱
+
+    예: param_grid(stop_loss_pct=[3, 5], max_hold_days=[10, 15]) → 4개 조합
+    """
+    base = base or BacktestConfig()
+    keys = list(axes)
+    grid = []
+    for values in product(*(list(axes[k]) for k in keys)):
+        params = dict(zip(keys, values))
+        name = ','.join(f"{k}={v}" for k, v in params.items()) or 'default'
+        grid.append((name, params, replace(base, **params)))
+    return grid
+
+
+def preset_grid() -> List[Tuple[str, Dict, BacktestConfig]]:
+    """BacktestConfig 프리셋 (default / conservative / aggressive)"""
+    return [
+        ('default', {}, BacktestConfig()),
+        ('conservative', {}, BacktestConfig.conservative()),
+        ('aggressive', {}, BacktestConfig.aggressive()),
+    ]
+
+
+def run_sweep(
+    data: BacktestData,
+    grid: List[Tuple[str, Dict, BacktestConfig]],
+    workers: Optional[int] = None,
+    sort_by: str = 'sharpe_ratio',
+) -> List[Dict]:
+    """그리드 전체 백테스트 → 요약 테이블 (sort_by 내림차순)
+
+    workers: None=CPU 코어 수, 1=현재 프로세스에서 순차 실행
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(grid))
+
+    if workers <= 1:
+        rows = [_summarize(name, params, data, config) for name, params, config in grid]
+    else:
+        with SharedBacktestData(data) as shared:
+            # spawn: 웹 서버/스케줄러 스레드가 있는 프로세스에서도 안전하게 워커 생성
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(shared.spec,),
+            ) as pool:
+                chunksize = max(1, len(grid) // (workers * 4))
+                rows = list(pool.map(_run_one, grid, chunksize=chunksize))
+
+    if sort_by:
+        rows.sort(key=lambda r: r.get(sort_by) or 0, reverse=True)
+    return rows
+
+
+def _parse_values(text: Optional[str], cast) -> Optional[List]:
+    if not text:
+        return None
+    return [cast(v) for v in text.split(',') if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest parameter sweep')
+    parser.add_argument('--type', default='vcp', choices=['vcp', 'jongga_v2'])
+    parser.add_argument('--start')
+    parser.add_argument('--end')
+    parser.add_argument('--stop', help='stop_loss_pct 목록 (예: 3,5,7)')
+    parser.add_argument('--target', help='take_profit_pct 목록')
+    parser.add_argument('--trailing', help='trailing_stop_pct 목록')
+    parser.add_argument('--hold', help='max_hold_days 목록')
+    parser.add_argument('--presets', action='store_true', help='프리셋 3종 포함')
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--sort', default='sharpe_ratio')
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--out', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    from engine.backtest import load_kr_signals
+
+    axes = {
+        'stop_loss_pct': _parse_values(args.stop, float),
+        'take_profit_pct': _parse_values(args.target, float),
+        'trailing_stop_pct': _parse_values(args.trailing, float),
+        'max_hold_days': _parse_values(args.hold, int),
+    }
+    axes = {k: v for k, v in axes.items() if v}
+    grid = param_grid(**axes) if axes else []
+    if args.presets or not grid:
+        grid = preset_grid() + grid
+
+    print(f"[Sweep] 시그널 로드 ({args.type})...")
+    data = prepare_data(load_kr_signals(args.type, start=args.start, end=args.end))
+    if data is None:
+        print("[Sweep] 가격 데이터가 있는 시그널 없음")
+        return
+
+    print(f"[Sweep] {len(grid)}개 조합 / 시그널 {len(data.base)}개 / {data.n_days}거래일")
+    rows = run_sweep(data, grid, workers=args.workers, sort_by=args.sort)
+
+    table = pd.DataFrame(rows).head(args.top)
+    print(table.to_string(index=False))
+    if args.out:
+        from engine.persist import write_json
+        write_json(args.out, {'type': args.type, 'sort_by': args.sort, 'rows': rows})
+        print(f"[Sweep] 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
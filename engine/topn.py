@@ -0,0 +1,50 @@
+"""
+크기 제한 상위 N 힙
+- 유니버스 전체를 정렬하지 않고 스트리밍으로 상위 N개만 유지 (메모리 O(N), 삽입 O(log N))
+"""
+
+import heapq
+from itertools import count
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class TopN(Generic[T]):
+    """key 가 큰 순으로 N개 유지 (동점은 먼저 들어온 항목 우선)"""
+
+    def __init__(self, n: int, key: Callable[[T], float]):
+        self.n = max(int(n), 0)
+        self.key = key
+        self._heap: List[Tuple[float, int, T]] = []   # 최소 힙 - 루트가 현재 N위
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def threshold(self) -> Optional[float]:
+        """가득 찼을 때 진입 기준 (N위 key), 아니면 None"""
+        return self._heap[0][0] if len(self._heap) >= self.n and self._heap else None
+
+    def push(self, item: T) -> Tuple[bool, Optional[T]]:
+        """(진입 여부, 밀려난 항목)"""
+        if self.n == 0:
+            return False, None
+        # 동점이면 먼저 들어온 항목이 남도록 순번을 음수로 (최소 힙에서 나중 항목이 먼저 빠짐)
+        entry = (self.key(item), -next(self._seq), item)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+            return True, None
+        if entry[:2] <= self._heap[0][:2]:
+            return False, None
+        evicted = heapq.heapreplace(self._heap, entry)[2]
+        return True, evicted
+
+    def extend(self, items) -> None:
+        for item in items:
+            self.push(item)
+
+    def items(self) -> List[T]:
+        """key 내림차순"""
+        return [e[2] for e in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
@@ -1,11 +1,11 @@
 """
 상위 시가총액 종목 리스트 생성 스크립트 (FinanceDataReader 사용)
-KOSPI 상위 200개 + KOSDAQ 상위 100개 추출하여 engine/stock_list_data.py 생성
+KOSPI 상위 200개 + KOSDAQ 상위 100개 추출하여 engine/data/kr_top_stocks.csv 생성
 """
 
+import csv
 import os
 import FinanceDataReader as fdr
-from datetime import datetime
 
 def generate_stock_list():
     print(f"Fetching stock data using FinanceDataReader...")
@@ -42,24 +42,14 @@ def generate_stock_list():
             name = row['Name']
             kosdaq_list.append((f"{code}.KQ", name, "KOSDAQ"))
 
-        # 3. 파일 생성
-        output_path = os.path.join("engine", "stock_list_data.py")
+        # 3. 파일 생성 (engine.stock_list_data 가 첫 사용 시 로드)
+        output_path = os.path.join("engine", "data", "kr_top_stocks.csv")
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("# Auto-generated stock list by fetch_stock_list.py (via FinanceDataReader)\n")
-            f.write(f"# Generated at: {datetime.now()}\n\n")
-            
-            f.write("KR_TOP_STOCKS = [\n")
-            
-            f.write("    # KOSPI Top 200\n")
-            for item in kospi_list:
-                f.write(f"    {str(item)},\n")
-                
-            f.write("\n    # KOSDAQ Top 100\n")
-            for item in kosdaq_list:
-                f.write(f"    {str(item)},\n")
-                
-            f.write("]\n")
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["ticker", "name", "market"])
+            writer.writerows(kospi_list + kosdaq_list)
             
         print(f"Successfully generated {output_path}")
         print(f"KOSPI: {len(kospi_list)}, KOSDAQ: {len(kosdaq_list)}")
@@ -2,7 +2,7 @@
 
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
-import { jpAPI, JPSignal, JPSignalsResponse } from '@/lib/api';
+import { jpAPI, JPSignal, JPSignalsResponse, waitForScreenerJob } from '@/lib/api';
 import GuideModal from '@/components/GuideModal';
 
 export default function JPClosingBetPage() {
@@ -11,6 +11,7 @@ export default function JPClosingBetPage() {
     const [availableDates, setAvailableDates] = useState<string[]>([]);
     const [loading, setLoading] = useState(true);
     const [running, setRunning] = useState(false);
+    const [progress, setProgress] = useState<number | null>(null);
     const [selectedGrade, setSelectedGrade] = useState<string | null>(null);
     const [chartModal, setChartModal] = useState<{isOpen: boolean; symbol: string; name: string}>({
         isOpen: false, symbol: '', name: ''
@@ -58,26 +59,13 @@ export default function JPClosingBetPage() {
         if (running) return;
         setRunning(true);
         try {
-            await jpAPI.runScreener();
-            
-            // Polling
-            const pollInterval = setInterval(async () => {
-                try {
-                    const status = await jpAPI.getScreenerStatus();
-                    
-                    if (!status.isRunning) {
-                        clearInterval(pollInterval);
-                        setRunning(false);
-                        alert(`스크리닝 완료! ${status.message}`);
-                        const latestData = await jpAPI.getJonggaLatest();
-                        setData(latestData);
-                    }
-                } catch (e) {
-                    console.error('Polling error:', e);
-                    clearInterval(pollInterval);
-                    setRunning(false);
-                }
-            }, 3000);
+            const { job_id } = await jpAPI.runScreener();
+            const status = await waitForScreenerJob('jp', job_id, (s) => setProgress(s.progress ?? null));
+            setRunning(false);
+            setProgress(null);
+            alert(`스크리닝 완료! ${status.message}`);
+            const latestData = await jpAPI.getJonggaLatest();
+            setData(latestData);
         } catch {
             alert('스크리닝 실행 중 오류가 발생했습니다.');
             setRunning(false);
@@ -155,7 +143,7 @@ export default function JPClosingBetPage() {
                     {running ? (
                         <>
                             <span className="w-4 h-4 border-2 border-white/30 border-t-white rounded-full animate-spin"></span>
-                            실행 중...
+                            실행 중{progress !== null ? ` ${progress}%` : ''}...
                         </>
                     ) : (
                         <>🔄 스크리너 실행</>
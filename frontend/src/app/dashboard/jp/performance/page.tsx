@@ -5,6 +5,7 @@ import Link from 'next/link';
 import { jpAPI, PerformanceAnalysisResult, PerformanceRow, DailyStat } from '@/lib/api';
 import GuideModal from '@/components/GuideModal';
 import JPChartModal from '@/components/JPChartModal';
+import PerformanceMatrixSummary from '@/components/PerformanceMatrixSummary';
 
 export default function JPPerformancePage() {
     const [targetType, setTargetType] = useState<'n225' | 'n400'>('n225');
@@ -155,6 +156,12 @@ export default function JPPerformancePage() {
                 </div>
             </div>
 
+            <PerformanceMatrixSummary
+                load={() => jpAPI.getPerformanceMatrix(targetType)}
+                reloadKey={targetType}
+                selectedGrade={selectedGrade}
+            />
+
             {loading ? (
                  <div className="flex flex-col items-center justify-center h-64">
                     <div className="w-8 h-8 border-2 border-rose-500 border-t-transparent rounded-full animate-spin mb-4"></div>
@@ -2,7 +2,7 @@
 
 import { useEffect, useState } from 'react';
 import Link from 'next/link';
-import { jpAPI, JPVCPResult } from '@/lib/api';
+import { jpAPI, JPVCPResult, openMarketStream, waitForScreenerJob } from '@/lib/api';
 import GuideModal from '@/components/GuideModal';
 import JPChartModal from '@/components/JPChartModal';
 
@@ -10,6 +10,7 @@ export default function JPVCPSignalsPage() {
     const [signals, setSignals] = useState<JPVCPResult[]>([]);
     const [loading, setLoading] = useState(true);
     const [running, setRunning] = useState(false);
+    const [progress, setProgress] = useState<number | null>(null);
     const [showGuide, setShowGuide] = useState(false);
     const [lastUpdated, setLastUpdated] = useState<string>('');
     const [signalDate, setSignalDate] = useState<string>('');
@@ -83,74 +84,47 @@ export default function JPVCPSignalsPage() {
         }
     };
 
-    // Real-time price updates
+    // Real-time price updates (SSE quotes stream)
     useEffect(() => {
         if (loading || signals.length === 0) return;
 
-        const updatePrices = async () => {
-            try {
-                const tickers = signals.map(s => s.code);
-                if (tickers.length === 0) return;
-
-                const res = await fetch('/api/jp/realtime-prices', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ tickers })
-                });
-                const prices = await res.json();
-
-                if (Object.keys(prices).length > 0) {
-                    setSignals(prev => prev.map(s => {
-                        if (prices[s.code]) {
-                            const current = prices[s.code];
-                            const entry = s.entry_price || s.current_price || 0;
-                            let ret = 0;
-                            if (entry > 0) {
-                                ret = ((current - entry) / entry) * 100;
-                            }
-                            return { ...s, current_price: current, return_pct: ret };
+        const tickers = signals.map(s => s.code);
+        return openMarketStream({
+            jp: tickers,
+            onQuotes: ({ prices }) => {
+                setSignals(prev => prev.map(s => {
+                    if (prices[s.code]) {
+                        const current = prices[s.code];
+                        const entry = s.entry_price || s.current_price || 0;
+                        let ret = 0;
+                        if (entry > 0) {
+                            ret = ((current - entry) / entry) * 100;
                         }
-                        return s;
-                    }));
-                    setLastUpdated(new Date().toLocaleTimeString('ko-KR', { hour: '2-digit', minute: '2-digit' }));
-                }
-            } catch (e) {
-                console.error('Price update failed:', e);
-            }
-        };
-
-        updatePrices();
-        const interval = setInterval(updatePrices, 60000);
-        return () => clearInterval(interval);
-    }, [signals, loading]);
+                        return { ...s, current_price: current, return_pct: ret };
+                    }
+                    return s;
+                }));
+                setLastUpdated(new Date().toLocaleTimeString('ko-KR', { hour: '2-digit', minute: '2-digit' }));
+            },
+        });
+    }, [signals.length, loading]); // 시세 갱신마다 재연결하지 않도록 종목 수 기준
 
     const handleRunScreener = async () => {
         if (running) return;
         setRunning(true);
         try {
-            await jpAPI.runVCPScreener();
-
-            const pollInterval = setInterval(async () => {
-                try {
-                    const status = await jpAPI.getScreenerStatus();
-                    if (!status.isRunning) {
-                        clearInterval(pollInterval);
-                        setRunning(false);
+            const { job_id } = await jpAPI.runVCPScreener();
+            const status = await waitForScreenerJob('jp', job_id, (s) => setProgress(s.progress ?? null));
+            setRunning(false);
+            setProgress(null);
 
-                        // Check if message indicates error
-                        if (status.message && status.message.startsWith('Error:')) {
-                            alert(`스크리닝 실패: ${status.message}`);
-                        } else {
-                            alert(status.message || 'JP VCP 스캔 완료');
-                            await loadSignals();
-                        }
-                    }
-                } catch (e) {
-                    console.error('Polling error:', e);
-                    clearInterval(pollInterval);
-                    setRunning(false);
-                }
-            }, 3000);
+            // Check if message indicates error
+            if (status.message && status.message.startsWith('Error:')) {
+                alert(`스크리닝 실패: ${status.message}`);
+            } else {
+                alert(status.message || 'JP VCP 스캔 완료');
+                await loadSignals();
+            }
         } catch (error) {
             console.error('Screening error:', error);
             alert('스크리너 실행 요청 실패');
@@ -247,7 +221,7 @@ export default function JPVCPSignalsPage() {
                     ) : (
                         <div className="text-2xl mb-1">🔄</div>
                     )}
-                    <div className="text-xs text-gray-500">{running ? 'Running...' : 'Run Screener'}</div>
+                    <div className="text-xs text-gray-500">{running ? `Running...${progress !== null ? ` ${progress}%` : ''}` : 'Run Screener'}</div>
                 </button>
             </div>
 
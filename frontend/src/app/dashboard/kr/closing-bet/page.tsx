@@ -2,7 +2,7 @@
 
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
-import { krAPI, KRSignal, ScreenerResult } from '@/lib/api';
+import { krAPI, KRSignal, ScreenerResult, openMarketStream, waitForScreenerJob } from '@/lib/api';
 import GuideModal from '@/components/GuideModal';
 
 export default function JonggaV2Page() {
@@ -11,6 +11,7 @@ export default function JonggaV2Page() {
     const [availableDates, setAvailableDates] = useState<string[]>([]);
     const [loading, setLoading] = useState(true);
     const [running, setRunning] = useState(false);
+    const [progress, setProgress] = useState<number | null>(null);
     const [showGuide, setShowGuide] = useState(false);
     const [chartModal, setChartModal] = useState<{isOpen: boolean; symbol: string; name: string}>({
         isOpen: false, symbol: '', name: ''
@@ -44,58 +45,40 @@ export default function JonggaV2Page() {
         fetchInitialData();
     }, []);
 
-    // 실시간 가격 업데이트 (60초 주기)
+    // 실시간 가격 업데이트 (SSE 시세 스트림)
     useEffect(() => {
         if (loading || !data?.signals || data.signals.length === 0) return;
 
-        const updatePrices = async () => {
-            try {
-                const tickers = data.signals.map(s => s.stock_code); // closing-bet uses stock_code instead of ticker? Check API types.
-                // Assuming KRSignal has stock_code. VCP uses ticker. Let's check type definition or usage.
-                // In SignalCard usage: signal.stock_code. So allow stock_code.
-                if (tickers.length === 0) return;
-
-                const res = await fetch('/api/kr/realtime-prices', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ tickers })
-                });
-                const prices = await res.json();
-
-                if (Object.keys(prices).length > 0) {
-                    setData(prev => {
-                        if (!prev) return null;
-                        return {
-                            ...prev,
-                            signals: prev.signals.map(s => {
-                                const code = s.stock_code; // krAPI uses stock_code for Jongga
-                                if (prices[code]) {
-                                    const current = prices[code];
-                                    const entry = s.entry_price || s.current_price || 0;
-                                    let ret = 0;
-                                    if (entry > 0) {
-                                        ret = ((current - entry) / entry) * 100;
-                                    }
-                                    return { 
-                                        ...s, 
-                                        current_price: current, 
-                                        return_pct: ret,
-                                        entry_price: entry 
-                                    };
+        const tickers = data.signals.map(s => s.stock_code); // 종가베팅 시그널은 stock_code 사용
+        return openMarketStream({
+            kr: tickers,
+            onQuotes: ({ prices }) => {
+                setData(prev => {
+                    if (!prev) return null;
+                    return {
+                        ...prev,
+                        signals: prev.signals.map(s => {
+                            const code = s.stock_code;
+                            if (prices[code]) {
+                                const current = prices[code];
+                                const entry = s.entry_price || s.current_price || 0;
+                                let ret = 0;
+                                if (entry > 0) {
+                                    ret = ((current - entry) / entry) * 100;
                                 }
-                                return s;
-                            })
-                        };
-                    });
-                }
-            } catch (e) {
-                console.error('Price update failed:', e);
-            }
-        };
-
-        const interval = setInterval(updatePrices, 60000);
-        updatePrices(); // Run immediately once
-        return () => clearInterval(interval);
+                                return { 
+                                    ...s, 
+                                    current_price: current, 
+                                    return_pct: ret,
+                                    entry_price: entry 
+                                };
+                            }
+                            return s;
+                        })
+                    };
+                });
+            },
+        });
     }, [data?.date, loading]); // signal list dependency
 
     const handleDateChange = async (dateStr: string) => {
@@ -138,25 +121,13 @@ export default function JonggaV2Page() {
             const res = await fetch('/api/kr/jongga-v2/run', { method: 'POST' });
             
             if (res.status === 202 || res.status === 200) {
-                // Polling start
-                const pollInterval = setInterval(async () => {
-                    try {
-                        const statusRes = await fetch('/api/kr/screener/status');
-                        const status = await statusRes.json();
-                        
-                        if (!status.isRunning) {
-                            clearInterval(pollInterval);
-                            setRunning(false);
-                            alert(`스크리닝 완료! ${status.message}`);
-                            const latestData = await krAPI.getJonggaLatest();
-                            setData(latestData);
-                        }
-                    } catch (e) {
-                        console.error('Polling error:', e);
-                        clearInterval(pollInterval);
-                        setRunning(false);
-                    }
-                }, 3000);
+                const { job_id } = await res.json();
+                const status = await waitForScreenerJob('kr', job_id, (s) => setProgress(s.progress ?? null));
+                setRunning(false);
+                setProgress(null);
+                alert(`스크리닝 완료! ${status.message}`);
+                const latestData = await krAPI.getJonggaLatest();
+                setData(latestData);
             } else {
                 throw new Error('API error');
             }
@@ -232,7 +203,7 @@ export default function JonggaV2Page() {
                     {running ? (
                         <>
                             <span className="w-4 h-4 border-2 border-white/30 border-t-white rounded-full animate-spin"></span>
-                            실행 중...
+                            실행 중{progress !== null ? ` ${progress}%` : ''}...
                         </>
                     ) : (
                         <>🔄 스크리너 실행</>
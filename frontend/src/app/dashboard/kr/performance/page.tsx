@@ -3,6 +3,7 @@
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
 import { krAPI, PerformanceAnalysisResult, PerformanceRow, DailyStat } from '@/lib/api';
+import PerformanceMatrixSummary from '@/components/PerformanceMatrixSummary';
 
 export default function PerformancePage() {
     const [availableDates, setAvailableDates] = useState<string[]>([]);
@@ -113,6 +114,11 @@ export default function PerformancePage() {
                 </div>
             </div>
 
+            <PerformanceMatrixSummary
+                load={() => krAPI.getPerformanceMatrix('jongga_v2')}
+                selectedGrade={selectedGrade}
+            />
+
             {loading ? (
                  <div className="flex flex-col items-center justify-center h-64">
                     <div className="w-8 h-8 border-2 border-blue-500 border-t-transparent rounded-full animate-spin mb-4"></div>
@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState } from 'react';
-import { krAPI } from '@/lib/api';
+import { krAPI, openMarketStream, waitForScreenerJob } from '@/lib/api';
 import GuideModal from '@/components/GuideModal';
 
 interface KRSignal {
@@ -30,6 +30,7 @@ export default function VCPSignalsPage() {
     const [signals, setSignals] = useState<KRSignal[]>([]);
     const [loading, setLoading] = useState(true);
     const [running, setRunning] = useState(false);
+    const [progress, setProgress] = useState<number | null>(null);
     const [showGuide, setShowGuide] = useState(false);
     const [lastUpdated, setLastUpdated] = useState<string>('');
     const [signalDate, setSignalDate] = useState<string>('');
@@ -75,51 +76,31 @@ export default function VCPSignalsPage() {
         }
     };
 
-    // Real-time price updates (every 60s)
-    // Real-time price updates
+    // Real-time price updates (SSE quotes stream)
     useEffect(() => {
         if (loading || signals.length === 0) return;
 
-        const updatePrices = async () => {
-            try {
-                const tickers = signals.map(s => s.ticker);
-                if (tickers.length === 0) return;
-
-                const res = await fetch('/api/kr/realtime-prices', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ tickers })
-                });
-                const prices = await res.json();
-
-                if (Object.keys(prices).length > 0) {
-                    setSignals(prev => prev.map(s => {
-                        if (prices[s.ticker]) {
-                            const current = prices[s.ticker];
-                            // entry_price가 없으면 기존(로딩시) current_price를 사용
-                            const entry = s.entry_price || s.current_price || 0;
-                            let ret = 0;
-                            if (entry > 0) {
-                                ret = ((current - entry) / entry) * 100;
-                            }
-                            return { ...s, current_price: current, return_pct: ret, entry_price: entry };
+        const tickers = signals.map(s => s.ticker);
+        return openMarketStream({
+            kr: tickers,
+            onQuotes: ({ prices }) => {
+                setSignals(prev => prev.map(s => {
+                    if (prices[s.ticker]) {
+                        const current = prices[s.ticker];
+                        // entry_price가 없으면 기존(로딩시) current_price를 사용
+                        const entry = s.entry_price || s.current_price || 0;
+                        let ret = 0;
+                        if (entry > 0) {
+                            ret = ((current - entry) / entry) * 100;
                         }
-                        return s;
-                    }));
-                    setLastUpdated(new Date().toLocaleTimeString('ko-KR', { hour: '2-digit', minute: '2-digit' }));
-                }
-            } catch (e) {
-                console.error('Price update failed:', e);
-            }
-        };
-
-        // 초기 로딩 후 즉시 실행
-        updatePrices();
-
-        // 이후 60초마다 갱신
-        const interval = setInterval(updatePrices, 60000);
-        return () => clearInterval(interval);
-    }, [signals.length]); // signals.length가 변할 때(로딩 완료 시) 실행
+                        return { ...s, current_price: current, return_pct: ret, entry_price: entry };
+                    }
+                    return s;
+                }));
+                setLastUpdated(new Date().toLocaleTimeString('ko-KR', { hour: '2-digit', minute: '2-digit' }));
+            },
+        });
+    }, [signals.length]); // signals.length가 변할 때(로딩 완료 시) 재구독
 
     const loadSignals = async () => {
         setLoading(true);
@@ -153,24 +134,12 @@ export default function VCPSignalsPage() {
         try {
             const res = await fetch('/api/kr/vcp/run', { method: 'POST' });
             if (res.status === 202 || res.status === 200) {
-                // Polling start
-                const pollInterval = setInterval(async () => {
-                    try {
-                        const statusRes = await fetch('/api/kr/screener/status');
-                        const status = await statusRes.json();
-                        
-                        if (!status.isRunning) {
-                            clearInterval(pollInterval);
-                            setRunning(false);
-                            alert(status.message || '스크리닝 완료');
-                            await loadSignals();
-                        }
-                    } catch (e) {
-                        console.error('Polling error:', e);
-                        clearInterval(pollInterval);
-                        setRunning(false);
-                    }
-                }, 3000);
+                const { job_id } = await res.json();
+                const status = await waitForScreenerJob('kr', job_id, (s) => setProgress(s.progress ?? null));
+                setRunning(false);
+                setProgress(null);
+                alert(status.message || '스크리닝 완료');
+                await loadSignals();
             } else {
                 throw new Error('API error');
             }
@@ -280,7 +249,7 @@ export default function VCPSignalsPage() {
                     ) : (
                         <div className="text-2xl mb-1">🔄</div>
                     )}
-                    <div className="text-xs text-gray-500">{running ? 'Running...' : 'Run Screener'}</div>
+                    <div className="text-xs text-gray-500">{running ? `Running...${progress !== null ? ` ${progress}%` : ''}` : 'Run Screener'}</div>
                 </button>
             </div>
 
@@ -2,7 +2,7 @@
 
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
-import { jpAPI, JPSignal, JPSignalsResponse } from '@/lib/api';
+import { jpAPI, JPSignal, JPSignalsResponse, openMarketStream, waitForScreenerJob } from '@/lib/api';
 import GuideModal from '@/components/GuideModal';
 import JPChartModal from '@/components/JPChartModal';
 
@@ -18,6 +18,7 @@ export default function JPSignalsPage({ type, title, description }: JPSignalsPag
     const [availableDates, setAvailableDates] = useState<string[]>([]);
     const [loading, setLoading] = useState(true);
     const [running, setRunning] = useState(false);
+    const [progress, setProgress] = useState<number | null>(null);
     const [selectedGrade, setSelectedGrade] = useState<string | null>(null);
     const [chartModal, setChartModal] = useState<{isOpen: boolean; symbol: string; name: string}>({
         isOpen: false, symbol: '', name: ''
@@ -64,71 +65,47 @@ export default function JPSignalsPage({ type, title, description }: JPSignalsPag
         if (running) return;
         setRunning(true);
         try {
-            await jpAPI.runScreener(type); // Runs specific type in backend
-            
-            // Polling
-            const pollInterval = setInterval(async () => {
-                try {
-                    const status = await jpAPI.getScreenerStatus();
-                    
-                    if (!status.isRunning) {
-                        clearInterval(pollInterval);
-                        setRunning(false);
-                        alert(`스크리닝 완료! ${status.message}`);
-                        // Refresh data for current type
-                        const latestData = await jpAPI.getJonggaLatest(type);
-                        setData(latestData);
-                    }
-                } catch (e) {
-                    console.error('Polling error:', e);
-                    clearInterval(pollInterval);
-                    setRunning(false);
-                }
-            }, 3000);
+            const { job_id } = await jpAPI.runScreener(type); // Runs specific type in backend
+            const status = await waitForScreenerJob('jp', job_id, (s) => setProgress(s.progress ?? null));
+            setRunning(false);
+            setProgress(null);
+            alert(`스크리닝 완료! ${status.message}`);
+            // Refresh data for current type
+            const latestData = await jpAPI.getJonggaLatest(type);
+            setData(latestData);
         } catch {
             alert('스크리닝 실행 중 오류가 발생했습니다.');
             setRunning(false);
         }
     };
 
-    // Real-time price polling
+    // Real-time prices (SSE quotes stream)
     useEffect(() => {
         if (loading || !data?.signals || data.signals.length === 0) return;
 
-        const updatePrices = async () => {
-            try {
-                const tickers = data.signals.map(s => s.code);
-                if (tickers.length === 0) return;
-
-                const prices = await jpAPI.getRealtimePrices(tickers);
-
-                if (Object.keys(prices).length > 0) {
-                    setData(prev => {
-                        if (!prev) return null;
-                        return {
-                            ...prev,
-                            signals: prev.signals.map(s => {
-                                if (prices[s.code]) {
-                                    const current = prices[s.code];
-                                    return { 
-                                        ...s, 
-                                        close: current,
-                                    };
-                                }
-                                return s;
-                            })
-                        };
-                    });
-                }
-            } catch (e) {
-                console.error('Price update failed:', e);
-            }
-        };
-
-        const interval = setInterval(updatePrices, 60000);
-        updatePrices();
-        return () => clearInterval(interval);
-    }, [data?.generated_at, loading, type, data?.signals]);
+        const tickers = data.signals.map(s => s.code);
+        return openMarketStream({
+            jp: tickers,
+            onQuotes: ({ prices }) => {
+                setData(prev => {
+                    if (!prev) return null;
+                    return {
+                        ...prev,
+                        signals: prev.signals.map(s => {
+                            if (prices[s.code]) {
+                                const current = prices[s.code];
+                                return { 
+                                    ...s, 
+                                    close: current,
+                                };
+                            }
+                            return s;
+                        })
+                    };
+                });
+            },
+        });
+    }, [data?.generated_at, loading, type, data?.signals?.length]); // 시세 갱신마다 재연결하지 않도록 종목 수 기준
 
     if (loading) {
         return (
@@ -212,7 +189,7 @@ export default function JPSignalsPage({ type, title, description }: JPSignalsPag
                     {running ? (
                         <>
                             <span className="w-4 h-4 border-2 border-white/30 border-t-white rounded-full animate-spin"></span>
-                            실행 중...
+                            실행 중{progress !== null ? ` ${progress}%` : ''}...
                         </>
                     ) : (
                         <>🔄 스크리너 실행</>
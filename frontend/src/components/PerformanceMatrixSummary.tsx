@@ -0,0 +1,118 @@
+'use client';
+
+import { useState, useEffect } from 'react';
+import { PerformanceMatrixResult, HorizonStat } from '@/lib/api';
+
+interface PerformanceMatrixSummaryProps {
+    // 전체 히스토리 성과 매트릭스 조회 (krAPI / jpAPI.getPerformanceMatrix)
+    load: () => Promise<PerformanceMatrixResult>;
+    reloadKey?: string;
+    selectedGrade?: string | null;
+}
+
+const HORIZON_KEYS = ['1d', '3d', '5d', '10d'] as const;
+const GRADE_ORDER = ['S', 'A', 'B', 'C'];
+
+function formatPct(value: number | null | undefined) {
+    if (value === null || value === undefined) return '-';
+    return `${value > 0 ? '+' : ''}${value.toFixed(2)}%`;
+}
+
+function pctColor(value: number | null | undefined) {
+    if (!value) return 'text-slate-500';
+    return value > 0 ? 'text-emerald-400' : 'text-rose-400';
+}
+
+function HorizonCell({ stat }: { stat?: HorizonStat }) {
+    if (!stat || !stat.count) {
+        return <td className="p-3 text-center text-slate-600">-</td>;
+    }
+    return (
+        <td className="p-3 text-center">
+            <div className={`font-bold ${pctColor(stat.avg_return)}`}>{formatPct(stat.avg_return)}</div>
+            <div className="text-[10px] text-slate-500">
+                적중 {stat.hit_rate !== null ? `${stat.hit_rate.toFixed(0)}%` : '-'} · {stat.count}건
+            </div>
+        </td>
+    );
+}
+
+export default function PerformanceMatrixSummary({ load, reloadKey, selectedGrade }: PerformanceMatrixSummaryProps) {
+    const [matrix, setMatrix] = useState<PerformanceMatrixResult | null>(null);
+    const [loading, setLoading] = useState(false);
+
+    useEffect(() => {
+        let cancelled = false;
+        setLoading(true);
+        load()
+            .then(data => { if (!cancelled) setMatrix(data); })
+            .catch(e => {
+                console.error("Failed to fetch performance matrix", e);
+                if (!cancelled) setMatrix(null);
+            })
+            .finally(() => { if (!cancelled) setLoading(false); });
+        return () => { cancelled = true; };
+        // eslint-disable-next-line react-hooks/exhaustive-deps
+    }, [reloadKey]);
+
+    const grades = matrix
+        ? Object.keys(matrix.summary)
+            .filter(g => !selectedGrade || g === selectedGrade)
+            .sort((a, b) => (GRADE_ORDER.indexOf(a) + 1 || 99) - (GRADE_ORDER.indexOf(b) + 1 || 99))
+        : [];
+
+    return (
+        <div className="glass-card overflow-hidden mb-8">
+            <div className="flex items-center justify-between p-4 border-b border-white/10">
+                <h2 className="font-bold">📈 등급별 누적 성과 (전체 히스토리)</h2>
+                {matrix && (
+                    <span className="text-xs text-slate-500">
+                        시그널 {matrix.rows.length}건 · {matrix.dates.length}일
+                    </span>
+                )}
+            </div>
+            {loading ? (
+                <div className="p-6 text-center text-slate-400 text-sm">누적 성과 계산 중...</div>
+            ) : grades.length ? (
+                <div className="overflow-x-auto">
+                    <table className="w-full text-sm">
+                        <thead>
+                            <tr className="bg-white/5 border-b border-white/10">
+                                <th className="p-3 text-left w-[80px]">등급</th>
+                                {HORIZON_KEYS.map(h => (
+                                    <th key={h} className="p-3 text-center">{h.replace('d', '일')} 후</th>
+                                ))}
+                                <th className="p-3 text-center">평균 MFE</th>
+                                <th className="p-3 text-center">평균 MAE</th>
+                            </tr>
+                        </thead>
+                        <tbody className="divide-y divide-white/5">
+                            {grades.map(grade => {
+                                const s = matrix!.summary[grade];
+                                return (
+                                    <tr key={grade} className="hover:bg-white/5 transition-colors">
+                                        <td className="p-3">
+                                            <span className={`font-bold ${
+                                                grade === 'S' ? 'text-red-400' :
+                                                grade === 'A' ? 'text-purple-400' :
+                                                grade === 'B' ? 'text-emerald-400' : 'text-gray-400'
+                                            }`}>
+                                                {grade}
+                                            </span>
+                                            <span className="text-xs text-slate-500 ml-2">{s.count}</span>
+                                        </td>
+                                        {HORIZON_KEYS.map(h => <HorizonCell key={h} stat={s[h]} />)}
+                                        <td className={`p-3 text-center font-mono ${pctColor(s.avg_mfe_pct)}`}>{formatPct(s.avg_mfe_pct)}</td>
+                                        <td className={`p-3 text-center font-mono ${pctColor(s.avg_mae_pct)}`}>{formatPct(s.avg_mae_pct)}</td>
+                                    </tr>
+                                );
+                            })}
+                        </tbody>
+                    </table>
+                </div>
+            ) : (
+                <div className="p-6 text-center text-slate-500 text-sm">누적 성과 데이터가 없습니다.</div>
+            )}
+        </div>
+    );
+}
@@ -127,6 +127,8 @@ export const krAPI = {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ date })
     }),
+    getPerformanceMatrix: (type: 'jongga_v2' | 'vcp' = 'jongga_v2') =>
+        fetchAPI<PerformanceMatrixResult>(`/api/kr/performance/matrix?type=${type}`),
 }; // End of krAPI
 
 export interface DailyStat {
@@ -145,6 +147,44 @@ export interface PerformanceAnalysisResult {
     rows: PerformanceRow[];
 }
 
+export interface PerformanceMatrixRow {
+    signal_date: string;
+    code: string;
+    name: string;
+    grade: string;
+    entry_price: number;
+    ret_1d: number | null;
+    ret_3d: number | null;
+    ret_5d: number | null;
+    ret_10d: number | null;
+    mfe_pct: number | null;
+    mae_pct: number | null;
+    is_final: boolean;
+}
+
+export interface HorizonStat {
+    count: number;
+    hit_rate: number | null;
+    avg_return: number | null;
+}
+
+export interface GradePerformanceSummary {
+    count: number;
+    '1d': HorizonStat;
+    '3d': HorizonStat;
+    '5d': HorizonStat;
+    '10d': HorizonStat;
+    avg_mfe_pct: number | null;
+    avg_mae_pct: number | null;
+}
+
+export interface PerformanceMatrixResult {
+    horizons: number[];
+    summary: Record<string, GradePerformanceSummary>;
+    dates: string[];
+    rows: PerformanceMatrixRow[];
+}
+
 // === JP Market Types ===
 export interface JPMarketGate {
     status: string;
@@ -237,7 +277,7 @@ export const jpAPI = {
     getJonggaDates: (type: 'n225' | 'n400' = 'n225') => fetchAPI<string[]>(`/api/jp/jongga-v2/dates?type=${type}`),
     getJonggaHistory: (date: string, type: 'n225' | 'n400' = 'n225') => fetchAPI<JPSignalsResponse>(`/api/jp/jongga-v2/history/${date}?type=${type}`),
     
-    runScreener: (type: 'n225' | 'n400' | 'all' = 'all') => fetchAPI<{ status: string; message: string }>(`/api/jp/jongga-v2/run?type=${type}`, {
+    runScreener: (type: 'n225' | 'n400' | 'all' = 'all') => fetchAPI<{ status: string; message: string; job_id?: string }>(`/api/jp/jongga-v2/run?type=${type}`, {
         method: 'POST',
     }),
     getBacktestSummary: () => fetchAPI<{ closing_bet: BacktestStats }>('/api/jp/backtest-summary'),
@@ -247,6 +287,8 @@ export const jpAPI = {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ date, type })
     }),
+    getPerformanceMatrix: (type: 'n225' | 'n400' | 'vcp' = 'n225') =>
+        fetchAPI<PerformanceMatrixResult>(`/api/jp/performance/matrix?type=${type}`),
     getRealtimePrices: (tickers: string[]) => fetchAPI<Record<string, number>>('/api/jp/realtime-prices', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
@@ -256,7 +298,7 @@ export const jpAPI = {
     getVCPLatest: () => fetchAPI<JPVCPResponse>('/api/jp/vcp/latest'),
     getVCPDates: () => fetchAPI<string[]>('/api/jp/vcp/dates'),
     getVCPHistory: (date: string) => fetchAPI<JPVCPResponse>(`/api/jp/vcp/history/${date}`),
-    runVCPScreener: () => fetchAPI<{ status: string; message: string }>('/api/jp/vcp/run', {
+    runVCPScreener: () => fetchAPI<{ status: string; message: string; job_id?: string }>('/api/jp/vcp/run', {
         method: 'POST',
     }),
 };
@@ -284,3 +326,74 @@ export const usAPI = {
     getMarketGateHistory: (date: string) => fetchAPI<USMarketGate>(`/api/us/market-gate/history/${date}`),
     getBacktestSummary: () => fetchAPI<{ closing_bet: BacktestStats }>('/api/us/backtest-summary'),
 };
+
+// === Server-Sent Events (screener progress + realtime quotes) ===
+export interface ScreenerStatusEvent {
+    isRunning: boolean;
+    task: string | null;
+    message: string;
+    startTime: string | null;
+    jobId?: string;
+    status?: string;
+    progress?: number;
+}
+
+export interface QuotesEvent {
+    market: 'KR' | 'JP';
+    prices: Record<string, number>;
+    updated_at: string;
+}
+
+export interface MarketStreamOptions {
+    kr?: string[];
+    jp?: string[];
+    onKRScreener?: (status: ScreenerStatusEvent) => void;
+    onJPScreener?: (status: ScreenerStatusEvent) => void;
+    onQuotes?: (quotes: QuotesEvent) => void;
+}
+
+// Returns a close function. The browser reconnects automatically on drop.
+export function openMarketStream(options: MarketStreamOptions): () => void {
+    const channels: string[] = [];
+    if (options.onKRScreener) channels.push('kr_screener');
+    if (options.onJPScreener) channels.push('jp_screener');
+    if (options.onQuotes) channels.push('quotes');
+
+    const params = new URLSearchParams({ channels: channels.join(',') });
+    if (options.kr?.length) params.set('kr', options.kr.join(','));
+    if (options.jp?.length) params.set('jp', options.jp.join(','));
+
+    const source = new EventSource(`${API_BASE}/api/stream?${params.toString()}`);
+    if (options.onKRScreener) {
+        source.addEventListener('kr_screener', (e) => options.onKRScreener!(JSON.parse((e as MessageEvent).data)));
+    }
+    if (options.onJPScreener) {
+        source.addEventListener('jp_screener', (e) => options.onJPScreener!(JSON.parse((e as MessageEvent).data)));
+    }
+    if (options.onQuotes) {
+        source.addEventListener('quotes', (e) => options.onQuotes!(JSON.parse((e as MessageEvent).data)));
+    }
+    return () => source.close();
+}
+
+// Resolves with the final status once the job leaves queued/running.
+// Status is read from the job row on the server, so jobs running on another worker are followed too.
+export function waitForScreenerJob(
+    market: 'kr' | 'jp',
+    jobId?: string,
+    onProgress?: (status: ScreenerStatusEvent) => void,
+): Promise<ScreenerStatusEvent> {
+    return new Promise((resolve) => {
+        const handler = (status: ScreenerStatusEvent) => {
+            // A newer job being latest also means ours has finished
+            const otherJob = !!jobId && !!status.jobId && status.jobId !== jobId;
+            if (status.isRunning && !otherJob) {
+                onProgress?.(status);
+                return;
+            }
+            close();
+            resolve(status);
+        };
+        const close = openMarketStream(market === 'kr' ? { onKRScreener: handler } : { onJPScreener: handler });
+    });
+}
@@ -0,0 +1,38 @@
+"""
+gunicorn 설정 (Procfile: gunicorn flask_app:app -c gunicorn.conf.py)
+- PRELOAD_APP=1 (기본): 마스터에서 앱 로드 + 무거운 모듈 워밍업 → 워커는 fork 시 copy-on-write 로 공유
+  워커 풀/DB 커넥션은 fork 이후 워커마다 준비 (app.startup.after_fork)
+- PRELOAD_APP=0: 워커마다 앱 로드. APP_WARMUP=1 이면 워커 기동 직후 백그라운드 워밍업
+- 시작 프로파일: GET /api/startup
+- async def 뷰는 워커당 영구 이벤트 루프 1개에서 실행 (app/utils/aio.py). 요청 스레드는 결과만 기다리고
+  블로킹 yfinance 호출은 AIO_BLOCKING_THREADS 로 제한되므로 GUNICORN_THREADS 를 늘려 동시 요청 수를 키울 수 있음
+"""
+
+import os
+import threading
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', '32'))
+preload_app = os.environ.get('PRELOAD_APP', '1') == '1'
+
+if preload_app:
+    os.environ['APP_PRELOAD'] = '1'   # create_app 이 마스터에서 워커 풀을 띄우지 않도록
+
+
+def when_ready(server):
+    """마스터: 워커 fork 직전 (preload 면 앱은 이미 로드됨)"""
+    if preload_app:
+        from app.startup import FORK_UNSAFE, warm_up
+        warm_up(exclude=FORK_UNSAFE)
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from app.startup import after_fork
+        after_fork(server.app.wsgi())
+
+
+def post_worker_init(worker):
+    if not preload_app and os.environ.get('APP_WARMUP') == '1':
+        from app.startup import warm_up
+        threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
@@ -7,6 +7,8 @@ from datetime import datetime, date
 from engine.jp_collectors import JPXCollector, YahooJapanNewsCollector
 from engine.jp_config import JPSignalConfig
 from engine.scorer import Scorer
+from engine.persist import save_daily_and_latest
+from engine.locks import FileLock
 
 # 콘솔에 한글 출력 설정
 sys.stdout.reconfigure(encoding='utf-8')
@@ -26,18 +28,8 @@ async def run_screening_manual():
     
     async with JPXCollector() as collector:
         async with YahooJapanNewsCollector() as news_collector:
-            print("[1] Fetching top gainers (top_n=400)...")
-            gainers = await collector.get_top_gainers(top_n=400)
-            print(f" -> Found {len(gainers)} stocks.")
-            
-            if not gainers:
-                print("No stocks found.")
-                return
-
-            print(f"[2] Starting parallel analysis (Batch Processing)...")
             config = JPSignalConfig()
             scorer = Scorer()
-            signals = []
             
             async def analyze_single_stock(stock):
                 try:
@@ -89,20 +81,16 @@ async def run_screening_manual():
                     # print(f"Error analyzing {stock.code}: {e}")
                     return None
 
-            batch_size = 20
-            for i in range(0, len(gainers), batch_size):
-                batch = gainers[i:i+batch_size]
-                progress = int((i / len(gainers)) * 100)
-                print(f" Analyzing... {progress}% ({i}/{len(gainers)})")
-                
-                tasks = [analyze_single_stock(stock) for stock in batch]
-                results = await asyncio.gather(*tasks)
-                
-                for res in results:
-                    if res:
-                        signals.append(res)
-                
-                await asyncio.sleep(0.5)
+            # 청크 스트리밍 → 상위 400 힙, 힙에 들어온 종목은 다운로드 중에도 바로 분석
+            print("[1] Streaming TSE universe (top 400 gainers, analysis overlaps download)...")
+            scanned = await collector.scan_top_gainers(analyze_single_stock, top_n=400, concurrency=20)
+            gainers = [stock for stock, _ in scanned]
+            signals = [res for _, res in scanned if res]
+            print(f" -> Found {len(gainers)} stocks.")
+            
+            if not gainers:
+                print("No stocks found.")
+                return
             
             print(f"Analysis Completed. Found {len(signals)} valid signals.")
             
@@ -116,16 +104,23 @@ async def run_screening_manual():
             
             data_dir = get_data_dir()
             
-            # Save latest
-            with open(os.path.join(data_dir, 'jongga_v2_latest.json'), 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, ensure_ascii=False, indent=2)
-            
-            # Save history
+            # Save history + latest (hardlink)
             today_str = date.today().strftime('%Y%m%d')
-            with open(os.path.join(data_dir, f'jongga_v2_results_{today_str}.json'), 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, ensure_ascii=False, indent=2)
+            save_daily_and_latest(
+                os.path.join(data_dir, f'jongga_v2_results_{today_str}.json'),
+                os.path.join(data_dir, 'jongga_v2_latest.json'),
+                result_data
+            )
                 
             print(f"Results saved to {data_dir}")
 
 if __name__ == "__main__":
-    asyncio.run(run_screening_manual())
+    # API 작업 큐(jp.screener)와 동시 실행 방지
+    lock = FileLock('job.jp.screener', timeout=0)
+    if not lock.acquire():
+        print("JP screener is already running (API job or another manual run).")
+        sys.exit(1)
+    try:
+        asyncio.run(run_screening_manual())
+    finally:
+        lock.release()
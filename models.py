@@ -135,7 +135,7 @@ class Trade:
     # 청산 (진행 중이면 None)
     exit_time: Optional[int] = None
     exit_price: Optional[float] = None
-    exit_reason: Optional[str] = None   # STOP_LOSS, TAKE_PROFIT, TRAILING_STOP, TIME_EXIT, FOREIGN_SELL, RSI_EXIT
+    exit_reason: Optional[str] = None   # STOP_LOSS, TAKE_PROFIT, TRAILING_STOP, TIME_EXIT, REGIME_EXIT, FOREIGN_SELL, RSI_EXIT
     
     # 포지션 정보
     quantity: int = 0
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-KR Market Scheduler - 백그라운드 데이터 업데이트 스케줄러
+Market Scheduler - 백그라운드 데이터 업데이트 스케줄러 (KR / JP / US)
+- 잡별 cron 트리거 (시장 현지 시각) + 시장 캘린더 휴장일 건너뜀
+- 서로 독립된 단계는 동시 실행: 시장별 Market Gate / KR 스크리너 / JP 스크리너
+  (같은 틱의 게이트 잡은 다운로드 1회로 묶음, 같은 락을 쓰는 KR VCP/종가베팅은 순차)
+- 입력 지문(장 상태, 게이트 상태)이 직전 성공 실행과 같으면 건너뜀 → data/scheduler_state.json
 """
 
 import os
@@ -10,8 +14,12 @@ import time
 import json
 import asyncio
 import argparse
-from datetime import datetime, timedelta
-from typing import Optional
+import importlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
 import threading
 
 
@@ -19,178 +27,441 @@ import threading
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, BASE_DIR)
 
+from engine.cron import CronTrigger
+from engine.locks import FileLock
+from engine.market_calendar import get_calendar
+
+# API 작업 큐의 스크리너(dedupe_key='kr.screener' / 'jp.screener')와 같은 락
+KR_SCREENER_LOCK = 'job.kr.screener'
+JP_SCREENER_LOCK = 'job.jp.screener'
+
+# 잡 이름 → (시장, cron 표현식 - 시장 현지 시각)
+SCHEDULE = {
+    'kr.gate': ('KR', '*/30 9-15 * * mon-fri'),
+    'jp.gate': ('JP', '*/30 9-15 * * mon-fri'),
+    'us.gate': ('US', '*/30 9-16 * * mon-fri'),
+    'kr.vcp': ('KR', '0 10-15 * * mon-fri'),
+    'kr.jongga_v2': ('KR', '15,45 9-15 * * mon-fri'),   # 장중 증분 재스캔
+    'jp.jongga_v2': ('JP', '5 15 * * mon-fri'),
+}
+
+# 게이트 갱신 함수 위치 (일자별 저장 + latest + DB 기록, 프로세스 간 single-flight)
+GATE_REFRESHERS = {
+    'KR': 'app.routes.kr_market',
+    'JP': 'app.routes.jp_market',
+    'US': 'app.routes.us_market',
+}
+
+# 지문을 저장하는(다음 실행에서 건너뛸 수 있는) 결과 상태
+_DONE_STATUSES = ('success', 'no_data')
+
+
+def session_inputs(market: str):
+    """장중에는 매번 실행(None), 장 마감 후에는 마지막 마감 거래일이 입력"""
+    state, day = get_calendar(market).session_state()
+    return None if state == 'open' else [state, day]
+
+
+def screener_inputs(market: str):
+    """스크리너 입력: 장 상태 + 현재 게이트 상태 (게이트가 바뀌면 축소/전체 스캔이 달라짐)"""
+    session = session_inputs(market)
+    if session is None:
+        return None
+    from engine.market_gate import current_gate
+    return session + [current_gate(market)]
+
+
+@dataclass
+class ScheduledJob:
+    """스케줄 잡"""
+    name: str
+    market: str
+    trigger: CronTrigger
+    run: Optional[Callable[[], Dict]] = None       # 게이트 잡은 None (묶어서 실행)
+    group: Optional[str] = None                   # 같은 그룹은 순차 실행
+    inputs: Optional[Callable[[], object]] = None  # 입력 지문 (None 반환 시 항상 실행)
+    next_run: Optional[datetime] = None
+
+    @property
+    def is_gate(self) -> bool:
+        return self.run is None
+
+    @property
+    def calendar(self):
+        return get_calendar(self.market)
+
+    def schedule_next(self, after: Optional[datetime] = None):
+        local = self.calendar.localize(after)
+        self.next_run = self.trigger.next_after(local)
+
 
 class MarketScheduler:
     """시장 데이터 업데이트 스케줄러"""
-    
-    def __init__(self):
+
+    def __init__(self, max_workers: int = 4):
         self.data_dir = os.path.join(BASE_DIR, 'data')
         os.makedirs(self.data_dir, exist_ok=True)
-        
+        self.state_file = os.path.join(self.data_dir, 'scheduler_state.json')
+
         self.is_running = False
         self.last_update = None
-        
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scheduler')
+        self._stop = threading.Event()
+        self._state_lock = threading.Lock()
+        self._state = self._load_state()
+        self._group_locks = defaultdict(threading.Lock)
+        self._running = set()
+        self.jobs = self._build_jobs()
+
+    def _build_jobs(self) -> List[ScheduledJob]:
+        runners = {
+            'kr.vcp': (self.run_vcp_scan, KR_SCREENER_LOCK),
+            'kr.jongga_v2': (lambda: self.run_jongga_v2(incremental=True), KR_SCREENER_LOCK),
+            'jp.jongga_v2': (self.run_jp_screener, JP_SCREENER_LOCK),
+        }
+        jobs = []
+        for name, (market, expr) in SCHEDULE.items():
+            run, group = runners.get(name, (None, None))
+            inputs = screener_inputs if run else session_inputs
+            jobs.append(ScheduledJob(
+                name=name,
+                market=market,
+                trigger=CronTrigger(expr),
+                run=run,
+                group=group,
+                inputs=lambda m=market, f=inputs: f(m),
+            ))
+        return jobs
+
+    # === 상태 (입력 지문) ===
+    def _load_state(self) -> Dict:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️ [Scheduler] 상태 파일 로드 실패: {e}")
+            return {}
+
+    def _fingerprint(self, job: ScheduledJob):
+        try:
+            # JSON 왕복으로 정규화 (저장된 값과 비교)
+            return json.loads(json.dumps(job.inputs(), default=str))
+        except Exception as e:
+            print(f"⚠️ [{job.name}] 입력 지문 계산 실패: {e}")
+            return None
+
+    def _unchanged(self, job: ScheduledJob, fingerprint) -> bool:
+        if fingerprint is None:
+            return False
+        with self._state_lock:
+            last = self._state.get(job.name, {})
+        return last.get('fingerprint') == fingerprint
+
+    def _record(self, name: str, result: Dict, fingerprint, elapsed: float):
+        from engine.persist import write_json
+
+        status = result.get('status')
+        with self._state_lock:
+            entry = self._state.setdefault(name, {})
+            entry.update({
+                'status': status,
+                'last_run': datetime.now().isoformat(),
+                'elapsed_seconds': round(elapsed, 2),
+            })
+            if status in _DONE_STATUSES:
+                entry['fingerprint'] = fingerprint
+            try:
+                write_json(self.state_file, self._state)
+            except Exception as e:
+                print(f"⚠️ [Scheduler] 상태 저장 실패: {e}")
+
+    # === 단계 ===
     def run_vcp_scan(self) -> dict:
         """VCP 스캔 실행"""
         print("🔍 [VCP] 스캔 시작...")
-        
+
+        lock = FileLock(KR_SCREENER_LOCK, timeout=0)
+        if not lock.acquire():
+            print("⏭️ [VCP] 다른 스크리너 실행 중 - 건너뜀")
+            return {"status": "skipped", "reason": "screener already running"}
         try:
             from screener import SmartMoneyScreener
-            
+
             screener = SmartMoneyScreener()
             results = screener.run_screening(max_stocks=50)
-            
+
             if results.empty:
                 return {"status": "no_data", "count": 0}
-            
+
             signals = screener.generate_signals(results)
-            
-            # signals_log.csv 저장
-            signals_path = os.path.join(self.data_dir, 'signals_log.csv')
-            results.to_csv(signals_path, index=False, encoding='utf-8-sig')
-            
+
+            # 스캔 결과는 별도 파일 (signals_log.csv 는 SignalTracker 스냅샷 - 덮어쓰면 저널이 폐기됨)
+            results_path = os.path.join(self.data_dir, 'vcp_scan_results.csv')
+            results.to_csv(results_path, index=False, encoding='utf-8-sig')
+
             print(f"✅ [VCP] {len(signals)}개 시그널 저장됨")
-            
+
             return {
                 "status": "success",
                 "count": len(signals),
                 "signals": signals[:10]  # 상위 10개만 반환
             }
-            
+
         except Exception as e:
             print(f"❌ [VCP] 스캔 실패: {e}")
             return {"status": "error", "error": str(e)}
-    
-    def run_jongga_v2(self) -> dict:
-        """종가베팅 V2 엔진 실행"""
-        print("🎯 [Jongga V2] 엔진 실행 시작...")
-        
+        finally:
+            lock.release()
+
+    def run_jongga_v2(self, incremental: bool = False) -> dict:
+        """종가베팅 V2 엔진 실행 (incremental: 직전 사이클 상태 재사용, 바뀐 종목만 재채점)"""
+        print(f"🎯 [Jongga V2] 엔진 실행 시작{' (증분)' if incremental else ''}...")
+
+        lock = FileLock(KR_SCREENER_LOCK, timeout=0)
+        if not lock.acquire():
+            print("⏭️ [Jongga V2] 다른 스크리너 실행 중 - 건너뜀")
+            return {"status": "skipped", "reason": "screener already running"}
         try:
             from engine.generator import run_screener
-            
-            result = asyncio.run(run_screener(capital=50_000_000))
-            
+
+            result = asyncio.run(run_screener(capital=50_000_000, incremental=incremental))
+
             print(f"✅ [Jongga V2] {result.filtered_count}개 시그널 생성됨")
-            
+
             return {
                 "status": "success",
                 "date": result.date.isoformat(),
                 "filtered_count": result.filtered_count,
                 "processing_time": result.processing_time_ms
             }
-            
+
         except Exception as e:
             print(f"❌ [Jongga V2] 실행 실패: {e}")
             return {"status": "error", "error": str(e)}
-    
-    def run_market_gate(self) -> dict:
-        """Market Gate 상태 업데이트"""
-        print("📈 [Market Gate] 분석 시작...")
-        
+        finally:
+            lock.release()
+
+    def run_jp_screener(self) -> dict:
+        """JP 종가베팅 V2 스크리너 실행 (manual_run_screener 와 같은 결과 파일)"""
+        print("🇯🇵 [JP Jongga V2] 스크리너 실행 시작...")
+
+        lock = FileLock(JP_SCREENER_LOCK, timeout=0)
+        if not lock.acquire():
+            print("⏭️ [JP Jongga V2] 다른 스크리너 실행 중 - 건너뜀")
+            return {"status": "skipped", "reason": "screener already running"}
         try:
-            from market_gate import run_kr_market_gate
-            
-            result = run_kr_market_gate()
-            
-            # 캐시 저장
-            cache_path = os.path.join(self.data_dir, 'market_gate_cache.json')
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                # to_dict()가 있으면 사용, 없으면 변환
-                if hasattr(result, 'to_dict'):
-                    data = result.to_dict()
-                elif isinstance(result, dict):
-                    data = result
-                else:
-                    data = vars(result)
-                    
-                data['updated_at'] = datetime.now().isoformat()
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ [Market Gate] 상태: {result.get('gate', 'N/A')}, 점수: {result.get('score', 0)}")
-            
-            return {
-                "status": "success",
-                "gate": result.get('gate', 'NEUTRAL'),
-                "score": result.get('score', 50)
-            }
-            
+            from manual_run_screener import run_screening_manual
+
+            asyncio.run(run_screening_manual())
+            print("✅ [JP Jongga V2] 완료")
+            return {"status": "success"}
+
+        except Exception as e:
+            print(f"❌ [JP Jongga V2] 실행 실패: {e}")
+            return {"status": "error", "error": str(e)}
+        finally:
+            lock.release()
+
+    def _persist_gate(self, market: str, payload: Dict) -> Dict:
+        refresh = importlib.import_module(GATE_REFRESHERS[market]).refresh_market_gate
+        data = refresh(payload)
+
+        if market == 'KR':
+            # 기존 캐시 파일 형식 유지
+            from market_gate import legacy_gate_payload
+            from engine.persist import write_json
+            cache = legacy_gate_payload(data)
+            cache['updated_at'] = datetime.now().isoformat()
+            write_json(os.path.join(self.data_dir, 'market_gate_cache.json'), cache)
+            if data.get('regime'):
+                print(f"✅ [Regime] {data['regime'].get('regime')}")
+
+        print(f"✅ [Market Gate {market}] 상태: {data.get('status', 'N/A')}, 점수: {data.get('score', 0)}")
+        return {"status": "success", "gate": data.get('status'), "score": data.get('score')}
+
+    def run_market_gates(self, markets: List[str]) -> Dict[str, dict]:
+        """여러 시장 Market Gate 갱신 (다운로드 1회 + 시장별 저장 동시 실행)"""
+        markets = [m.upper() for m in markets]
+        print(f"📈 [Market Gate] 분석 시작 ({', '.join(markets)})...")
+
+        try:
+            from engine.market_gate import compute_market_gates
+            payloads = compute_market_gates(markets)
         except Exception as e:
             print(f"❌ [Market Gate] 분석 실패: {e}")
+            return {m: {"status": "error", "error": str(e)} for m in markets}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(markets)) as pool:
+            futures = {m: pool.submit(self._persist_gate, m, payloads[m]) for m in markets}
+            for market, future in futures.items():
+                try:
+                    results[market] = future.result()
+                except Exception as e:
+                    print(f"❌ [Market Gate {market}] 저장 실패: {e}")
+                    results[market] = {"status": "error", "error": str(e)}
+        return results
+
+    def run_market_gate(self) -> dict:
+        """KR Market Gate 상태 업데이트 (+ 레짐)"""
+        return self.run_market_gates(['KR'])['KR']
+
+    # === 실행 ===
+    def _execute(self, job: ScheduledJob, force: bool = False) -> dict:
+        fingerprint = self._fingerprint(job)
+        if not force and self._unchanged(job, fingerprint):
+            print(f"⏭️ [{job.name}] 입력 변화 없음 - 건너뜀")
+            return {"status": "unchanged"}
+
+        with self._group_locks[job.group or job.name]:
+            start = time.time()
+            result = job.run()
+        self._record(job.name, result, fingerprint, time.time() - start)
+        return result
+
+    def _execute_gates(self, jobs: List[ScheduledJob], force: bool = False) -> dict:
+        pending = {}
+        for job in jobs:
+            fingerprint = self._fingerprint(job)
+            if not force and self._unchanged(job, fingerprint):
+                print(f"⏭️ [{job.name}] 입력 변화 없음 - 건너뜀")
+                continue
+            pending[job.market] = (job, fingerprint)
+        if not pending:
+            return {job.market: {"status": "unchanged"} for job in jobs}
+
+        start = time.time()
+        results = self.run_market_gates(list(pending))
+        elapsed = time.time() - start
+        for market, (job, fingerprint) in pending.items():
+            self._record(job.name, results[market], fingerprint, elapsed)
+        return {job.market: results.get(job.market, {"status": "unchanged"}) for job in jobs}
+
+    def _guarded(self, key: str, fn, *args) -> dict:
+        """같은 잡이 아직 실행 중이면 이번 트리거는 건너뜀"""
+        with self._state_lock:
+            if key in self._running:
+                print(f"⏭️ [{key}] 이전 실행 진행 중 - 건너뜀")
+                return {"status": "skipped", "reason": "previous run in progress"}
+            self._running.add(key)
+        try:
+            return fn(*args)
+        except Exception as e:
+            print(f"❌ [{key}] 실행 실패: {e}")
             return {"status": "error", "error": str(e)}
-    
-    def run_full_update(self) -> dict:
-        """전체 데이터 업데이트"""
+        finally:
+            with self._state_lock:
+                self._running.discard(key)
+
+    def _dispatch(self, jobs: List[ScheduledJob], force: bool = False) -> Dict:
+        """잡 동시 실행 → {결과 키: Future} (게이트 잡은 1개 작업으로 묶음)"""
+        futures = {}
+        gates = [j for j in jobs if j.is_gate]
+        if gates:
+            key = 'market_gate:' + ','.join(j.market for j in gates)
+            futures['market_gate'] = self._pool.submit(self._guarded, key, self._execute_gates, gates, force)
+        for job in jobs:
+            if not job.is_gate:
+                futures[job.name] = self._pool.submit(self._guarded, job.name, self._execute, job, force)
+        return futures
+
+    def run_full_update(self, force: bool = False) -> dict:
+        """전체 데이터 업데이트 (독립 단계 동시 실행 - 소요 시간은 가장 느린 단계 기준)"""
         print("\n" + "="*60)
         print(f"🚀 전체 업데이트 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*60 + "\n")
-        
-        results = {}
+
         start_time = time.time()
-        
-        # 1. Market Gate
-        results["market_gate"] = self.run_market_gate()
-        
-        # 2. VCP Scan
-        results["vcp_scan"] = self.run_vcp_scan()
-        
-        # 3. Jongga V2
-        results["jongga_v2"] = self.run_jongga_v2()
-        
+        futures = self._dispatch(self.jobs, force=force)
+        results = {key: future.result() for key, future in futures.items()}
         elapsed = time.time() - start_time
-        
+
         print("\n" + "="*60)
         print(f"✅ 전체 업데이트 완료 ({elapsed:.1f}초 소요)")
         print("="*60 + "\n")
-        
+
         self.last_update = datetime.now()
-        
+
         return {
             "status": "completed",
             "elapsed_seconds": elapsed,
             "results": results,
             "updated_at": self.last_update.isoformat()
         }
-    
-    def start_scheduler(self, interval_minutes: int = 30, run_immediately: bool = True):
-        """스케줄러 시작"""
-        print(f"\n⏰ 스케줄러 시작 - {interval_minutes}분 간격")
+
+    def set_gate_interval(self, minutes: int):
+        """게이트 잡 실행 간격 변경 (시간/요일 필드는 유지)"""
+        for job in self.jobs:
+            if job.is_gate:
+                fields = job.trigger.expr.split()
+                fields[0] = f"*/{minutes}" if minutes < 60 else "0"
+                job.trigger = CronTrigger(' '.join(fields))
+
+    def print_schedule(self):
+        for job in self.jobs:
+            if job.next_run is None:
+                job.schedule_next()
+            print(f"   {job.name:<14} [{job.market}] {job.trigger.expr:<24} 다음: {job.next_run:%Y-%m-%d %H:%M %Z}")
+
+    def _due_jobs(self, now: datetime) -> List[ScheduledJob]:
+        due = []
+        for job in self.jobs:
+            if job.next_run is None or job.next_run > now:
+                continue
+            fire_day = job.next_run.date()
+            job.schedule_next(now)  # 밀린 트리거는 1회로 합침
+            if not job.calendar.is_trading_day(fire_day):
+                print(f"📅 [{job.name}] {fire_day} 휴장일 - 건너뜀")
+                continue
+            due.append(job)
+        return due
+
+    def start_scheduler(self, interval_minutes: Optional[int] = None, run_immediately: bool = True):
+        """스케줄러 시작 (interval_minutes: 게이트 간격 재지정)"""
+        if interval_minutes:
+            self.set_gate_interval(interval_minutes)
+
+        print("\n⏰ 스케줄러 시작 (시장 현지 시각 기준)")
+        self.print_schedule()
         print("   Ctrl+C로 종료하세요.\n")
-        
+
         self.is_running = True
-        
-        # 즉시 1회 실행 여부 확인
-        if run_immediately:
-            self.run_full_update()
-        else:
-            print("⏭️ 초기 업데이트를 건너뜁니다. 첫 업데이트는 {}분 뒤에 실행됩니다.".format(interval_minutes))
-        
-        while self.is_running:
-            try:
-                # 대기
-                print(f"\n💤 다음 업데이트까지 {interval_minutes}분 대기...\n")
-                time.sleep(interval_minutes * 60)
-                
-                # 거래 시간 체크 (09:00 ~ 15:30)
-                now = datetime.now()
-                if now.weekday() >= 5:  # 주말
-                    print("📅 주말입니다. 업데이트 건너뜀.")
-                    continue
-                
-                if now.hour < 9 or (now.hour == 15 and now.minute > 30) or now.hour >= 16:
-                    print("⏰ 장외 시간입니다. 업데이트 건너뜀.")
-                    continue
-                
-                # 업데이트 실행
+        self._stop.clear()
+
+        try:
+            # 즉시 1회 실행 여부 확인
+            if run_immediately:
                 self.run_full_update()
-                
-            except KeyboardInterrupt:
-                print("\n\n👋 스케줄러를 종료합니다.")
-                self.is_running = False
-                break
-    
+            else:
+                print("⏭️ 초기 업데이트를 건너뜁니다.")
+
+            for job in self.jobs:
+                job.schedule_next()
+
+            while self.is_running:
+                now = datetime.now(timezone.utc)
+                due = self._due_jobs(now)
+                if due:
+                    print(f"\n⏰ {datetime.now():%H:%M} 실행: {', '.join(j.name for j in due)}")
+                    self._dispatch(due)
+
+                upcoming = [j.next_run for j in self.jobs if j.next_run is not None]
+                wait = (min(upcoming) - datetime.now(timezone.utc)).total_seconds() if upcoming else 60
+                self._stop.wait(min(max(wait, 1), 30))
+
+        except KeyboardInterrupt:
+            print("\n\n👋 스케줄러를 종료합니다.")
+        finally:
+            self.is_running = False
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
     def stop_scheduler(self):
         """스케줄러 중지"""
         self.is_running = False
+        self._stop.set()
 
 
 def run_vcp_scan() -> dict:
@@ -207,32 +478,42 @@ def run_full_update() -> dict:
 
 def main():
     """메인 함수"""
-    parser = argparse.ArgumentParser(description='KR Market Scheduler')
+    parser = argparse.ArgumentParser(description='Market Scheduler (KR / JP / US)')
     parser.add_argument('--now', action='store_true', help='즉시 1회 실행')
-    parser.add_argument('--interval', type=int, default=30, help='실행 간격 (분)')
+    parser.add_argument('--interval', type=int, help='Market Gate 실행 간격 (분, 기본: cron 설정)')
     parser.add_argument('--no-init', action='store_true', help='시작 시 즉시 분석 수행 안 함')
+    parser.add_argument('--force', action='store_true', help='입력 변화가 없어도 실행')
+    parser.add_argument('--list', action='store_true', help='잡 목록 / 다음 실행 시각 출력')
     parser.add_argument('--vcp', action='store_true', help='VCP 스캔만 실행')
     parser.add_argument('--jongga', action='store_true', help='종가베팅 V2만 실행')
-    parser.add_argument('--gate', action='store_true', help='Market Gate만 실행')
-    
+    parser.add_argument('--incremental', action='store_true', help='종가베팅 V2 증분 재스캔 (--jongga 와 함께)')
+    parser.add_argument('--jp', action='store_true', help='JP 종가베팅 V2만 실행')
+    parser.add_argument('--gate', action='store_true', help='Market Gate만 실행 (KR/JP/US)')
+
     args = parser.parse_args()
-    
+
     scheduler = MarketScheduler()
-    
+
+    if args.list:
+        if args.interval:
+            scheduler.set_gate_interval(args.interval)
+        scheduler.print_schedule()
+        return
+
     if args.vcp:
         result = scheduler.run_vcp_scan()
-        print(json.dumps(result, ensure_ascii=False, indent=2))
     elif args.jongga:
-        result = scheduler.run_jongga_v2()
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        result = scheduler.run_jongga_v2(incremental=args.incremental)
+    elif args.jp:
+        result = scheduler.run_jp_screener()
     elif args.gate:
-        result = scheduler.run_market_gate()
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        result = scheduler.run_market_gates(list(GATE_REFRESHERS))
     elif args.now:
-        result = scheduler.run_full_update()
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        result = scheduler.run_full_update(force=args.force)
     else:
         scheduler.start_scheduler(interval_minutes=args.interval, run_immediately=not args.no_init)
+        return
+    print(json.dumps(result, ensure_ascii=False, indent=2))
 
 
 if __name__ == "__main__":
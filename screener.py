@@ -8,9 +8,14 @@ import os
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
+from engine.kr_symbols import get_kr_resolver
+from engine.market_gate import is_gate_red
+
+CANCEL_CHECK_BATCH = 10   # 완료 종목 N개마다 취소 확인 (= 스레드 수)
+
 
 @dataclass
 class VCPResult:
@@ -58,18 +63,30 @@ class SmartMoneyScreener:
         # VCP 기준
         self.contraction_threshold = self.config.get('contraction_threshold', 0.7)
         
-    def run_screening(self, max_stocks: int = 50) -> pd.DataFrame:
+        # Market Gate 연동 (RED 장세: 종목 수 축소 + 수급 크롤링 생략)
+        self.gate_aware = self.config.get('gate_aware', True)
+        self.red_max_stocks = self.config.get('red_max_stocks', 30)
+        self.reduced_scan = False
+        
+    def run_screening(self, max_stocks: int = 50, cancel_check: Optional[Callable[[], None]] = None) -> pd.DataFrame:
         """
         스크리닝 실행
         
         Args:
             max_stocks: 분석할 최대 종목 수
+            cancel_check: 취소 체크포인트 (취소 시 예외 발생 - 워커 수 단위 배치마다 호출, 남은 종목은 취소)
         
         Returns:
             스크리닝 결과 DataFrame
         """
         results = []
         
+        # 0. Market Gate RED → 축소 스캔
+        self.reduced_scan = bool(self.gate_aware and is_gate_red('KR'))
+        if self.reduced_scan:
+            max_stocks = min(max_stocks, self.red_max_stocks)
+            print(f"🔴 Market Gate RED - 상위 {max_stocks}개만, 수급 크롤링 생략")
+        
         # 1. 종목 리스트 로드
         stocks = self._load_stock_list()
         if stocks.empty:
@@ -95,7 +112,14 @@ class SmartMoneyScreener:
                 for ticker, name, market in targets
             }
             
-            for future in concurrent.futures.as_completed(future_to_stock):
+            for done, future in enumerate(concurrent.futures.as_completed(future_to_stock), 1):
+                if cancel_check and done % CANCEL_CHECK_BATCH == 0:
+                    try:
+                        cancel_check()
+                    except Exception:
+                        for pending in future_to_stock:
+                            pending.cancel()
+                        raise
                 ticker, name = future_to_stock[future]
                 try:
                     result = future.result()
@@ -118,8 +142,8 @@ class SmartMoneyScreener:
     def _load_stock_list(self) -> pd.DataFrame:
         """종목 리스트 로드 (yfinance 대응용 주요 종목)"""
         try:
-            # engine.collectors에서 정의한 주요 종목 리스트 재사용
-            from engine.collectors import KR_TOP_STOCKS
+            # 주요 종목 리스트 재사용 (전종목 유니버스는 engine.kr_universe)
+            from engine.stock_list_data import KR_TOP_STOCKS
             
             stocks = []
             # KR_TOP_STOCKS는 [ (ticker, name, market), ... ] 형식의 리스트임
@@ -145,18 +169,16 @@ class SmartMoneyScreener:
         try:
             import yfinance as yf
             
-            # 티커 변환
-            symbol = f"{ticker}.KS" if market == 'KOSPI' else f"{ticker}.KQ"
-            stock_yf = yf.Ticker(symbol)
-            
-            # 60일 데이터 조회
-            df = stock_yf.history(period='3mo')
-            if df.empty or len(df) < 20:
-                # KOSPI/KOSDAQ 반대로 재시도
-                symbol = f"{ticker}.KQ" if market == 'KOSPI' else f"{ticker}.KS"
+            # 티커 변환 (거래소 확인된 종목은 1회, 미확인 종목만 반대 거래소 재시도)
+            resolver = get_kr_resolver()
+            df = None
+            for symbol in resolver.candidates(ticker, market):
                 df = yf.Ticker(symbol).history(period='3mo')
-                if df.empty or len(df) < 20:
-                    return None
+                if not df.empty:
+                    resolver.learn(symbol)
+                    break
+            if df is None or df.empty or len(df) < 20:
+                return None
             
             # VCP 점수 계산 (VCP 패턴 + 수급 점수 합계 100점 만점)
             vcp_score, contraction = self._calculate_vcp_score(df)
@@ -164,10 +186,11 @@ class SmartMoneyScreener:
             # 네이버 금융에서 외인/기관 수급 데이터 크롤링
             foreign_5d = 0
             inst_5d = 0
-            try:
-                foreign_5d, inst_5d = self._fetch_naver_investor_data(ticker)
-            except Exception as e:
-                print(f"[Naver] {ticker} 수급 데이터 조회 실패: {e}")
+            if not self.reduced_scan:
+                try:
+                    foreign_5d, inst_5d = self._fetch_naver_investor_data(ticker)
+                except Exception as e:
+                    print(f"[Naver] {ticker} 수급 데이터 조회 실패: {e}")
             
             # 수급 점수 계산
             supply_score = 50  # 기본 중립
@@ -5,12 +5,23 @@ Signal Tracker - VCP 시그널 추적 및 로깅
 """
 
 import os
+import io
 import csv
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 
+import numpy as np
+import pandas as pd
+
+from config import BacktestConfig
+from models import Trade
+from engine.exits import make_trade, resolve_exits
+
+# pykrx 전종목 시세 컬럼 → 영문
+KRX_SNAPSHOT_COLUMNS = {'시가': 'Open', '고가': 'High', '저가': 'Low', '종가': 'Close', '거래량': 'Volume'}
+
 
 @dataclass
 class Signal:
@@ -30,11 +41,284 @@ class Signal:
     exit_date: Optional[str] = None
     exit_price: Optional[float] = None
     exit_reason: Optional[str] = None
+    peak_price: float = 0.0  # 진입 후 최고가 (트레일링 스탑 기준)
     
     def to_dict(self) -> Dict:
         return asdict(self)
 
 
+# CSV 스냅샷 컬럼 순서
+SIGNAL_FIELDS = [
+    'ticker', 'name', 'signal_date', 'entry_price', 'status',
+    'score', 'contraction_ratio', 'foreign_5d', 'inst_5d',
+    'market', 'current_price', 'return_pct', 'exit_date',
+    'exit_price', 'exit_reason', 'peak_price'
+]
+
+
+def _num(value, cast=float, default=0):
+    try:
+        return cast(float(value)) if value not in (None, '') else default
+    except (TypeError, ValueError):
+        return default
+
+
+def _signal_from_row(row: Dict) -> Signal:
+    """CSV 행 → Signal (빈 값/누락 컬럼 허용)"""
+    return Signal(
+        ticker=str(row.get('ticker', '')),
+        name=row.get('name', ''),
+        signal_date=row.get('signal_date', ''),
+        entry_price=_num(row.get('entry_price')),
+        status=row.get('status') or 'OPEN',
+        score=_num(row.get('score')),
+        contraction_ratio=_num(row.get('contraction_ratio')),
+        foreign_5d=_num(row.get('foreign_5d'), int),
+        inst_5d=_num(row.get('inst_5d'), int),
+        market=row.get('market') or 'KOSPI',
+        current_price=_num(row.get('current_price')),
+        return_pct=_num(row.get('return_pct')),
+        exit_date=row.get('exit_date') or None,
+        exit_price=_num(row.get('exit_price'), default=None),
+        exit_reason=row.get('exit_reason') or None,
+        peak_price=_num(row.get('peak_price')),
+    )
+
+
+class SignalBook:
+    """시그널 저장소 - 인덱스 + 추가 전용 저널
+    
+    - 인덱스: (ticker, signal_date) → Signal, ticker → 열린 시그널, 상태별 키 (추가/청산 O(1))
+    - 변경은 저널(jsonl)에 한 줄씩 추가, CSV 스냅샷은 compact() 때만 재작성
+    - 청산 이력(signals_history.json)도 compact() 때 한 번에 병합
+    - 저널 첫 줄에 기준 스냅샷(mtime, size) 기록 → 외부에서 CSV를 교체했으면 저널 폐기
+    """
+    
+    COMPACT_LINES = 1000    # 저널이 이 줄 수를 넘으면 자동 compact
+    
+    def __init__(self, snapshot_path: str, journal_path: str, history_path: str):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.history_path = history_path
+        
+        self._signals: Dict[Tuple[str, str], Signal] = {}
+        self._open: Dict[str, Tuple[str, str]] = {}
+        self._status: Dict[str, Dict[Tuple[str, str], None]] = {}
+        self._pending_history: List[Tuple[str, str]] = []
+        self._journal_lines = 0
+    
+    @staticmethod
+    def key(signal: Signal) -> Tuple[str, str]:
+        return signal.ticker, signal.signal_date
+    
+    # ------------------------------------------------------------------
+    # 인덱스
+    # ------------------------------------------------------------------
+    def _index(self, signal: Signal):
+        key = self.key(signal)
+        self._signals[key] = signal
+        self._status.setdefault(signal.status, {})[key] = None
+        if signal.status == "OPEN":
+            self._open[signal.ticker] = key
+    
+    def _set_status(self, signal: Signal, status: str):
+        key = self.key(signal)
+        self._status.get(signal.status, {}).pop(key, None)
+        if signal.status == "OPEN" and self._open.get(signal.ticker) == key:
+            del self._open[signal.ticker]
+        signal.status = status
+        self._status.setdefault(status, {})[key] = None
+        if status == "OPEN":
+            self._open[signal.ticker] = key
+    
+    @property
+    def signals(self) -> List[Signal]:
+        return list(self._signals.values())
+    
+    def get(self, ticker: str, signal_date: str) -> Optional[Signal]:
+        return self._signals.get((ticker, signal_date))
+    
+    def open_for(self, ticker: str) -> Optional[Signal]:
+        key = self._open.get(ticker)
+        return self._signals[key] if key else None
+    
+    def by_status(self, status: str) -> List[Signal]:
+        return [self._signals[k] for k in self._status.get(status, {})]
+    
+    def __len__(self) -> int:
+        return len(self._signals)
+    
+    # ------------------------------------------------------------------
+    # 변경 (저널 기록)
+    # ------------------------------------------------------------------
+    def add(self, signal: Signal) -> bool:
+        if signal.status == "OPEN" and signal.ticker in self._open:
+            return False
+        if self.key(signal) in self._signals:
+            return False
+        self._apply({'op': 'add', 's': signal.to_dict()})
+        return True
+    
+    def close(
+        self,
+        ticker: str,
+        exit_price: float,
+        exit_reason: str,
+        exit_date: str = None,
+        return_pct: float = None,
+    ) -> Optional[Signal]:
+        signal = self.open_for(ticker)
+        if signal is None:
+            return None
+        if return_pct is None:
+            return_pct = signal.return_pct
+            if signal.entry_price > 0:
+                return_pct = ((exit_price - signal.entry_price) / signal.entry_price) * 100
+        self._apply({
+            'op': 'close',
+            'k': list(self.key(signal)),
+            'f': {
+                'exit_date': exit_date or datetime.now().strftime('%Y-%m-%d'),
+                'exit_price': float(exit_price),
+                'exit_reason': exit_reason,
+                'return_pct': float(return_pct),
+            },
+        })
+        return signal
+    
+    def update_prices(self, updates: List[Tuple[Signal, float, float, float]]):
+        """(signal, current_price, return_pct, peak_price) 목록을 저널 한 줄로 기록"""
+        if updates:
+            self._apply({
+                'op': 'prices',
+                'u': [[s.ticker, s.signal_date, float(price), float(ret), float(peak)]
+                      for s, price, ret, peak in updates],
+            })
+    
+    def _apply(self, record: Dict, journal: bool = True):
+        op = record['op']
+        if op == 'add':
+            self._index(_signal_from_row(record['s']))
+        elif op == 'close':
+            signal = self._signals.get(tuple(record['k']))
+            if signal is None:
+                return
+            for name, value in record['f'].items():
+                setattr(signal, name, value)
+            self._set_status(signal, "CLOSED")
+            self._pending_history.append(self.key(signal))
+        elif op == 'prices':
+            for ticker, signal_date, price, ret, *peak in record['u']:
+                signal = self._signals.get((ticker, signal_date))
+                if signal is not None:
+                    signal.current_price = price
+                    signal.return_pct = ret
+                    if peak:
+                        signal.peak_price = peak[0]
+        if journal:
+            self._append(record)
+    
+    def _snapshot_stamp(self) -> List[int]:
+        try:
+            st = os.stat(self.snapshot_path)
+            return [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return [0, 0]
+    
+    def _append(self, record: Dict):
+        new_journal = self._journal_lines == 0
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            if new_journal:
+                f.write(json.dumps({'op': 'base', 'snapshot': self._snapshot_stamp()}) + '\n')
+                self._journal_lines = 1
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+        self._journal_lines += 1
+    
+    # ------------------------------------------------------------------
+    # 로드 / compaction
+    # ------------------------------------------------------------------
+    def load(self):
+        """CSV 스냅샷 로드 후 저널 재생"""
+        self._signals.clear()
+        self._open.clear()
+        self._status.clear()
+        self._pending_history = []
+        self._journal_lines = 0
+        
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    self._index(_signal_from_row(row))
+        
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        replayed = 0
+        for i, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 마지막 줄 기록 중 중단된 경우
+                print(f"⚠️ 저널 손상 줄 무시: {self.journal_path}:{i + 1}")
+                continue
+            if record.get('op') == 'base':
+                if record.get('snapshot') != self._snapshot_stamp():
+                    print("⚠️ 시그널 CSV가 외부에서 교체됨 - 이전 저널 폐기")
+                    self._discard_journal()
+                    return
+                continue
+            self._apply(record, journal=False)
+            replayed += 1
+        self._journal_lines = len(lines)
+        if replayed:
+            print(f"✅ 저널 {replayed}건 재생됨")
+    
+    def _discard_journal(self):
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        self._journal_lines = 0
+    
+    def maybe_compact(self):
+        if self._journal_lines >= self.COMPACT_LINES:
+            self.compact()
+    
+    def compact(self):
+        """청산 이력 병합 → CSV 스냅샷 재작성 → 저널 비우기"""
+        from engine.persist import atomic_write_bytes, write_json
+        
+        if self._pending_history:
+            history = []
+            if os.path.exists(self.history_path):
+                try:
+                    with open(self.history_path, 'r', encoding='utf-8') as f:
+                        history = json.load(f)
+                except (OSError, ValueError):
+                    history = []
+            # 저널 비우기 전 중단됐다 재생된 청산은 중복 기록하지 않음
+            seen = {(h.get('ticker'), h.get('signal_date'), h.get('exit_date')) for h in history}
+            for key in self._pending_history:
+                signal = self._signals.get(key)
+                if signal is None:
+                    continue
+                item = signal.to_dict()
+                if (item['ticker'], item['signal_date'], item['exit_date']) not in seen:
+                    history.append(item)
+            write_json(self.history_path, history)
+            self._pending_history = []
+        
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=SIGNAL_FIELDS)
+        writer.writeheader()
+        for signal in self._signals.values():
+            writer.writerow(signal.to_dict())
+        atomic_write_bytes(self.snapshot_path, buf.getvalue().encode('utf-8-sig'))
+        self._discard_journal()
+
+
 class SignalTracker:
     """시그널 추적 관리자"""
     
@@ -43,77 +327,55 @@ class SignalTracker:
         os.makedirs(self.data_dir, exist_ok=True)
         
         self.signals_file = os.path.join(self.data_dir, 'signals_log.csv')
+        self.journal_file = os.path.join(self.data_dir, 'signals_journal.jsonl')
         self.history_file = os.path.join(self.data_dir, 'signals_history.json')
         
-        self.signals: List[Signal] = []
+        self.book = SignalBook(self.signals_file, self.journal_file, self.history_file)
         self._load_signals()
     
+    @property
+    def signals(self) -> List[Signal]:
+        return self.book.signals
+    
     def _load_signals(self):
-        """시그널 파일 로드"""
-        if not os.path.exists(self.signals_file):
-            return
-        
+        """시그널 파일 로드 (CSV 스냅샷 + 저널)"""
         try:
-            with open(self.signals_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                
-                for row in reader:
-                    signal = Signal(
-                        ticker=row.get('ticker', ''),
-                        name=row.get('name', ''),
-                        signal_date=row.get('signal_date', ''),
-                        entry_price=float(row.get('entry_price', 0)),
-                        status=row.get('status', 'OPEN'),
-                        score=float(row.get('score', 0)),
-                        contraction_ratio=float(row.get('contraction_ratio', 0)),
-                        foreign_5d=int(row.get('foreign_5d', 0)),
-                        inst_5d=int(row.get('inst_5d', 0)),
-                        market=row.get('market', 'KOSPI'),
-                        current_price=float(row.get('current_price', 0)),
-                        return_pct=float(row.get('return_pct', 0))
-                    )
-                    self.signals.append(signal)
-                    
-            print(f"✅ {len(self.signals)}개 시그널 로드됨")
-            
+            self.book.load()
+            if len(self.book):
+                print(f"✅ {len(self.book)}개 시그널 로드됨")
         except Exception as e:
             print(f"❌ 시그널 로드 실패: {e}")
     
     def save_signals(self):
-        """시그널 파일 저장"""
-        if not self.signals:
+        """시그널 파일 저장 (저널을 CSV 스냅샷으로 compact + DB 전체 동기화)"""
+        if not len(self.book):
             return
         
         try:
-            fieldnames = [
-                'ticker', 'name', 'signal_date', 'entry_price', 'status',
-                'score', 'contraction_ratio', 'foreign_5d', 'inst_5d',
-                'market', 'current_price', 'return_pct', 'exit_date',
-                'exit_price', 'exit_reason'
-            ]
-            
-            with open(self.signals_file, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for signal in self.signals:
-                    writer.writerow(signal.to_dict())
-            
-            print(f"✅ {len(self.signals)}개 시그널 저장됨")
-            
+            self.book.compact()
+            print(f"✅ {len(self.book)}개 시그널 저장됨")
         except Exception as e:
             print(f"❌ 시그널 저장 실패: {e}")
+        
+        self._sync_store(self.signals)
+    
+    def _sync_store(self, signals: List[Signal]):
+        """결과 저장소(DB) 기록 - 실패해도 CSV 저장은 유지"""
+        try:
+            from app.store import get_store
+            get_store().upsert_tracked_signals([s.to_dict() for s in signals])
+        except Exception as e:
+            print(f"⚠️ DB 기록 생략: {e}")
     
     def add_signal(self, signal: Signal) -> bool:
         """시그널 추가"""
-        # 중복 체크
-        for existing in self.signals:
-            if existing.ticker == signal.ticker and existing.status == "OPEN":
-                print(f"⚠️ 이미 열린 시그널 존재: {signal.ticker}")
-                return False
-        
-        self.signals.append(signal)
-        self.save_signals()
+        if not self.book.add(signal):
+            print(f"⚠️ 이미 열린 시그널 존재: {signal.ticker}")
+            return False
+        
+        added = self.book.get(signal.ticker, signal.signal_date)
+        self._sync_store([added])
+        self.book.maybe_compact()
         print(f"✅ 시그널 추가됨: {signal.name} ({signal.ticker})")
         return True
     
@@ -124,109 +386,208 @@ class SignalTracker:
         exit_reason: str = "MANUAL"
     ) -> bool:
         """시그널 청산"""
-        for signal in self.signals:
-            if signal.ticker == ticker and signal.status == "OPEN":
-                signal.status = "CLOSED"
-                signal.exit_date = datetime.now().strftime('%Y-%m-%d')
-                signal.exit_price = exit_price
-                signal.exit_reason = exit_reason
-                
-                # 수익률 계산
-                if signal.entry_price > 0:
-                    signal.return_pct = ((exit_price - signal.entry_price) / signal.entry_price) * 100
-                
-                self.save_signals()
-                self._log_to_history(signal)
-                
-                print(f"✅ 시그널 청산: {signal.name} ({signal.ticker}) - {signal.return_pct:.2f}%")
-                return True
-        
-        print(f"⚠️ 열린 시그널 없음: {ticker}")
-        return False
-    
-    def _log_to_history(self, signal: Signal):
-        """히스토리에 기록"""
-        history = []
-        
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-            except:
-                history = []
-        
-        history.append(signal.to_dict())
+        signal = self.book.close(ticker, exit_price, exit_reason)
+        if signal is None:
+            print(f"⚠️ 열린 시그널 없음: {ticker}")
+            return False
         
-        with open(self.history_file, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        self._sync_store([signal])
+        self.book.maybe_compact()
+        print(f"✅ 시그널 청산: {signal.name} ({signal.ticker}) - {signal.return_pct:.2f}%")
+        return True
     
-    def update_prices(self) -> int:
-        """가격 업데이트"""
+    def fetch_snapshot(self, date: str = None) -> pd.DataFrame:
+        """전종목 일봉 스냅샷 1회 조회 (index: 티커, columns: Open/High/Low/Close/Volume)
+        - date 생략 시 오늘 기준 가장 가까운 영업일
+        """
         from pykrx import stock
         
-        today = datetime.now().strftime("%Y%m%d")
-        updated_count = 0
+        date = date or datetime.now().strftime("%Y%m%d")
+        try:
+            date = stock.get_nearest_business_day_in_a_week(date)
+            df = stock.get_market_ohlcv(date, market="ALL")
+        except Exception as e:
+            print(f"⚠️ 전종목 시세 조회 실패 ({date}): {e}")
+            return pd.DataFrame(columns=list(KRX_SNAPSHOT_COLUMNS.values()))
+        
+        df = df.rename(columns=KRX_SNAPSHOT_COLUMNS)[list(KRX_SNAPSHOT_COLUMNS.values())]
+        df.index = df.index.astype(str)
+        # 거래정지 종목은 0으로 내려옴
+        df = df[df['Close'] > 0].astype(float)
+        df.attrs['date'] = date
+        return df
+    
+    def _fetch_bars(self, signals: List[Signal], snapshot: pd.DataFrame = None) -> pd.DataFrame:
+        """열린 시그널의 당일 봉 (스냅샷에 없는 종목만 공유 시세 서비스로 보충 - 시/고/저/종 = 현재가)"""
+        if snapshot is None:
+            snapshot = self.fetch_snapshot()
+        tickers = [s.ticker for s in signals]
+        bars = snapshot.reindex(tickers)
         
-        for signal in self.signals:
-            if signal.status != "OPEN":
-                continue
-            
+        missing = bars.index[bars['Close'].isna()].tolist()
+        if missing:
             try:
-                # 현재가 조회
-                ohlcv = stock.get_market_ohlcv(today, today, signal.ticker)
-                
-                if not ohlcv.empty:
-                    current = float(ohlcv.iloc[-1]['종가'])
-                    signal.current_price = current
-                    
-                    if signal.entry_price > 0:
-                        signal.return_pct = ((current - signal.entry_price) / signal.entry_price) * 100
-                    
-                    updated_count += 1
-                    print(f"  📈 {signal.name}: {current:,.0f}원 ({signal.return_pct:+.2f}%)")
-                    
+                from engine.quote_service import get_quote_service
+                markets = {s.ticker: s.market for s in signals}
+                quotes = pd.Series(get_quote_service().get_kr_prices(missing, markets), dtype=float)
+                for col in ('Open', 'High', 'Low', 'Close'):
+                    bars[col] = bars[col].fillna(quotes)
             except Exception as e:
-                continue
+                print(f"⚠️ 시세 서비스 보충 실패 ({len(missing)}종목): {e}")
+        bars.attrs['date'] = snapshot.attrs.get('date') or datetime.now().strftime("%Y%m%d")
+        return bars
+    
+    @staticmethod
+    def _held_days(signals: List[Signal], bar_date: str) -> np.ndarray:
+        """시그널일 ~ 봉 날짜 보유 거래일 수 (시그널 당일 = 0, 날짜 불명은 1일로 간주)"""
+        today = np.datetime64(datetime.strptime(bar_date, "%Y%m%d").date(), 'D')
+        signal_days = pd.to_datetime([s.signal_date for s in signals], errors='coerce')
+        valid_day = ~signal_days.isna()
+        starts = np.where(valid_day, signal_days.to_numpy(dtype='datetime64[D]'), today)
+        return np.where(valid_day, np.busday_count(starts, today), 1)
+    
+    def update_prices(self, snapshot: pd.DataFrame = None) -> int:
+        """가격 업데이트 - 전종목 시세 1회 조회 후 열린 시그널 수익률/최고가 일괄 계산"""
+        open_signals = self.get_open_signals()
+        if not open_signals:
+            return 0
+        
+        bars = self._fetch_bars(open_signals, snapshot)
+        held = self._held_days(open_signals, bars.attrs['date'])
+        prices = bars['Close'].to_numpy(dtype=float)
+        highs = bars['High'].fillna(bars['Close']).to_numpy(dtype=float)
+        entries = np.asarray([s.entry_price for s in open_signals], dtype=float)
+        peaks = np.fmax(np.asarray([s.peak_price for s in open_signals], dtype=float), entries)
+        
+        has_price = ~np.isnan(prices)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            returns = np.where(entries > 0, (prices / entries - 1) * 100, np.nan)
+        # 종가 진입이라 시그널 당일 고가는 보유 중 고가가 아님 → 진입 다음 봉부터 최고가 반영
+        peaks = np.where(held > 0, np.fmax(peaks, highs), peaks)
         
-        if updated_count > 0:
-            self.save_signals()
+        updates = [
+            (open_signals[i], float(prices[i]),
+             open_signals[i].return_pct if np.isnan(returns[i]) else float(returns[i]),
+             float(peaks[i]))
+            for i in np.flatnonzero(has_price)
+        ]
+        
+        updated_count = len(updates)
+        if updated_count < len(open_signals):
+            skipped = [open_signals[i].ticker for i in np.flatnonzero(~has_price)]
+            print(f"  ⚠️ 시세 없음 {len(skipped)}개: {', '.join(skipped[:10])}")
+        
+        if updates:
+            self.book.update_prices(updates)
+            self._sync_store([u[0] for u in updates])
+            self.book.maybe_compact()
         
         return updated_count
     
-    def check_exits(self, stop_loss: float = -5.0, take_profit: float = 15.0) -> List[Signal]:
-        """청산 조건 체크"""
-        exit_signals = []
+    def _current_regime(self) -> Optional[str]:
+        """저장된 레짐 상태 (네트워크 조회 없음)"""
+        try:
+            from engine.regime import get_regime_engine
+            status = get_regime_engine().current()
+            return status.regime if status else None
+        except Exception as e:
+            print(f"⚠️ 레짐 조회 생략: {e}")
+            return None
+    
+    def check_exits(
+        self,
+        snapshot: pd.DataFrame = None,
+        config: BacktestConfig = None,
+        regime: str = None,
+        regime_exit: bool = False,
+    ) -> List[Tuple[Signal, str, float]]:
+        """청산 조건 체크 - 열린 시그널 전체를 당일 봉으로 일괄 판정 (engine.exits)
+        
+        - 레짐 이탈 청산은 regime 을 직접 넘기거나 regime_exit=True 일 때만 (백테스트 기본값과 달리 옵트인)
+        
+        Returns: [(signal, exit_reason, exit_price)] - 시그널당 최대 1건
+        """
+        config = config or BacktestConfig()
+        open_signals = self.get_open_signals()
+        if not open_signals:
+            return []
+        
+        bars = self._fetch_bars(open_signals, snapshot)
+        
+        entries = np.asarray([s.entry_price for s in open_signals], dtype=float)
+        peaks = np.asarray([s.peak_price for s in open_signals], dtype=float)
+        # 보유 거래일 수 (시그널 당일 = 0 → 평가 제외)
+        held = self._held_days(open_signals, bars.attrs['date'])
+        held = np.where(entries > 0, held, 0)
+        
+        if regime is None and regime_exit:
+            regime = self._current_regime()
+        regime_ok = None
+        if regime:
+            regime_ok = np.full((len(open_signals), 1), config.should_trade_in_regime(regime))
+        
+        def _col(name: str) -> np.ndarray:
+            return bars[name].to_numpy(dtype=float)[:, None]
+        
+        decision = resolve_exits(
+            entries, _col('Open'), _col('High'), _col('Low'), _col('Close'),
+            held[:, None], config, prior_peak=peaks, regime_ok=regime_ok,
+        )
+        reasons = decision.reason_names()
+        return [
+            (open_signals[i], reasons[i], round(float(decision.price[i]), 2))
+            for i in np.flatnonzero(decision.exited)
+        ]
+    
+    def process_exits(
+        self,
+        snapshot: pd.DataFrame = None,
+        config: BacktestConfig = None,
+        regime: str = None,
+        regime_exit: bool = False,
+    ) -> List[Trade]:
+        """청산 조건에 걸린 시그널을 저널로 청산하고 Trade(R-Multiple 포함) 목록 반환"""
+        config = config or BacktestConfig()
+        if snapshot is None:
+            snapshot = self.fetch_snapshot()
+        exits = self.check_exits(snapshot, config, regime, regime_exit)
+        if not exits:
+            return []
         
-        for signal in self.signals:
-            if signal.status != "OPEN":
+        exit_day = datetime.strptime(snapshot.attrs.get('date') or datetime.now().strftime("%Y%m%d"), "%Y%m%d")
+        trades, closed = [], []
+        for signal, reason, price in exits:
+            if self.book.close(signal.ticker, price, reason, exit_date=exit_day.strftime('%Y-%m-%d')) is None:
                 continue
-            
-            # 손절 체크
-            if signal.return_pct <= stop_loss:
-                exit_signals.append((signal, "STOP_LOSS"))
-            
-            # 익절 체크
-            elif signal.return_pct >= take_profit:
-                exit_signals.append((signal, "TAKE_PROFIT"))
-            
-            # 시간 청산 체크 (15일)
-            signal_date = datetime.strptime(signal.signal_date, '%Y-%m-%d')
-            if (datetime.now() - signal_date).days >= 15:
-                exit_signals.append((signal, "TIME_EXIT"))
-        
-        return exit_signals
+            closed.append(signal)
+            try:
+                entry_time = datetime.strptime(signal.signal_date, '%Y-%m-%d').timestamp()
+            except ValueError:
+                entry_time = exit_day.timestamp()
+            trades.append(make_trade(
+                signal.ticker, signal.name,
+                entry_time, signal.entry_price, exit_day.timestamp(), price, reason, config,
+                entry_score=signal.score,
+                foreign_net_5d=signal.foreign_5d,
+                inst_net_5d=signal.inst_5d,
+                market_regime=regime or self._current_regime() or "KR_NEUTRAL",
+            ))
+        
+        self._sync_store(closed)
+        self.book.maybe_compact()
+        return trades
     
     def get_open_signals(self) -> List[Signal]:
         """열린 시그널 조회"""
-        return [s for s in self.signals if s.status == "OPEN"]
+        return self.book.by_status("OPEN")
     
     def get_stats(self) -> Dict:
         """통계 조회"""
-        closed = [s for s in self.signals if s.status == "CLOSED"]
+        closed = self.book.by_status("CLOSED")
         
         if not closed:
             return {
-                "total": len(self.signals),
+                "total": len(self.book),
                 "open": len(self.get_open_signals()),
                 "closed": 0,
                 "win_rate": 0,
@@ -237,7 +598,7 @@ class SignalTracker:
         avg_return = sum(s.return_pct for s in closed) / len(closed)
         
         return {
-            "total": len(self.signals),
+            "total": len(self.book),
             "open": len(self.get_open_signals()),
             "closed": len(closed),
             "wins": wins,
@@ -253,20 +614,27 @@ class SignalTracker:
         print(f"🔄 일일 시그널 업데이트 - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
         print("="*50)
         
-        # 1. 가격 업데이트
-        print("\n[1/3] 가격 업데이트...")
-        updated = self.update_prices()
-        print(f"  → {updated}개 종목 업데이트됨")
+        snapshot = self.fetch_snapshot()
+        
+        # 1. 청산 조건 체크 → 청산 (당일 봉 기준, 트레일링은 전일까지 최고가)
+        print("\n[1/3] 청산 조건 체크...")
+        trades = self.process_exits(snapshot)
+        for trade in trades:
+            print(f"  ⚠️ {trade.name}: {trade.exit_reason} ({trade.return_pct:+.2f}%, {trade.r_multiple:+.2f}R)")
+        print(f"  → {len(trades)}개 청산됨")
         
-        # 2. 청산 조건 체크
-        print("\n[2/3] 청산 조건 체크...")
-        exits = self.check_exits()
-        for signal, reason in exits:
-            print(f"  ⚠️ {signal.name}: {reason} ({signal.return_pct:.2f}%)")
+        # 2. 가격 업데이트 (남은 열린 시그널)
+        print("\n[2/3] 가격 업데이트...")
+        updated = self.update_prices(snapshot)
+        print(f"  → {updated}개 종목 업데이트됨")
         
         # 3. 통계 출력
         print("\n[3/3] 현재 통계...")
         stats = self.get_stats()
+        try:
+            self.book.compact()
+        except Exception as e:
+            print(f"  ⚠️ 시그널 파일 정리 실패: {e}")
         print(f"  열린 시그널: {stats['open']}개")
         print(f"  청산 시그널: {stats['closed']}개")
         print(f"  승률: {stats['win_rate']:.1f}%")
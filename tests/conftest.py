@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트 모듈(config, models, signal_tracker ...) import 경로
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
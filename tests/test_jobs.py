@@ -0,0 +1,80 @@
+"""작업 큐 / 중복 방지 / 워커 풀"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from app import database, jobs
+from engine.locks import FileLock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setenv('TURSO_DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+    monkeypatch.setattr(database, '_engine', None)
+    monkeypatch.setattr(database, '_session_factory', None)
+    monkeypatch.setattr(jobs, 'job_lock', lambda key, timeout=None: FileLock('test', lock_dir=str(tmp_path)))
+    return jobs.JobQueue()
+
+
+def test_start_worker_pool_in_fresh_process(tmp_path):
+    # get_job_queue() 를 _init_lock 안에서 호출하면 새 프로세스에서 자기 자신과 교착
+    script = textwrap.dedent("""
+        from app import jobs
+        pool = jobs.start_worker_pool(1)
+        assert pool is not None and jobs.get_job_queue() is pool.queue
+        pool.stop()
+        print('started')
+    """)
+    env = dict(os.environ, TURSO_DATABASE_URL=f"sqlite:///{tmp_path / 'jobs.db'}")
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (ROOT, env.get('PYTHONPATH')) if p)
+    proc = subprocess.run([sys.executable, '-c', script], cwd=ROOT, env=env,
+                          capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr
+    assert 'started' in proc.stdout
+
+
+def test_submit_dedupes_active_jobs(queue):
+    first, created = queue.submit('test.scan', {'market': 'KR'}, dedupe_key='test.scan')
+    assert created
+    again, created = queue.submit('test.scan', {'market': 'KR'}, dedupe_key='test.scan')
+    assert not created and again['id'] == first['id']
+
+    # 종료되면 active_key 해제 → 재등록 가능
+    queue.finish(first['id'], 'succeeded', 'Done')
+    third, created = queue.submit('test.scan', {'market': 'KR'}, dedupe_key='test.scan')
+    assert created and third['id'] != first['id']
+
+
+def test_claim_only_known_kinds(queue, monkeypatch):
+    queue.submit('test.unknown')
+    assert queue.claim('w0') is None
+
+    monkeypatch.setitem(jobs._handlers, 'test.known', lambda ctx: {'status': 'success'})
+    job, _ = queue.submit('test.known')
+    claimed = queue.claim('w0')
+    assert claimed['id'] == job['id'] and claimed['status'] == 'running'
+    assert queue.claim('w1') is None
+
+
+def test_run_job_result_and_cancel(queue, monkeypatch):
+    monkeypatch.setitem(jobs._handlers, 'test.ok', lambda ctx, n: {'message': f"n={n}"})
+    queue.submit('test.ok', {'n': 3, '_label': 'meta'})
+    jobs.run_job(queue, queue.claim('w0'))
+    done = queue.latest('test.ok')
+    assert done['status'] == 'succeeded' and done['message'] == 'n=3' and done['progress'] == 100
+
+    def _cancelling(ctx):
+        queue.cancel(ctx.job_id)
+        ctx.check_cancelled()
+        return {'message': 'unreachable'}
+
+    monkeypatch.setitem(jobs._handlers, 'test.cancel', _cancelling)
+    queue.submit('test.cancel')
+    jobs.run_job(queue, queue.claim('w0'))
+    assert queue.latest('test.cancel')['status'] == 'cancelled'
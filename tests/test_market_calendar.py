@@ -0,0 +1,32 @@
+"""시장 캘린더 내장 휴장일 규칙"""
+
+from datetime import date, timedelta
+
+from engine.market_calendar import MarketCalendar, _kr_holidays
+
+# KRX 2025 평일 휴장일 (1/27 임시공휴일, 6/3 대통령 선거 포함)
+KR_2025_CLOSED = {
+    '2025-01-01', '2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30',
+    '2025-03-03', '2025-05-01', '2025-05-05', '2025-05-06', '2025-06-03',
+    '2025-06-06', '2025-08-15', '2025-10-03', '2025-10-06', '2025-10-07',
+    '2025-10-08', '2025-10-09', '2025-12-25', '2025-12-31',
+}
+
+
+def test_kr_2025_holidays():
+    weekdays = {d.isoformat() for d in _kr_holidays(2025) if d.weekday() < 5}
+    assert weekdays == KR_2025_CLOSED
+
+
+def test_kr_2025_trading_days_without_exchange_calendar():
+    calendar = MarketCalendar('KR')
+    calendar._exchange = None
+    calendar._extra = set()
+
+    day, closed = date(2025, 1, 1), set()
+    while day.year == 2025:
+        if day.weekday() < 5 and not calendar.is_trading_day(day):
+            closed.add(day.isoformat())
+        day += timedelta(days=1)
+    assert closed == KR_2025_CLOSED
+    assert calendar.previous_trading_day(date(2025, 1, 31)) == date(2025, 1, 24)
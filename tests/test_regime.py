@@ -0,0 +1,50 @@
+"""RegimeEngine 상태 파일 복구"""
+
+import json
+from datetime import date, timedelta
+
+import pandas as pd
+
+from engine.regime import HISTORY_DAYS, KOSPI, RegimeEngine
+
+
+class _FakeStore:
+    def __init__(self, frames):
+        self.frames = frames
+        self.starts = []
+
+    def get_history(self, symbols, start, end=None):
+        self.starts.append(pd.Timestamp(start))
+        return {s: self.frames[s] for s in symbols if s in self.frames}
+
+
+def test_update_recovers_from_state_without_dates(tmp_path, monkeypatch):
+    monkeypatch.setattr(RegimeEngine, '_fetch_flows', lambda self, day: None)
+    today = date(2026, 3, 2)
+    state_path = tmp_path / 'market_regime.json'
+
+    # 첫 갱신에서 종가를 하나도 못 받아 last_date 가 모두 null 로 저장된 상태
+    windows = RegimeEngine()._windows
+    state = {
+        'windows': windows,
+        'series': {sym: {'last_date': None, 'values': []} for sym in windows},
+        'flows': {},
+        'status': None,
+    }
+    state_path.write_text(json.dumps(state), encoding='utf-8')
+
+    days = pd.bdate_range(end=pd.Timestamp(today) - timedelta(days=1), periods=80)
+    closes = pd.DataFrame({'Close': [2500.0 + i for i in range(len(days))]}, index=days)
+    store = _FakeStore({sym: closes for sym in windows})
+    engine = RegimeEngine(store=store, state_path=str(state_path))
+
+    status = engine.update(today)
+
+    assert store.starts == [pd.Timestamp(today) - timedelta(days=HISTORY_DAYS)]
+    assert status.kospi == closes['Close'].iloc[-1]
+    assert engine._series[KOSPI].last_date == days[-1].strftime('%Y-%m-%d')
+    assert all(m.value is not None for m in engine._series[KOSPI].means.values())
+
+    # 다음 갱신은 저장된 last_date 기준 최근 구간만
+    engine.update(today + timedelta(days=1))
+    assert store.starts[-1] == pd.Timestamp(today + timedelta(days=1)) - timedelta(days=10)
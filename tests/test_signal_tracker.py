@@ -0,0 +1,57 @@
+"""SignalTracker 최고가/청산 판정"""
+
+import pandas as pd
+import pytest
+
+from config import BacktestConfig
+from signal_tracker import Signal, SignalTracker
+
+
+def _bar(date: str, o: float, h: float, l: float, c: float) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {'Open': [o], 'High': [h], 'Low': [l], 'Close': [c], 'Volume': [1_000_000.0]},
+        index=pd.Index(['005930']),
+    )
+    df.attrs['date'] = date
+    return df
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    monkeypatch.setattr(SignalTracker, '_sync_store', lambda self, signals: None)
+    tracker = SignalTracker(data_dir=str(tmp_path))
+    tracker.add_signal(Signal(ticker='005930', name='삼성전자', signal_date='2026-01-05', entry_price=100.0))
+    return tracker
+
+
+def test_signal_day_high_not_folded_into_peak(tracker):
+    # 종가 100 진입 - 당일 고가 130 은 진입 전 고가
+    tracker.update_prices(_bar('20260105', 105, 130, 98, 100))
+    assert tracker.book.open_for('005930').peak_price == 100.0
+
+    # 다음 봉 +16% - 트레일링 스탑(고점 대비 5%)에 걸리면 안 됨 (익절 목표는 범위 밖으로)
+    config = BacktestConfig(take_profit_pct=30.0, trailing_stop_pct=5.0)
+    exits = tracker.check_exits(_bar('20260106', 112, 118, 110, 116), config)
+    assert exits == []
+
+
+def test_peak_tracks_highs_after_entry(tracker):
+    tracker.update_prices(_bar('20260106', 112, 118, 110, 116))
+    assert tracker.book.open_for('005930').peak_price == 118.0
+
+
+def test_regime_exit_is_opt_in(tracker, monkeypatch):
+    monkeypatch.setattr(SignalTracker, '_current_regime', lambda self: 'KR_BEARISH')
+    bar = _bar('20260106', 101, 102, 100, 101)
+
+    assert tracker.check_exits(bar, BacktestConfig()) == []
+    reasons = [reason for _, reason, _ in tracker.check_exits(bar, BacktestConfig(), regime_exit=True)]
+    assert reasons == ['REGIME_EXIT']
+
+
+def test_exit_price_is_rounded(tracker):
+    config = BacktestConfig()
+    exits = tracker.check_exits(_bar('20260106', 101, 140, 100, 120), config)
+    assert len(exits) == 1
+    price = exits[0][2]
+    assert price == round(price, 2)